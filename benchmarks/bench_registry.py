@@ -0,0 +1,91 @@
+"""
+Benchmark reading a large Docker Desktop MCP registry.
+
+Compares the pure-Python YAML loader, libyaml's CSafeLoader and the cached
+registry reader shared by DockerRegistryParser and SimpleMCPManager.
+
+Usage:
+    python benchmarks/bench_registry.py [--servers 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from mcp_manager.core.parsers.docker_parser import (
+    DockerRegistryParser, clear_registry_cache, read_registry,
+)
+
+
+def write_registry(path: Path, servers: int):
+    """Write a registry.yaml with the given number of servers."""
+    lines = ["registry:"]
+    for index in range(servers):
+        lines.append(f"  server-{index:04d}:")
+        lines.append(f"    ref: \"docker.io/mcp/server-{index:04d}@sha256:{index:064x}\"")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def measure(func, repeat: int) -> dict:
+    """Run func repeatedly and return timing statistics in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+    }
+
+
+def run(servers: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "registry.yaml"
+        write_registry(path, servers)
+
+        def pure_python():
+            with open(path) as f:
+                yaml.load(f, Loader=yaml.SafeLoader)
+
+        def cold_reader():
+            clear_registry_cache()
+            read_registry(path)
+
+        results = {"servers": servers, "libyaml": getattr(yaml, "__with_libyaml__", False)}
+        results["safe_load"] = measure(pure_python, repeat)
+
+        if hasattr(yaml, "CSafeLoader"):
+            def c_loader():
+                with open(path, "rb") as f:
+                    yaml.load(f, Loader=yaml.CSafeLoader)
+            results["csafe_load"] = measure(c_loader, repeat)
+
+        results["read_registry_cold"] = measure(cold_reader, repeat)
+
+        read_registry(path)
+        results["read_registry_cached"] = measure(lambda: read_registry(path), repeat)
+
+        parser = DockerRegistryParser(str(path))
+        parser.parse_registry()
+        results["parse_registry_cached"] = measure(parser.parse_registry, repeat)
+
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--servers", type=int, default=1000, help="Servers in the registry")
+    parser.add_argument("--repeat", type=int, default=20, help="Samples per measurement")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.servers, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
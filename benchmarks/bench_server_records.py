@@ -0,0 +1,92 @@
+"""
+Benchmark server construction on listing paths.
+
+Compares building validated Server models with building ServerRecord
+instances, measuring per-server construction time and retained memory.
+
+Usage:
+    python benchmarks/bench_server_records.py [--servers 10000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+
+from mcp_manager.core.models import Server, ServerRecord, ServerScope, ServerType
+
+
+def server_fields(servers: int) -> list:
+    """Field sets resembling parsed claude mcp list output."""
+    return [
+        dict(
+            name=f"server-{index:05d}",
+            command="npx",
+            args=["-y", f"@example/server-{index:05d}"],
+            server_type=ServerType.NPM,
+            scope=ServerScope.USER,
+            enabled=True,
+        )
+        for index in range(servers)
+    ]
+
+
+def measure_time(build, fields: list, repeat: int) -> dict:
+    """Return per-server construction time in microseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(fields)
+        samples.append((time.perf_counter() - started) * 1e6 / len(fields))
+    return {
+        "min_us_per_server": round(min(samples), 3),
+        "median_us_per_server": round(statistics.median(samples), 3),
+    }
+
+
+def measure_memory(build, fields: list) -> dict:
+    """Return memory retained by the built list."""
+    gc.collect()
+    tracemalloc.start()
+    built = build(fields)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return {
+        "retained_kib": round(retained / 1024, 1),
+        "bytes_per_server": round(retained / len(fields)),
+    }
+
+
+def run(servers: int, repeat: int) -> dict:
+    fields = server_fields(servers)
+
+    builders = {
+        "server_model": lambda items: [Server(**item) for item in items],
+        "server_record": lambda items: [ServerRecord(**item) for item in items],
+    }
+
+    results = {"servers": servers}
+    for name, build in builders.items():
+        results[name] = {**measure_time(build, fields, repeat), **measure_memory(build, fields)}
+
+    records = builders["server_record"](fields)
+    results["record_to_server"] = measure_time(
+        lambda items: [record.to_server() for record in items], records, repeat
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--servers", type=int, default=10000, help="Servers to construct")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per measurement")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.servers, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark tool extraction from large READMEs.
+
+Compares running each tool pattern separately over a document, as the
+discovery parsers used to, with the single-pass scanners in
+mcp_manager.core.tool_extraction, on synthetic npm READMEs, Docker Hub
+descriptions and container READMEs of about 1 MB. Like real
+documentation, each README mentions a few dozen tools over and over.
+Both approaches must find the same set of tool names.
+
+Usage:
+    python benchmarks/bench_tool_extraction.py [--size-kib 1024] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import time
+
+from mcp_manager.core.tool_extraction import (
+    HUB_TOOLS_TABLE_RE, scan_hub_docs, scan_package_docs, scan_readme,
+)
+
+# One pattern per findall, as before the combined scanners
+SEPARATE_PATTERNS = {
+    "npm_readme": [
+        r'tools?[:\s]+([^.\n]+)',
+        r'provides?\s+([^.\n]+)\s+tools?',
+        r'supports?\s+([^.\n]+)\s+operations?',
+        r'functions?[:\s]+([^.\n]+)',
+        r'commands?[:\s]+([^.\n]+)',
+    ],
+    "hub_description": [
+        r'tool:\s*\*\*`([a-zA-Z_][a-zA-Z0-9_]*)`\*\*',
+    ],
+    "container_readme": [
+        r'- `(\w+)`[:\s]+([^\n]+)',
+        r'\*\*(\w+)\*\*[:\s]+([^\n]+)',
+        r'### (\w+)\n([^\n]+)',
+    ],
+}
+
+SCANNERS = {
+    "npm_readme": scan_package_docs,
+    "hub_description": scan_hub_docs,
+    "container_readme": scan_readme,
+}
+
+# Distinct tools mentioned in each README
+TOOLS = 40
+
+SECTIONS = {
+    "npm_readme": (
+        "## Server {tool}\n\nThis MCP server provides search_{tool} and fetch_{tool} tools.\n"
+        "Tools: read_{tool}, write_{tool} & list_{tool}\n"
+        "It also provides query_{tool} tools: index_{tool}, drop_{tool}\n\n"
+        "Installation is the same as for any other package; see the usage section below.\n\n"
+    ),
+    "hub_description": (
+        "#### Tool: **`tool_{tool}`**\n\nCall `tool_{tool}` with a `string` argument.\n"
+        "| Parameter | Type |\n|---|---|\n| `query_{tool}` | `string` |\n\n"
+    ),
+    "container_readme": (
+        "### read_{tool}\nRead item {tool} from the store\n\n"
+        "- `write_{tool}`: write item {tool}\n**list_{tool}**: list items like {tool}\n\n"
+        "Some prose explaining the server, long enough to resemble real documentation.\n\n"
+    ),
+}
+
+
+def make_document(kind: str, size: int) -> str:
+    """Repeat a section of the given kind until the document reaches size bytes."""
+    parts = []
+    if kind == "hub_description":
+        parts.append("## Tools provided by this server\n| Tool | Description |\n|---|---|\n| `fetch` | Fetch a URL |\n\n")
+    length = sum(len(part) for part in parts)
+    index = 0
+    while length < size:
+        part = SECTIONS[kind].format(tool=index % TOOLS)
+        parts.append(part)
+        length += len(part)
+        index += 1
+    return "".join(parts)
+
+
+def tool(name: str, source: str) -> dict:
+    return {"name": name, "description": "", "source": source}
+
+
+def separate_patterns(kind: str, document: str) -> list:
+    """Extract tools the way the parsers did before: one findall per pattern."""
+    text = document.lower()
+    tools = []
+    if kind == "npm_readme":
+        for pattern in SEPARATE_PATTERNS[kind]:
+            for match in re.findall(pattern, text):
+                # Split on separators like the scanner does; the parsers used
+                # to split on the letters a, n and d as well
+                for name in re.findall(r'[^,&\s]+', match):
+                    if len(name) > 2 and name not in ['the', 'and', 'or']:
+                        tools.append(tool(name, kind))
+    elif kind == "hub_description":
+        table = HUB_TOOLS_TABLE_RE.search(text)
+        if table:
+            for name, _ in re.findall(r'`([a-zA-Z_][a-zA-Z0-9_]*)`\s*\|\s*([^|]+)', table.group(1)):
+                tools.append(tool(name, kind))
+        for name in re.findall(SEPARATE_PATTERNS[kind][0], text, re.IGNORECASE):
+            if not any(t["name"] == name for t in tools):
+                tools.append(tool(name, kind))
+    else:
+        for pattern in SEPARATE_PATTERNS[kind]:
+            for name, _ in re.findall(pattern, text):
+                if any(keyword in name.lower() for keyword in ["read", "write", "list", "create", "delete", "search"]):
+                    tools.append(tool(name, kind))
+    return tools
+
+
+def single_pass(kind: str, document: str) -> list:
+    """Extract tools with the combined scanner."""
+    return [tool(candidate.name, kind) for candidate in SCANNERS[kind](document.lower())]
+
+
+def measure(func, repeat: int) -> dict:
+    """Run func repeatedly and return timing statistics in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+    }
+
+
+def run(size_kib: int, repeat: int) -> dict:
+    results = {"size_kib": size_kib}
+    for kind in SCANNERS:
+        document = make_document(kind, size_kib * 1024)
+        separate = separate_patterns(kind, document)
+        combined = single_pass(kind, document)
+        # The scanners report each tool once, but must find the same tools
+        assert {t["name"] for t in separate} == {t["name"] for t in combined}, kind
+        results[kind] = {
+            "separate_patterns": measure(lambda: separate_patterns(kind, document), repeat),
+            "single_pass": measure(lambda: single_pass(kind, document), repeat),
+            "tools_found": {
+                "separate_patterns": len(separate),
+                "single_pass": len(combined),
+            },
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-kib", type=int, default=1024, help="Size of each README in KiB")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per measurement")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.size_kib, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
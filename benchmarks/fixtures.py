@@ -0,0 +1,185 @@
+"""
+Synthetic environments for the benchmark suite.
+
+Builds a fake home directory holding ~/.claude.json, the Docker Desktop
+registry.yaml and mcp-manager's server_catalog.json for a given number of
+servers, plus a bin directory of stub claude/docker/npx/npm executables
+whose answers agree with those files.
+"""
+
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from bench_registry import write_registry
+
+STUB_PROGRAMS = ("claude", "docker", "npx", "npm")
+
+# Tools reported per synthetic server
+TOOLS_PER_SERVER = 3
+
+# PATH before any stub directory was prepended
+_BASE_PATH = os.environ.get("PATH", "")
+
+
+@dataclass
+class ServerMix:
+    """Names of the synthetic servers by type."""
+
+    npm: List[str] = field(default_factory=list)
+    docker: List[str] = field(default_factory=list)
+    docker_desktop: List[str] = field(default_factory=list)
+
+    @classmethod
+    def for_size(cls, servers: int) -> "ServerMix":
+        """Split servers 60/20/20 between NPM, Docker and Docker Desktop."""
+        desktop = max(1, servers // 5)
+        docker = max(1, servers // 5)
+        npm = max(1, servers - desktop - docker)
+        return cls(
+            npm=[f"npm-{index:04d}" for index in range(npm)],
+            docker=[f"docker-{index:04d}" for index in range(docker)],
+            docker_desktop=[f"server-{index:04d}" for index in range(desktop)],
+        )
+
+    def claude_servers(self) -> Dict[str, Dict[str, object]]:
+        """Server definitions as Claude Code stores them."""
+        servers: Dict[str, Dict[str, object]] = {}
+        for name in self.npm:
+            servers[name] = {"command": "npx", "args": ["-y", f"@bench/{name}"]}
+        for name in self.docker:
+            servers[name] = {"command": "docker", "args": ["run", "-i", "--rm", f"mcp/{name}"]}
+        servers["docker-gateway"] = {
+            "command": "docker",
+            "args": ["mcp", "gateway", "run", "--servers", ",".join(self.docker_desktop)],
+        }
+        return servers
+
+
+def write_claude_json(path: Path, mix: ServerMix, project_dir: Path):
+    """Write a ~/.claude.json with user servers and a project entry."""
+    data = {
+        "numStartups": 42,
+        "mcpServers": mix.claude_servers(),
+        "projects": {
+            str(project_dir): {
+                "allowedTools": [],
+                "history": [{"display": f"prompt {index}", "pastedContents": {}} for index in range(50)],
+                "mcpServers": {},
+            }
+        },
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def write_catalog(path: Path, mix: ServerMix):
+    """Write server_catalog.json with every server, a tenth of them disabled."""
+    installed_at = datetime(2025, 1, 1).isoformat()
+    servers = {}
+    typed = [(name, "npm") for name in mix.npm] + [(name, "docker") for name in mix.docker] + [
+        (name, "docker-desktop") for name in mix.docker_desktop
+    ]
+    for index, (name, server_type) in enumerate(typed):
+        servers[name] = {
+            "type": server_type,
+            "enabled": index % 10 != 0,
+            "installed_at": installed_at,
+        }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"servers": servers}, indent=2))
+
+
+def stub_rules(mix: ServerMix) -> List[Dict[str, object]]:
+    """Answers for the stub executables, most specific first."""
+    servers = mix.claude_servers()
+    mcp_list = "".join(
+        f"{name}: {config['command']} {' '.join(config['args'])}\n" for name, config in servers.items()
+    )
+    catalog = "".join(f"{name}: Synthetic server {name}\n" for name in mix.docker_desktop)
+    verbose = "".join(f"- gateway:   > {name}: ({TOOLS_PER_SERVER} tools)\n" for name in mix.docker_desktop)
+    tools_json = json.dumps([
+        {"name": f"{name}_tool_{index}", "description": f"Tool {index} of {name}"}
+        for name in mix.docker_desktop
+        for index in range(TOOLS_PER_SERVER)
+    ])
+    npm_info = json.dumps({"name": "@bench/package", "version": "1.0.0", "description": "Synthetic MCP server"})
+
+    return [
+        {"argv": ["claude", "--version"], "stdout": "1.0.0 (Claude Code)\n"},
+        {"argv": ["claude", "mcp", "list"], "stdout": mcp_list},
+        {"argv": ["docker", "--version"], "stdout": "Docker version 27.0.0, build bench\n"},
+        {"argv": ["docker", "mcp", "server", "list"], "stdout": ",".join(mix.docker_desktop) + "\n"},
+        {"argv": ["docker", "mcp", "catalog", "show"], "stdout": catalog},
+        {"argv": ["docker", "mcp", "tools", "list", "--verbose", "--format", "json"], "stdout": tools_json},
+        {"argv": ["docker", "mcp", "tools", "list", "--verbose"], "stderr": verbose},
+        {"argv": ["docker", "run", "-i", "--rm", "mcp/*"], "mcp_tools": TOOLS_PER_SERVER},
+        {"argv": ["npm", "info", "*"], "stdout": npm_info},
+        {"argv": ["npm", "--version"], "stdout": "10.0.0\n"},
+        {"argv": ["npx", "--version"], "stdout": "10.0.0\n"},
+        {"argv": ["npx", "@bench/*", "--help"], "stdout": "Usage: server [options]\n"},
+        {"argv": ["npx", "-y", "@bench/*"], "mcp_tools": TOOLS_PER_SERVER},
+    ]
+
+
+def install_stubs(bin_dir: Path, rules_file: Path, rules: List[Dict[str, object]]):
+    """Write the rules file and a wrapper script per stub program."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    rules_file.write_text(json.dumps(rules))
+    benchmarks_dir = Path(__file__).resolve().parent
+    for program in STUB_PROGRAMS:
+        wrapper = bin_dir / program
+        wrapper.write_text(
+            f"#!{sys.executable} -S\n"
+            f"import sys\n"
+            f"sys.path.insert(0, {str(benchmarks_dir)!r})\n"
+            f"import stub_bin\n"
+            f"stub_bin.main()\n"
+        )
+        wrapper.chmod(0o755)
+
+
+@dataclass
+class Environment:
+    """A synthetic home, project and stub PATH for one server count."""
+
+    root: Path
+    servers: int
+    mix: ServerMix = field(init=False)
+
+    def __post_init__(self):
+        self.mix = ServerMix.for_size(self.servers)
+
+    @property
+    def home(self) -> Path:
+        return self.root / "home"
+
+    @property
+    def project(self) -> Path:
+        return self.root / "project"
+
+    @property
+    def bin_dir(self) -> Path:
+        return self.root / "bin"
+
+    def build(self) -> "Environment":
+        """Write all files for this environment."""
+        self.project.mkdir(parents=True, exist_ok=True)
+        (self.home / ".docker" / "mcp").mkdir(parents=True, exist_ok=True)
+        write_claude_json(self.home / ".claude.json", self.mix, self.project)
+        write_registry(self.home / ".docker" / "mcp" / "registry.yaml", len(self.mix.docker_desktop))
+        write_catalog(self.home / ".config" / "mcp-manager" / "server_catalog.json", self.mix)
+        install_stubs(self.bin_dir, self.root / "rules.json", stub_rules(self.mix))
+        return self
+
+    def activate(self, latency_ms: float, padding_bytes: int):
+        """Point HOME, PATH and the stub settings of this process at the environment."""
+        os.environ["HOME"] = str(self.home)
+        os.environ["PATH"] = f"{self.bin_dir}{os.pathsep}{_BASE_PATH}"
+        os.environ["MCP_BENCH_RULES"] = str(self.root / "rules.json")
+        os.environ["MCP_BENCH_LATENCY_MS"] = str(latency_ms)
+        os.environ["MCP_BENCH_PADDING_BYTES"] = str(padding_bytes)
+        os.chdir(self.project)
@@ -0,0 +1,284 @@
+"""
+Local stand-in for the npm and Docker Hub APIs used by discovery.
+
+Serves deterministic synthetic results for:
+
+    GET /-/v1/search?text=&size=&from=           npm registry search
+    GET /v2/repositories/<org>/?page_size=&page=  Docker Hub repository listing
+    GET /v2/repositories/<org>/<repo>/            Docker Hub repository details
+    GET /v1/search?q=&n=&page=                    Docker Index search
+
+with configurable latency, result set size, page size and injected errors.
+Point mcp-manager at it through the discovery settings:
+
+    [discovery]
+    npm_registry = "http://127.0.0.1:8765"
+    docker_hub_url = "http://127.0.0.1:8765"
+    docker_index_url = "http://127.0.0.1:8765"
+
+Usage:
+    python benchmarks/registry_server.py [--port 8765] [--latency-ms 50]
+        [--packages 500] [--repositories 200] [--page-size 25] [--fail-every 0]
+"""
+
+import argparse
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+# Organizations ServerDiscovery lists on Docker Hub
+ORGANIZATIONS = ("modelcontextprotocol", "anthropics", "mcp-docker", "mcp-server")
+
+# Terms present in every synthetic entry, so they match everything
+UNIVERSAL_TERMS = {"mcp", "server", "model", "context", "protocol"}
+
+
+@dataclass
+class FixtureSettings:
+    """Behaviour of the fixture server."""
+
+    latency_ms: float = 0.0
+    packages: int = 500
+    repositories: int = 200
+    page_size: int = 25
+    max_page_size: int = 250
+    # Answer every Nth request with error_status; 0 disables errors
+    fail_every: int = 0
+    error_status: int = 503
+
+
+def npm_package(index: int) -> Dict[str, Any]:
+    name = f"@bench/mcp-server-{index:04d}"
+    return {
+        "package": {
+            "name": name,
+            "version": f"1.{index % 10}.0",
+            "description": f"Model Context Protocol server number {index} for benchmarks",
+            "keywords": ["mcp", "model-context-protocol", f"topic-{index % 20}"],
+            "date": "2025-01-01T00:00:00.000Z",
+            "links": {"npm": f"https://www.npmjs.com/package/{name}"},
+            "author": {"name": "bench"},
+            "publisher": {"username": "bench"},
+        },
+        "score": {"final": 0.5, "detail": {"quality": 0.5, "popularity": (index % 100) / 100, "maintenance": 0.5}},
+        "searchScore": 1.0,
+        "downloads": {"monthly": index * 400, "weekly": index * 100},
+    }
+
+
+def docker_repository(org: str, index: int) -> Dict[str, Any]:
+    return {
+        "name": f"mcp-server-{index:04d}",
+        "namespace": org,
+        "short_description": f"MCP server number {index} for benchmarks",
+        "pull_count": index * 100,
+        "star_count": index % 50,
+        "last_updated": "2025-01-01T00:00:00.000000Z",
+    }
+
+
+def matches(query: str, *fields: str) -> bool:
+    """Whether every specific term of the query appears in one of the fields."""
+    terms = [term for term in query.lower().replace("/", " ").replace("@", " ").split() if term not in UNIVERSAL_TERMS]
+    text = " ".join(fields).lower()
+    return all(term in text for term in terms)
+
+
+class RegistryHandler(BaseHTTPRequestHandler):
+    """Route GET requests to the emulated endpoints."""
+
+    server: "RegistryFixtureServer"
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+    def do_GET(self):
+        fixture = self.server
+        settings = fixture.settings
+        count = fixture.count_request()
+
+        if settings.latency_ms:
+            time.sleep(settings.latency_ms / 1000)
+
+        if settings.fail_every and count % settings.fail_every == 0:
+            self.send_json(settings.error_status, {"message": "injected failure"})
+            return
+
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["-", "v1", "search"]:
+            self.send_json(200, self.npm_search(params))
+        elif parts == ["v1", "search"]:
+            self.send_json(200, self.index_search(params))
+        elif len(parts) == 3 and parts[:2] == ["v2", "repositories"]:
+            self.send_json(200, self.repository_list(parts[2], params))
+        elif len(parts) == 4 and parts[:2] == ["v2", "repositories"]:
+            detail = self.repository_detail(parts[2], parts[3])
+            self.send_json(200 if detail else 404, detail or {"message": "not found"})
+        else:
+            self.send_json(404, {"message": "not found"})
+
+    def send_json(self, status: int, body: Dict[str, Any]):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def page(self, params: Dict[str, str], size_key: str) -> Tuple[int, int]:
+        """Return the requested page (1-based) and page size."""
+        settings = self.server.settings
+        size = min(int(params.get(size_key, settings.page_size)), settings.max_page_size)
+        page = max(1, int(params.get("page", 1)))
+        return page, max(1, size)
+
+    def page_url(self, params: Dict[str, str], page: int) -> str:
+        host, port = self.server.server_address[:2]
+        path = urlsplit(self.path).path
+        return f"http://{host}:{port}{path}?{urlencode({**params, 'page': page})}"
+
+    def npm_search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        settings = self.server.settings
+        text = params.get("text", "")
+        size = min(int(params.get("size", 20)), settings.max_page_size)
+        offset = int(params.get("from", 0))
+        found = [npm_package(index) for index in range(settings.packages)]
+        found = [item for item in found if matches(text, item["package"]["name"], item["package"]["description"])]
+        return {"objects": found[offset:offset + size], "total": len(found), "time": "Wed Jan 01 2025"}
+
+    def repository_list(self, org: str, params: Dict[str, str]) -> Dict[str, Any]:
+        settings = self.server.settings
+        page, size = self.page(params, "page_size")
+        total = settings.repositories if org in ORGANIZATIONS else 0
+        start = (page - 1) * size
+        results = [docker_repository(org, index) for index in range(start, min(start + size, total))]
+        return {
+            "count": total,
+            "next": self.page_url(params, page + 1) if start + size < total else None,
+            "previous": self.page_url(params, page - 1) if page > 1 else None,
+            "results": results,
+        }
+
+    def repository_detail(self, org: str, repo: str) -> Optional[Dict[str, Any]]:
+        settings = self.server.settings
+        for index in range(settings.repositories):
+            entry = docker_repository(org, index)
+            if entry["name"] == repo:
+                return {
+                    **entry,
+                    "description": entry["short_description"],
+                    "full_description": f"# {repo}\n\nTools: read_file, write_file, search",
+                }
+        return None
+
+    def index_search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        settings = self.server.settings
+        query = params.get("q", "")
+        page, size = self.page(params, "n")
+        found = [
+            {
+                "name": f"{entry['namespace']}/{entry['name']}",
+                "description": entry["short_description"],
+                "star_count": entry["star_count"],
+                "pull_count": entry["pull_count"],
+                "is_official": False,
+                "is_automated": False,
+            }
+            for org in ORGANIZATIONS
+            for entry in (docker_repository(org, index) for index in range(settings.repositories))
+        ]
+        found = [item for item in found if matches(query, item["name"], item["description"])]
+        start = (page - 1) * size
+        return {
+            "query": query,
+            "num_results": len(found),
+            "num_pages": (len(found) + size - 1) // size,
+            "page": page,
+            "page_size": size,
+            "results": found[start:start + size],
+        }
+
+
+class RegistryFixtureServer(ThreadingHTTPServer):
+    """Threaded fixture server, usable as a context manager running in the background."""
+
+    daemon_threads = True
+
+    def __init__(self, settings: Optional[FixtureSettings] = None, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), RegistryHandler)
+        self.settings = settings or FixtureSettings()
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_request(self) -> int:
+        """Count a request and return its 1-based sequence number."""
+        with self._requests_lock:
+            self.requests += 1
+            return self.requests
+
+    def __enter__(self) -> "RegistryFixtureServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="registry-fixture", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+def configure_discovery(config: Any, url: str):
+    """Point a Config's discovery endpoints at the fixture server."""
+    config.discovery.npm_registry = url
+    config.discovery.docker_hub_url = url
+    config.discovery.docker_index_url = url
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before each response")
+    parser.add_argument("--packages", type=int, default=500, help="Packages in the npm index")
+    parser.add_argument("--repositories", type=int, default=200, help="Docker repositories per organization")
+    parser.add_argument("--page-size", type=int, default=25, help="Default Docker Hub page size")
+    parser.add_argument("--fail-every", type=int, default=0, help="Fail every Nth request (0 disables)")
+    parser.add_argument("--error-status", type=int, default=503, help="Status of injected failures")
+    args = parser.parse_args()
+
+    settings = FixtureSettings(
+        latency_ms=args.latency_ms,
+        packages=args.packages,
+        repositories=args.repositories,
+        page_size=args.page_size,
+        fail_every=args.fail_every,
+        error_status=args.error_status,
+    )
+    server = RegistryFixtureServer(settings, args.host, args.port)
+    print(f"Serving registry fixtures on {server.url}")
+    for variable in ("NPM_REGISTRY", "DOCKER_HUB_URL", "DOCKER_INDEX_URL"):
+        print(f"  export MCP_MANAGER_DISCOVERY__{variable}={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+End-to-end benchmark suite for MCP Manager.
+
+Times the main manager operations against synthetic environments of
+10/100/1,000 servers, with stub claude/docker/npx/npm executables on PATH
+instead of Claude Code and Docker Desktop, and the local registry fixture
+server in place of npm and Docker Hub. Results are written as JSON, and
+--baseline compares them with an earlier run.
+
+Usage:
+    python benchmarks/run_suite.py [--sizes 10,100,1000] [--latency-ms 5]
+        [--padding-bytes 0] [--http-latency-ms 20] [--repeat 3]
+        [--operations list_servers,...]
+        [--output FILE] [--baseline FILE] [--threshold 1.25] [--micro]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from fixtures import Environment
+from registry_server import FixtureSettings, RegistryFixtureServer, configure_discovery
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Operations sampled once per size however large --repeat is; both probe
+# every server, so at 1,000 servers a sample takes minutes
+SLOW_OPERATIONS = {"check_sync_status", "_test_all_servers"}
+
+OPERATIONS = [
+    "list_servers", "check_sync_status", "detect_changes", "discover_servers",
+    "discover_servers_cached", "discover_concurrent", "_test_all_servers",
+]
+
+# Queries issued together by discover_concurrent
+CONCURRENT_QUERIES = ["filesystem", "github", "postgres", "slack", "browser", "memory", "search", "fetch"]
+
+
+def operations() -> Dict[str, Callable[[], object]]:
+    """Benchmarked operations, imported after the environment is active."""
+    from mcp_manager.core.change_detector import ChangeDetector
+    from mcp_manager.core.discovery import ServerDiscovery
+    from mcp_manager.core.simple_manager import SimpleMCPManager
+
+    manager = SimpleMCPManager()
+    detector = ChangeDetector(catalog_manager=manager)
+    discovery = ServerDiscovery()
+
+    async def discover_concurrent():
+        await asyncio.gather(*(
+            discovery.discover_servers(query=query, use_cache=False) for query in CONCURRENT_QUERIES
+        ))
+
+    return {
+        "list_servers": lambda: asyncio.run(manager.list_servers()),
+        "check_sync_status": lambda: asyncio.run(manager.check_sync_status()),
+        "detect_changes": lambda: asyncio.run(detector.detect_changes()),
+        "discover_servers": lambda: asyncio.run(discovery.discover_servers(use_cache=False)),
+        "discover_servers_cached": lambda: asyncio.run(discovery.discover_servers()),
+        "discover_concurrent": lambda: asyncio.run(discover_concurrent()),
+        "_test_all_servers": lambda: asyncio.run(manager._test_all_servers()),
+    }
+
+
+def measure(func: Callable[[], object], repeat: int, warmup: bool = True) -> dict:
+    """Time func and count the subprocesses one traced run starts."""
+    from mcp_manager.utils.tracing import get_tracer
+
+    tracer = get_tracer()
+    samples = []
+    # Tool discovery prints progress to stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        if warmup:
+            func()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+
+        tracer.start()
+        try:
+            func()
+        finally:
+            tracer.stop()
+    spans = tracer.spans()
+
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "samples": len(samples),
+        "subprocess_calls": sum(1 for span in spans if span.category == "subprocess"),
+        "http_requests": sum(1 for span in spans if span.category == "http"),
+        "file_parses": sum(1 for span in spans if span.category == "parse"),
+    }
+
+
+def stub_overhead(repeat: int) -> float:
+    """Median milliseconds for one stub invocation, the floor of every subprocess call."""
+    samples = []
+    for _ in range(max(repeat, 5)):
+        started = time.perf_counter()
+        subprocess.run(["claude", "--version"], capture_output=True, check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=Path(__file__).resolve().parent,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run(sizes: List[int], selected: List[str], repeat: int, latency_ms: float,
+        padding_bytes: int, http_latency_ms: float, micro: bool) -> dict:
+    from mcp_manager.utils.config import get_config
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency_ms": latency_ms,
+            "padding_bytes": padding_bytes,
+            "http_latency_ms": http_latency_ms,
+            "repeat": repeat,
+        },
+        "sizes": {},
+    }
+    cwd = os.getcwd()
+
+    try:
+        for size in sizes:
+            settings = FixtureSettings(latency_ms=http_latency_ms, packages=size, repositories=max(1, size // 4))
+            with RegistryFixtureServer(settings) as registry, \
+                    tempfile.TemporaryDirectory(prefix=f"mcp-bench-{size}-") as tmp:
+                configure_discovery(get_config(), registry.url)
+                env = Environment(Path(tmp), size).build()
+                env.activate(latency_ms, padding_bytes)
+                results["meta"].setdefault("stub_overhead_ms", stub_overhead(repeat))
+
+                size_results = {}
+                for name, func in operations().items():
+                    if name not in selected:
+                        continue
+                    slow = name in SLOW_OPERATIONS
+                    size_results[name] = measure(func, 1 if slow else repeat, warmup=not slow)
+                    print(f"{size:>6} servers  {name:<24} {size_results[name]['median_ms']:>10.1f} ms",
+                          file=sys.stderr)
+                results["sizes"][str(size)] = size_results
+    finally:
+        os.chdir(cwd)
+
+    if micro:
+        import bench_registry
+        import bench_server_records
+        import bench_tool_extraction
+
+        results["micro"] = {
+            "registry": bench_registry.run(1000, 20),
+            "server_records": bench_server_records.run(10000, 5),
+            "tool_extraction": bench_tool_extraction.run(1024, 5),
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Describe operations whose median grew by more than threshold."""
+    regressions = []
+    for size, size_results in results["sizes"].items():
+        for name, stats in size_results.items():
+            previous = baseline.get("sizes", {}).get(size, {}).get(name)
+            if not previous or not previous["median_ms"]:
+                continue
+            ratio = stats["median_ms"] / previous["median_ms"]
+            line = (f"{size:>6} servers  {name:<24} {previous['median_ms']:>10.1f} -> "
+                    f"{stats['median_ms']:>10.1f} ms  x{ratio:.2f}")
+            print(line, file=sys.stderr)
+            if ratio > threshold:
+                regressions.append(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated server counts")
+    parser.add_argument("--operations", default=",".join(OPERATIONS), help="Comma-separated operations to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per measurement")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Added latency of each stub call")
+    parser.add_argument("--padding-bytes", type=int, default=0, help="Extra stdout bytes per stub call")
+    parser.add_argument("--http-latency-ms", type=float, default=20.0,
+                        help="Latency of each registry fixture response")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/<time>.json)")
+    parser.add_argument("--baseline", type=Path, help="Earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Median ratio over the baseline reported as a regression")
+    parser.add_argument("--micro", action="store_true",
+                        help="Also run the registry, server record and tool extraction micro-benchmarks")
+    args = parser.parse_args()
+
+    results = run(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        selected=args.operations.split(","),
+        repeat=args.repeat,
+        latency_ms=args.latency_ms,
+        padding_bytes=args.padding_bytes,
+        http_latency_ms=args.http_latency_ms,
+        micro=args.micro,
+    )
+
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        stamp = results["meta"]["timestamp"].replace(":", "").replace("+0000", "Z")
+        output = RESULTS_DIR / f"{stamp}-{results['meta']['commit'] or 'unknown'}.json"
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Results written to {output}", file=sys.stderr)
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} operations slower than x{args.threshold}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
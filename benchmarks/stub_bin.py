@@ -0,0 +1,89 @@
+"""
+Stand-in for the claude, docker, npx and npm executables.
+
+Installed on PATH by fixtures.install_stubs as small wrapper scripts. Each
+invocation sleeps for MCP_BENCH_LATENCY_MS, then answers from the first
+rule in the MCP_BENCH_RULES file whose argv patterns match. Rules look like:
+
+    {"argv": ["claude", "mcp", "list"], "stdout": "...", "returncode": 0}
+
+Patterns are fnmatch globs matched against the leading arguments, with the
+program reduced to its basename. A rule with "mcp_tools" acts as an MCP
+server: it reads one JSON-RPC request from stdin and answers tools/list
+with that many tools. Unmatched commands succeed with no output.
+MCP_BENCH_PADDING_BYTES appends that many newlines to stdout, which all of
+mcp-manager's parsers ignore, to model chattier real binaries.
+
+Only the standard library is used so the wrappers can run with ``python -S``.
+"""
+
+import fnmatch
+import json
+import os
+import sys
+import time
+
+
+def load_rules() -> list:
+    path = os.environ.get("MCP_BENCH_RULES")
+    if not path:
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def match(rules: list, argv: list):
+    """Return the first rule whose patterns match the start of argv."""
+    for rule in rules:
+        patterns = rule["argv"]
+        if len(patterns) > len(argv):
+            continue
+        if all(fnmatch.fnmatchcase(arg, pattern) for arg, pattern in zip(argv, patterns)):
+            return rule
+    return None
+
+
+def mcp_response(tools: int) -> str:
+    """Answer a single tools/list request read from stdin."""
+    line = sys.stdin.readline()
+    try:
+        request_id = json.loads(line).get("id", 1)
+    except ValueError:
+        request_id = 1
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {
+            "tools": [
+                {
+                    "name": f"tool_{index}",
+                    "description": f"Synthetic tool {index}",
+                    "inputSchema": {"type": "object", "properties": {"path": {"type": "string"}}},
+                }
+                for index in range(tools)
+            ]
+        },
+    }) + "\n"
+
+
+def main():
+    argv = [os.path.basename(sys.argv[0])] + sys.argv[1:]
+
+    latency_ms = float(os.environ.get("MCP_BENCH_LATENCY_MS", "0"))
+    if latency_ms:
+        time.sleep(latency_ms / 1000)
+
+    rule = match(load_rules(), argv) or {}
+    if "mcp_tools" in rule:
+        stdout = mcp_response(rule["mcp_tools"])
+    else:
+        stdout = rule.get("stdout", "")
+
+    stdout += "\n" * int(os.environ.get("MCP_BENCH_PADDING_BYTES", "0"))
+    sys.stdout.write(stdout)
+    sys.stderr.write(rule.get("stderr", ""))
+    sys.exit(rule.get("returncode", 0))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ rich help formatting and professional command structure.
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional
@@ -18,13 +19,18 @@ from rich.text import Text
 from mcp_manager import __version__
 from mcp_manager.core.discovery import ServerDiscovery
 from mcp_manager.core.exceptions import MCPManagerError
+from mcp_manager.core.install_index import generate_install_id
 from mcp_manager.core.simple_manager import SimpleMCPManager
-from mcp_manager.core.models import ServerScope, ServerType
-from mcp_manager.core.change_detector import detect_external_changes, ChangeDetector
-from mcp_manager.core.background_monitor import BackgroundMonitor
+from mcp_manager.core.models import Server, ServerScope, ServerType
+from mcp_manager.core.auto_sync import AutoSyncPlanner
+from mcp_manager.core.change_detector import detect_external_changes, ChangeDetector, DetectedChange
+from mcp_manager.core.background_monitor import MonitorDaemon, load_saved_state
+from mcp_manager.core.monitor_ipc import call_daemon, get_socket_path
+from mcp_manager.core.parsers.claude_json import load_claude_mcp_sections
 from mcp_manager.utils.config import get_config
 from mcp_manager.utils.logging import setup_logging
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import get_tracer, span
 from mcp_manager.cli import enhanced_commands
 
 console = Console()
@@ -55,18 +61,6 @@ class CLIContext:
 cli_context = CLIContext()
 
 
-def _generate_install_id(result) -> str:
-    """Generate consistent install ID for a discovery result."""
-    if result.server_type == ServerType.NPM:
-        return result.package.replace("@", "").replace("/", "-").replace("server-", "")
-    elif result.server_type == ServerType.DOCKER:
-        return result.package.replace("/", "-")
-    elif result.server_type == ServerType.DOCKER_DESKTOP:
-        return f"dd-{result.name.replace('docker-desktop-', '')}"
-    else:
-        return result.name
-
-
 def _prompt_for_server_configuration(server_name: str, server_type: ServerType, package: Optional[str]) -> Optional[dict]:
     """Prompt user for server configuration if needed."""
     from rich.prompt import Prompt
@@ -331,7 +325,7 @@ async def _show_discovery_for_next_install(discovery):
         # Add rows for each result
         for result in results:
             # Generate install ID using same logic as discover command
-            install_id = _generate_install_id(result)
+            install_id = generate_install_id(result)
             
             # Create simple install command
             install_cmd = f"mcp-manager install-package {install_id}"
@@ -376,6 +370,23 @@ def handle_errors(func):
     return wrapper
 
 
+def _start_tracing(ctx: click.Context, trace_file: Optional[Path]) -> None:
+    """Trace the rest of the command and report spans when it finishes."""
+    tracer = get_tracer()
+    tracer.start()
+    
+    def report() -> None:
+        tracer.stop()
+        click.echo(tracer.summary(), err=True)
+        if trace_file:
+            tracer.export_chrome_trace(trace_file)
+            click.echo(f"Trace written to {trace_file}", err=True)
+    
+    # Resources close in reverse order, so the root span ends before the report
+    ctx.call_on_close(report)
+    ctx.with_resource(span(f"mcp-manager {ctx.invoked_subcommand or 'menu'}", "cli"))
+
+
 @click.group(name="mcp-manager", invoke_without_command=True)
 @click.version_option(__version__)
 @click.option(
@@ -398,8 +409,19 @@ def handle_errors(func):
     is_flag=True,
     help="Launch interactive menu (default when no command given)"
 )
+@click.option(
+    "--trace",
+    is_flag=True,
+    help="Print a timing breakdown of external calls when the command finishes"
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write spans as Chrome trace-event JSON (implies --trace)"
+)
 @click.pass_context
-def cli(ctx: click.Context, debug: bool, verbose: bool, config_dir: Optional[Path], menu: bool):
+def cli(ctx: click.Context, debug: bool, verbose: bool, config_dir: Optional[Path], menu: bool,
+        trace: bool, trace_file: Optional[Path]) -> None:
     """
     Enterprise-grade MCP server management tool.
     
@@ -410,6 +432,9 @@ def cli(ctx: click.Context, debug: bool, verbose: bool, config_dir: Optional[Pat
     # Ensure context object exists
     ctx.ensure_object(dict)
     
+    if trace or trace_file:
+        _start_tracing(ctx, trace_file)
+    
     # Setup logging
     config = get_config()
     
@@ -457,13 +482,16 @@ def cli(ctx: click.Context, debug: bool, verbose: bool, config_dir: Optional[Pat
 @handle_errors
 def list_cmd(scope: Optional[str], output_format: str):
     """List configured MCP servers."""
-    manager = cli_context.get_manager()
-    
     # Parse scope
     scope_filter = ServerScope(scope) if scope else None
     
-    # Get servers
-    servers = asyncio.run(manager.list_servers())
+    # Answer from a running monitor daemon when possible
+    cached = call_daemon("list_servers", {"cwd": os.getcwd()})
+    if cached is not None:
+        servers = [Server(**data) for data in cached]
+    else:
+        manager = cli_context.get_manager()
+        servers = asyncio.run(manager.list_servers())
     
     if output_format == "json":
         import json
@@ -688,7 +716,7 @@ def discover(query: Optional[str], server_type: Optional[str], limit: int, updat
     
     for result in results:
         # Create unique install ID - use same logic as in install-package command
-        install_id = _generate_install_id(result)
+        install_id = generate_install_id(result)
         
         # Create simple install command
         install_cmd = f"mcp-manager install-package {install_id}"
@@ -718,35 +746,7 @@ def install_package(install_id: str):
     
     # Resolve install ID back to package info
     async def find_and_install():
-        # Try to extract search terms from install_id to improve discovery
-        search_query = None
-        if install_id.startswith("dd-"):
-            # Docker Desktop server - extract server name
-            search_query = install_id[3:]  # Remove 'dd-' prefix
-        elif "-" in install_id:
-            # Extract likely server name from install_id
-            search_query = install_id.split("-")[-1]  # Take last part
-            
-        # Search with higher limits to ensure we find all servers
-        # Try with query first, then without query as fallback
-        target_result = None
-        
-        for query_attempt in [search_query, None]:
-            results = await discovery.discover_servers(
-                query=query_attempt, 
-                limit=200  # Higher limit to ensure we find all servers
-            )
-            
-            for result in results:
-                # Generate install_id using same logic as discover command
-                result_id = _generate_install_id(result)
-                
-                if result_id == install_id:
-                    target_result = result
-                    break
-            
-            if target_result:
-                break
+        target_result = await discovery.resolve_install_id(install_id)
         
         if not target_result:
             console.print(f"[red]✗[/red] Install ID '{install_id}' not found")
@@ -848,10 +848,11 @@ def install(name: str):
     
     # Search for the server
     async def find_and_install():
-        results = await discovery.discover_servers(query=name, limit=10)
-        
-        # Find exact match or best match
-        exact_match = next((r for r in results if r.name == name), None)
+        # Servers shown by an earlier discovery need no search
+        exact_match = discovery.install_index.find_by_name(name)
+        if not exact_match:
+            results = await discovery.discover_servers(query=name, limit=10)
+            exact_match = next((r for r in results if r.name == name), None)
         if not exact_match:
             # Try partial match
             partial_matches = [r for r in results if name.lower() in r.name.lower()]
@@ -1133,10 +1134,9 @@ async def _cleanup_impl(dry_run: bool, no_backup: bool):
         shutil.copy2(claude_config, backup_path)
         console.print(f"✅ Created backup: {backup_path}")
     
-    # Load and analyze configuration
+    # Analyze only the server sections; project history is skipped
     try:
-        with open(claude_config) as f:
-            config = json.load(f)
+        config = load_claude_mcp_sections(claude_config)
     except json.JSONDecodeError as e:
         console.print(f"[red]Error reading Claude configuration: {e}[/red]")
         return
@@ -1184,6 +1184,14 @@ async def _cleanup_impl(dry_run: bool, no_backup: bool):
     if projects_to_clean:
         console.print(f"\n[blue]🔧 Cleaning up configurations...[/blue]")
         
+        # Rewriting needs the full document
+        try:
+            with open(claude_config) as f:
+                config = json.load(f)
+        except json.JSONDecodeError as e:
+            console.print(f"[red]Error reading Claude configuration: {e}[/red]")
+            return
+        
         for project_path, servers_to_remove in projects_to_clean.items():
             for server_name in servers_to_remove:
                 del config["projectConfigs"][project_path]["mcpServers"][server_name]
@@ -1720,88 +1728,38 @@ async def _sync_external_impl(dry_run: bool, auto_apply: bool):
     
     console.print("[blue]🔄 Applying synchronization changes...[/blue]")
     
+    results = await AutoSyncPlanner(manager).apply(changes)
+    
     success_count = 0
     error_count = 0
+    skipped_count = 0
     
-    for change in changes:
-        try:
-            change_desc = f"{change.change_type.value} {change.server_name}"
-            
-            if change.change_type.value == 'server_added':
-                # Add server to catalog based on external configuration
-                server_info = change.details.get('server_info', {})
-                command = server_info.get('command', '')
-                args = server_info.get('args', [])
-                env = server_info.get('env', {})
-                
-                # Simple server type detection - don't overthink it
-                if command == 'npx':
-                    server_type = ServerType.NPM
-                elif command.endswith('/docker') or command == 'docker':
-                    server_type = ServerType.CUSTOM  # Let Claude handle Docker servers
-                else:
-                    server_type = ServerType.CUSTOM
-                
-                try:
-                    await manager.add_server(
-                        name=change.server_name,
-                        server_type=server_type,
-                        command=command,
-                        args=args,
-                        env=env,
-                        scope=ServerScope.USER
-                    )
-                    console.print(f"  ✅ Added server: {change.server_name}")
-                except Exception as e:
-                    # If server already exists in Claude, just add to catalog
-                    if "already exists" in str(e).lower():
-                        catalog = await manager._get_server_catalog()
-                        servers = catalog.setdefault('servers', {})
-                        servers[change.server_name] = {
-                            'name': change.server_name,
-                            'type': server_type.value,
-                            'command': command,
-                            'args': args,
-                            'env': env,
-                            'enabled': True,
-                            'scope': 'user'
-                        }
-                        await manager._save_server_catalog(catalog)
-                        console.print(f"  ✅ Synced server to catalog: {change.server_name}")
-                    else:
-                        raise
-                
-            elif change.change_type.value == 'server_removed':
-                # For servers that don't exist externally, remove from catalog directly
-                # This handles cases where servers were removed externally and we need to sync our catalog
-                try:
-                    # First try regular removal (works if server exists in Claude)
-                    await manager.remove_server(change.server_name)
-                    console.print(f"  ➖ Removed server: {change.server_name}")
-                except Exception as e:
-                    # If regular removal fails, remove from catalog directly
-                    logger.debug(f"Regular removal failed: {e}, removing from catalog directly")
-                    catalog = await manager._get_server_catalog()
-                    servers = catalog.get('servers', {})
-                    if change.server_name in servers:
-                        del servers[change.server_name]
-                        await manager._save_server_catalog(catalog)
-                        console.print(f"  ➖ Removed server from catalog: {change.server_name}")
-                    else:
-                        raise
-                
-            elif change.change_type.value in ['server_enabled', 'server_disabled']:
-                enabled = change.change_type.value == 'server_enabled'
-                # Update server status in catalog
-                await manager._update_server_status(change.server_name, enabled)
-                status = "enabled" if enabled else "disabled"
-                console.print(f"  🔄 {change.server_name}: {status}")
-                
-            success_count += 1
-            
-        except Exception as e:
-            console.print(f"  ❌ Failed to apply change for {change.server_name}: {e}")
+    for result in results:
+        if result.skipped:
+            console.print(f"  ⏭️ Skipped {result.change_type} for {result.server_name}: {result.error}")
+            skipped_count += 1
+            continue
+        
+        if not result.success:
+            console.print(f"  ❌ Failed to apply change for {result.server_name}: {result.error}")
             error_count += 1
+            continue
+        
+        if result.change_type == 'server_added':
+            if result.action == 'claude_add':
+                console.print(f"  ✅ Added server: {result.server_name}")
+            else:
+                console.print(f"  ✅ Synced server to catalog: {result.server_name}")
+        elif result.change_type == 'server_removed':
+            if result.action == 'claude_remove':
+                console.print(f"  ➖ Removed server: {result.server_name}")
+            else:
+                console.print(f"  ➖ Removed server from catalog: {result.server_name}")
+        elif result.change_type in ['server_enabled', 'server_disabled']:
+            status = "enabled" if result.change_type == 'server_enabled' else "disabled"
+            console.print(f"  🔄 {result.server_name}: {status}")
+        
+        success_count += 1
     
     # Summary
     console.print()
@@ -1809,6 +1767,8 @@ async def _sync_external_impl(dry_run: bool, auto_apply: bool):
         console.print(f"[green]✅ Successfully applied {success_count} changes[/green]")
     if error_count > 0:
         console.print(f"[red]❌ Failed to apply {error_count} changes[/red]")
+    if skipped_count > 0:
+        console.print(f"[yellow]⏭️ Skipped {skipped_count} changes that need manual review[/yellow]")
     
     console.print("[blue]🎉 Synchronization complete[/blue]")
 
@@ -1846,13 +1806,18 @@ async def _detect_changes_impl(watch: bool, interval: int):
     from rich.panel import Panel
     from rich import box
     
-    manager = cli_context.get_manager()
-    detector = ChangeDetector(manager)
-    
     if not watch:
         # Single detection
         console.print("[blue]🔍 Detecting external configuration changes...[/blue]")
-        changes = await detector.detect_changes()
+        
+        # Let a running monitor daemon detect changes when available; unlike
+        # its periodic checks this neither records nor auto-syncs them
+        daemon_changes = call_daemon("detect_changes", timeout=120.0)
+        if daemon_changes is not None:
+            changes = [DetectedChange.from_dict(data) for data in daemon_changes]
+        else:
+            detector = ChangeDetector(cli_context.get_manager())
+            changes = await detector.detect_changes()
         
         if not changes:
             console.print("[green]✅ No external changes detected[/green]")
@@ -1866,6 +1831,7 @@ async def _detect_changes_impl(watch: bool, interval: int):
         return
     
     # Watch mode
+    detector = ChangeDetector(cli_context.get_manager())
     console.print(f"[blue]👀 Monitoring external changes (interval: {interval}s, press Ctrl+C to stop)...[/blue]")
     console.print()
     
@@ -1958,10 +1924,30 @@ async def _monitor_service_impl(start: bool, stop: bool, status: bool, interval:
         console.print("[blue]🔍 Background Monitor Service Status[/blue]")
         console.print()
         
-        # Check if service is running (this is a simplified check)
-        # In a real implementation, you'd check if a daemon process is running
+        daemon_status = call_daemon("status", timeout=5.0)
+        if daemon_status is not None:
+            stats = daemon_status.get('statistics', {})
+            console.print(Panel(
+                f"[green]● Running[/green] (pid {daemon_status.get('pid')})\n\n"
+                f"[cyan]Uptime:[/cyan] {daemon_status.get('uptime') or 'n/a'}\n"
+                f"[cyan]Last check:[/cyan] {daemon_status.get('last_check') or 'never'}\n"
+                f"[cyan]Check interval:[/cyan] {daemon_status.get('check_interval')}s\n"
+                f"[cyan]Auto-sync:[/cyan] {'enabled' if daemon_status.get('auto_sync') else 'disabled'}\n"
+                f"[cyan]Checks performed:[/cyan] {stats.get('checks_performed', 0)}\n"
+                f"[cyan]Changes detected:[/cyan] {stats.get('changes_detected', 0)}\n"
+                f"[cyan]Changes synced:[/cyan] {stats.get('changes_synced', 0)}\n\n"
+                f"[dim]Socket: {daemon_status.get('socket')}[/dim]",
+                title="Monitor Status",
+                style="green",
+                box=box.ROUNDED
+            ))
+            return
+        
+        saved_state = load_saved_state()
+        last_check = saved_state.get('last_check') or 'never'
         console.print(Panel(
-            "[dim]Service status checking not implemented yet[/dim]\n\n"
+            "[red]● Not running[/red]\n\n"
+            f"[cyan]Last recorded check:[/cyan] {last_check}\n\n"
             "[yellow]To start monitoring:[/yellow] mcp-manager monitor --start\n"
             "[yellow]For real-time monitoring:[/yellow] mcp-manager detect-changes --watch",
             title="Monitor Status",
@@ -1971,43 +1957,39 @@ async def _monitor_service_impl(start: bool, stop: bool, status: bool, interval:
         return
     
     if start:
+        if call_daemon("ping", timeout=1.0) is not None:
+            console.print("[yellow]⚠️ A monitor daemon is already running[/yellow]")
+            console.print("[dim]Use 'mcp-manager monitor --stop' to stop it[/dim]")
+            return
+        
         console.print("[blue]🚀 Starting background monitor service...[/blue]")
         console.print()
         
-        manager = cli_context.get_manager()
-        
-        def notification_callback(changes):
-            """Handle change notifications."""
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"[{timestamp}] Detected {len(changes)} configuration changes")
-            for change in changes:
-                logger.info(f"  • {change}")
-        
-        monitor = BackgroundMonitor(
-            manager=manager,
-            check_interval=interval,
-            auto_sync=auto_sync,
-            notification_callback=notification_callback
-        )
+        daemon = MonitorDaemon()
+        daemon.config.update({
+            'check_interval': interval,
+            'auto_sync': auto_sync,
+        })
         
         console.print(f"[green]Monitor configuration:[/green]")
         console.print(f"  • Check interval: {interval} seconds")
         console.print(f"  • Auto-sync: {'enabled' if auto_sync else 'disabled'}")
+        console.print(f"  • Control socket: {get_socket_path()}")
         console.print()
         console.print("[dim]Press Ctrl+C to stop monitoring[/dim]")
         console.print()
         
         try:
-            await monitor.start()
+            await daemon.start_daemon()
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopping monitor...[/yellow]")
-            await monitor.stop()
-            console.print("[blue]Monitor stopped[/blue]")
+        console.print("[blue]Monitor stopped[/blue]")
     
     if stop:
-        console.print("[yellow]⏸️ Stop command not implemented yet[/yellow]")
-        console.print("[dim]Use Ctrl+C to stop a running monitor session[/dim]")
+        if call_daemon("shutdown", timeout=5.0) is not None:
+            console.print("[green]✅ Stop requested - monitor daemon is shutting down[/green]")
+        else:
+            console.print("[yellow]ℹ No running monitor daemon found[/yellow]")
 
 
 @cli.command("monitor-status")
@@ -2016,6 +1998,19 @@ def monitor_status_quick():
     """Quick status check for background monitor service."""
     console.print("[blue]🔍 Quick Monitor Status[/blue]")
     console.print()
+    
+    daemon_status = call_daemon("status", timeout=5.0)
+    if daemon_status is not None:
+        stats = daemon_status.get('statistics', {})
+        console.print(
+            f"[green]● Running[/green] (pid {daemon_status.get('pid')}) - "
+            f"{stats.get('checks_performed', 0)} checks, "
+            f"{stats.get('changes_detected', 0)} changes detected, "
+            f"last check {daemon_status.get('last_check') or 'never'}"
+        )
+    else:
+        console.print("[red]● Not running[/red]")
+    
     console.print("[dim]Full status available with: mcp-manager monitor --status[/dim]")
 
 
@@ -1,7 +1,7 @@
 """Core MCP Manager functionality."""
 
 from mcp_manager.core.exceptions import MCPManagerError, ServerError, ConfigError
-from mcp_manager.core.models import Server, ServerScope, ServerStatus
+from mcp_manager.core.models import Server, ServerRecord, ServerScope, ServerStatus
 from mcp_manager.core.simple_manager import SimpleMCPManager
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
     "ServerError", 
     "ConfigError",
     "Server",
+    "ServerRecord",
     "ServerScope",
     "ServerStatus",
     "SimpleMCPManager",
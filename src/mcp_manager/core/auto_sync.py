@@ -0,0 +1,364 @@
+"""
+Planned, batched application of detected external configuration changes.
+
+Detected changes are grouped by the system they touch: Docker Desktop
+changes are folded into a single docker-gateway reconcile, Claude add/remove
+calls run concurrently under a limit, and all catalog updates are written
+in one batch. Every change gets a structured result.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from pydantic import BaseModel, Field
+
+from mcp_manager.core.change_detector import ChangeSource, ChangeType, DetectedChange
+from mcp_manager.core.models import ServerType
+from mcp_manager.core.simple_manager import SimpleMCPManager
+from mcp_manager.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Sources reported by ChangeDetector for Docker Desktop managed servers
+DOCKER_SOURCES = {"docker", "docker-desktop", "claude-gateway"}
+
+# Sync targets
+TARGET_DOCKER = "docker"
+TARGET_CLAUDE = "claude"
+TARGET_CATALOG = "catalog"
+
+
+class ChangeSyncResult(BaseModel):
+    """Outcome of applying one detected change."""
+
+    server_name: str
+    change_type: str
+    target: str
+    action: str
+    success: bool
+    skipped: bool = Field(default=False, description="Change was left for the user to apply")
+    error: Optional[str] = None
+    duration: float = Field(default=0.0, description="Seconds spent on this change")
+
+
+class AutoSyncPlan(BaseModel):
+    """Changes grouped by the system they have to be applied to."""
+
+    docker: List[DetectedChange] = Field(default_factory=list)
+    claude: List[DetectedChange] = Field(default_factory=list)
+    catalog: List[DetectedChange] = Field(default_factory=list)
+    skipped: List[DetectedChange] = Field(default_factory=list)
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def __len__(self) -> int:
+        return len(self.docker) + len(self.claude) + len(self.catalog) + len(self.skipped)
+
+
+class AutoSyncPlanner:
+    """Plans and applies detected changes with dependency-aware batching."""
+
+    def __init__(self, manager: SimpleMCPManager, max_concurrency: int = 4):
+        """
+        Initialize the planner.
+
+        Args:
+            manager: SimpleMCPManager used to reach Claude, Docker and the catalog
+            max_concurrency: Maximum concurrent Claude CLI calls
+        """
+        self.manager = manager
+        self.max_concurrency = max(1, max_concurrency)
+
+    def plan(self, changes: List[DetectedChange]) -> AutoSyncPlan:
+        """Group changes by sync target."""
+        plan = AutoSyncPlan()
+
+        for change in changes:
+            if change.change_type in (ChangeType.SERVER_ENABLED, ChangeType.SERVER_DISABLED):
+                plan.catalog.append(change)
+            elif change.change_type in (ChangeType.SERVER_ADDED, ChangeType.SERVER_REMOVED):
+                if self._is_docker_change(change):
+                    plan.docker.append(change)
+                else:
+                    plan.claude.append(change)
+            else:
+                plan.skipped.append(change)
+
+        return plan
+
+    async def apply(self, changes: List[DetectedChange]) -> List[ChangeSyncResult]:
+        """
+        Apply detected changes.
+
+        Args:
+            changes: Changes reported by ChangeDetector
+
+        Returns:
+            One result per change, in the order the changes were given
+        """
+        if not changes:
+            return []
+
+        plan = self.plan(changes)
+        logger.debug(
+            f"Auto-sync plan: {len(plan.docker)} docker, {len(plan.claude)} claude, "
+            f"{len(plan.catalog)} catalog, {len(plan.skipped)} skipped"
+        )
+
+        # Prevent our own writes from being detected as external changes
+        self.manager._mark_operation_start()
+
+        results: Dict[int, ChangeSyncResult] = {}
+        catalog = await self.manager._get_server_catalog()
+        catalog.setdefault("servers", {})
+
+        if plan.claude:
+            for change, result in zip(plan.claude, await self._apply_claude(plan.claude, catalog)):
+                results[id(change)] = result
+
+        if plan.docker:
+            for change, result in zip(plan.docker, await self._apply_docker(plan.docker, catalog)):
+                results[id(change)] = result
+
+        for change in plan.catalog:
+            results[id(change)] = self._apply_catalog_status(change, catalog)
+
+        # Modified definitions are not applied automatically
+        for change in plan.skipped:
+            results[id(change)] = ChangeSyncResult(
+                server_name=change.server_name,
+                change_type=change.change_type.value,
+                target=TARGET_CATALOG,
+                action="skipped",
+                success=False,
+                skipped=True,
+                error="Not synced automatically",
+            )
+
+        # All catalog updates land in a single write
+        await self.manager._save_server_catalog(catalog)
+
+        return [results[id(change)] for change in changes]
+
+    def _is_docker_change(self, change: DetectedChange) -> bool:
+        """Check if a change belongs to a Docker Desktop server."""
+        if change.source == ChangeSource.DOCKER:
+            return True
+
+        server_info = change.details.get("server_info", {})
+        if server_info.get("source") in DOCKER_SOURCES:
+            return True
+
+        catalog_info = change.details.get("catalog_info", {})
+        return bool(catalog_info.get("type") == ServerType.DOCKER_DESKTOP.value)
+
+    async def _apply_claude(
+        self, changes: List[DetectedChange], catalog: Dict[str, Any]
+    ) -> List[ChangeSyncResult]:
+        """Apply Claude add/remove changes concurrently."""
+        try:
+            existing = await self._list_claude_server_names()
+        except Exception as e:
+            # Without Claude's servers, changes already applied there cannot be
+            # told apart from pending ones, so none of them is applied
+            logger.warning(f"Failed to list Claude servers for auto-sync: {e}")
+            return [
+                self._result(
+                    change, TARGET_CLAUDE,
+                    "claude_add" if change.change_type == ChangeType.SERVER_ADDED else "claude_remove",
+                    False, error=f"Failed to list Claude servers: {e}",
+                )
+                for change in changes
+            ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def apply_one(change: DetectedChange) -> ChangeSyncResult:
+            started = time.monotonic()
+            adding = change.change_type == ChangeType.SERVER_ADDED
+            server_info = self._get_server_info(change)
+
+            # Changes already reflected in Claude only need the catalog update
+            needs_cli = (change.server_name not in existing) if adding else (change.server_name in existing)
+            action = "catalog"
+
+            try:
+                if needs_cli:
+                    action = "claude_add" if adding else "claude_remove"
+                    async with semaphore:
+                        if adding:
+                            await asyncio.to_thread(
+                                self.manager.claude.add_server,
+                                change.server_name,
+                                server_info.get("command", ""),
+                                server_info.get("args", []),
+                                server_info.get("env", {}),
+                            )
+                        else:
+                            await asyncio.to_thread(self.manager.claude.remove_server, change.server_name)
+
+                return self._result(change, TARGET_CLAUDE, action, True, started=started)
+
+            except Exception as e:
+                return self._result(change, TARGET_CLAUDE, action, False, error=str(e), started=started)
+
+        results = list(await asyncio.gather(*(apply_one(change) for change in changes)))
+
+        # Concurrent writers to Claude's config can lose updates, so verify once
+        # and retry anything that did not stick one at a time
+        if any(result.action != "catalog" and result.success for result in results):
+            await self._verify_claude_results(changes, results)
+
+        for change, result in zip(changes, results):
+            if result.success:
+                self._update_catalog_entry(change, catalog)
+
+        return results
+
+    async def _verify_claude_results(
+        self, changes: List[DetectedChange], results: List[ChangeSyncResult]
+    ) -> None:
+        """Retry Claude mutations that are not visible after the concurrent batch."""
+        try:
+            current = await self._list_claude_server_names()
+        except Exception as e:
+            logger.warning(f"Failed to verify Claude servers after auto-sync: {e}")
+            return
+
+        for index, (change, result) in enumerate(zip(changes, results)):
+            if not result.success or result.action == "catalog":
+                continue
+
+            adding = change.change_type == ChangeType.SERVER_ADDED
+            if (change.server_name in current) == adding:
+                continue
+
+            logger.debug(f"Retrying {result.action} for {change.server_name} after verification")
+            started = time.monotonic()
+            server_info = self._get_server_info(change)
+
+            try:
+                if adding:
+                    await asyncio.to_thread(
+                        self.manager.claude.add_server,
+                        change.server_name,
+                        server_info.get("command", ""),
+                        server_info.get("args", []),
+                        server_info.get("env", {}),
+                    )
+                else:
+                    await asyncio.to_thread(self.manager.claude.remove_server, change.server_name)
+                results[index] = self._result(
+                    change, TARGET_CLAUDE, result.action, True,
+                    started=started, extra=result.duration,
+                )
+            except Exception as e:
+                results[index] = self._result(
+                    change, TARGET_CLAUDE, result.action, False,
+                    error=str(e), started=started, extra=result.duration,
+                )
+
+    async def _apply_docker(
+        self, changes: List[DetectedChange], catalog: Dict[str, Any]
+    ) -> List[ChangeSyncResult]:
+        """Record Docker Desktop changes and reconcile the gateway once."""
+        started = time.monotonic()
+
+        try:
+            reconciled = await self.manager._refresh_docker_gateway()
+            error = None if reconciled else "docker-gateway reconcile failed"
+        except Exception as e:
+            reconciled = False
+            error = str(e)
+
+        elapsed = time.monotonic() - started
+        results = []
+
+        for change in changes:
+            if reconciled:
+                self._update_catalog_entry(change, catalog)
+            results.append(ChangeSyncResult(
+                server_name=change.server_name,
+                change_type=change.change_type.value,
+                target=TARGET_DOCKER,
+                action="gateway_reconcile",
+                success=reconciled,
+                error=error,
+                duration=elapsed,
+            ))
+
+        return results
+
+    def _apply_catalog_status(self, change: DetectedChange, catalog: Dict[str, Any]) -> ChangeSyncResult:
+        """Apply an enabled/disabled change to the catalog."""
+        started = time.monotonic()
+        entry = catalog["servers"].get(change.server_name)
+
+        if entry is not None:
+            entry["enabled"] = change.change_type == ChangeType.SERVER_ENABLED
+            entry["updated_at"] = datetime.now().isoformat()
+
+        return self._result(change, TARGET_CATALOG, "catalog", True, started=started)
+
+    def _update_catalog_entry(self, change: DetectedChange, catalog: Dict[str, Any]) -> None:
+        """Mirror an applied add/remove change in the catalog."""
+        servers = catalog["servers"]
+
+        if change.change_type == ChangeType.SERVER_REMOVED:
+            servers.pop(change.server_name, None)
+            return
+
+        server_info = self._get_server_info(change)
+        if self._is_docker_change(change):
+            server_type = ServerType.DOCKER_DESKTOP
+            command = "docker"
+            args = ["mcp", "server", change.server_name]
+        else:
+            command = server_info.get("command", "")
+            args = server_info.get("args", [])
+            server_type = self.manager.claude._determine_server_type(command)
+
+        servers[change.server_name] = {
+            "type": server_type.value,
+            "enabled": server_info.get("enabled", True),
+            "installed_at": datetime.now().isoformat(),
+            "command": command,
+            "args": args,
+            "env": server_info.get("env", {}),
+            "description": f"{server_type.value} server: {change.server_name}",
+        }
+
+    async def _list_claude_server_names(self) -> Set[str]:
+        """Get the names of servers currently configured in Claude."""
+        servers = await asyncio.to_thread(self.manager.claude.list_server_records, strict=True)
+        return {server.name for server in servers}
+
+    def _get_server_info(self, change: DetectedChange) -> Dict[str, Any]:
+        """Get the server definition carried by a change."""
+        server_info = dict(change.details.get("server_info", {}))
+        for key in ("command", "args", "env"):
+            if key not in server_info and key in change.details:
+                server_info[key] = change.details[key]
+        return server_info
+
+    def _result(
+        self,
+        change: DetectedChange,
+        target: str,
+        action: str,
+        success: bool,
+        error: Optional[str] = None,
+        started: Optional[float] = None,
+        extra: float = 0.0,
+    ) -> ChangeSyncResult:
+        duration = (time.monotonic() - started) if started is not None else 0.0
+        return ChangeSyncResult(
+            server_name=change.server_name,
+            change_type=change.change_type.value,
+            target=target,
+            action=action,
+            success=success,
+            error=error,
+            duration=duration + extra,
+        )
@@ -6,21 +6,59 @@ external MCP configurations and can automatically sync changes or notify users.
 """
 
 import asyncio
+import os
 import signal
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple
 import json
 import logging
 
+from mcp_manager.core.auto_sync import AutoSyncPlanner, ChangeSyncResult
 from mcp_manager.core.change_detector import ChangeDetector, DetectedChange
+from mcp_manager.core.monitor_ipc import MonitorIPCServer
 from mcp_manager.core.simple_manager import SimpleMCPManager
+from mcp_manager.core.watchers import ConfigChangeEvent, ConfigWatcher
 from mcp_manager.utils.logging import get_logger
 from mcp_manager.utils.config import get_config
 
 logger = get_logger(__name__)
 
+# Path, mtime and size of each server source file; None for a missing file
+SourceFingerprint = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+def get_state_file() -> Path:
+    """Get the path of the persisted monitor state file."""
+    return Path.home() / ".config" / "mcp-manager" / "monitor_state.json"
+
+
+def load_saved_state() -> Dict[str, Any]:
+    """Load the last persisted monitor state without starting a monitor."""
+    state_file = get_state_file()
+    try:
+        if state_file.exists():
+            with open(state_file, 'r') as f:
+                state: Dict[str, Any] = json.load(f)
+                return state
+    except Exception as e:
+        logger.debug(f"Failed to load monitor state: {e}")
+    
+    return {}
+
+
+def _server_source_files() -> List[Path]:
+    """Files whose contents determine the output of list_servers."""
+    home_dir = Path.home()
+    return [
+        home_dir / ".claude.json",
+        home_dir / ".config" / "claude-code" / "mcp-servers.json",
+        home_dir / ".config" / "mcp-manager" / "server_catalog.json",
+        home_dir / ".docker" / "mcp" / "registry.yaml",
+        Path.cwd() / ".mcp.json",
+    ]
+
 
 class BackgroundMonitor:
     """Background service for monitoring external MCP configuration changes."""
@@ -30,13 +68,16 @@ class BackgroundMonitor:
         manager: Optional[SimpleMCPManager] = None,
         check_interval: int = 60,  # seconds
         auto_sync: bool = False,
-        notification_callback: Optional[Callable[[List[DetectedChange]], None]] = None
+        notification_callback: Optional[Callable[[List[DetectedChange]], None]] = None,
+        sync_concurrency: int = 4
     ):
         self.manager = manager or SimpleMCPManager()
         self.detector = ChangeDetector(self.manager)
         self.check_interval = check_interval
         self.auto_sync = auto_sync
         self.notification_callback = notification_callback
+        self.sync_planner = AutoSyncPlanner(self.manager, max_concurrency=sync_concurrency)
+        self.last_sync_results: List[ChangeSyncResult] = []
         
         self.running = False
         self.monitor_task: Optional[asyncio.Task] = None
@@ -49,8 +90,13 @@ class BackgroundMonitor:
         self.changes_synced = 0
         self.last_check: Optional[datetime] = None
         
+        # Cached server list served to CLI clients, keyed by source file stats
+        self._server_cache: Optional[List[Dict[str, Any]]] = None
+        self._server_cache_fingerprint: Optional[SourceFingerprint] = None
+        self._server_cache_lock = asyncio.Lock()
+        
         # State file for persistence
-        self.state_file = Path.home() / ".config" / "mcp-manager" / "monitor_state.json"
+        self.state_file = get_state_file()
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
     
     async def start(self):
@@ -170,44 +216,35 @@ class BackgroundMonitor:
         except Exception as e:
             logger.error(f"Error during change detection: {e}")
     
-    async def _auto_sync_changes(self, changes: List[DetectedChange]):
+    async def _auto_sync_changes(self, changes: List[DetectedChange]) -> List[ChangeSyncResult]:
         """Automatically apply detected changes."""
         logger.info(f"Auto-syncing {len(changes)} changes...")
         
+        results = await self.sync_planner.apply(changes)
+        self.last_sync_results = results
+        
         success_count = 0
         error_count = 0
+        skipped_count = 0
         
-        for change in changes:
-            try:
-                logger.debug(f"Applying {change.change_type.value} for {change.server_name}")
-                
-                if change.change_type.value == 'server_added':
-                    server_info = change.details.get('server_info', {})
-                    await self.manager.add_server(
-                        name=change.server_name,
-                        command=server_info.get('command', ''),
-                        args=server_info.get('args', []),
-                        env=server_info.get('env', {}),
-                        scope=server_info.get('scope', 'user'),
-                        enabled=server_info.get('enabled', True)
-                    )
-                    
-                elif change.change_type.value == 'server_removed':
-                    await self.manager.remove_server(change.server_name)
-                    
-                elif change.change_type.value in ['server_enabled', 'server_disabled']:
-                    enabled = change.change_type.value == 'server_enabled'
-                    await self.manager._update_server_status(change.server_name, enabled)
-                
+        for result in results:
+            if result.skipped:
+                skipped_count += 1
+                logger.info(f"Skipped {result.change_type} for {result.server_name}: {result.error}")
+            elif result.success:
                 success_count += 1
-                self.changes_synced += 1
-                logger.info(f"✅ Applied {change.change_type.value} for {change.server_name}")
-                
-            except Exception as e:
+                logger.info(f"✅ Applied {result.change_type} for {result.server_name} ({result.action})")
+            else:
                 error_count += 1
-                logger.error(f"❌ Failed to apply {change.change_type.value} for {change.server_name}: {e}")
+                logger.error(f"❌ Failed to apply {result.change_type} for {result.server_name}: {result.error}")
+        
+        self.changes_synced += success_count
+        logger.info(f"Auto-sync complete: {success_count} successful, {error_count} failed, {skipped_count} skipped")
         
-        logger.info(f"Auto-sync complete: {success_count} successful, {error_count} failed")
+        if success_count:
+            self.invalidate_server_cache()
+        
+        return results
     
     async def _save_state(self):
         """Save monitor state to disk."""
@@ -232,14 +269,7 @@ class BackgroundMonitor:
     
     def _load_state(self) -> Dict[str, Any]:
         """Load monitor state from disk."""
-        try:
-            if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            logger.debug(f"Failed to load monitor state: {e}")
-        
-        return {}
+        return load_saved_state()
     
     def get_status(self) -> Dict[str, Any]:
         """Get current monitor status."""
@@ -267,6 +297,56 @@ class BackgroundMonitor:
         recent = self.change_history[-limit:] if self.change_history else []
         return [change.to_dict() for change in recent]
     
+    def _get_source_fingerprint(self) -> SourceFingerprint:
+        """Get a cheap stat-only fingerprint of the server source files."""
+        fingerprint: List[Tuple[str, Optional[int], Optional[int]]] = []
+        for path in _server_source_files():
+            try:
+                stat = path.stat()
+                fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append((str(path), None, None))
+        return tuple(fingerprint)
+    
+    def invalidate_server_cache(self) -> None:
+        """Drop the cached server list so the next request rebuilds it."""
+        self._server_cache = None
+        self._server_cache_fingerprint = None
+    
+    async def get_cached_servers(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the server list, rebuilding it only when a source file changed.
+        
+        Args:
+            refresh: Force a rebuild even if nothing changed
+            
+        Returns:
+            List of JSON-serializable server dictionaries
+        """
+        async with self._server_cache_lock:
+            if (
+                not refresh
+                and self._server_cache is not None
+                and self._server_cache_fingerprint == self._get_source_fingerprint()
+            ):
+                return self._server_cache
+            
+            servers = await self.manager.list_servers()
+            self._server_cache = [server.model_dump(mode="json") for server in servers]
+            # Take the fingerprint after listing, since list_servers may update the catalog
+            self._server_cache_fingerprint = self._get_source_fingerprint()
+            logger.debug(f"Rebuilt server cache: {len(self._server_cache)} servers")
+            return self._server_cache
+    
+    async def detect_changes(self) -> List[DetectedChange]:
+        """
+        Detect changes without recording, notifying or applying them.
+        
+        Returns:
+            Changes between the external configurations and the catalog
+        """
+        return await self.detector.detect_changes()
+    
     async def force_check(self) -> List[DetectedChange]:
         """Force an immediate check for changes."""
         logger.info("Forcing immediate change detection...")
@@ -282,9 +362,11 @@ class BackgroundMonitor:
 class MonitorDaemon:
     """Daemon wrapper for the background monitor."""
     
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(self, config_file: Optional[str] = None, socket_path: Optional[Path] = None):
         self.config_file = config_file
         self.monitor: Optional[BackgroundMonitor] = None
+        self.ipc_server = MonitorIPCServer(socket_path)
+        self.config_watcher: Optional[ConfigWatcher] = None
         
         # Load configuration
         self.config = self._load_config()
@@ -294,6 +376,7 @@ class MonitorDaemon:
         default_config = {
             'check_interval': 60,
             'auto_sync': False,
+            'sync_concurrency': 4,
             'log_level': 'INFO',
             'max_history': 1000
         }
@@ -319,17 +402,107 @@ class MonitorDaemon:
         self.monitor = BackgroundMonitor(
             check_interval=self.config.get('check_interval', 60),
             auto_sync=self.config.get('auto_sync', False),
-            notification_callback=self._notification_handler
+            notification_callback=self._notification_handler,
+            sync_concurrency=self.config.get('sync_concurrency', 4)
         )
         
+        self._register_ipc_methods()
+        await self.ipc_server.start()
+        
+        # The watcher drops the loaded settings when a settings file changes,
+        # so the long-running daemon does not keep a stale configuration
+        self._start_config_watcher()
+        replan_task = asyncio.create_task(self._replan_loop())
+        
         try:
             await self.monitor.start()
         except KeyboardInterrupt:
             logger.info("Daemon interrupted by user")
         finally:
-            if self.monitor:
+            replan_task.cancel()
+            await asyncio.gather(replan_task, return_exceptions=True)
+            await self.ipc_server.stop()
+            self._stop_config_watcher()
+            if self.monitor and self.monitor.running:
                 await self.monitor.stop()
     
+    def _start_config_watcher(self) -> None:
+        """Watch the configuration files; the daemon keeps running without it."""
+        self.config_watcher = ConfigWatcher(self._config_change_handler)
+        try:
+            self.config_watcher.start()
+        except Exception as e:
+            logger.warning(f"Config watcher unavailable, settings changes need a restart: {e}")
+            self.config_watcher = None
+    
+    def _stop_config_watcher(self) -> None:
+        if self.config_watcher:
+            self.config_watcher.stop()
+            self.config_watcher = None
+    
+    async def _replan_loop(self) -> None:
+        """Re-plan the watches each check interval in case the working directory moved."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.config.get('check_interval', 60))
+            if self.config_watcher:
+                try:
+                    if await loop.run_in_executor(None, self.config_watcher.replan):
+                        logger.debug("Config watches re-planned")
+                except Exception as e:
+                    logger.warning(f"Failed to re-plan config watches: {e}")
+    
+    def _config_change_handler(self, event: ConfigChangeEvent) -> None:
+        logger.debug(f"Daemon saw config change: {event}")
+    
+    def _register_ipc_methods(self) -> None:
+        """Expose monitor operations on the IPC control socket."""
+        self.ipc_server.register("ping", self._ipc_ping)
+        self.ipc_server.register("status", self._ipc_status)
+        self.ipc_server.register("recent_changes", self._ipc_recent_changes)
+        self.ipc_server.register("list_servers", self._ipc_list_servers)
+        self.ipc_server.register("detect_changes", self._ipc_detect_changes)
+        self.ipc_server.register("force_check", self._ipc_force_check)
+        self.ipc_server.register("shutdown", self._ipc_shutdown)
+    
+    def _active_monitor(self) -> BackgroundMonitor:
+        if self.monitor is None:
+            raise RuntimeError("Monitor is not running")
+        return self.monitor
+    
+    async def _ipc_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {'pid': os.getpid()}
+    
+    async def _ipc_status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        status = self.get_status()
+        status['pid'] = os.getpid()
+        status['socket'] = str(self.ipc_server.socket_path)
+        return status
+    
+    async def _ipc_recent_changes(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return self._active_monitor().get_recent_changes(limit=int(params.get('limit', 10)))
+    
+    async def _ipc_list_servers(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # Project and local scoped servers depend on the working directory,
+        # so only answer for clients running where the daemon runs
+        cwd = params.get('cwd')
+        if cwd and os.path.realpath(cwd) != os.path.realpath(os.getcwd()):
+            raise ValueError("Server list is cached for a different working directory")
+        return await self._active_monitor().get_cached_servers(refresh=bool(params.get('refresh', False)))
+    
+    async def _ipc_detect_changes(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        changes = await self._active_monitor().detect_changes()
+        return [change.to_dict() for change in changes]
+    
+    async def _ipc_force_check(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        changes = await self._active_monitor().force_check()
+        return [change.to_dict() for change in changes]
+    
+    async def _ipc_shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info("Shutdown requested over IPC")
+        asyncio.ensure_future(self._active_monitor().stop())
+        return {'stopping': True}
+    
     def _notification_handler(self, changes: List[DetectedChange]):
         """Handle change notifications."""
         logger.info(f"🔔 Configuration changes detected: {len(changes)} changes")
@@ -14,6 +14,7 @@ from mcp_manager.core.parsers import DockerRegistryParser, ClaudeConfigParser
 from mcp_manager.core.parsers.docker_parser import DockerRegistryState
 from mcp_manager.core.parsers.claude_parser import ClaudeConfigState, ClaudeServerDefinition
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command
 
 logger = get_logger(__name__)
 
@@ -44,8 +45,8 @@ class DetectedChange:
         change_type: ChangeType,
         source: ChangeSource,
         server_name: str,
-        details: Dict[str, Any] = None,
-        timestamp: datetime = None
+        details: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None
     ):
         self.change_type = change_type
         self.source = source
@@ -65,6 +66,18 @@ class DetectedChange:
             'details': self.details,
             'timestamp': self.timestamp.isoformat()
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DetectedChange':
+        """Create a change from its dictionary representation."""
+        timestamp = data.get('timestamp')
+        return cls(
+            change_type=ChangeType(data['change_type']),
+            source=ChangeSource(data.get('source', ChangeSource.UNKNOWN.value)),
+            server_name=data['server_name'],
+            details=data.get('details') or {},
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else None
+        )
 
 
 class ExternalState:
@@ -360,12 +373,11 @@ class ChangeDetector:
     
     async def _get_external_servers_simple(self) -> Dict[str, Dict[str, Any]]:
         """Get external servers using simple command-based approach."""
-        import subprocess
         external_servers = {}
         
         # Get Claude servers via claude mcp list
         try:
-            result = subprocess.run(['claude', 'mcp', 'list'], 
+            result = run_command(['claude', 'mcp', 'list'], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
                 for line in result.stdout.strip().split('\n'):
@@ -413,7 +425,7 @@ class ChangeDetector:
         
         # Get Docker Desktop servers via docker mcp server list
         try:
-            result = subprocess.run(['docker', 'mcp', 'server', 'list'], 
+            result = run_command(['docker', 'mcp', 'server', 'list'], 
                                   capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0 and result.stdout.strip():
@@ -13,8 +13,10 @@ from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from mcp_manager.core.exceptions import ClaudeError, MCPManagerError
-from mcp_manager.core.models import Server, ServerType, ServerScope
+from mcp_manager.core.models import Server, ServerRecord, ServerType, ServerScope
+from mcp_manager.core.parsers.claude_scopes import read_server_scopes
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command
 
 logger = get_logger(__name__)
 
@@ -79,7 +81,7 @@ class ClaudeInterface:
     def _check_claude_availability(self) -> None:
         """Check if Claude CLI is available."""
         try:
-            result = subprocess.run(
+            result = run_command(
                 [self.claude_path, "--version"],
                 capture_output=True,
                 timeout=10,
@@ -111,8 +113,20 @@ class ClaudeInterface:
         Returns:
             List of servers from Claude's internal state
         """
+        return [record.to_server() for record in self.list_server_records()]
+    
+    def list_server_records(self, strict: bool = False) -> List[ServerRecord]:
+        """
+        List all MCP servers known to Claude as lightweight records.
+        
+        Args:
+            strict: Raise if claude mcp list fails instead of returning no servers
+        
+        Returns:
+            List of server records from Claude's internal state
+        """
         try:
-            result = subprocess.run(
+            result = run_command(
                 [self.claude_path, "mcp", "list"],
                 capture_output=True,
                 text=True,
@@ -121,9 +135,14 @@ class ClaudeInterface:
             )
             
             if result.returncode != 0:
+                if strict:
+                    raise MCPManagerError(f"claude mcp list failed: {result.stderr}")
                 logger.warning(f"claude mcp list failed: {result.stderr}")
                 return []
             
+            # claude mcp list doesn't print scopes; take them from the config files
+            scopes = read_server_scopes()
+            
             servers = []
             for line in result.stdout.strip().split('\n'):
                 if line and ':' in line:
@@ -137,15 +156,19 @@ class ClaudeInterface:
                     command = cmd_parts[0] if cmd_parts else ""
                     args = cmd_parts[1:] if len(cmd_parts) > 1 else []
                     
+                    # Skip lines a Server model would reject
+                    if not name or not command:
+                        continue
+                    
                     # Determine server type
                     server_type = self._determine_server_type(command)
                     
-                    server = Server(
+                    server = ServerRecord(
                         name=name,
                         command=command,
                         args=args,
                         server_type=server_type,
-                        scope=ServerScope.USER,  # Claude manages globally
+                        scope=scopes.get(name, ServerScope.USER),
                         enabled=True,  # If it's in claude mcp list, it's enabled
                     )
                     servers.append(server)
@@ -163,6 +186,7 @@ class ClaudeInterface:
         command: str,
         args: Optional[List[str]] = None,
         env: Optional[Dict[str, str]] = None,
+        scope: ServerScope = ServerScope.USER,
     ) -> bool:
         """
         Add a server to Claude's configuration.
@@ -172,14 +196,14 @@ class ClaudeInterface:
             command: Server command
             args: Command arguments
             env: Environment variables
+            scope: Scope to add the server to, user-wide by default
             
         Returns:
             True if successful
         """
         try:
             # Build command args - Claude expects: claude mcp add <name> <command> [args...]
-            # Use --scope user to store in user-wide configuration
-            cmd_args = [self.claude_path, "mcp", "add", "--scope", "user", name, command]
+            cmd_args = [self.claude_path, "mcp", "add", "--scope", scope.value, name, command]
             if args:
                 # Check if any args start with - (options) - if so, use -- separator
                 has_options = any(arg.startswith('-') for arg in args)
@@ -192,7 +216,7 @@ class ClaudeInterface:
             if env:
                 cmd_env.update(env)
             
-            result = subprocess.run(
+            result = run_command(
                 cmd_args,
                 capture_output=True,
                 text=True,
@@ -211,19 +235,24 @@ class ClaudeInterface:
             logger.error(f"Failed to add server '{name}': {e}")
             raise MCPManagerError(f"Failed to add server: {e}")
     
-    def remove_server(self, name: str) -> bool:
+    def remove_server(self, name: str, scope: Optional[ServerScope] = None) -> bool:
         """
         Remove a server from Claude's configuration.
         
         Args:
             name: Server name to remove
+            scope: Scope to remove the server from, looked up in Claude's
+                configuration files if not given
             
         Returns:
             True if successful
         """
+        if scope is None:
+            scope = self.get_server_scope(name) or ServerScope.USER
+        
         try:
-            result = subprocess.run(
-                [self.claude_path, "mcp", "remove", "--scope", "user", name],
+            result = run_command(
+                [self.claude_path, "mcp", "remove", "--scope", scope.value, name],
                 capture_output=True,
                 text=True,
                 timeout=30,
@@ -231,7 +260,7 @@ class ClaudeInterface:
             )
             
             if result.returncode == 0:
-                logger.debug(f"Removed server '{name}' from Claude")
+                logger.debug(f"Removed server '{name}' from Claude ({scope.value} scope)")
                 return True
             else:
                 logger.error(f"Failed to remove server '{name}': {result.stderr}")
@@ -252,7 +281,7 @@ class ClaudeInterface:
             Server object if found, None otherwise
         """
         try:
-            result = subprocess.run(
+            result = run_command(
                 [self.claude_path, "mcp", "get", name],
                 capture_output=True,
                 text=True,
@@ -265,13 +294,26 @@ class ClaudeInterface:
             
             # Parse the output (this might need adjustment based on actual format)
             # For now, fall back to listing all and finding the one
-            servers = self.list_servers()
-            return next((s for s in servers if s.name == name), None)
+            servers = self.list_server_records()
+            record = next((s for s in servers if s.name == name), None)
+            return record.to_server() if record else None
             
         except Exception as e:
             logger.warning(f"Failed to get server '{name}': {e}")
             return None
     
+    def get_server_scope(self, name: str) -> Optional[ServerScope]:
+        """
+        Get the scope Claude loads a server from.
+        
+        Args:
+            name: Server name
+            
+        Returns:
+            The scope, or None if the server isn't in Claude's configuration files
+        """
+        return read_server_scopes().get(name)
+    
     def server_exists(self, name: str) -> bool:
         """
         Check if a server exists in Claude's configuration.
@@ -283,7 +325,7 @@ class ClaudeInterface:
             True if server exists
         """
         # Use list_servers instead of get_server as it's more reliable
-        servers = self.list_servers()
+        servers = self.list_server_records()
         return any(s.name == name for s in servers)
     
     def _determine_server_type(self, command: str) -> ServerType:
@@ -0,0 +1,376 @@
+"""
+Probe sessions that run help and documentation probes in one container.
+
+Tool discovery for a Docker server tries several help commands and reads
+several documentation files. A ``ContainerProbe`` creates a single
+container of the image with its entrypoint replaced by an idle process,
+runs every probe in it with exec, copies files out through the archive
+endpoint, and removes it once. Results are cached per image ID, so probing
+an image that was probed before starts no container at all. The image
+itself is described by its cached ``ImageMetadata``.
+"""
+
+import io
+import json
+import os
+import tarfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from mcp_manager.core.docker_engine import DockerEngineClient, get_docker_engine
+from mcp_manager.core.image_metadata import ImageMetadata, get_image_metadata
+from mcp_manager.core.parsers.json_store import JsonFileStore, put_recent
+from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command, span
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 1
+
+# Images whose probe results are kept; the least recently probed are dropped first
+MAX_CACHED_IMAGES = 200
+
+# Largest documentation file read out of a container
+MAX_FILE_BYTES = 1024 * 1024
+
+# Keeps the probe container running without depending on the image's entrypoint
+IDLE_ENTRYPOINT = ["sleep"]
+IDLE_CMD = ["3600"]
+
+# docker cp errors meaning the path does not exist, as opposed to daemon failures
+MISSING_PATH_ERRORS = ("could not find the file", "no such container:path", "no such file")
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of a probe command."""
+    
+    returncode: int
+    stdout: str
+    stderr: str = ""
+
+
+def get_probe_cache_file() -> Path:
+    """Get the path of the persisted probe results."""
+    return Path.home() / ".config" / "mcp-manager" / "probe_cache.json"
+
+
+class ProbeCache:
+    """Probe results per image ID backed by a JSON file."""
+    
+    def __init__(self, cache_file: Optional[Union[str, Path]] = None, max_images: int = MAX_CACHED_IMAGES):
+        self._cache_file = Path(cache_file) if cache_file else None
+        self.max_images = max_images
+        self._store = JsonFileStore(lambda: self.cache_file, CACHE_VERSION, ("images",), "probe cache")
+    
+    @property
+    def cache_file(self) -> Path:
+        return self._cache_file or get_probe_cache_file()
+    
+    def get(self, image_id: str) -> Dict[str, Any]:
+        """
+        Get the cached probe results of an image.
+        
+        Args:
+            image_id: Image ID the probes ran against
+        
+        Returns:
+            Results by probe key; empty if the image was never probed
+        """
+        with self._store.lock:
+            return dict(self._store.load()["images"].get(image_id, {}))
+    
+    def update(self, image_id: str, results: Dict[str, Any]) -> None:
+        """
+        Merge new probe results of an image and persist the cache.
+        
+        Args:
+            image_id: Image ID the probes ran against
+            results: Results by probe key
+        """
+        if not results:
+            return
+        with self._store.lock:
+            images = self._store.load()["images"]
+            put_recent(images, image_id, {**images.get(image_id, {}), **results}, self.max_images)
+            self._store.save()
+
+
+def read_tar_file(archive: bytes) -> Optional[str]:
+    """Return the text of the first regular file in a tar archive."""
+    try:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                if member.size > MAX_FILE_BYTES:
+                    logger.debug(f"Skipping {member.name}: {member.size} bytes")
+                    return None
+                f = tar.extractfile(member)
+                return f.read().decode("utf-8", errors="replace") if f else None
+    except tarfile.TarError as e:
+        logger.debug(f"Unreadable archive: {e}")
+    return None
+
+
+class ContainerProbe:
+    """
+    One idle container of an image that probes run in.
+    
+    Used as a context manager. The container is only created for the first
+    probe that misses the cache, through the Docker Engine API when it is
+    available and the docker CLI otherwise, and removed on exit.
+    """
+    
+    def __init__(
+        self,
+        image: str,
+        inspect: Callable[[str], Optional[ImageMetadata]] = get_image_metadata,
+        engine: Optional[DockerEngineClient] = None,
+        docker_path: str = "docker",
+        cache: Optional[ProbeCache] = None,
+    ):
+        """
+        Initialize the probe session.
+        
+        Args:
+            image: Image to probe
+            inspect: Returns the metadata of an image, or None if it is not available locally
+            engine: Engine API client, or None to use the docker CLI
+            docker_path: docker executable for the CLI
+            cache: Probe result cache, defaulting to the global one
+        """
+        self.image = image
+        self.engine = engine
+        self.docker_path = docker_path
+        self.cache = cache if cache is not None else get_probe_cache()
+        self._inspect = inspect
+        self.metadata = inspect(image)
+        self._results: Dict[str, Any] = self.cache.get(self.image_id) if self.image_id else {}
+        self._new_results: Dict[str, Any] = {}
+        self._container_id: Optional[str] = None
+        self._running = False
+        self._failed = False
+    
+    def __enter__(self) -> "ContainerProbe":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    @property
+    def image_id(self) -> Optional[str]:
+        return self.metadata.id if self.metadata is not None else None
+    
+    def _cached(self, key: str, probe: Callable[[], Tuple[Any, bool]]) -> Any:
+        """Get a probe's result, running it on a miss; probe returns the result and whether it ran."""
+        if key in self._results:
+            return self._results[key]
+        value, ran = probe()
+        self._results[key] = value
+        # Probes that did not run in the image's container, or timed out, are
+        # retried next session; their results say nothing about the image
+        if ran:
+            self._new_results[key] = value
+        return value
+    
+    def _start(self) -> bool:
+        """Create and start the idle container; True if it is running."""
+        if self._running or self._failed:
+            return self._running
+        
+        with span("container probe start", "subprocess", image=self.image):
+            name = f"mcp-manager-probe-{uuid.uuid4().hex[:12]}"
+            try:
+                if self.engine is not None:
+                    self._start_engine(self.engine, name)
+                else:
+                    self._start_cli(name)
+                self._running = True
+            except Exception as e:
+                logger.debug(f"Could not start a probe container for {self.image}: {e}")
+                self._failed = True
+        
+        # A pulled image can only be inspected once the container exists
+        if self.metadata is None and self._container_id:
+            self.metadata = self._inspect(self.image)
+            if self.image_id:
+                self._results = {**self.cache.get(self.image_id), **self._results}
+        return self._running
+    
+    def _start_engine(self, engine: DockerEngineClient, name: str) -> None:
+        self._container_id = engine.create_container({
+            "Image": self.image,
+            "Entrypoint": IDLE_ENTRYPOINT,
+            "Cmd": IDLE_CMD,
+            "Labels": {"mcp-manager.probe": name},
+        })
+        engine.start_container(self._container_id)
+    
+    def _start_cli(self, name: str) -> None:
+        result = run_command(
+            [self.docker_path, "create", "--name", name, "--label", f"mcp-manager.probe={name}",
+             "--entrypoint", IDLE_ENTRYPOINT[0], self.image, *IDLE_CMD],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+        self._container_id = result.stdout.strip()
+        result = run_command(
+            [self.docker_path, "start", self._container_id],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+    
+    def _exec(self, cmd: List[str], timeout: float) -> Dict[str, Any]:
+        if not self._start() or self._container_id is None:
+            return {"returncode": -1, "stdout": "", "stderr": "probe container not running"}
+        try:
+            if self.engine is not None:
+                returncode, stdout, stderr = self.engine.exec_run(self._container_id, cmd, timeout=timeout)
+            else:
+                result = run_command(
+                    [self.docker_path, "exec", self._container_id, *cmd],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+                returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+        except Exception as e:
+            logger.debug(f"Probe {' '.join(cmd)} failed in {self.image}: {e}")
+            return {"returncode": -1, "stdout": "", "stderr": str(e)}
+        return {"returncode": returncode, "stdout": stdout, "stderr": stderr}
+    
+    def exec(self, cmd: List[str], timeout: float = 10) -> ProbeResult:
+        """
+        Run a command in the probe container.
+        
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds to wait for the command
+        
+        Returns:
+            The command's result; returncode -1 if it could not run
+        """
+        def probe() -> Tuple[Dict[str, Any], bool]:
+            result = self._exec(cmd, timeout)
+            return result, result["returncode"] != -1
+        
+        return ProbeResult(**self._cached(f"exec:{json.dumps(cmd)}", probe))
+    
+    def run(self, args: List[str], timeout: float = 10) -> ProbeResult:
+        """
+        Run the image's entrypoint with arguments, like ``docker run --rm <image> <args>``.
+        
+        Args:
+            args: Arguments that replace the image's default command
+            timeout: Seconds to wait for the command
+        
+        Returns:
+            The command's result; returncode -1 if it could not run
+        """
+        def probe() -> Tuple[Dict[str, Any], bool]:
+            if self._start():
+                entrypoint = self.metadata.entrypoint if self.metadata is not None else []
+                result = self._exec([*entrypoint, *args], timeout)
+                return result, result["returncode"] != -1
+            
+            # The image cannot idle, e.g. it has no sleep binary, or Docker is
+            # unavailable: use a container for this probe. Its result is not
+            # cached, since a daemon error looks like any failing command.
+            try:
+                completed = run_command(
+                    [self.docker_path, "run", "--rm", self.image, *args],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+            except Exception as e:
+                return {"returncode": -1, "stdout": "", "stderr": str(e)}, False
+            return {"returncode": completed.returncode, "stdout": completed.stdout, "stderr": completed.stderr}, False
+        
+        return ProbeResult(**self._cached(f"run:{json.dumps(args)}", probe))
+    
+    def read_file(self, path: str) -> Optional[str]:
+        """
+        Read a file from the image's filesystem.
+        
+        Args:
+            path: Absolute path in the container
+        
+        Returns:
+            The file's text, or None if it does not exist or is too large
+        """
+        def probe() -> Tuple[Optional[str], bool]:
+            # Copying out works on a created container even if it would not start
+            self._start()
+            if not self._container_id:
+                return None, False
+            try:
+                if self.engine is not None:
+                    archive = self.engine.get_archive(self._container_id, path)
+                else:
+                    result = run_command(
+                        [self.docker_path, "cp", f"{self._container_id}:{path}", "-"],
+                        capture_output=True,
+                        timeout=30,
+                    )
+                    if result.returncode != 0:
+                        stderr = os.fsdecode(result.stderr or b"").lower()
+                        missing = any(error in stderr for error in MISSING_PATH_ERRORS)
+                        return None, missing
+                    archive = result.stdout
+            except Exception as e:
+                logger.debug(f"Could not read {path} from {self.image}: {e}")
+                return None, False
+            return (read_tar_file(archive) if archive else None), True
+        
+        content: Optional[str] = self._cached(f"file:{path}", probe)
+        return content
+    
+    def close(self) -> None:
+        """Remove the probe container and store new results under the image ID."""
+        if self._container_id:
+            with span("container probe remove", "subprocess", image=self.image):
+                try:
+                    if self.engine is not None:
+                        self.engine.remove_container(self._container_id)
+                    else:
+                        run_command(
+                            [self.docker_path, "rm", "-f", self._container_id],
+                            capture_output=True,
+                            text=True,
+                            timeout=30,
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to remove probe container {self._container_id}: {e}")
+            self._container_id = None
+            self._running = False
+        
+        if self.image_id:
+            self.cache.update(self.image_id, self._new_results)
+        self._new_results = {}
+
+
+# Global probe cache instance
+_probe_cache: Optional[ProbeCache] = None
+
+
+def get_probe_cache() -> ProbeCache:
+    """Get the global probe cache instance."""
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = ProbeCache()
+    return _probe_cache
+
+
+def open_probe(image: str) -> ContainerProbe:
+    """Open a probe session on an image using the Engine API when it is available."""
+    return ContainerProbe(image, engine=get_docker_engine())
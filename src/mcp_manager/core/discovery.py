@@ -12,18 +12,24 @@ import re
 import fnmatch
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from pydantic import BaseModel
 
 from mcp_manager.core.exceptions import DiscoveryError, NetworkError
+from mcp_manager.core.install_index import InstallIndex, generate_install_id
 from mcp_manager.core.models import DiscoveryResult, ServerType
+from mcp_manager.core.npm_metadata import NpmMetadataService
 from mcp_manager.utils.config import Config, get_config
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command, span
 
 logger = get_logger(__name__)
 
+# Package names tried per source when an install ID is not in the index
+MAX_LOOKUP_CANDIDATES = 8
+
 
 class CacheEntry(BaseModel):
     """Cache entry for discovery results."""
@@ -40,14 +46,23 @@ class CacheEntry(BaseModel):
 class ServerDiscovery:
     """Server discovery service."""
     
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        install_index: Optional[InstallIndex] = None,
+        npm_metadata: Optional[NpmMetadataService] = None,
+    ):
         """
         Initialize server discovery.
         
         Args:
             config: Configuration instance
+            install_index: Install-ID index, defaults to the one in the config directory
+            npm_metadata: npm manifest source, sharing its cache with tool discovery by default
         """
         self.config = config or get_config()
+        self.install_index = install_index or InstallIndex()
+        self.npm_metadata = npm_metadata or NpmMetadataService(registry=self.config.discovery.npm_registry)
         self._cache: Dict[str, CacheEntry] = {}
         
         # Suppress verbose HTTP logging from httpx
@@ -202,6 +217,9 @@ class ServerDiscovery:
         # Limit results
         results = results[:limit]
         
+        # Remember install IDs so installs can resolve them without searching
+        self.install_index.record(results)
+        
         # Cache results
         if use_cache:
             self._cache[cache_key] = CacheEntry(
@@ -238,7 +256,7 @@ class ServerDiscovery:
                     search_queries = ["mcp server", "@modelcontextprotocol"]
                 
                 for search_query in search_queries:
-                    params = {
+                    params: Dict[str, Any] = {
                         "text": search_query,
                         "size": min(limit, 20),
                         "quality": 0.4,  # Lower quality threshold to find more packages
@@ -247,7 +265,8 @@ class ServerDiscovery:
                     }
                     
                     try:
-                        response = await client.get(search_url, params=params)
+                        with span("GET npm search", "http", url=search_url, query=search_query):
+                            response = await client.get(search_url, params=params)
                         response.raise_for_status()
                         
                         data = response.json()
@@ -278,7 +297,7 @@ class ServerDiscovery:
                                     server_type=ServerType.NPM,
                                     install_command="npx",
                                     install_args=["-y", name],
-                                    downloads=package.get("score", {}).get("detail", {}).get("popularity"),
+                                    downloads=self._get_npm_downloads(package),
                                     last_updated=self._parse_date(pkg_info.get("date")),
                                 )
                                 results.append(result)
@@ -322,8 +341,9 @@ class ServerDiscovery:
                 # Strategy 1: Check known organizations for repositories
                 for org in known_orgs:
                     try:
-                        repos_url = f"https://hub.docker.com/v2/repositories/{org}/"
-                        response = await client.get(repos_url, params={"page_size": 50})
+                        repos_url = f"{self.config.discovery.docker_hub_url}/v2/repositories/{org}/"
+                        with span("GET docker hub repositories", "http", url=repos_url):
+                            response = await client.get(repos_url, params={"page_size": 50})
                         
                         if response.status_code == 200:
                             data = response.json()
@@ -374,7 +394,7 @@ class ServerDiscovery:
                         break
                 
                 # Strategy 2: Use Docker Index API (v1) which actually works
-                search_url = "https://index.docker.io/v1/search"
+                search_url = f"{self.config.discovery.docker_index_url}/v1/search"
                 search_terms = []
                 
                 if query:
@@ -384,8 +404,9 @@ class ServerDiscovery:
                 
                 for term in search_terms:
                     try:
-                        params = {"q": term, "n": min(limit, 25)}
-                        response = await client.get(search_url, params=params)
+                        params: Dict[str, Any] = {"q": term, "n": min(limit, 25)}
+                        with span("GET docker hub search", "http", url=search_url, query=term):
+                            response = await client.get(search_url, params=params)
                         
                         if response.status_code == 200:
                             data = response.json()
@@ -479,17 +500,7 @@ class ServerDiscovery:
                     if not (name_match or desc_match):
                         continue
                 
-                result = DiscoveryResult(
-                    name=f"docker-desktop-{server_name}",
-                    package=server_info.get("package", server_name),
-                    version=server_info.get("version", "latest"),
-                    description=server_info.get("description", f"Docker Desktop MCP server: {server_name}"),
-                    server_type=ServerType.DOCKER_DESKTOP,
-                    install_command="docker",
-                    install_args=["mcp", "server", "enable", server_name],
-                    keywords=["mcp", "docker-desktop", server_name],
-                )
-                results.append(result)
+                results.append(self._docker_desktop_result(server_name, server_info))
             
             # Add gateway option if enabled servers exist
             if enabled_servers:
@@ -512,10 +523,22 @@ class ServerDiscovery:
             logger.warning(f"Failed to discover Docker Desktop servers: {e}")
             return []
     
+    def _docker_desktop_result(self, server_name: str, server_info: Dict[str, Any]) -> DiscoveryResult:
+        """Build the discovery result for a Docker MCP catalog entry."""
+        return DiscoveryResult(
+            name=f"docker-desktop-{server_name}",
+            package=server_info.get("package", server_name),
+            version=server_info.get("version", "latest"),
+            description=server_info.get("description", f"Docker Desktop MCP server: {server_name}"),
+            server_type=ServerType.DOCKER_DESKTOP,
+            install_command="docker",
+            install_args=["mcp", "server", "enable", server_name],
+            keywords=["mcp", "docker-desktop", server_name],
+        )
+    
     async def _get_docker_mcp_catalog(self) -> dict:
         """Get available servers from Docker MCP catalog."""
         try:
-            import subprocess
             import shutil
             
             # Use proper Docker path discovery
@@ -532,7 +555,7 @@ class ServerDiscovery:
                 return {}
             
             # First try to get the full catalog
-            result = subprocess.run(
+            result = run_command(
                 [docker_path, "mcp", "catalog", "show"],
                 capture_output=True,
                 text=True,
@@ -571,7 +594,6 @@ class ServerDiscovery:
     async def _get_docker_mcp_enabled_servers(self) -> list:
         """Get currently enabled servers using docker mcp server list command."""
         try:
-            import subprocess
             import shutil
             
             # Use proper Docker path discovery
@@ -588,7 +610,7 @@ class ServerDiscovery:
                 return []
             
             # Use docker mcp server list to get enabled servers
-            result = subprocess.run(
+            result = run_command(
                 [docker_path, "mcp", "server", "list"],
                 capture_output=True,
                 text=True,
@@ -669,6 +691,15 @@ class ServerDiscovery:
             return author.get("name")
         return None
         
+    def _get_npm_downloads(self, package: Dict[str, Any]) -> Optional[int]:
+        """Extract weekly downloads from an npm search result.
+        
+        The search score's popularity is a 0-1 rating, not a download count.
+        """
+        downloads = package.get("downloads")
+        weekly = downloads.get("weekly") if isinstance(downloads, dict) else None
+        return weekly if isinstance(weekly, int) else None
+        
     def _get_repo_url(self, links: Dict[str, Any]) -> Optional[str]:
         """Extract repository URL from links."""
         repo = links.get("repository")
@@ -746,7 +777,6 @@ class ServerDiscovery:
     async def update_docker_catalog(self) -> bool:
         """Update Docker MCP catalog using docker mcp catalog update."""
         try:
-            import subprocess
             import shutil
             
             # Use proper Docker path discovery
@@ -763,7 +793,7 @@ class ServerDiscovery:
                 return False
             
             logger.debug("Updating Docker MCP catalog...")
-            result = subprocess.run(
+            result = run_command(
                 [docker_path, "mcp", "catalog", "update"],
                 capture_output=True,
                 text=True,
@@ -786,4 +816,131 @@ class ServerDiscovery:
     def clear_cache(self) -> None:
         """Clear discovery cache."""
         self._cache.clear()
-        logger.debug("Discovery cache cleared")
\ No newline at end of file
+        logger.debug("Discovery cache cleared")
+    
+    async def resolve_install_id(self, install_id: str) -> Optional[DiscoveryResult]:
+        """
+        Resolve an install ID shown by discovery to its result.
+        
+        IDs recorded by an earlier discovery are answered from the install
+        index. Unknown IDs are looked up directly: a ``dd-`` ID in the Docker
+        MCP catalog, anything else as an npm package and a Docker Hub
+        repository whose names produce the ID.
+        
+        Args:
+            install_id: Install ID as shown by discover
+            
+        Returns:
+            The matching result, or None if no package produces the ID
+        """
+        result = self.install_index.get(install_id)
+        if result is not None:
+            logger.debug(f"Resolved install ID {install_id} from index")
+            return result
+        
+        logger.debug(f"Install ID {install_id} not indexed, looking it up directly")
+        if install_id.startswith("dd-"):
+            result = await self._lookup_docker_desktop_server(install_id[3:])
+        else:
+            async with httpx.AsyncClient(timeout=15.0) as client:
+                npm_result, docker_result = await asyncio.gather(
+                    self._lookup_npm_package(install_id),
+                    self._lookup_docker_hub_repository(client, install_id),
+                )
+            result = npm_result or docker_result
+        
+        if result is not None:
+            self.install_index.record([result])
+        return result
+    
+    def _install_id_splits(self, install_id: str) -> List[Tuple[str, str]]:
+        """Split an install ID into (owner, name) pairs at each hyphen."""
+        parts = install_id.split("-")
+        return [("-".join(parts[:i]), "-".join(parts[i:])) for i in range(1, len(parts))]
+    
+    def _npm_package_candidates(self, install_id: str) -> List[str]:
+        """Package names that produce install_id, most likely first."""
+        candidates = []
+        for scope, name in self._install_id_splits(install_id):
+            candidates += [f"@{scope}/server-{name}", f"@{scope}/{name}", f"{scope}-server-{name}"]
+        candidates += [install_id, f"server-{install_id}"]
+        
+        # Keep only names that map back to the ID
+        matching = []
+        for package in candidates:
+            probe = DiscoveryResult.model_construct(package=package, server_type=ServerType.NPM)
+            if generate_install_id(probe) == install_id and package not in matching:
+                matching.append(package)
+        return matching[:MAX_LOOKUP_CANDIDATES]
+    
+    async def _lookup_npm_package(self, install_id: str) -> Optional[DiscoveryResult]:
+        """Fetch the latest manifest of the npm packages an install ID can name."""
+        candidates = self._npm_package_candidates(install_id)
+        manifests = await asyncio.gather(*(self.npm_metadata.fetch_manifest(package) for package in candidates))
+        
+        for package, manifest in zip(candidates, manifests):
+            if not manifest:
+                continue
+            repository = manifest.get("repository")
+            return DiscoveryResult(
+                name=self._extract_server_name(package),
+                package=package,
+                version=manifest.get("version", "unknown"),
+                description=manifest.get("description", ""),
+                author=self._get_author_name(manifest.get("author")),
+                homepage=manifest.get("homepage"),
+                repository=self._get_repo_url({"repository": repository}) if repository else None,
+                keywords=manifest.get("keywords") or [],
+                server_type=ServerType.NPM,
+                install_command="npx",
+                install_args=["-y", package],
+            )
+        return None
+    
+    async def _lookup_docker_hub_repository(
+        self, client: httpx.AsyncClient, install_id: str
+    ) -> Optional[DiscoveryResult]:
+        """Fetch the Docker Hub repositories an install ID can name."""
+        async def fetch(namespace: str, repo: str) -> Optional[Dict[str, Any]]:
+            url = f"{self.config.discovery.docker_hub_url}/v2/repositories/{namespace}/{repo}/"
+            try:
+                with span("GET docker hub repository", "http", url=url):
+                    response = await client.get(url)
+            except httpx.RequestError as e:
+                logger.debug(f"Docker Hub lookup of {namespace}/{repo} failed: {e}")
+                return None
+            return response.json() if response.status_code == 200 else None
+        
+        candidates = self._install_id_splits(install_id)[:MAX_LOOKUP_CANDIDATES]
+        repositories = await asyncio.gather(*(fetch(namespace, repo) for namespace, repo in candidates))
+        
+        for (namespace, repo), repository in zip(candidates, repositories):
+            if not repository:
+                continue
+            full_name = f"{namespace}/{repo}"
+            server_name = self._extract_docker_server_name(repo)
+            return DiscoveryResult(
+                name=server_name,
+                package=full_name,
+                version="latest",
+                description=repository.get("description") or f"Docker MCP server: {server_name}",
+                author=namespace,
+                server_type=ServerType.DOCKER,
+                install_command="docker",
+                install_args=["run", "-i", "--rm", "--pull", "always", f"{full_name}:latest"],
+                keywords=["mcp", "docker", server_name],
+                downloads=repository.get("pull_count"),
+                last_updated=self._parse_date(repository.get("last_updated")),
+            )
+        return None
+    
+    async def _lookup_docker_desktop_server(self, server_name: str) -> Optional[DiscoveryResult]:
+        """Find one server in the Docker MCP catalog."""
+        catalog = await self._get_docker_mcp_catalog()
+        if server_name not in catalog:
+            # Install IDs keep the catalog's spelling, but users may not
+            match = next((name for name in catalog if name.lower() == server_name.lower()), None)
+            if match is None:
+                return None
+            server_name = match
+        return self._docker_desktop_result(server_name, catalog[server_name])
\ No newline at end of file
@@ -0,0 +1,344 @@
+"""
+Docker Engine API client over the local Unix socket.
+
+Image operations and container probes go straight to the daemon through a
+pooled httpx connection instead of starting the docker CLI for each call.
+Callers treat the client as optional: ``get_docker_engine()`` returns None
+when the API is disabled or the socket is unreachable, and any
+``DockerEngineError`` means the caller should fall back to the CLI.
+"""
+
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from mcp_manager.core.exceptions import DockerEngineError
+from mcp_manager.utils.config import get_config
+from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import span
+
+logger = get_logger(__name__)
+
+# Sockets of Docker Engine, Docker Desktop for Mac and Docker Desktop for Linux
+DEFAULT_SOCKET_PATHS = (
+    "/var/run/docker.sock",
+    "~/.docker/run/docker.sock",
+    "~/.docker/desktop/docker.sock",
+)
+
+# The host part is ignored when requests travel over a Unix socket
+API_BASE_URL = "http://docker"
+
+
+def find_docker_socket() -> Optional[str]:
+    """
+    Find the Docker Engine socket.
+    
+    Returns:
+        Path from a ``unix://`` DOCKER_HOST, else the first standard socket
+        that exists, or None if the daemon is not reachable over a socket
+    """
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host:
+        # A TCP or SSH host is left to the CLI
+        return docker_host[len("unix://"):] if docker_host.startswith("unix://") else None
+    
+    for candidate in DEFAULT_SOCKET_PATHS:
+        path = Path(candidate).expanduser()
+        if path.is_socket():
+            return str(path)
+    return None
+
+
+class DockerEngineClient:
+    """Minimal Docker Engine API client for image and container operations."""
+    
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(uds=socket_path),
+            base_url=API_BASE_URL,
+            timeout=timeout,
+        )
+    
+    def close(self) -> None:
+        self._client.close()
+    
+    def _request(self, name: str, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        with span(f"{method} docker engine {name}", "http", path=path) as request_span:
+            try:
+                response = self._client.request(method, path, **kwargs)
+            except httpx.HTTPError as e:
+                raise DockerEngineError(f"Docker Engine request {method} {path} failed: {e}") from e
+            request_span.set("status", response.status_code)
+            return response
+    
+    def _error(self, response: httpx.Response) -> DockerEngineError:
+        try:
+            message = response.json().get("message", response.text)
+        except ValueError:
+            message = response.text
+        return DockerEngineError(
+            f"Docker Engine returned {response.status_code}: {message}",
+            details={"status": response.status_code},
+        )
+    
+    def ping(self) -> bool:
+        """Check that the daemon answers on the socket."""
+        try:
+            return self._request("ping", "GET", "/_ping").status_code == 200
+        except DockerEngineError:
+            return False
+    
+    def list_images(self) -> List[Dict[str, Any]]:
+        """
+        List local images.
+        
+        Returns:
+            Image summaries with Id, RepoTags and RepoDigests
+        """
+        response = self._request("images", "GET", "/images/json", params={"digests": "true"})
+        if response.status_code != 200:
+            raise self._error(response)
+        images: List[Dict[str, Any]] = response.json()
+        return images
+    
+    def inspect_image(self, image: str) -> Optional[Dict[str, Any]]:
+        """
+        Inspect an image.
+        
+        Args:
+            image: Image reference or ID
+        
+        Returns:
+            The image details as ``docker image inspect`` shows them, or None
+            if the image is not present locally
+        """
+        response = self._request("image inspect", "GET", f"/images/{image}/json")
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise self._error(response)
+        details: Dict[str, Any] = response.json()
+        return details
+    
+    def remove_image(self, image: str, force: bool = True) -> bool:
+        """
+        Remove an image.
+        
+        Args:
+            image: Image reference or ID
+            force: Remove the image even if it has several tags or stopped containers
+        
+        Returns:
+            True if the image was removed, False if it was missing or in use
+        """
+        response = self._request(
+            "image remove", "DELETE", f"/images/{image}", params={"force": str(force).lower()}
+        )
+        if response.status_code == 200:
+            return True
+        if response.status_code in (404, 409):
+            logger.debug(f"Image {image} not removed: {self._error(response)}")
+            return False
+        raise self._error(response)
+    
+    def prune_images(self) -> int:
+        """
+        Remove dangling images, like ``docker image prune -f``.
+        
+        Returns:
+            Number of images deleted
+        """
+        response = self._request(
+            "image prune", "POST", "/images/prune", params={"filters": json.dumps({"dangling": ["true"]})}
+        )
+        if response.status_code != 200:
+            raise self._error(response)
+        return len(response.json().get("ImagesDeleted") or [])
+    
+    def pull_image(self, image: str, timeout: float = 300.0) -> None:
+        """
+        Pull an image, like ``docker pull``.
+        
+        Args:
+            image: Image reference
+            timeout: Seconds allowed for the whole pull
+        """
+        repository, tag = image, "latest"
+        if "@" in image:
+            repository, tag = image.split("@", 1)
+        elif image.rfind(":") > image.rfind("/"):
+            repository, tag = image.rsplit(":", 1)
+        response = self._request(
+            "image pull", "POST", "/images/create",
+            params={"fromImage": repository, "tag": tag}, timeout=timeout,
+        )
+        if response.status_code != 200:
+            raise self._error(response)
+        # Progress is streamed as JSON lines; failures arrive as an error line
+        for line in response.text.splitlines():
+            if '"error"' in line:
+                raise DockerEngineError(f"Failed to pull {image}: {json.loads(line).get('error')}")
+    
+    def create_container(self, config: Dict[str, Any]) -> str:
+        """
+        Create a container, pulling its image first if it is missing.
+        
+        Args:
+            config: Container configuration as accepted by the create endpoint
+        
+        Returns:
+            The container ID
+        """
+        response = self._request("container create", "POST", "/containers/create", json=config)
+        if response.status_code == 404:
+            self.pull_image(config["Image"])
+            response = self._request("container create", "POST", "/containers/create", json=config)
+        if response.status_code != 201:
+            raise self._error(response)
+        container_id: str = response.json()["Id"]
+        return container_id
+    
+    def start_container(self, container_id: str) -> None:
+        """Start a created container."""
+        response = self._request("container start", "POST", f"/containers/{container_id}/start")
+        if response.status_code not in (204, 304):
+            raise self._error(response)
+    
+    def remove_container(self, container_id: str) -> None:
+        """Kill and remove a container."""
+        response = self._request(
+            "container remove", "DELETE", f"/containers/{container_id}", params={"force": "true"}
+        )
+        if response.status_code not in (204, 404):
+            raise self._error(response)
+    
+    def exec_run(self, container_id: str, cmd: List[str], timeout: Optional[float] = None) -> Tuple[int, str, str]:
+        """
+        Run a command in a running container, like ``docker exec``.
+        
+        Args:
+            container_id: Container to run in
+            cmd: Command and arguments
+            timeout: Seconds to wait for the command
+        
+        Returns:
+            Exit code, stdout and stderr
+        """
+        response = self._request(
+            "exec create", "POST", f"/containers/{container_id}/exec",
+            json={"Cmd": cmd, "AttachStdout": True, "AttachStderr": True},
+        )
+        if response.status_code != 201:
+            raise self._error(response)
+        exec_id = response.json()["Id"]
+        
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        response = self._request(
+            "exec start", "POST", f"/exec/{exec_id}/start", json={"Detach": False, "Tty": False}, **kwargs
+        )
+        if response.status_code != 200:
+            raise self._error(response)
+        stdout, stderr = demultiplex(response.content)
+        
+        response = self._request("exec inspect", "GET", f"/exec/{exec_id}/json")
+        if response.status_code != 200:
+            raise self._error(response)
+        exit_code = response.json().get("ExitCode")
+        return (-1 if exit_code is None else exit_code), stdout, stderr
+    
+    def get_archive(self, container_id: str, path: str) -> Optional[bytes]:
+        """
+        Copy a path out of a container as a tar archive, like ``docker cp``.
+        
+        Args:
+            container_id: Container to read from
+            path: Absolute path in the container
+        
+        Returns:
+            The tar archive, or None if the path does not exist
+        """
+        response = self._request(
+            "container archive", "GET", f"/containers/{container_id}/archive", params={"path": path}
+        )
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise self._error(response)
+        return response.content
+
+
+def demultiplex(stream: bytes) -> Tuple[str, str]:
+    """
+    Split an attached, non-TTY output stream into stdout and stderr.
+    
+    Each frame is an 8-byte header holding the stream type and the payload
+    size as a big-endian uint32, followed by the payload.
+    """
+    stdout: List[bytes] = []
+    stderr: List[bytes] = []
+    offset = 0
+    while offset + 8 <= len(stream):
+        stream_type = stream[offset]
+        size = struct.unpack(">I", stream[offset + 4:offset + 8])[0]
+        payload = stream[offset + 8:offset + 8 + size]
+        (stderr if stream_type == 2 else stdout).append(payload)
+        offset += 8 + size
+    return (
+        b"".join(stdout).decode("utf-8", errors="replace"),
+        b"".join(stderr).decode("utf-8", errors="replace"),
+    )
+
+# Global client, looked up once per process
+_docker_engine: Optional[DockerEngineClient] = None
+_docker_engine_checked = False
+_docker_engine_lock = threading.Lock()
+
+
+def get_docker_engine() -> Optional[DockerEngineClient]:
+    """
+    Get the global Docker Engine client.
+    
+    Returns:
+        The client, or None if the Engine API is disabled in the configuration
+        or no daemon answers on the socket
+    """
+    global _docker_engine, _docker_engine_checked
+    with _docker_engine_lock:
+        if _docker_engine_checked:
+            return _docker_engine
+        _docker_engine_checked = True
+        
+        settings = get_config().docker
+        if not settings.engine_api:
+            return None
+        socket_path = settings.socket_path or find_docker_socket()
+        if not socket_path:
+            logger.debug("No Docker Engine socket found, using the docker CLI")
+            return None
+        
+        client = DockerEngineClient(socket_path, timeout=settings.timeout)
+        if not client.ping():
+            logger.debug(f"Docker Engine not answering on {socket_path}, using the docker CLI")
+            client.close()
+            return None
+        
+        logger.debug(f"Using Docker Engine API on {socket_path}")
+        _docker_engine = client
+        return _docker_engine
+
+
+def reset_docker_engine() -> None:
+    """Forget the global client so the next lookup checks the socket again."""
+    global _docker_engine, _docker_engine_checked
+    with _docker_engine_lock:
+        if _docker_engine is not None:
+            _docker_engine.close()
+        _docker_engine = None
+        _docker_engine_checked = False
@@ -0,0 +1,318 @@
+"""
+Batched cleanup of Docker images left behind by removed servers.
+
+Removing a Docker-based server schedules its image here instead of deleting
+it inline. A background sweep takes one image inventory, resolves every
+scheduled image to image IDs, and removes them all followed by at most one
+prune. The Docker Engine API is used when its socket is available, else a
+single ``docker images``, ``docker rmi`` and ``docker image prune``.
+Images scheduled inside ``batch()`` are swept together when it exits.
+"""
+
+import json
+import subprocess
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from mcp_manager.core.docker_engine import get_docker_engine
+from mcp_manager.core.exceptions import DockerEngineError
+from mcp_manager.core.image_metadata import get_image_metadata_cache
+from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command, span
+
+logger = get_logger(__name__)
+
+# Registry prefixes Docker omits when it shows Docker Hub images
+DOCKER_HUB_PREFIXES = ("docker.io/library/", "docker.io/", "index.docker.io/library/", "index.docker.io/")
+
+
+@dataclass(frozen=True)
+class ImageRecord:
+    """One row of the docker images inventory."""
+    
+    id: str
+    repository: str
+    tag: str
+    digest: str
+
+
+def image_repository(reference: str) -> str:
+    """
+    Get the repository of an image reference.
+    
+    Args:
+        reference: Image reference such as ``mcp/sqlite:latest`` or ``repo@sha256:...``
+    
+    Returns:
+        The repository without tag, digest or Docker Hub registry prefix
+    """
+    name = reference.split("@", 1)[0]
+    # A colon before the last slash belongs to a registry port, not a tag
+    if name.rfind(":") > name.rfind("/"):
+        name = name[:name.rfind(":")]
+    for prefix in DOCKER_HUB_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def parse_inventory(output: str) -> List[ImageRecord]:
+    """Parse ``docker images --format '{{json .}}'`` output, one object per line."""
+    records = []
+    for line in output.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            logger.debug(f"Skipping unparseable docker images line: {line}")
+            continue
+        records.append(ImageRecord(
+            id=row.get("ID", ""),
+            repository=row.get("Repository", ""),
+            tag=row.get("Tag", ""),
+            digest=row.get("Digest", ""),
+        ))
+    return records
+
+
+def engine_inventory(images: List[Dict[str, Any]]) -> List[ImageRecord]:
+    """Flatten Engine API image summaries into one record per tag or digest."""
+    records = []
+    for image in images:
+        image_id = image.get("Id", "")
+        tags = [tag for tag in image.get("RepoTags") or [] if tag != "<none>:<none>"]
+        digests = [digest for digest in image.get("RepoDigests") or [] if digest != "<none>@<none>"]
+        for tag in tags:
+            repository, _, name_tag = tag.rpartition(":")
+            records.append(ImageRecord(image_id, repository, name_tag, ""))
+        for digest in digests:
+            repository, _, name_digest = digest.partition("@")
+            records.append(ImageRecord(image_id, repository, "<none>", name_digest))
+        if not tags and not digests:
+            records.append(ImageRecord(image_id, "<none>", "<none>", ""))
+    return records
+
+
+def resolve_image_ids(images: Iterable[str], inventory: List[ImageRecord]) -> List[str]:
+    """
+    Resolve image references to the IDs of every matching local image.
+    
+    All tags and digests of a scheduled repository are matched. An image
+    that is also tagged under a repository that was not scheduled is kept,
+    since ``docker rmi -f <id>`` would delete that tag too.
+    
+    Args:
+        images: Image references to clean up
+        inventory: Local images
+    
+    Returns:
+        Image IDs to remove, in inventory order
+    """
+    targets = {image_repository(image) for image in images}
+    repositories: Dict[str, Set[str]] = {}
+    for record in inventory:
+        if record.id:
+            repositories.setdefault(record.id, set()).add(image_repository(record.repository))
+    
+    image_ids = []
+    for image_id, repos in repositories.items():
+        if not repos & targets:
+            continue
+        others = repos - targets - {"<none>"}
+        if others:
+            logger.debug(f"Keeping image {image_id}, still tagged as {', '.join(sorted(others))}")
+            continue
+        image_ids.append(image_id)
+    return image_ids
+
+
+class ImageJanitor:
+    """Removes scheduled Docker images in background sweeps."""
+    
+    def __init__(self, docker_path: str = "docker"):
+        self.docker_path = docker_path
+        self._pending: Dict[str, None] = {}
+        self._holds = 0
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def schedule(self, images: Iterable[str]) -> None:
+        """
+        Schedule images for removal.
+        
+        Outside ``batch()`` a sweep starts right away; images scheduled while
+        one is running are picked up by the next sweep of the same worker.
+        
+        Args:
+            images: Image references of removed servers
+        """
+        with self._lock:
+            for image in images:
+                self._pending[image] = None
+            if self._pending and not self._holds:
+                self._start_locked()
+    
+    @contextmanager
+    def batch(self) -> Iterator["ImageJanitor"]:
+        """Hold back sweeps so that images scheduled inside are removed together."""
+        with self._lock:
+            self._holds += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._holds -= 1
+                if self._pending and not self._holds:
+                    self._start_locked()
+    
+    def _start_locked(self) -> None:
+        if self._worker is not None:
+            return
+        # Not a daemon, so the interpreter finishes a sweep before exiting
+        self._worker = threading.Thread(target=self._run, name="docker-image-janitor")
+        self._worker.start()
+    
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending or self._holds:
+                    self._worker = None
+                    return
+                images = list(self._pending)
+                self._pending.clear()
+            try:
+                self.sweep(images)
+            except Exception as e:
+                logger.warning(f"Docker image cleanup failed: {e}")
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for scheduled sweeps to finish.
+        
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+        
+        Returns:
+            True if no sweep is running anymore
+        """
+        with self._lock:
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+            return not worker.is_alive()
+        return True
+    
+    def inventory(self) -> List[ImageRecord]:
+        """List local images with their digests using a single Engine API or docker call."""
+        engine = get_docker_engine()
+        if engine is not None:
+            try:
+                return engine_inventory(engine.list_images())
+            except DockerEngineError as e:
+                logger.debug(f"Falling back to the docker CLI to list images: {e}")
+        
+        result = run_command(
+            [self.docker_path, "images", "--digests", "--format", "{{json .}}"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            logger.debug(f"Failed to list Docker images: {result.stderr}")
+            return []
+        return parse_inventory(result.stdout)
+    
+    def remove(self, image_ids: List[str]) -> bool:
+        """
+        Remove images by ID.
+        
+        Args:
+            image_ids: IDs to remove
+        
+        Returns:
+            True if any image was removed
+        """
+        engine = get_docker_engine()
+        if engine is not None:
+            try:
+                # The Engine API removes one image per request, all over one connection
+                return any([engine.remove_image(image_id) for image_id in image_ids])
+            except DockerEngineError as e:
+                logger.debug(f"Falling back to the docker CLI to remove images: {e}")
+        
+        result = run_command(
+            [self.docker_path, "rmi", "-f", *image_ids],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if result.returncode != 0:
+            # rmi keeps going past images it cannot remove
+            logger.debug(f"Some Docker images were not removed: {result.stderr}")
+        return bool(result.stdout.strip())
+    
+    def prune(self) -> None:
+        """Remove dangling images."""
+        engine = get_docker_engine()
+        if engine is not None:
+            try:
+                engine.prune_images()
+                logger.debug("Cleaned up dangling Docker images")
+                return
+            except DockerEngineError as e:
+                logger.debug(f"Falling back to the docker CLI to prune images: {e}")
+        
+        result = run_command(
+            [self.docker_path, "image", "prune", "-f"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if result.returncode == 0:
+            logger.debug("Cleaned up dangling Docker images")
+    
+    def sweep(self, images: Iterable[str]) -> List[str]:
+        """
+        Remove the given images now.
+        
+        Args:
+            images: Image references to clean up
+        
+        Returns:
+            IDs of the images docker was asked to remove
+        """
+        images = list(images)
+        with span("docker image cleanup", "internal", images=len(images)):
+            try:
+                image_ids = resolve_image_ids(images, self.inventory())
+                if not image_ids:
+                    logger.debug(f"No local Docker images found for: {', '.join(images)}")
+                    return []
+                
+                logger.debug(f"Removing Docker images {', '.join(image_ids)} for: {', '.join(images)}")
+                if self.remove(image_ids):
+                    get_image_metadata_cache().forget(image_ids)
+                    self.prune()
+                return image_ids
+            
+            except subprocess.TimeoutExpired:
+                logger.warning(f"Timeout removing Docker images for: {', '.join(images)}")
+            except OSError as e:
+                logger.debug(f"Docker is not available for image cleanup: {e}")
+            return []
+
+
+# Global janitor instance
+_image_janitor: Optional[ImageJanitor] = None
+
+
+def get_image_janitor() -> ImageJanitor:
+    """Get the global image janitor instance."""
+    global _image_janitor
+    if _image_janitor is None:
+        _image_janitor = ImageJanitor()
+    return _image_janitor
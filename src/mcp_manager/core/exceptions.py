@@ -88,4 +88,9 @@ class NetworkError(MCPManagerError):
 
 class TimeoutError(MCPManagerError):
     """Operation timeout errors."""
-    pass
\ No newline at end of file
+    pass
+
+
+class DockerEngineError(MCPManagerError):
+    """Docker Engine API errors."""
+    pass
@@ -0,0 +1,243 @@
+"""
+Typed Docker image metadata with a digest-keyed on-disk cache.
+
+Tool discovery reads an image's entrypoint, command, environment, labels
+and OCI annotations. Each image is inspected once as JSON, through the
+Docker Engine API or ``docker image inspect``, and stored under its image
+ID, which never changes for the same content. A reference such as
+``mcp/fetch:latest`` maps to an ID for ``image_cache_ttl`` seconds, or
+forever when it is pinned to a digest, so repeated lookups start no docker
+process at all.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from mcp_manager.core.docker_engine import get_docker_engine
+from mcp_manager.core.exceptions import DockerEngineError
+from mcp_manager.core.parsers.json_store import JsonFileStore, put_recent
+from mcp_manager.utils.config import get_config
+from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 1
+
+# Images kept; the least recently inspected are dropped first
+MAX_CACHED_IMAGES = 500
+
+# Label prefix of the pre-defined OCI annotation keys
+OCI_ANNOTATION_PREFIX = "org.opencontainers.image."
+
+
+class ImageMetadata(BaseModel):
+    """Image configuration relevant to tool discovery."""
+    
+    id: str = Field(description="Image ID")
+    repo_tags: List[str] = Field(default_factory=list, description="Tags pointing at the image")
+    repo_digests: List[str] = Field(default_factory=list, description="Registry digests of the image")
+    entrypoint: List[str] = Field(default_factory=list, description="Entrypoint")
+    cmd: List[str] = Field(default_factory=list, description="Default command")
+    env: Dict[str, str] = Field(default_factory=dict, description="Environment variables")
+    working_dir: str = Field(default="", description="Working directory")
+    labels: Dict[str, str] = Field(default_factory=dict, description="Image labels")
+    annotations: Dict[str, str] = Field(default_factory=dict, description="OCI annotations")
+    
+    @classmethod
+    def from_inspect(cls, data: Dict[str, Any]) -> "ImageMetadata":
+        """
+        Build metadata from ``docker image inspect`` output.
+        
+        Args:
+            data: One inspected image, as the CLI or the Engine API returns it
+        
+        Returns:
+            The typed metadata
+        """
+        config = data.get("Config") or {}
+        labels = config.get("Labels") or {}
+        env = {}
+        for item in config.get("Env") or []:
+            key, _, value = item.partition("=")
+            env[key] = value
+        
+        # Annotations appear as labels, and on the descriptor with the containerd image store
+        annotations = {key: value for key, value in labels.items() if key.startswith(OCI_ANNOTATION_PREFIX)}
+        annotations.update((data.get("Descriptor") or {}).get("annotations") or {})
+        
+        return cls(
+            id=data.get("Id", ""),
+            repo_tags=data.get("RepoTags") or [],
+            repo_digests=data.get("RepoDigests") or [],
+            entrypoint=config.get("Entrypoint") or [],
+            cmd=config.get("Cmd") or [],
+            env=env,
+            working_dir=config.get("WorkingDir") or "",
+            labels=labels,
+            annotations=annotations,
+        )
+    
+    def env_text(self) -> str:
+        """Environment as space-separated KEY=value pairs."""
+        return " ".join(f"{key}={value}" for key, value in self.env.items())
+
+
+def inspect_image(reference: str) -> Optional[Dict[str, Any]]:
+    """
+    Inspect an image through the Engine API, or the docker CLI without it.
+    
+    Args:
+        reference: Image reference or ID
+    
+    Returns:
+        The image details, or None if the image is not available locally
+    """
+    engine = get_docker_engine()
+    if engine is not None:
+        try:
+            return engine.inspect_image(reference)
+        except DockerEngineError as e:
+            logger.debug(f"Falling back to the docker CLI to inspect {reference}: {e}")
+    
+    try:
+        result = run_command(
+            ["docker", "image", "inspect", reference],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        if result.returncode != 0:
+            return None
+        details = json.loads(result.stdout)
+        return details[0] if details else None
+    except Exception as e:
+        logger.debug(f"Error inspecting {reference}: {e}")
+        return None
+
+
+def get_image_metadata_file() -> Path:
+    """Get the path of the persisted image metadata."""
+    return Path.home() / ".config" / "mcp-manager" / "image_metadata.json"
+
+
+class ImageMetadataCache:
+    """Image metadata by image ID, and image references resolved to IDs."""
+    
+    def __init__(
+        self,
+        cache_file: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = None,
+        max_images: int = MAX_CACHED_IMAGES,
+    ):
+        self._cache_file = Path(cache_file) if cache_file else None
+        self._ttl = ttl
+        self.max_images = max_images
+        self._store = JsonFileStore(
+            lambda: self.cache_file, CACHE_VERSION, ("images", "references"), "image metadata cache"
+        )
+    
+    @property
+    def cache_file(self) -> Path:
+        return self._cache_file or get_image_metadata_file()
+    
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else get_config().docker.image_cache_ttl
+    
+    def _lookup(self, reference: str) -> Optional[ImageMetadata]:
+        sections = self._store.load()
+        images, entry = sections["images"], sections["references"].get(reference)
+        if entry is None or entry["id"] not in images:
+            return None
+        # A digest reference always names the same image; a tag can be re-pulled
+        if "@" not in reference and time.time() - entry["resolved_at"] > self.ttl:
+            return None
+        return ImageMetadata.model_validate(images[entry["id"]])
+    
+    def _drop_dangling_references(self) -> None:
+        sections = self._store.sections
+        images = sections["images"]
+        sections["references"] = {
+            ref: entry for ref, entry in sections["references"].items() if entry["id"] in images
+        }
+    
+    def get(
+        self,
+        reference: str,
+        inspect: Callable[[str], Optional[Dict[str, Any]]] = inspect_image,
+    ) -> Optional[ImageMetadata]:
+        """
+        Get the metadata of an image, inspecting it only on a cache miss.
+        
+        Args:
+            reference: Image reference or ID
+            inspect: Returns ``docker image inspect`` details of an image, or None
+        
+        Returns:
+            The metadata, or None if the image is not available locally
+        """
+        with self._store.lock:
+            cached = self._lookup(reference)
+        if cached is not None:
+            return cached
+        
+        data = inspect(reference)
+        if data is None:
+            return None
+        metadata = ImageMetadata.from_inspect(data)
+        if not metadata.id:
+            return metadata
+        
+        with self._store.lock:
+            sections = self._store.load()
+            sections["references"][reference] = {"id": metadata.id, "resolved_at": time.time()}
+            if put_recent(sections["images"], metadata.id, metadata.model_dump(), self.max_images):
+                self._drop_dangling_references()
+            self._store.save()
+        return metadata
+    
+    def forget(self, image_ids: Iterable[str]) -> None:
+        """
+        Drop removed images so references to them are inspected again.
+        
+        Args:
+            image_ids: IDs of the removed images, full or short as ``docker images`` prints them
+        """
+        removed = tuple(image_id.split(":")[-1] for image_id in image_ids)
+        if not removed:
+            return
+        
+        def is_removed(image_id: str) -> bool:
+            return image_id.split(":")[-1].startswith(removed)
+        
+        with self._store.lock:
+            images = self._store.load()["images"]
+            stale = [image_id for image_id in images if is_removed(image_id)]
+            if not stale:
+                return
+            for image_id in stale:
+                del images[image_id]
+            self._drop_dangling_references()
+            self._store.save()
+
+
+# Global cache instance
+_image_metadata_cache: Optional[ImageMetadataCache] = None
+
+
+def get_image_metadata_cache() -> ImageMetadataCache:
+    """Get the global image metadata cache instance."""
+    global _image_metadata_cache
+    if _image_metadata_cache is None:
+        _image_metadata_cache = ImageMetadataCache()
+    return _image_metadata_cache
+
+
+def get_image_metadata(reference: str) -> Optional[ImageMetadata]:
+    """Get the metadata of an image using the global cache."""
+    return get_image_metadata_cache().get(reference)
@@ -0,0 +1,111 @@
+"""
+Persistent install-ID index for discovery results.
+
+Install IDs printed by ``discover`` are derived from each result's package
+and type. Every result discovery returns is recorded here under its ID, so
+``install-package`` can resolve an ID with a dictionary lookup instead of
+rerunning a broad search.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from mcp_manager.core.models import DiscoveryResult, ServerType
+from mcp_manager.core.parsers.json_store import JsonFileStore, put_recent
+from mcp_manager.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+
+# Entries kept; the least recently recorded are dropped first
+MAX_ENTRIES = 5000
+
+
+def generate_install_id(result: DiscoveryResult) -> str:
+    """Generate the install ID shown for a discovery result."""
+    if result.server_type == ServerType.NPM:
+        return result.package.replace("@", "").replace("/", "-").replace("server-", "")
+    elif result.server_type == ServerType.DOCKER:
+        return result.package.replace("/", "-")
+    elif result.server_type == ServerType.DOCKER_DESKTOP:
+        return f"dd-{result.name.replace('docker-desktop-', '')}"
+    else:
+        return result.name
+
+
+def get_index_file() -> Path:
+    """Get the path of the persisted install-ID index."""
+    return Path.home() / ".config" / "mcp-manager" / "install_index.json"
+
+
+class InstallIndex:
+    """Install-ID to discovery result mapping backed by a JSON file."""
+    
+    def __init__(self, index_file: Optional[Union[str, Path]] = None, max_entries: int = MAX_ENTRIES):
+        self._index_file = Path(index_file) if index_file else None
+        self.max_entries = max_entries
+        self._store = JsonFileStore(lambda: self.index_file, INDEX_VERSION, ("entries",), "install index")
+    
+    @property
+    def index_file(self) -> Path:
+        return self._index_file or get_index_file()
+    
+    def _entries(self) -> Dict[str, Dict[str, Any]]:
+        return self._store.load()["entries"]
+    
+    def get(self, install_id: str) -> Optional[DiscoveryResult]:
+        """
+        Look up a discovery result by install ID.
+        
+        Args:
+            install_id: ID as shown by discover
+        
+        Returns:
+            The recorded result, or None if the ID has not been seen
+        """
+        with self._store.lock:
+            entry = self._entries().get(install_id)
+        return _parse_entry(entry) if entry is not None else None
+    
+    def find_by_name(self, name: str) -> Optional[DiscoveryResult]:
+        """Look up the most recently recorded result with the given server name."""
+        with self._store.lock:
+            entries = list(self._entries().values())
+        for entry in reversed(entries):
+            if entry.get("name") == name:
+                return _parse_entry(entry)
+        return None
+    
+    def record(self, results: Iterable[DiscoveryResult]) -> None:
+        """
+        Record results under their install IDs and persist the index.
+        
+        Args:
+            results: Discovery results that were shown to the user
+        """
+        with self._store.lock:
+            entries = self._entries()
+            changed = False
+            for result in results:
+                install_id = generate_install_id(result)
+                entry = result.model_dump(mode="json")
+                changed = changed or entries.get(install_id) != entry
+                # Re-insert so the most recent results survive trimming
+                if put_recent(entries, install_id, entry, self.max_entries):
+                    changed = True
+            if changed:
+                self._store.save()
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._store.lock:
+            self._store.clear()
+
+
+def _parse_entry(entry: Dict[str, Any]) -> Optional[DiscoveryResult]:
+    try:
+        return DiscoveryResult.model_validate(entry)
+    except ValueError as e:
+        logger.debug(f"Ignoring invalid install index entry: {e}")
+        return None
@@ -8,7 +8,8 @@ core data structures with validation and serialization support.
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -101,6 +102,105 @@ class Server(BaseModel):
         return config
 
 
+_NO_ENV: Mapping[str, str] = MappingProxyType({})
+
+
+class ServerRecord:
+    """
+    Lightweight, immutable server record for internal list, diff and index paths.
+    
+    Carries only the configuration fields of Server, without validation or
+    runtime state. Convert with to_server() where a full model is needed,
+    such as API responses and serialization.
+    """
+    
+    __slots__ = ("name", "command", "scope", "server_type", "args", "env", "enabled", "description")
+    
+    name: str
+    command: str
+    scope: ServerScope
+    server_type: ServerType
+    args: Tuple[str, ...]
+    env: Mapping[str, str]
+    enabled: bool
+    description: Optional[str]
+    
+    def __init__(
+        self,
+        name: str,
+        command: str,
+        scope: ServerScope,
+        server_type: ServerType,
+        args: Iterable[str] = (),
+        env: Optional[Mapping[str, str]] = None,
+        enabled: bool = True,
+        description: Optional[str] = None,
+    ):
+        setattr_ = object.__setattr__
+        setattr_(self, "name", name)
+        setattr_(self, "command", command)
+        setattr_(self, "scope", scope)
+        setattr_(self, "server_type", server_type)
+        setattr_(self, "args", tuple(args))
+        setattr_(self, "env", env or _NO_ENV)
+        setattr_(self, "enabled", enabled)
+        setattr_(self, "description", description)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.name, self.command, self.scope, self.server_type, self.args, self.enabled, self.description)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ServerRecord):
+            return NotImplemented
+        return self._key() == other._key() and dict(self.env) == dict(other.env)
+    
+    def __hash__(self) -> int:
+        return hash(self._key())
+    
+    def __repr__(self) -> str:
+        return (
+            f"ServerRecord(name={self.name!r}, command={self.command!r}, "
+            f"server_type={self.server_type.value!r}, enabled={self.enabled!r})"
+        )
+    
+    def __str__(self) -> str:
+        """String representation."""
+        return f"{self.name} ({self.scope.value})"
+    
+    @classmethod
+    def from_server(cls, server: Server) -> "ServerRecord":
+        """Create a record from a Server model."""
+        return cls(
+            name=server.name,
+            command=server.command,
+            scope=server.scope,
+            server_type=server.server_type,
+            args=server.args,
+            env=server.env,
+            enabled=server.enabled,
+            description=server.description,
+        )
+    
+    def to_server(self) -> Server:
+        """Convert to a validated Server model."""
+        return Server(
+            name=self.name,
+            command=self.command,
+            scope=self.scope,
+            server_type=self.server_type,
+            args=list(self.args),
+            env=dict(self.env),
+            enabled=self.enabled,
+            description=self.description,
+        )
+
+
 class ServerCollection(BaseModel):
     """Collection of servers grouped by scope."""
     
@@ -0,0 +1,278 @@
+"""
+Local IPC control channel for the background monitor daemon.
+
+This module exposes a small JSON-RPC 2.0 endpoint over a Unix domain socket
+so that short-lived CLI invocations can ask a running monitor daemon for its
+status, recent changes and cached server list instead of rebuilding
+SimpleMCPManager and re-probing Claude on every call.
+"""
+
+import asyncio
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from mcp_manager.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+JSONRPC_VERSION = "2.0"
+
+# Standard JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+# Maximum size of a single request line
+MAX_REQUEST_BYTES = 64 * 1024
+
+# Connecting to a dead or missing daemon must never slow the CLI down
+CONNECT_TIMEOUT = 0.25
+
+IPCHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def ipc_supported() -> bool:
+    """Check if Unix domain sockets are available on this platform."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_socket_path() -> Path:
+    """Get the path of the monitor daemon control socket."""
+    override = os.environ.get("MCP_MANAGER_MONITOR_SOCKET")
+    if override:
+        return Path(os.path.expanduser(override))
+    return Path.home() / ".config" / "mcp-manager" / "monitor.sock"
+
+
+class MonitorIPCError(Exception):
+    """Error returned by the monitor daemon for a JSON-RPC call."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class MonitorIPCServer:
+    """JSON-RPC server bound to a Unix domain socket.
+
+    Requests and responses are newline-delimited JSON objects. Each
+    connection may send any number of requests.
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None):
+        self.socket_path = Path(socket_path) if socket_path else get_socket_path()
+        self._handlers: Dict[str, IPCHandler] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def register(self, method: str, handler: IPCHandler) -> None:
+        """Register an async handler for a JSON-RPC method."""
+        self._handlers[method] = handler
+
+    def methods(self) -> list:
+        """Get the registered method names."""
+        return sorted(self._handlers.keys())
+
+    async def start(self) -> None:
+        """Bind the socket and start accepting connections."""
+        if not ipc_supported():
+            logger.debug("Unix domain sockets not supported, IPC disabled")
+            return
+
+        if self.socket_path.exists():
+            if is_daemon_running(self.socket_path):
+                raise RuntimeError(f"Another monitor daemon is listening on {self.socket_path}")
+            # Stale socket left behind by a crashed daemon
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection,
+            path=str(self.socket_path),
+            limit=MAX_REQUEST_BYTES,
+        )
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"Monitor IPC listening on {self.socket_path}")
+
+    async def stop(self) -> None:
+        """Stop accepting connections and remove the socket file."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Failed to remove monitor socket: {e}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests from a single client connection."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(self._encode_error(None, INVALID_REQUEST, "Request too large"))
+                    await writer.drain()
+                    break
+
+                if not line:
+                    break
+
+                response = await self._dispatch(line)
+                writer.write(response)
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        except Exception as e:
+            logger.debug(f"Monitor IPC connection error: {e}")
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> bytes:
+        """Decode one request line, run its handler and encode the response."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return self._encode_error(None, PARSE_ERROR, f"Invalid JSON: {e}")
+
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._encode_error(None, INVALID_REQUEST, "Missing method")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+
+        handler = self._handlers.get(method)
+        if handler is None:
+            return self._encode_error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+        try:
+            result = await handler(params)
+        except Exception as e:
+            logger.error(f"Monitor IPC method '{method}' failed: {e}")
+            return self._encode_error(request_id, INTERNAL_ERROR, str(e))
+
+        return self._encode({"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result})
+
+    def _encode_error(self, request_id: Any, code: int, message: str) -> bytes:
+        return self._encode({
+            "jsonrpc": JSONRPC_VERSION,
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        })
+
+    def _encode(self, payload: Dict[str, Any]) -> bytes:
+        return (json.dumps(payload, default=str) + "\n").encode("utf-8")
+
+
+class MonitorIPCClient:
+    """Blocking JSON-RPC client for the monitor daemon socket."""
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: float = 30.0):
+        self.socket_path = Path(socket_path) if socket_path else get_socket_path()
+        self.timeout = timeout
+        self._next_id = 1
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Call a method on the daemon.
+
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+
+        Returns:
+            The method result
+
+        Raises:
+            OSError: If the daemon cannot be reached
+            MonitorIPCError: If the daemon returned an error
+        """
+        request = {
+            "jsonrpc": JSONRPC_VERSION,
+            "id": self._next_id,
+            "method": method,
+            "params": params or {},
+        }
+        self._next_id += 1
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(self.socket_path))
+            sock.settimeout(self.timeout)
+            sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+
+        if not line:
+            raise ConnectionResetError("Monitor daemon closed the connection")
+
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise MonitorIPCError(error.get("code", INTERNAL_ERROR), error.get("message", "Unknown error"))
+
+        return response.get("result")
+
+
+def is_daemon_running(socket_path: Optional[Path] = None) -> bool:
+    """Check if a monitor daemon is answering on the control socket."""
+    if not ipc_supported():
+        return False
+
+    path = Path(socket_path) if socket_path else get_socket_path()
+    if not path.exists():
+        return False
+
+    try:
+        MonitorIPCClient(path, timeout=CONNECT_TIMEOUT * 4).call("ping")
+        return True
+    except (OSError, ValueError, MonitorIPCError):
+        return False
+
+
+def call_daemon(
+    method: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = 30.0,
+    socket_path: Optional[Path] = None,
+) -> Optional[Any]:
+    """
+    Call the running monitor daemon, if there is one.
+
+    Callers use this to answer from the daemon and fall back to in-process
+    execution when None is returned.
+
+    Args:
+        method: JSON-RPC method name
+        params: Method parameters
+        timeout: Read timeout in seconds
+        socket_path: Override the control socket path
+
+    Returns:
+        Method result, or None if no daemon is reachable or the call failed
+    """
+    if not ipc_supported():
+        return None
+
+    path = Path(socket_path) if socket_path else get_socket_path()
+    if not path.exists():
+        return None
+
+    try:
+        return MonitorIPCClient(path, timeout=timeout).call(method, params)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Monitor daemon not reachable: {e}")
+        return None
+    except MonitorIPCError as e:
+        logger.debug(f"Monitor daemon call '{method}' failed: {e}")
+        return None
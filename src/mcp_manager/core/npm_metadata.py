@@ -0,0 +1,213 @@
+"""
+npm package metadata straight from the registry, cached per name@version.
+
+Tool discovery and install-ID resolution need a package's description,
+keywords, README and bin entries. ``NpmMetadataService`` reads them from
+the configured registry instead of running ``npm info``. The version is
+resolved from the abbreviated packument, which is small, cached by the
+registry client and revalidated with conditional requests. A published
+version never changes, so its manifest is fetched once from the version
+document at ``/<name>/<version>`` and kept on disk under ``name@version``.
+Registries often leave the README out of version documents; the full
+packument is then downloaded for the latest version only, since it carries
+every version and its top-level README belongs to the latest one. A
+package that was seen before needs no subprocess, and no request while
+its packument is fresh.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import quote
+
+from mcp_manager.core.parsers.json_store import JsonFileStore, put_recent
+from mcp_manager.core.registry_client import RegistryClient, get_registry_client
+from mcp_manager.utils.config import get_config
+from mcp_manager.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 3: the latest version falls back to the full packument's README
+CACHE_VERSION = 3
+
+# Manifests kept; the least recently fetched are dropped first
+MAX_CACHED_MANIFESTS = 500
+
+# Accept header of the abbreviated ("corgi") packument used by package managers to resolve versions
+ABBREVIATED_ACCEPT = "application/vnd.npm.install-v1+json; q=1.0, application/json; q=0.8, */*"
+FULL_ACCEPT = "application/json"
+
+# Fields kept from a version document
+MANIFEST_FIELDS = ("name", "version", "description", "keywords", "author", "homepage", "repository", "bin", "main")
+
+
+def split_package_spec(spec: str) -> Tuple[str, str]:
+    """
+    Split a package spec as passed to npx into name and version.
+    
+    Args:
+        spec: Spec such as ``pkg``, ``pkg@1.2.0`` or ``@scope/pkg@latest``
+    
+    Returns:
+        The package name and the requested version or tag, empty if none
+    """
+    at = spec.rfind("@")
+    if at > 0:
+        return spec[:at], spec[at + 1:]
+    return spec, ""
+
+
+def resolve_version(packument: Dict[str, Any], wanted: str) -> Optional[str]:
+    """
+    Pick the version of a packument that a spec refers to.
+    
+    Args:
+        packument: Abbreviated or full packument
+        wanted: Exact version, dist-tag, or empty for latest
+    
+    Returns:
+        The version, or None if the package has no matching release
+    """
+    dist_tags: Dict[str, str] = packument.get("dist-tags") or {}
+    if wanted in (packument.get("versions") or {}):
+        return wanted
+    if wanted in dist_tags:
+        return dist_tags[wanted]
+    # Ranges would need a semver implementation; the latest release is what npx usually runs
+    return dist_tags.get("latest")
+
+
+def get_npm_metadata_file() -> Path:
+    """Get the path of the persisted npm manifests."""
+    return Path.home() / ".config" / "mcp-manager" / "npm_metadata.json"
+
+
+class NpmManifestCache:
+    """Package manifests by name@version backed by a JSON file."""
+    
+    def __init__(self, cache_file: Optional[Union[str, Path]] = None, max_manifests: int = MAX_CACHED_MANIFESTS):
+        self._cache_file = Path(cache_file) if cache_file else None
+        self.max_manifests = max_manifests
+        self._store = JsonFileStore(lambda: self.cache_file, CACHE_VERSION, ("manifests",), "npm metadata cache")
+    
+    @property
+    def cache_file(self) -> Path:
+        return self._cache_file or get_npm_metadata_file()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached manifest.
+        
+        Args:
+            key: ``name@version``
+        
+        Returns:
+            The manifest, or None if it was never fetched
+        """
+        with self._store.lock:
+            manifest = self._store.load()["manifests"].get(key)
+            return dict(manifest) if manifest is not None else None
+    
+    def put(self, key: str, manifest: Dict[str, Any]) -> None:
+        """
+        Store a manifest and persist the cache.
+        
+        Args:
+            key: ``name@version``
+            manifest: The version's manifest
+        """
+        with self._store.lock:
+            put_recent(self._store.load()["manifests"], key, manifest, self.max_manifests)
+            self._store.save()
+
+
+class NpmMetadataService:
+    """Package manifests from the npm registry."""
+    
+    def __init__(
+        self,
+        registry: Optional[str] = None,
+        client: Optional[RegistryClient] = None,
+        cache: Optional[NpmManifestCache] = None,
+    ):
+        """
+        Initialize the service.
+        
+        Args:
+            registry: Registry URL, defaulting to the discovery setting
+            client: Registry client, defaulting to the shared one
+            cache: Manifest cache, defaulting to the one in the config directory
+        """
+        self._registry = registry
+        self._client = client
+        self.cache = cache if cache is not None else NpmManifestCache()
+    
+    @property
+    def registry(self) -> str:
+        return (self._registry or get_config().discovery.npm_registry).rstrip("/")
+    
+    @property
+    def client(self) -> RegistryClient:
+        return self._client or get_registry_client()
+    
+    def packument_url(self, name: str) -> str:
+        return f"{self.registry}/{quote(name, safe='@/')}"
+    
+    async def fetch_manifest(self, spec: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the manifest of the version a package spec resolves to.
+        
+        Args:
+            spec: Package spec as passed to npx, e.g. ``@scope/pkg@1.2.0``
+        
+        Returns:
+            The manifest with name, version, description, keywords, bin and
+            readme, or None if the package does not exist or the registry
+            cannot be reached
+        """
+        name, wanted = split_package_spec(spec)
+        url = self.packument_url(name)
+        
+        packument = await self.client.fetch_json(url, headers={"Accept": ABBREVIATED_ACCEPT})
+        if not packument:
+            return None
+        version = resolve_version(packument, wanted)
+        if not version:
+            return None
+        
+        key = f"{name}@{version}"
+        manifest = self.cache.get(key)
+        if manifest is not None:
+            return manifest
+        
+        # The manifest cache keeps the extract, so the document itself is not cached
+        version_data = await self.client.fetch_json(
+            f"{url}/{quote(version, safe='')}", headers={"Accept": FULL_ACCEPT}, use_cache=False
+        )
+        if not version_data:
+            return None
+        manifest = {field: version_data[field] for field in MANIFEST_FIELDS if field in version_data}
+        manifest["readme"] = version_data.get("readme") or ""
+        
+        if not manifest["readme"] and version == (packument.get("dist-tags") or {}).get("latest"):
+            full = await self.client.fetch_json(url, headers={"Accept": FULL_ACCEPT}, use_cache=False)
+            manifest["readme"] = (full or {}).get("readme") or ""
+        
+        self.cache.put(key, manifest)
+        logger.debug(f"Cached npm manifest of {key}")
+        return manifest
+    
+    def get_manifest(self, spec: str) -> Optional[Dict[str, Any]]:
+        """Get a manifest from synchronous code; see ``fetch_manifest``."""
+        return self.client.run(self.fetch_manifest(spec))
+
+
+# Global service instance
+_npm_metadata: Optional[NpmMetadataService] = None
+
+
+def get_npm_metadata() -> NpmMetadataService:
+    """Get the global npm metadata service instance."""
+    global _npm_metadata
+    if _npm_metadata is None:
+        _npm_metadata = NpmMetadataService()
+    return _npm_metadata
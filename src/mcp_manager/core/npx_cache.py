@@ -0,0 +1,198 @@
+"""
+Offline package lookup in the local npx cache.
+
+``npx`` installs every package it runs into its own directory under
+``<npm cache>/_npx/<hash>/node_modules``. For a server that has run before,
+its ``package.json``, README and any tool manifest it ships are therefore
+already on disk. ``NpxCache`` finds the installed package and reads the
+tools it declares, without starting npm, npx or the server, and without
+any network access.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from mcp_manager.core.npm_metadata import split_package_spec
+from mcp_manager.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tool manifests a package may ship next to its package.json, in lookup order
+TOOL_MANIFEST_FILES = ("manifest.json", "mcp.json", "tools.json", "server.json")
+
+README_FILES = ("README.md", "readme.md", "README", "README.txt")
+
+# Largest manifest or README read from the cache
+MAX_FILE_BYTES = 1024 * 1024
+
+
+def find_npx_cache_dir() -> Path:
+    """Get the npx cache directory, honouring npm's cache setting."""
+    npm_cache = os.environ.get("npm_config_cache") or os.environ.get("NPM_CONFIG_CACHE")
+    if npm_cache:
+        return Path(npm_cache).expanduser() / "_npx"
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "npm-cache" / "_npx"
+    return Path.home() / ".npm" / "_npx"
+
+
+def read_text(path: Path) -> Optional[str]:
+    """Read a file from the cache, or None if it is missing or too large."""
+    try:
+        if path.stat().st_size > MAX_FILE_BYTES:
+            logger.debug(f"Skipping {path}: too large")
+            return None
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """Read a JSON file from the cache, or None if it is missing or invalid."""
+    text = read_text(path)
+    if text is None:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        logger.debug(f"Ignoring invalid JSON in {path}: {e}")
+        return None
+
+
+def parse_declared_tools(document: Any, source: str) -> List[Dict[str, Any]]:
+    """
+    Get the tools a manifest declares.
+    
+    Args:
+        document: Manifest with a ``tools`` list, or the list itself; entries
+            are tool names or objects with ``name`` and ``description``
+        source: Source recorded on each tool
+    
+    Returns:
+        The declared tools, empty if there are none
+    """
+    entries = document.get("tools") if isinstance(document, dict) else document
+    if not isinstance(entries, list):
+        return []
+    
+    tools = []
+    for entry in entries:
+        if isinstance(entry, str):
+            name, description = entry, ""
+        elif isinstance(entry, dict) and isinstance(entry.get("name"), str):
+            name, description = entry["name"], entry.get("description") or ""
+        else:
+            continue
+        tools.append({"name": name, "description": description, "source": source})
+    return tools
+
+
+class NpxCache:
+    """Packages installed in the npx cache."""
+    
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+    
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or find_npx_cache_dir()
+    
+    def find_package(self, spec: str) -> Optional[Path]:
+        """
+        Find the installed directory of a package.
+        
+        Args:
+            spec: Package spec as passed to npx, e.g. ``@scope/pkg@1.2.0``
+        
+        Returns:
+            The package directory; for specs without an exact installed
+            version the most recently installed copy. None if npx never
+            installed the package.
+        """
+        name, wanted = split_package_spec(spec)
+        try:
+            installs = list(self.cache_dir.iterdir())
+        except OSError:
+            return None
+        
+        candidates = []
+        for install in installs:
+            package_dir = install / "node_modules" / name
+            package_json = package_dir / "package.json"
+            try:
+                mtime = package_json.stat().st_mtime
+            except OSError:
+                continue
+            if wanted:
+                version = (read_json(package_json) or {}).get("version")
+                if version == wanted:
+                    return package_dir
+            candidates.append((mtime, package_dir))
+        
+        if not candidates:
+            return None
+        return max(candidates, key=lambda candidate: candidate[0])[1]
+    
+    def read_package(self, spec: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the manifest of an installed package, shaped like a registry manifest.
+        
+        Args:
+            spec: Package spec as passed to npx
+        
+        Returns:
+            package.json with the README under ``readme`` and the installed
+            directory under ``path``, or None if the package is not installed
+        """
+        package_dir = self.find_package(spec)
+        if package_dir is None:
+            return None
+        manifest = read_json(package_dir / "package.json")
+        if not isinstance(manifest, dict):
+            return None
+        
+        if not manifest.get("readme"):
+            for readme_file in README_FILES:
+                readme = read_text(package_dir / readme_file)
+                if readme:
+                    manifest["readme"] = readme
+                    break
+        manifest["path"] = str(package_dir)
+        return manifest
+    
+    def declared_tools(self, manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get the tools an installed package declares about itself.
+        
+        Args:
+            manifest: Result of ``read_package``
+        
+        Returns:
+            Tools from the ``mcp`` field of package.json, else from the
+            first shipped tool manifest that lists any
+        """
+        tools = parse_declared_tools(manifest.get("mcp"), "package_json_mcp")
+        if tools:
+            return tools
+        
+        package_dir = Path(manifest["path"])
+        for manifest_file in TOOL_MANIFEST_FILES:
+            document = read_json(package_dir / manifest_file)
+            tools = parse_declared_tools(document, f"npx_cache_{manifest_file}")
+            if tools:
+                return tools
+        return []
+
+
+# Global cache instance
+_npx_cache: Optional[NpxCache] = None
+
+
+def get_npx_cache() -> NpxCache:
+    """Get the global npx cache instance."""
+    global _npx_cache
+    if _npx_cache is None:
+        _npx_cache = NpxCache()
+    return _npx_cache
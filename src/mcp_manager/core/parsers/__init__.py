@@ -1,6 +1,9 @@
 """Configuration parsers for external MCP configuration files."""
 
-from .docker_parser import DockerRegistryParser
+from .docker_parser import DockerRegistryParser, read_registry
 from .claude_parser import ClaudeConfigParser
+from .claude_json import load_claude_mcp_sections
+from .claude_scopes import read_server_scopes
 
-__all__ = ['DockerRegistryParser', 'ClaudeConfigParser']
\ No newline at end of file
+__all__ = ['DockerRegistryParser', 'ClaudeConfigParser', 'load_claude_mcp_sections', 'read_registry',
+           'read_server_scopes']
\ No newline at end of file
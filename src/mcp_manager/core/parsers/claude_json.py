@@ -0,0 +1,265 @@
+"""
+Incremental extraction of MCP server sections from ~/.claude.json.
+
+Claude keeps project history and per-project settings in ~/.claude.json, so
+the file grows with every project ever opened. Only the ``mcpServers``
+sections matter to MCP Manager. This module memory-maps the file, walks the
+top-level structure and skips unrelated subtrees by scanning for matching
+brackets without building them. Only the wanted sections are decoded, so
+memory use tracks the size of the server definitions, not the file.
+"""
+
+import json
+import mmap
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, Tuple, Union
+
+from mcp_manager.utils.tracing import span
+
+# Containers holding per-project settings keyed by project path
+PROJECT_CONTAINERS = ('projectConfigs',)
+
+SERVERS_KEY = 'mcpServers'
+
+# Documents are read from memory maps, or from bytes in tests
+Buffer = Union[bytes, mmap.mmap]
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_STRING_PATTERN = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING = re.compile(_STRING_PATTERN, re.S)
+_SCALAR = re.compile(rb'[^,}\]\s]+')
+
+# Patterns are written in unrolled form so they never backtrack badly:
+# text between brackets, including complete strings
+_BODY = rb'[^"\[\]{}]*(?:' + _STRING_PATTERN + rb'[^"\[\]{}]*)*'
+# a container with no nested containers
+_LEAF = rb'(?:\{' + _BODY + rb'\}|\[' + _BODY + rb'\])'
+# a container nesting leaves only, e.g. a history entry holding an empty object
+_LEAF2 = (
+    rb'(?:\{' + _BODY + rb'(?:' + _LEAF + _BODY + rb')*\}'
+    rb'|\[' + _BODY + rb'(?:' + _LEAF + _BODY + rb')*\])'
+)
+# Everything up to the next bracket that needs depth tracking in Python
+_SKIP = re.compile(_BODY + rb'(?:' + _LEAF2 + _BODY + rb')*', re.S)
+
+
+class StreamingJSONError(json.JSONDecodeError):
+    """Malformed JSON found while scanning a document without decoding it."""
+
+    def __init__(self, msg: str, pos: int):
+        ValueError.__init__(self, f"{msg} (byte {pos})")
+        self.msg = msg
+        self.doc = ""
+        self.pos = pos
+        # Lines are not counted while scanning bytes
+        self.lineno = 0
+        self.colno = 0
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, int]]:
+        return self.__class__, (self.msg, self.pos)
+
+
+class _Scanner:
+    """Position-tracking reader over a bytes-like JSON document."""
+
+    def __init__(self, buf: Buffer):
+        self.buf = buf
+        self.size = len(buf)
+
+    def skip_ws(self, pos: int) -> int:
+        # The pattern matches the empty string, so it never fails
+        match = _WHITESPACE.match(self.buf, pos)
+        return match.end() if match else pos
+
+    def expect(self, pos: int, char: bytes) -> int:
+        pos = self.skip_ws(pos)
+        if self.buf[pos:pos + 1] != char:
+            raise StreamingJSONError(f"Expected {char.decode()!r}", pos)
+        return pos + 1
+
+    def peek(self, pos: int) -> Tuple[bytes, int]:
+        pos = self.skip_ws(pos)
+        return self.buf[pos:pos + 1], pos
+
+    def read_key(self, pos: int) -> Tuple[str, int]:
+        """Read an object key and the following colon."""
+        pos = self.skip_ws(pos)
+        match = _STRING.match(self.buf, pos)
+        if not match:
+            raise StreamingJSONError("Expected object key", pos)
+        key = json.loads(match.group())
+        return key, self.expect(match.end(), b':')
+
+    def skip_value(self, pos: int) -> Tuple[int, int]:
+        """Skip one value without building it, returning its (start, end)."""
+        pos = self.skip_ws(pos)
+        char = self.buf[pos:pos + 1]
+
+        if char == b'"':
+            match = _STRING.match(self.buf, pos)
+            if not match:
+                raise StreamingJSONError("Unterminated string", pos)
+            return pos, match.end()
+
+        if char in (b'{', b'['):
+            # Shallow subtrees and all strings are consumed by the regex engine;
+            # only deeper brackets reach this loop
+            depth = 1
+            end = pos + 1
+            while True:
+                # The pattern matches the empty string, so it never fails
+                match = _SKIP.match(self.buf, end)
+                end = match.end() if match else end
+                token = self.buf[end:end + 1]
+                if token in (b'{', b'['):
+                    depth += 1
+                elif token in (b'}', b']'):
+                    depth -= 1
+                    if depth == 0:
+                        return pos, end + 1
+                else:
+                    raise StreamingJSONError("Unterminated container", pos)
+                end += 1
+
+        match = _SCALAR.match(self.buf, pos)
+        if not match:
+            raise StreamingJSONError("Expected value", pos)
+        return pos, match.end()
+
+    def decode_value(self, pos: int) -> Tuple[Any, int]:
+        """Decode one value, returning it and the position after it."""
+        start, end = self.skip_value(pos)
+        try:
+            return json.loads(self.buf[start:end]), end
+        except json.JSONDecodeError as e:
+            raise StreamingJSONError(e.msg, start + e.pos)
+
+    def iter_object(self, pos: int) -> Generator[Tuple[str, int], int, int]:
+        """Iterate over the keys of an object, yielding (key, value position).
+
+        The consumer must advance past each value by sending back the
+        position after it.
+        """
+        pos = self.expect(pos, b'{')
+        char, pos = self.peek(pos)
+        if char == b'}':
+            return pos + 1
+
+        while True:
+            key, pos = self.read_key(pos)
+            pos = yield key, pos
+            char, pos = self.peek(pos)
+            if char == b',':
+                pos += 1
+            elif char == b'}':
+                return pos + 1
+            else:
+                raise StreamingJSONError("Expected ',' or '}'", pos)
+
+
+def _walk_object(scanner: _Scanner, pos: int, visit: Callable[[str, int], int]) -> int:
+    """Walk an object, letting ``visit(key, pos)`` consume each value."""
+    walker = scanner.iter_object(pos)
+    try:
+        key, value_pos = next(walker)
+        while True:
+            key, value_pos = walker.send(visit(key, value_pos))
+    except StopIteration as stop:
+        end: int = stop.value
+        return end
+
+
+def extract_mcp_servers_from_bytes(
+    buf: Buffer, containers: Tuple[str, ...] = PROJECT_CONTAINERS
+) -> Dict[str, Any]:
+    """
+    Extract MCP server sections from a JSON document.
+
+    Args:
+        buf: Bytes-like JSON document
+        containers: Top-level keys holding per-project objects
+
+    Returns:
+        A pruned document containing only the top-level ``mcpServers`` and
+        ``<container>.<project>.mcpServers`` entries that exist in the input
+
+    Raises:
+        json.JSONDecodeError: If the document structure is malformed
+    """
+    scanner = _Scanner(buf)
+    result: Dict[str, Any] = {}
+    
+    if scanner.skip_ws(0) == scanner.size:
+        return result
+
+    def visit_project(project: Dict[str, Any]) -> Callable[[str, int], int]:
+        def visit(key: str, pos: int) -> int:
+            if key == SERVERS_KEY:
+                project[SERVERS_KEY], pos = scanner.decode_value(pos)
+                return pos
+            return scanner.skip_value(pos)[1]
+        return visit
+
+    def visit_container(projects: Dict[str, Any]) -> Callable[[str, int], int]:
+        def visit(project_path: str, pos: int) -> int:
+            char, pos = scanner.peek(pos)
+            if char != b'{':
+                return scanner.skip_value(pos)[1]
+            project: Dict[str, Any] = {}
+            pos = _walk_object(scanner, pos, visit_project(project))
+            if project:
+                projects[project_path] = project
+            return pos
+        return visit
+
+    def visit_root(key: str, pos: int) -> int:
+        if key == SERVERS_KEY:
+            result[SERVERS_KEY], pos = scanner.decode_value(pos)
+            return pos
+        if key in containers:
+            char, pos = scanner.peek(pos)
+            if char == b'{':
+                projects: Dict[str, Any] = {}
+                pos = _walk_object(scanner, pos, visit_container(projects))
+                result[key] = projects
+                return pos
+        return scanner.skip_value(pos)[1]
+
+    char, pos = scanner.peek(0)
+    if char != b'{':
+        raise StreamingJSONError("Expected top-level object", pos)
+
+    pos = _walk_object(scanner, pos, visit_root)
+    if scanner.skip_ws(pos) != scanner.size:
+        raise StreamingJSONError("Extra data", scanner.skip_ws(pos))
+
+    return result
+
+
+def load_claude_mcp_sections(
+    path: Union[str, Path], containers: Tuple[str, ...] = PROJECT_CONTAINERS
+) -> Dict[str, Any]:
+    """
+    Load only the MCP server sections of a Claude configuration file.
+
+    Args:
+        path: Path to the configuration file (usually ~/.claude.json)
+        containers: Top-level keys holding per-project objects
+
+    Returns:
+        Pruned document with the ``mcpServers`` sections, empty for an empty file
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped
+            return {}
+
+    with buf, span("parse claude.json", "parse", path=str(path), bytes=len(buf)):
+        return extract_mcp_servers_from_bytes(buf, containers)
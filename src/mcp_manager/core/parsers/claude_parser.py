@@ -11,6 +11,8 @@ from typing import Dict, List, Set, Optional, Any
 from datetime import datetime
 
 from mcp_manager.core.models import Server, ServerType, ServerScope
+from mcp_manager.core.parsers.claude_json import load_claude_mcp_sections
+from mcp_manager.core.parsers.file_stamp import FileStamp, get_file_stamp
 from mcp_manager.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -123,6 +125,8 @@ class ClaudeConfigParser:
         self._config_paths = self._get_config_paths()
         self._last_states: Dict[str, ClaudeConfigState] = {}
         self._last_parsed: Dict[str, datetime] = {}
+        # File stamp each cached state was parsed from, None for a missing file
+        self._stamps: Dict[str, Optional[FileStamp]] = {}
     
     def _get_config_paths(self) -> Dict[str, str]:
         """Get Claude configuration file paths by scope."""
@@ -135,26 +139,38 @@ class ClaudeConfigParser:
         }
     
     def parse_config(self, scope: str = 'user') -> Optional[ClaudeConfigState]:
-        """Parse a Claude configuration file for the given scope."""
+        """
+        Parse a Claude configuration file for the given scope.
+        
+        The parsed state is cached and returned as-is while the file's
+        (inode, size, mtime_ns) stamp is unchanged.
+        """
         if scope not in self._config_paths:
             logger.error(f"Invalid scope: {scope}")
             return None
         
         config_path = Path(self._config_paths[scope])
+        stamp = get_file_stamp(config_path)
+        
+        if scope in self._last_states and self._stamps.get(scope) == stamp:
+            return self._last_states[scope]
         
         try:
-            if not config_path.exists():
+            if stamp is None:
                 logger.debug(f"Claude config file not found: {config_path}")
-                return ClaudeConfigState(scope=scope)  # Empty state
+                return self._remember(scope, ClaudeConfigState(scope=scope), stamp)  # Empty state
             
-            with open(config_path, 'r') as f:
-                content = f.read().strip()
-                
-            if not content:
-                logger.debug(f"Claude config file is empty: {config_path}")
-                return ClaudeConfigState(scope=scope)  # Empty state
+            if scope == 'internal':
+                # ~/.claude.json also holds project history; only extract the server sections
+                config_data = load_claude_mcp_sections(config_path)
+            else:
+                with open(config_path, 'r') as f:
+                    content = f.read().strip()
+                config_data = json.loads(content) if content else {}
             
-            config_data = json.loads(content)
+            if not config_data:
+                logger.debug(f"Claude config file is empty: {config_path}")
+                return self._remember(scope, ClaudeConfigState(scope=scope), stamp)  # Empty state
             
             servers = {}
             
@@ -208,11 +224,9 @@ class ClaudeConfigParser:
                 servers[server_name] = server_def
             
             state = ClaudeConfigState(servers, scope)
-            self._last_states[scope] = state
-            self._last_parsed[scope] = datetime.now()
             
             logger.debug(f"Parsed Claude {scope} config: {len(servers)} servers")
-            return state
+            return self._remember(scope, state, stamp)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON in Claude config {config_path}: {e}")
@@ -221,6 +235,15 @@ class ClaudeConfigParser:
             logger.error(f"Failed to parse Claude config {config_path}: {e}")
             return None
     
+    def _remember(
+        self, scope: str, state: ClaudeConfigState, stamp: Optional[FileStamp]
+    ) -> ClaudeConfigState:
+        """Cache a parsed state together with the file stamp it came from."""
+        self._last_states[scope] = state
+        self._last_parsed[scope] = datetime.now()
+        self._stamps[scope] = stamp
+        return state
+    
     def parse_all_configs(self) -> Dict[str, ClaudeConfigState]:
         """Parse all Claude configuration files."""
         results = {}
@@ -234,35 +257,21 @@ class ClaudeConfigParser:
     
     def get_changes_since_last_parse(self, scope: str = 'user') -> Optional[Dict[str, List[str]]]:
         """Get changes since the last parse for a specific scope."""
-        if scope not in self._last_states:
+        previous_state = self._last_states.get(scope)
+        if previous_state is None:
             return None
         
         current_state = self.parse_config(scope)
         if not current_state:
             return None
         
-        return current_state.compare_with(self._last_states[scope])
+        return current_state.compare_with(previous_state)
     
     def has_changed(self, scope: str = 'user') -> bool:
-        """Check if the config has changed since last parse."""
-        config_path = Path(self._config_paths[scope])
-        
-        if not config_path.exists():
-            # File doesn't exist - has it been deleted?
-            return scope in self._last_states and len(self._last_states[scope].servers) > 0
-        
-        try:
-            current_mtime = config_path.stat().st_mtime
-            
-            if scope not in self._last_parsed:
-                return True
-            
-            last_parsed_timestamp = self._last_parsed[scope].timestamp()
-            return current_mtime > last_parsed_timestamp
-            
-        except Exception as e:
-            logger.debug(f"Error checking config file modification time: {e}")
-            return True  # Assume changed if we can't determine
+        """Check if the config has changed since last parse using a single stat call."""
+        if scope not in self._last_states:
+            return True
+        return get_file_stamp(self._config_paths[scope]) != self._stamps.get(scope)
     
     def get_all_servers(self) -> List[ClaudeServerDefinition]:
         """Get all servers from all scopes, with proper precedence."""
@@ -311,9 +320,11 @@ class ClaudeConfigParser:
         if scope:
             self._last_states.pop(scope, None)
             self._last_parsed.pop(scope, None)
+            self._stamps.pop(scope, None)
         else:
             self._last_states.clear()
             self._last_parsed.clear()
+            self._stamps.clear()
 
 
 def parse_claude_config(scope: str = 'user') -> Optional[ClaudeConfigState]:
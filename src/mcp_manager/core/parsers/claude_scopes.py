@@ -0,0 +1,106 @@
+"""
+Scope index for servers configured in Claude Code.
+
+``claude mcp list`` prints every server without saying where it is defined,
+but ``claude mcp add`` and ``claude mcp remove`` need the scope. Claude Code
+keeps local servers in ~/.claude.json under the project path, project servers
+in the project's .mcp.json and user servers in the top-level ``mcpServers``
+of ~/.claude.json. This module reads those files, memoized by file stamp, so
+a mutation can target the right scope in a single call.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from mcp_manager.core.models import ServerScope
+from mcp_manager.core.parsers.claude_json import SERVERS_KEY, load_claude_mcp_sections
+from mcp_manager.core.parsers.file_stamp import FileStamp, get_file_stamp
+from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import span
+
+logger = get_logger(__name__)
+
+# Keys of ~/.claude.json holding per-project settings by project path
+LOCAL_CONTAINERS = ('projects', 'projectConfigs')
+
+PROJECT_CONFIG = '.mcp.json'
+
+# Scope indexes keyed by project directory, valid while both file stamps match
+_scope_cache: Dict[str, Tuple[Tuple[Optional[FileStamp], Optional[FileStamp]], Dict[str, ServerScope]]] = {}
+_scope_cache_lock = threading.Lock()
+
+
+def _server_names(section: Any) -> Tuple[str, ...]:
+    return tuple(section) if isinstance(section, dict) else ()
+
+
+def read_server_scopes(project_dir: Optional[Union[str, Path]] = None) -> Dict[str, ServerScope]:
+    """
+    Map each server Claude Code loads for a project to its scope.
+    
+    A name defined in several scopes maps to the one Claude Code uses:
+    local before project before user. Unreadable files are treated as
+    empty.
+    
+    Args:
+        project_dir: Project directory, defaults to the current directory
+    
+    Returns:
+        Mapping of server name to scope
+    """
+    project = os.path.abspath(project_dir or os.getcwd())
+    claude_json = Path.home() / '.claude.json'
+    mcp_json = Path(project) / PROJECT_CONFIG
+    stamps = (get_file_stamp(claude_json), get_file_stamp(mcp_json))
+    
+    with _scope_cache_lock:
+        cached = _scope_cache.get(project)
+        if cached and cached[0] == stamps:
+            return dict(cached[1])
+    
+    user_names: Tuple[str, ...] = ()
+    local_names: Tuple[str, ...] = ()
+    project_names: Tuple[str, ...] = ()
+    
+    if stamps[0] is not None:
+        try:
+            sections = load_claude_mcp_sections(claude_json, LOCAL_CONTAINERS)
+            user_names = _server_names(sections.get(SERVERS_KEY))
+            for container in LOCAL_CONTAINERS:
+                project_config = sections.get(container, {}).get(project, {})
+                local_names += _server_names(project_config.get(SERVERS_KEY))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read server scopes from {claude_json}: {e}")
+    
+    if stamps[1] is not None:
+        try:
+            with span("parse .mcp.json", "parse", path=str(mcp_json)):
+                with open(mcp_json, 'r') as f:
+                    content = f.read().strip()
+                project_data = json.loads(content) if content else {}
+            if isinstance(project_data, dict):
+                project_names = _server_names(project_data.get(SERVERS_KEY))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read server scopes from {mcp_json}: {e}")
+    
+    scopes: Dict[str, ServerScope] = {}
+    for names, scope in (
+        (user_names, ServerScope.USER),
+        (project_names, ServerScope.PROJECT),
+        (local_names, ServerScope.LOCAL),
+    ):
+        scopes.update(dict.fromkeys(names, scope))
+    
+    with _scope_cache_lock:
+        _scope_cache[project] = (stamps, scopes)
+    
+    return dict(scopes)
+
+
+def clear_scope_cache() -> None:
+    """Drop all cached scope indexes."""
+    with _scope_cache_lock:
+        _scope_cache.clear()
@@ -5,15 +5,81 @@ This module parses the ~/.docker/mcp/registry.yaml file to track changes
 in Docker Desktop MCP server enable/disable states.
 """
 
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Any, Dict, List, Set, Optional, Tuple, Union
 from datetime import datetime
 
+from mcp_manager.core.parsers.file_stamp import FileStamp, get_file_stamp
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import span
 
 logger = get_logger(__name__)
 
+# libyaml's loader is several times faster than the pure-Python one
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed registry sections keyed by path, valid while the file stamp matches
+_registry_cache: Dict[str, Tuple[Optional[FileStamp], Dict[str, Dict[str, Any]]]] = {}
+_registry_cache_lock = threading.Lock()
+
+
+def get_registry_path() -> Path:
+    """Get the path of the Docker Desktop MCP registry."""
+    return Path.home() / '.docker' / 'mcp' / 'registry.yaml'
+
+
+def read_registry(registry_path: Optional[Union[str, Path]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the server section of a Docker Desktop MCP registry.
+    
+    The parsed result is shared by all callers and only re-read when the
+    file's (inode, size, mtime_ns) stamp changes. The returned mapping is a
+    copy; the per-server dicts are shared and must not be modified.
+    
+    Args:
+        registry_path: Registry file, defaults to ~/.docker/mcp/registry.yaml
+        
+    Returns:
+        Mapping of server name to its registry entry, empty if the file is
+        missing, empty or has no registry section
+        
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+        OSError: If the file exists but cannot be read
+    """
+    path = str(registry_path or get_registry_path())
+    stamp = get_file_stamp(path)
+    
+    with _registry_cache_lock:
+        cached = _registry_cache.get(path)
+        if cached and cached[0] == stamp:
+            return dict(cached[1])
+    
+    servers: Dict[str, Dict[str, Any]] = {}
+    
+    if stamp is not None:
+        with span("parse registry.yaml", "parse", path=path), open(path, 'rb') as f:
+            registry_data = yaml.load(f, Loader=YAML_LOADER)
+        
+        registry_section = registry_data.get('registry') if isinstance(registry_data, dict) else None
+        if isinstance(registry_section, dict):
+            for server_name, server_config in registry_section.items():
+                servers[str(server_name)] = server_config if isinstance(server_config, dict) else {}
+    
+    with _registry_cache_lock:
+        _registry_cache[path] = (stamp, servers)
+    
+    logger.debug(f"Read Docker registry {path}: {len(servers)} servers")
+    return dict(servers)
+
+
+def clear_registry_cache() -> None:
+    """Drop all cached registry contents."""
+    with _registry_cache_lock:
+        _registry_cache.clear()
+
 
 class DockerServerState:
     """Represents the state of a Docker Desktop MCP server."""
@@ -79,43 +145,33 @@ class DockerRegistryParser:
         if registry_path:
             self.registry_path = Path(registry_path)
         else:
-            self.registry_path = Path.home() / '.docker' / 'mcp' / 'registry.yaml'
+            self.registry_path = get_registry_path()
         
         self._last_state: Optional[DockerRegistryState] = None
         self._last_parsed: Optional[datetime] = None
+        # File stamp the cached state was parsed from, None for a missing file
+        self._last_stamp: Optional[FileStamp] = None
     
     def parse_registry(self) -> Optional[DockerRegistryState]:
-        """Parse the Docker registry file and return the current state."""
+        """
+        Parse the Docker registry file and return the current state.
+        
+        The parsed state is cached and returned as-is while the file's
+        (inode, size, mtime_ns) stamp is unchanged.
+        """
+        stamp = get_file_stamp(self.registry_path)
+        
+        if self._last_state is not None and stamp == self._last_stamp:
+            return self._last_state
+        
         try:
-            if not self.registry_path.exists():
+            if stamp is None:
                 logger.debug(f"Docker registry file not found: {self.registry_path}")
-                return DockerRegistryState()  # Empty state
-            
-            with open(self.registry_path, 'r') as f:
-                content = f.read().strip()
-                
-            if not content:
-                logger.debug("Docker registry file is empty")
-                return DockerRegistryState()  # Empty state
-                
-            registry_data = yaml.safe_load(content)
-            
-            if not registry_data or 'registry' not in registry_data:
-                logger.debug("Invalid registry file format")
-                return DockerRegistryState()  # Empty state
+                return self._remember(DockerRegistryState(), stamp)  # Empty state
             
             servers = {}
-            registry_section = registry_data['registry']
             
-            if registry_section is None:
-                # Empty registry section
-                logger.debug("Registry section is empty")
-                return DockerRegistryState()
-            
-            for server_name, server_config in registry_section.items():
-                if server_config is None:
-                    server_config = {}
-                
+            for server_name, server_config in read_registry(self.registry_path).items():
                 # If a server is in the registry, it's enabled
                 # Disabled servers are removed from the registry
                 server_state = DockerServerState(
@@ -126,11 +182,9 @@ class DockerRegistryParser:
                 servers[server_name] = server_state
             
             state = DockerRegistryState(servers)
-            self._last_state = state
-            self._last_parsed = datetime.now()
             
             logger.debug(f"Parsed Docker registry: {len(servers)} servers")
-            return state
+            return self._remember(state, stamp)
             
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse YAML in Docker registry: {e}")
@@ -139,34 +193,30 @@ class DockerRegistryParser:
             logger.error(f"Failed to parse Docker registry: {e}")
             return None
     
+    def _remember(self, state: DockerRegistryState, stamp: Optional[FileStamp]) -> DockerRegistryState:
+        """Cache a parsed state together with the file stamp it came from."""
+        self._last_state = state
+        self._last_parsed = datetime.now()
+        self._last_stamp = stamp
+        return state
+    
     def get_changes_since_last_parse(self) -> Optional[Dict[str, List[str]]]:
         """Get changes since the last parse."""
-        if not self._last_state:
+        previous_state = self._last_state
+        if not previous_state:
             return None
         
         current_state = self.parse_registry()
         if not current_state:
             return None
         
-        return current_state.compare_with(self._last_state)
+        return current_state.compare_with(previous_state)
     
     def has_changed(self) -> bool:
-        """Check if the registry has changed since last parse."""
-        if not self.registry_path.exists():
-            return self._last_state is not None and len(self._last_state.servers) > 0
-        
-        try:
-            current_mtime = self.registry_path.stat().st_mtime
-            
-            if not self._last_parsed:
-                return True
-                
-            last_parsed_timestamp = self._last_parsed.timestamp()
-            return current_mtime > last_parsed_timestamp
-            
-        except Exception as e:
-            logger.debug(f"Error checking registry file modification time: {e}")
-            return True  # Assume changed if we can't determine
+        """Check if the registry has changed since last parse using a single stat call."""
+        if self._last_state is None:
+            return True
+        return get_file_stamp(self.registry_path) != self._last_stamp
     
     def get_last_state(self) -> Optional[DockerRegistryState]:
         """Get the last parsed state."""
@@ -176,6 +226,7 @@ class DockerRegistryParser:
         """Reset the parser state."""
         self._last_state = None
         self._last_parsed = None
+        self._last_stamp = None
 
 
 def parse_docker_registry(registry_path: Optional[str] = None) -> Optional[DockerRegistryState]:
@@ -0,0 +1,30 @@
+"""
+Cheap file identity checks for configuration parsers.
+
+A stamp of (inode, size, mtime_ns) changes whenever a file is rewritten in
+place or replaced by an atomic rename, so parsers can skip re-reading files
+whose stamp is unchanged at the cost of a single ``stat`` call.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+FileStamp = Tuple[int, int, int]
+
+
+def get_file_stamp(path: Union[str, Path]) -> Optional[FileStamp]:
+    """
+    Get the (inode, size, mtime_ns) stamp of a file.
+    
+    Args:
+        path: File to stat
+        
+    Returns:
+        The stamp, or None if the file does not exist or cannot be read
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
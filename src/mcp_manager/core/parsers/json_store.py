@@ -0,0 +1,136 @@
+"""
+Versioned JSON files shared between processes.
+
+The discovery caches each keep their entries in one JSON file under the
+config directory. ``JsonFileStore`` holds the file's sections in memory,
+re-reads them only when the file's stamp shows another process rewrote
+it, and saves them atomically. A file from another cache version, or one
+that cannot be read, counts as empty, and a failed write is only logged:
+a cache that cannot be saved only costs recomputing its entries later.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from mcp_manager.core.parsers.file_stamp import FileStamp, get_file_stamp
+from mcp_manager.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def write_json_atomic(path: Union[str, Path], data: Any) -> None:
+    """
+    Write JSON through a temporary file renamed over the target.
+    
+    Readers see either the old or the new document, never a partial one.
+    
+    Args:
+        path: File to write; its directory is created if needed
+        data: JSON-serializable document
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def put_recent(entries: Dict[str, Any], key: str, value: Any, max_entries: int) -> List[str]:
+    """
+    Insert an entry as the most recent, dropping the least recent over the limit.
+    
+    Args:
+        entries: Entries in insertion order, least recent first
+        key: Key of the entry
+        value: New value of the entry
+        max_entries: Entries kept
+    
+    Returns:
+        The keys that were dropped
+    """
+    entries.pop(key, None)
+    entries[key] = value
+    dropped = list(entries)[:max(0, len(entries) - max_entries)]
+    for stale in dropped:
+        del entries[stale]
+    return dropped
+
+
+class JsonFileStore:
+    """Named sections of a versioned JSON file, each mapping keys to JSON values."""
+    
+    def __init__(self, path: Callable[[], Path], version: int, sections: Iterable[str], description: str):
+        """
+        Initialize the store; the file is read on first use.
+        
+        Args:
+            path: Returns the file's path, looked up on every load and save
+            version: Format version; files with another version are ignored
+            sections: Names of the top-level sections
+            description: What the file holds, for log messages
+        """
+        self._path = path
+        self.version = version
+        self.section_names = tuple(sections)
+        self.description = description
+        self.sections: Dict[str, Dict[str, Any]] = {name: {} for name in self.section_names}
+        self._stamp: Optional[FileStamp] = None
+        self._loaded = False
+        # Held by users across a load, their changes and the save
+        self.lock = threading.Lock()
+    
+    @property
+    def path(self) -> Path:
+        return self._path()
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Re-read the file if another process has rewritten it.
+        
+        Returns:
+            The sections by name, to read and change in place
+        """
+        path = self.path
+        stamp = get_file_stamp(path)
+        if self._loaded and stamp == self._stamp:
+            return self.sections
+        
+        sections: Dict[str, Dict[str, Any]] = {name: {} for name in self.section_names}
+        if stamp is not None:
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                if data.get("version") == self.version:
+                    for name in self.section_names:
+                        sections[name] = data.get(name) or {}
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable {self.description} {path}: {e}")
+        
+        self.sections = sections
+        self._stamp = stamp
+        self._loaded = True
+        return sections
+    
+    def save(self) -> None:
+        """Write the sections atomically."""
+        path = self.path
+        try:
+            write_json_atomic(path, {"version": self.version, **self.sections})
+            self._stamp = get_file_stamp(path)
+        except Exception as e:
+            logger.debug(f"Failed to write {self.description} {path}: {e}")
+    
+    def clear(self) -> None:
+        """Empty every section and save."""
+        self.sections = {name: {} for name in self.section_names}
+        self._loaded = True
+        self.save()
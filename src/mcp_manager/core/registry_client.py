@@ -0,0 +1,322 @@
+"""
+Shared HTTP client for registry documents with an on-disk response cache.
+
+Tool discovery reads repository and package documents from Docker Hub and
+the npm registry. ``RegistryClient`` sends all of these requests through
+one pooled ``httpx.AsyncClient``. The client runs on a background event
+loop, so synchronous and asynchronous callers share its connections, and
+a batch of documents never has more than ``max_connections`` requests in
+flight. Responses are stored on disk together with their ETag and
+Last-Modified validators. A document younger than ``max_age`` is served
+without any request. An older document is revalidated with
+If-None-Match / If-Modified-Since, and a 304 answer costs no body
+transfer.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Coroutine, Dict, Iterable, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from mcp_manager.core.parsers.json_store import write_json_atomic
+from mcp_manager.utils.config import get_config
+from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import span
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 1
+
+T = TypeVar("T")
+
+
+@dataclass
+class CachedResponse:
+    """A registry response as stored in the cache."""
+    
+    status: int
+    body: Any = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+def get_response_cache_dir() -> Path:
+    """Get the directory of the persisted registry responses."""
+    return Path.home() / ".config" / "mcp-manager" / "http_cache"
+
+
+class ResponseCache:
+    """Registry responses persisted as one JSON file per request."""
+    
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+    
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or get_response_cache_dir()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Get a stored response.
+        
+        Args:
+            key: Request key
+        
+        Returns:
+            The response, or None if it was never stored or is unreadable
+        """
+        try:
+            with open(self._path(key)) as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION or data.get("key") != key:
+                return None
+            return CachedResponse(**data["response"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cached response for {key}: {e}")
+            return None
+    
+    def put(self, key: str, response: CachedResponse) -> None:
+        """
+        Store a response atomically; failures only cost a later request.
+        
+        Args:
+            key: Request key
+            response: Response to store
+        """
+        try:
+            write_json_atomic(self._path(key), {"version": CACHE_VERSION, "key": key, "response": asdict(response)})
+        except Exception as e:
+            logger.debug(f"Failed to cache response for {key}: {e}")
+
+
+class RegistryClient:
+    """Pooled, cached GET requests for JSON registry documents."""
+    
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        max_connections: Optional[int] = None,
+        max_age: Optional[float] = None,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the client; connections are opened on first use.
+        
+        Args:
+            cache: Response cache, defaulting to the one in the config directory
+            max_connections: Concurrent requests, defaulting to the discovery setting
+            max_age: Seconds a response is used without revalidation,
+                defaulting to the discovery cache TTL
+            timeout: Request timeout in seconds
+            transport: httpx transport, e.g. a mock in tests
+        """
+        self.cache = cache if cache is not None else ResponseCache()
+        self._max_connections = max_connections
+        self._max_age = max_age
+        self.timeout = timeout
+        self._transport = transport
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def max_connections(self) -> int:
+        return self._max_connections or get_config().discovery.max_connections
+    
+    @property
+    def max_age(self) -> float:
+        return self._max_age if self._max_age is not None else get_config().discovery.cache_ttl
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop that owns the connection pool."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="registry-client", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+    
+    def _http_client(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        # Only called on the background loop, so no locking is needed
+        if self._client is None or self._semaphore is None:
+            limit = self.max_connections
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                transport=self._transport,
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+            )
+            self._semaphore = asyncio.Semaphore(limit)
+        return self._client, self._semaphore
+    
+    async def _fetch(
+        self, url: str, headers: Dict[str, str], max_age: float, use_cache: bool
+    ) -> Optional[CachedResponse]:
+        key = f"{headers.get('Accept', '')} {url}"
+        cached = self.cache.get(key) if use_cache else None
+        if cached is not None and time.time() - cached.fetched_at < max_age:
+            return cached
+        
+        request_headers = dict(headers)
+        if cached is not None and cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+        
+        client, semaphore = self._http_client()
+        async with semaphore:
+            with span("GET registry document", "http", url=url) as request_span:
+                try:
+                    response = await client.get(url, headers=request_headers)
+                except httpx.HTTPError as e:
+                    logger.debug(f"Request for {url} failed: {e}")
+                    # A stale document is better than none
+                    return cached
+                request_span.set("status", response.status_code)
+        
+        now = time.time()
+        if response.status_code == 304 and cached is not None:
+            cached.fetched_at = now
+            self.cache.put(key, cached)
+            return cached
+        if response.status_code == 200:
+            try:
+                body = response.json()
+            except ValueError:
+                logger.debug(f"{url} did not return JSON")
+                return None
+            entry = CachedResponse(
+                status=200,
+                body=body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched_at=now,
+            )
+            if use_cache:
+                self.cache.put(key, entry)
+            return entry
+        if response.status_code == 404:
+            # Remember missing documents too, so they are not requested on every lookup
+            entry = CachedResponse(status=404, fetched_at=now)
+            if use_cache:
+                self.cache.put(key, entry)
+            return entry
+        
+        logger.debug(f"{url} returned {response.status_code}")
+        return cached
+    
+    def _submit(
+        self, url: str, headers: Optional[Dict[str, str]], max_age: Optional[float], use_cache: bool = True
+    ) -> "concurrent.futures.Future[Optional[CachedResponse]]":
+        return asyncio.run_coroutine_threadsafe(
+            self._fetch(url, headers or {}, self.max_age if max_age is None else max_age, use_cache),
+            self._event_loop(),
+        )
+    
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine that uses this client on its loop, blocking the calling thread.
+        
+        Args:
+            coroutine: Coroutine to run
+        
+        Returns:
+            The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._event_loop()).result()
+    
+    @staticmethod
+    def _body(response: Optional[CachedResponse]) -> Optional[Any]:
+        return response.body if response is not None and response.status == 200 else None
+    
+    def get_json(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_age: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> Optional[Any]:
+        """
+        Get a JSON document, blocking the calling thread.
+        
+        Args:
+            url: Document URL
+            headers: Extra request headers, e.g. Accept
+            max_age: Seconds a cached document is used without revalidation
+            use_cache: Whether to read and store the response cache, off for
+                large documents the caller keeps its own extract of
+        
+        Returns:
+            The parsed document, or None if it does not exist or could not be fetched
+        """
+        return self._body(self._submit(url, headers, max_age, use_cache).result())
+    
+    async def fetch_json(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_age: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> Optional[Any]:
+        """Get a JSON document from a coroutine; see ``get_json``."""
+        return self._body(await asyncio.wrap_future(self._submit(url, headers, max_age, use_cache)))
+    
+    async def fetch_all(
+        self, urls: Iterable[str], headers: Optional[Dict[str, str]] = None, max_age: Optional[float] = None
+    ) -> Dict[str, Optional[Any]]:
+        """
+        Get several JSON documents concurrently, bounded by ``max_connections``.
+        
+        Args:
+            urls: Document URLs
+            headers: Extra request headers for every request
+            max_age: Seconds a cached document is used without revalidation
+        
+        Returns:
+            Parsed documents by URL, None for those that could not be fetched
+        """
+        urls = list(dict.fromkeys(urls))
+        bodies = await asyncio.gather(*(self.fetch_json(url, headers, max_age) for url in urls))
+        return dict(zip(urls, bodies))
+    
+    def close(self) -> None:
+        """Close the connections and stop the background loop."""
+        with self._lock:
+            loop, thread, self._loop, self._thread = self._loop, self._thread, None, None
+        if loop is None or thread is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result()
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+# Global client instance
+_registry_client: Optional[RegistryClient] = None
+
+
+def get_registry_client() -> RegistryClient:
+    """Get the global registry client instance."""
+    global _registry_client
+    if _registry_client is None:
+        _registry_client = RegistryClient()
+    return _registry_client
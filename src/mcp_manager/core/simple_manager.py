@@ -5,7 +5,10 @@ This manager is a thin wrapper around claude mcp CLI commands.
 """
 
 import asyncio
+import json
+import logging
 import os
+import re
 import subprocess
 import sys
 from datetime import datetime
@@ -15,10 +18,27 @@ import threading
 import time
 
 from mcp_manager.core.claude_interface import ClaudeInterface
+from mcp_manager.core.container_probe import ContainerProbe, open_probe
+from mcp_manager.core.docker_janitor import get_image_janitor, image_repository
 from mcp_manager.core.exceptions import MCPManagerError
-from mcp_manager.core.models import Server, ServerType, ServerScope, SystemInfo
+from mcp_manager.core.models import Server, ServerRecord, ServerType, ServerScope, SystemInfo
+from mcp_manager.core.npm_metadata import get_npm_metadata
+from mcp_manager.core.npx_cache import get_npx_cache
+from mcp_manager.core.parsers.docker_parser import read_registry
+from mcp_manager.core.registry_client import get_registry_client
+from mcp_manager.core.tool_extraction import (
+    HELP_BUILTINS,
+    HELP_COMMANDS,
+    HELP_SECTION_RE,
+    scan_hub_docs,
+    scan_hub_mentions,
+    scan_labels,
+    scan_package_docs,
+    scan_readme,
+)
 from mcp_manager.utils.config import get_config
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command, span
 
 logger = get_logger(__name__)
 
@@ -77,9 +97,23 @@ class SimpleMCPManager:
             List of servers from Claude's internal state with docker-gateway expanded,
             plus any disabled Docker Desktop servers
         """
-        servers = self.claude.list_servers()
+        return [record.to_server() for record in await self.list_server_records()]
+    
+    async def list_server_records(self) -> List[ServerRecord]:
+        """
+        List all MCP servers as lightweight records.
+        
+        Same contents as list_servers, for internal callers that only
+        compare or index servers and don't need validated models.
+        
+        Returns:
+            List of server records with docker-gateway expanded, plus any
+            disabled servers from the catalog
+        """
+        servers = self.claude.list_server_records()
         result = []
         enabled_docker_servers = set()
+        catalog = await self._get_server_catalog()
         
         for server in servers:
             if server.name == "docker-gateway":
@@ -90,7 +124,6 @@ class SimpleMCPManager:
                 enabled_docker_servers.update(s.name for s in docker_servers)
                 
                 # Auto-populate catalog for servers that aren't tracked yet
-                catalog = await self._get_server_catalog()
                 for docker_server in docker_servers:
                     if docker_server.name not in catalog["servers"]:
                         await self._add_server_to_catalog(
@@ -98,28 +131,27 @@ class SimpleMCPManager:
                             server_type=docker_server.server_type.value,
                             enabled=True,
                             command=docker_server.command,
-                            args=docker_server.args,
-                            env=docker_server.env,
+                            args=list(docker_server.args),
+                            env=dict(docker_server.env),
                             description=docker_server.description,
                         )
             else:
                 result.append(server)
                 
                 # Auto-populate catalog for non-docker-gateway servers too
-                catalog = await self._get_server_catalog()
                 if server.name not in catalog["servers"]:
                     await self._add_server_to_catalog(
                         name=server.name,
                         server_type=server.server_type.value,
                         enabled=True,
                         command=server.command,
-                        args=server.args,
-                        env=server.env,
+                        args=list(server.args),
+                        env=dict(server.env),
                         description=server.description or f"{server.server_type.value} server: {server.name}",
                     )
         
-        # Add disabled servers from our catalog that were previously installed
-        catalog = await self._get_server_catalog()
+        # Add disabled servers from our catalog that were previously installed;
+        # entries added above are enabled, so the catalog read earlier is current
         for server_name, server_info in catalog["servers"].items():
             # Only include if disabled and not already in enabled list
             if not server_info.get("enabled", True) and server_name not in enabled_docker_servers:
@@ -138,7 +170,7 @@ class SimpleMCPManager:
                     command = server_info.get("command", "unknown")
                     args = server_info.get("args", [])
                 
-                disabled_server = Server(
+                disabled_server = ServerRecord(
                     name=server_name,
                     command=command,
                     args=args,
@@ -172,11 +204,13 @@ class SimpleMCPManager:
             description: Server description (ignored - Claude doesn't store this)
             env: Environment variables
             args: Command arguments
-            scope: Server scope (ignored - Claude manages globally)
+            scope: Claude scope to add the server to
             
         Returns:
             The created server
         """
+        scope = ServerScope(scope)
+        
         # Mark operation start to prevent sync loops
         self._mark_operation_start()
         logger.debug(f"Adding server '{name}' to Claude")
@@ -192,6 +226,7 @@ class SimpleMCPManager:
                 command=command,
                 args=args,
                 env=env,
+                scope=scope,
             )
         
         if not success:
@@ -214,7 +249,7 @@ class SimpleMCPManager:
             command=command,
             args=args or [],
             server_type=server_type,
-            scope=ServerScope.USER,
+            scope=scope,
             enabled=True,
             description=description,
             env=env or {},
@@ -232,7 +267,7 @@ class SimpleMCPManager:
         
         Args:
             name: Server name to remove
-            scope: Server scope (ignored - Claude manages globally)
+            scope: Server scope, looked up in Claude's configuration if not given
             
         Returns:
             True if removed successfully
@@ -242,14 +277,14 @@ class SimpleMCPManager:
         logger.debug(f"Removing server '{name}' from Claude")
         
         # Get server details from Claude's list to find Docker images
-        servers = await self.list_servers()
+        servers = await self.list_server_records()
         server = next((s for s in servers if s.name == name), None)
         docker_image = None
         
         if server:
             logger.debug(f"Server details - Name: {server.name}, Type: {server.server_type}, Command: {server.command}, Args: {server.args}")
             if server.server_type in [ServerType.DOCKER, ServerType.DOCKER_DESKTOP]:
-                docker_image = self._extract_docker_image(server.command, server.args)
+                docker_image = self._extract_docker_image(server.command, list(server.args))
                 logger.debug(f"Extracted Docker image: {docker_image}")
                 
                 # If extraction failed, try alternative methods based on server type
@@ -268,16 +303,12 @@ class SimpleMCPManager:
         if name.startswith("docker-desktop-") or await self._is_docker_desktop_server(name):
             success = await self._disable_docker_desktop_server(name)
         else:
-            success = self.claude.remove_server(name)
+            success = self.claude.remove_server(name, scope=ServerScope(scope) if scope else None)
         
-        # Clean up Docker image if removal was successful and we have an image
+        # Clean up the Docker image in the background once the removal is confirmed
         if success and docker_image:
-            logger.debug(f"Attempting to remove Docker image: {docker_image}")
-            image_removed = await self._remove_docker_image(docker_image)
-            if image_removed:
-                logger.debug(f"Docker image cleanup completed for: {docker_image}")
-            else:
-                logger.warning(f"Docker image cleanup failed for: {docker_image}")
+            logger.debug(f"Scheduling cleanup of Docker image: {docker_image}")
+            get_image_janitor().schedule([docker_image])
         
         # Remove from our catalog if removal was successful
         if success:
@@ -391,7 +422,7 @@ class SimpleMCPManager:
             raise MCPManagerError(f"Server '{name}' not found")
         
         # Remove from Claude (this is how we "disable")
-        success = self.claude.remove_server(name)
+        success = self.claude.remove_server(name, scope=server.scope)
         if not success:
             raise MCPManagerError(f"Failed to disable server '{name}'")
         
@@ -425,8 +456,6 @@ class SimpleMCPManager:
     
     async def _enable_docker_desktop_server(self, name: str, command: str, args: List[str]) -> bool:
         """Enable a Docker Desktop MCP server and sync with Claude Code."""
-        import subprocess
-        
         try:
             # Extract the actual server name (remove docker-desktop- prefix if present)
             if name.startswith("docker-desktop-"):
@@ -437,7 +466,7 @@ class SimpleMCPManager:
             logger.debug(f"Enabling Docker Desktop MCP server: {server_name}")
             
             # Step 1: Enable the server in Docker Desktop
-            result = subprocess.run(
+            result = run_command(
                 [self.claude.docker_path, "mcp", "server", "enable", server_name],
                 capture_output=True,
                 text=True,
@@ -468,17 +497,7 @@ class SimpleMCPManager:
     async def _get_enabled_docker_servers(self) -> List[str]:
         """Get list of enabled Docker Desktop MCP servers."""
         try:
-            import yaml
-            from pathlib import Path
-            
-            registry_path = Path.home() / ".docker" / "mcp" / "registry.yaml"
-            if not registry_path.exists():
-                return []
-            
-            with open(registry_path) as f:
-                registry_data = yaml.safe_load(f)
-            
-            return list(registry_data.get("registry", {}).keys())
+            return list(read_registry().keys())
             
         except Exception as e:
             logger.warning(f"Failed to get enabled Docker servers: {e}")
@@ -488,27 +507,37 @@ class SimpleMCPManager:
     async def _refresh_docker_gateway(self) -> bool:
         """Refresh docker-gateway by removing and re-adding it with updated servers."""
         try:
-            # Remove existing gateway if it exists - try all scopes
-            if self.claude.server_exists("docker-gateway"):
-                # Try removing from different scopes until successful
-                removed = False
-                for scope in ["user", "project", "local"]:
-                    try:
-                        result = subprocess.run(
-                            [self.claude.claude_path, "mcp", "remove", "--scope", scope, "docker-gateway"],
-                            capture_output=True,
-                            text=True,
-                            timeout=30,
-                        )
-                        if result.returncode == 0:
-                            logger.debug(f"Removed existing docker-gateway from {scope} scope")
-                            removed = True
-                            break
-                    except Exception:
-                        continue
-                
-                if not removed:
-                    logger.warning("Could not remove docker-gateway from any scope, proceeding anyway")
+            # Claude's config files tell us which scope the gateway lives in
+            scope = self.claude.get_server_scope("docker-gateway")
+            if scope is not None:
+                try:
+                    self.claude.remove_server("docker-gateway", scope=scope)
+                except MCPManagerError as e:
+                    logger.warning(f"Could not remove docker-gateway from {scope.value} scope: {e}")
+                return await self._add_docker_gateway(scope)
+            
+            if not self.claude.server_exists("docker-gateway"):
+                return await self._add_docker_gateway(ServerScope.USER)
+            
+            # Listed by Claude but not found in its config files - try all scopes
+            removed = False
+            for scope_name in ["user", "project", "local"]:
+                try:
+                    result = run_command(
+                        [self.claude.claude_path, "mcp", "remove", "--scope", scope_name, "docker-gateway"],
+                        capture_output=True,
+                        text=True,
+                        timeout=30,
+                    )
+                    if result.returncode == 0:
+                        logger.debug(f"Removed existing docker-gateway from {scope_name} scope")
+                        removed = True
+                        break
+                except Exception:
+                    continue
+            
+            if not removed:
+                logger.warning("Could not remove docker-gateway from any scope, proceeding anyway")
             
             # Re-add with current server list
             return await self._import_docker_gateway_to_claude_code()
@@ -525,6 +554,15 @@ class SimpleMCPManager:
                 logger.debug("docker-gateway already configured in Claude Code")
                 return True
             
+            return await self._add_docker_gateway(ServerScope.USER)
+            
+        except Exception as e:
+            logger.error(f"Failed to set up docker-gateway: {e}")
+            return False
+    
+    async def _add_docker_gateway(self, scope: ServerScope) -> bool:
+        """Add docker-gateway to Claude Code with the enabled Docker Desktop servers."""
+        try:
             # Try to automatically add docker-gateway
             logger.debug("Setting up docker-gateway for Docker Desktop integration")
             
@@ -544,6 +582,7 @@ class SimpleMCPManager:
                 command=self.claude.docker_path,
                 args=["mcp", "gateway", "run", "--servers", servers_list],
                 env=None,
+                scope=scope,
             )
             
             if success:
@@ -559,8 +598,6 @@ class SimpleMCPManager:
     
     async def _disable_docker_desktop_server(self, name: str) -> bool:
         """Disable a Docker Desktop MCP server and sync with Claude Code."""
-        import subprocess
-        
         try:
             # Extract the actual server name (remove docker-desktop- prefix if present)
             if name.startswith("docker-desktop-"):
@@ -571,7 +608,7 @@ class SimpleMCPManager:
             logger.debug(f"Disabling Docker Desktop MCP server: {server_name}")
             
             # Step 1: Disable the server in Docker Desktop
-            result = subprocess.run(
+            result = run_command(
                 [self.claude.docker_path, "mcp", "server", "disable", server_name],
                 capture_output=True,
                 text=True,
@@ -592,7 +629,7 @@ class SimpleMCPManager:
             if sync_success:
                 # Docker Desktop MCP servers use the format: mcp/server-name:latest (lowercase)
                 docker_image = f"mcp/{server_name.lower()}:latest"
-                await self._remove_docker_image(docker_image)
+                get_image_janitor().schedule([docker_image])
                 
                 logger.debug(f"Successfully removed {server_name} from Claude Code")
                 return True
@@ -637,7 +674,7 @@ class SimpleMCPManager:
         except Exception:
             return False
     
-    async def _expand_docker_gateway(self, gateway_server: Server) -> List[Server]:
+    async def _expand_docker_gateway(self, gateway_server: ServerRecord) -> List[ServerRecord]:
         """Expand docker-gateway into individual Docker Desktop servers."""
         docker_servers = []
         
@@ -649,8 +686,8 @@ class SimpleMCPManager:
                 server_names = [s.strip() for s in servers_arg.split(",")]
                 
                 for server_name in server_names:
-                    # Create a Server object for each Docker Desktop server
-                    docker_server = Server(
+                    # Create a record for each Docker Desktop server
+                    docker_server = ServerRecord(
                         name=server_name,
                         command="docker",
                         args=["mcp", "server", server_name],
@@ -658,7 +695,6 @@ class SimpleMCPManager:
                         scope=gateway_server.scope,
                         enabled=True,  # If it's in the gateway, it's enabled
                         description=f"Docker Desktop MCP server: {server_name}",
-                        env={},
                     )
                     docker_servers.append(docker_server)
                     
@@ -713,7 +749,7 @@ class SimpleMCPManager:
     def _check_command(self, command: str, args: List[str]) -> Tuple[bool, Optional[str]]:
         """Check if a command is available and get its version."""
         try:
-            result = subprocess.run(
+            result = run_command(
                 [command] + args,
                 capture_output=True,
                 text=True,
@@ -736,7 +772,6 @@ class SimpleMCPManager:
                         version = parts[-1]
                 elif command in ["npm", "docker", "git"]:
                     # Extract version number from common patterns
-                    import re
                     match = re.search(r'(\d+\.\d+\.\d+)', version)
                     if match:
                         version = match.group(1)
@@ -763,8 +798,9 @@ class SimpleMCPManager:
             return None
         
         try:
-            # Log the full command for debugging
-            logger.debug(f"Extracting image from command: {command} {' '.join(args)}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Extracting image from command: %s %s", command, " ".join(args))
             
             # Look for the image name in Docker run command
             # Typical format: ["run", "-i", "--rm", "--pull", "always", "image:tag"]
@@ -775,10 +811,11 @@ class SimpleMCPManager:
                 # and comes after all the flags
                 for i in range(len(args) - 1, run_index, -1):
                     arg = args[i]
-                    logger.debug(f"Checking arg[{i}]: '{arg}'")
+                    if debug:
+                        logger.debug("Checking arg[%d]: '%s'", i, arg)
                     # Image name should contain : or / and not start with -
                     if not arg.startswith("-") and (":" in arg or "/" in arg):
-                        logger.debug(f"Found image with : or /: {arg}")
+                        logger.debug("Found image with : or /: %s", arg)
                         return arg
                 
                 # Fallback: find the last non-flag argument that isn't a known flag value
@@ -787,12 +824,11 @@ class SimpleMCPManager:
                     if (not arg.startswith("-") and 
                         arg not in ["always", "missing", "never", "run"] and
                         len(arg) > 3):  # Image names are typically longer than 3 chars
-                        logger.debug(f"Found fallback image: {arg}")
+                        logger.debug("Found fallback image: %s", arg)
                         return arg
             
             # Try to extract from the full command if it contains common Docker image patterns
             full_command = ' '.join(args)
-            import re
             # Look for patterns like mcp/name:tag or registry/name:tag
             patterns = [
                 r'(mcp/[^:\s]+(?::[^:\s]+)?)',
@@ -804,7 +840,7 @@ class SimpleMCPManager:
                 match = re.search(pattern, full_command)
                 if match:
                     image = match.group(1)
-                    logger.debug(f"Found image via regex: {image}")
+                    logger.debug("Found image via regex: %s", image)
                     return image
             
             logger.debug("No Docker image found in command")
@@ -813,99 +849,6 @@ class SimpleMCPManager:
             logger.warning(f"Failed to extract Docker image from command: {e}")
             return None
     
-    async def _remove_docker_image(self, image: str) -> bool:
-        """
-        Remove a Docker image.
-        
-        Args:
-            image: Docker image name to remove
-            
-        Returns:
-            True if removed successfully or image doesn't exist
-        """
-        try:
-            logger.debug(f"Removing Docker image: {image}")
-            
-            # First, try to find all matching images using docker images command
-            # This handles both :latest tagged and digest-tagged images
-            matching_images = await self._find_matching_docker_images(image)
-            
-            if not matching_images:
-                logger.debug(f"No matching Docker images found for: {image}")
-                return True  # Consider this success since the goal is achieved
-            
-            # Try multiple image variations (with/without tags)
-            image_variations = [
-                image,
-                f"{image}:latest",
-                image.replace(":latest", ""),  # Remove :latest if present
-            ] + matching_images  # Add images found by docker images command
-            
-            # Remove duplicates while preserving order
-            image_variations = list(dict.fromkeys(image_variations))
-            
-            removed_any = False
-            for img_variant in image_variations:
-                logger.debug(f"Trying to remove image variant: {img_variant}")
-                
-                # First check if image exists
-                check_result = subprocess.run(
-                    ["docker", "image", "inspect", img_variant],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                
-                if check_result.returncode != 0:
-                    logger.debug(f"Docker image {img_variant} not found")
-                    continue
-                
-                # Try to remove this variant
-                logger.debug(f"Found image {img_variant}, attempting removal")
-                result = subprocess.run(
-                    ["docker", "rmi", "-f", img_variant],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                
-                if result.returncode == 0:
-                    logger.debug(f"Successfully removed Docker image: {img_variant}")
-                    removed_any = True
-                else:
-                    logger.debug(f"Failed to remove {img_variant}: {result.stderr}")
-                    # Try alternative removal method for this variant
-                    alt_result = subprocess.run(
-                        ["docker", "image", "rm", "-f", img_variant],
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                    )
-                    
-                    if alt_result.returncode == 0:
-                        logger.debug(f"Successfully removed {img_variant} with alternative method")
-                        removed_any = True
-            
-            # Clean up dangling images if we removed anything
-            if removed_any:
-                cleanup_result = subprocess.run(
-                    ["docker", "image", "prune", "-f"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                if cleanup_result.returncode == 0:
-                    logger.debug("Cleaned up dangling Docker images")
-            
-            return True  # Always return True to not fail the server removal
-                
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Timeout removing Docker image {image}")
-            return True
-        except Exception as e:
-            logger.warning(f"Error removing Docker image {image}: {e}")
-            return True
-    
     async def check_sync_status(self) -> SyncCheckResult:
         """
         Check synchronization status between mcp-manager and Claude.
@@ -945,7 +888,7 @@ class SimpleMCPManager:
             # Check if running 'claude mcp list' will start a session
             try:
                 # First check if Claude has an active session by trying a quick command
-                result = subprocess.run(
+                result = run_command(
                     ["claude", "--help"],
                     capture_output=True,
                     text=True,
@@ -963,7 +906,7 @@ class SimpleMCPManager:
             
             # Get servers from mcp-manager's perspective
             try:
-                servers = await self.list_servers()
+                servers = await self.list_server_records()
                 manager_servers = [s.name for s in servers]
                 logger.debug(f"Found {len(manager_servers)} servers in manager: {manager_servers}")
             except Exception as e:
@@ -973,7 +916,7 @@ class SimpleMCPManager:
             # Get servers from Claude CLI
             try:
                 logger.debug("Getting server list from Claude CLI")
-                result = subprocess.run(
+                result = run_command(
                     ["claude", "mcp", "list"],
                     capture_output=True,
                     text=True,
@@ -1067,8 +1010,8 @@ class SimpleMCPManager:
                 # Check if configuration is readable
                 try:
                     import json
-                    with open(claude_config_path) as f:
-                        config_data = json.load(f)
+                    from mcp_manager.core.parsers.claude_json import load_claude_mcp_sections
+                    config_data = load_claude_mcp_sections(claude_config_path)
                     
                     # Check for common configuration issues
                     if "mcpServers" not in config_data:
@@ -1096,7 +1039,7 @@ class SimpleMCPManager:
                     enabled_servers = await self._get_enabled_docker_servers()
                     if enabled_servers:
                         # Verify docker-gateway exists in Claude
-                        servers = self.claude.list_servers()
+                        servers = self.claude.list_server_records()
                         has_gateway = any(s.name == "docker-gateway" for s in servers)
                         if not has_gateway:
                             issues.append("Docker Desktop servers enabled but docker-gateway not configured in Claude")
@@ -1121,7 +1064,8 @@ class SimpleMCPManager:
         servers = []
         
         try:
-            logger.debug(f"Parsing Claude output: {claude_output}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            logger.debug("Parsing Claude output: %s", claude_output)
             output_lines = claude_output.strip().split('\n')
             
             for line in output_lines:
@@ -1129,19 +1073,20 @@ class SimpleMCPManager:
                 if not line or line.startswith('No servers') or line.startswith('Servers:'):
                     continue
                 
-                logger.debug(f"Processing line: '{line}'")
+                if debug:
+                    logger.debug("Processing line: '%s'", line)
                 
                 # Check if line contains docker-gateway command
                 if "docker" in line and "mcp" in line and "gateway" in line and "--servers" in line:
                     # This is a docker-gateway command line, extract the server list
                     expanded_servers = await self._extract_servers_from_gateway_command(line)
                     servers.extend(expanded_servers)
-                    logger.debug(f"Expanded docker-gateway command to: {expanded_servers}")
+                    logger.debug("Expanded docker-gateway command to: %s", expanded_servers)
                 elif line.startswith("docker-gateway"):
                     # Handle "docker-gateway: server1,server2" format
                     expanded_servers = await self._expand_docker_gateway_from_claude_output(line)
                     servers.extend(expanded_servers)
-                    logger.debug(f"Expanded docker-gateway to: {expanded_servers}")
+                    logger.debug("Expanded docker-gateway to: %s", expanded_servers)
                 else:
                     # Regular server - extract server name (first word/column)
                     parts = line.split()
@@ -1150,9 +1095,10 @@ class SimpleMCPManager:
                         # Skip if it looks like a command path
                         if not server_name.startswith('/') and server_name not in servers:
                             servers.append(server_name)
-                            logger.debug(f"Added regular server: {server_name}")
+                            if debug:
+                                logger.debug("Added regular server: %s", server_name)
             
-            logger.debug(f"Final parsed servers: {servers}")
+            logger.debug("Final parsed servers: %s", servers)
             return servers
             
         except Exception as e:
@@ -1160,7 +1106,7 @@ class SimpleMCPManager:
             # Fallback: try to get enabled servers from docker directly
             try:
                 enabled_servers = await self._get_enabled_docker_servers()
-                logger.debug(f"Fallback to Docker servers: {enabled_servers}")
+                logger.debug("Fallback to Docker servers: %s", enabled_servers)
                 return enabled_servers
             except Exception:
                 return []
@@ -1176,7 +1122,7 @@ class SimpleMCPManager:
             List of individual server names
         """
         try:
-            logger.debug(f"Extracting servers from command: {command_line}")
+            logger.debug("Extracting servers from command: %s", command_line)
             
             # Look for --servers argument
             if "--servers" not in command_line:
@@ -1202,7 +1148,7 @@ class SimpleMCPManager:
             
             # Split by comma and clean up names
             server_names = [s.strip() for s in servers_part.split(",") if s.strip()]
-            logger.debug(f"Extracted server names: {server_names}")
+            logger.debug("Extracted server names: %s", server_names)
             
             return server_names
             
@@ -1260,7 +1206,7 @@ class SimpleMCPManager:
             # Check if docker-gateway is configured by checking Claude directly
             # (not from list_servers which shows expanded servers)
             try:
-                result = subprocess.run(
+                result = run_command(
                     ["claude", "mcp", "list"],
                     capture_output=True,
                     text=True,
@@ -1326,7 +1272,7 @@ class SimpleMCPManager:
             
             logger.debug(f"Running Docker gateway test: {' '.join(test_command)}")
             
-            result = subprocess.run(
+            result = run_command(
                 test_command,
                 capture_output=True,
                 text=True,
@@ -1497,7 +1443,7 @@ class SimpleMCPManager:
         """Get all tools mapped by server using docker mcp tools list --verbose --format json."""
         try:
             # Step 1: Get verbose output to determine server order and tool counts
-            verbose_result = subprocess.run(
+            verbose_result = run_command(
                 ["docker", "mcp", "tools", "list", "--verbose"],
                 capture_output=True,
                 text=True,
@@ -1531,7 +1477,7 @@ class SimpleMCPManager:
                 return {}
                 
             # Step 2: Get all tools with full JSON schema
-            json_result = subprocess.run(
+            json_result = run_command(
                 ["docker", "mcp", "tools", "list", "--verbose", "--format", "json"],
                 capture_output=True,
                 text=True,
@@ -1762,7 +1708,7 @@ class SimpleMCPManager:
             request_json = json.dumps(mcp_request)
             
             # Run the server process with a timeout
-            result = subprocess.run(
+            result = run_command(
                 cmd,
                 input=request_json + "\n",
                 capture_output=True,
@@ -1824,8 +1770,6 @@ class SimpleMCPManager:
     
     async def _enable_docker_desktop_server_simple(self, name: str) -> bool:
         """Enable a Docker Desktop MCP server (simplified version for enable_server)."""
-        import subprocess
-        
         try:
             # Extract the actual server name (remove docker-desktop- prefix if present)
             if name.startswith("docker-desktop-"):
@@ -1836,7 +1780,7 @@ class SimpleMCPManager:
             logger.debug(f"Enabling Docker Desktop MCP server: {server_name}")
             
             # Enable the server in Docker Desktop
-            result = subprocess.run(
+            result = run_command(
                 [self.claude.docker_path, "mcp", "server", "enable", server_name],
                 capture_output=True,
                 text=True,
@@ -1865,8 +1809,6 @@ class SimpleMCPManager:
     
     async def _disable_docker_desktop_server_simple(self, name: str) -> bool:
         """Disable a Docker Desktop MCP server (simplified version for disable_server)."""
-        import subprocess
-        
         try:
             # Extract the actual server name (remove docker-desktop- prefix if present)
             if name.startswith("docker-desktop-"):
@@ -1877,7 +1819,7 @@ class SimpleMCPManager:
             logger.debug(f"Disabling Docker Desktop MCP server: {server_name}")
             
             # Disable the server in Docker Desktop
-            result = subprocess.run(
+            result = run_command(
                 [self.claude.docker_path, "mcp", "server", "disable", server_name],
                 capture_output=True,
                 text=True,
@@ -1897,7 +1839,7 @@ class SimpleMCPManager:
                 # Clean up Docker Desktop MCP image if sync was successful
                 # Docker image names are typically lowercase
                 docker_image = f"mcp/{server_name.lower()}:latest"
-                await self._remove_docker_image(docker_image)
+                get_image_janitor().schedule([docker_image])
                 
                 logger.debug(f"Successfully removed {server_name} from Claude Code")
                 return True
@@ -1912,31 +1854,12 @@ class SimpleMCPManager:
     async def _get_available_docker_servers(self) -> List[str]:
         """Get list of all available Docker Desktop MCP servers (enabled and disabled)."""
         try:
-            # First get enabled servers
-            enabled_servers = await self._get_enabled_docker_servers()
-            
-            # For available but not enabled servers, we need to check what Docker Desktop supports
-            # The registry.yaml file should contain all available servers
-            import yaml
-            from pathlib import Path
-            
-            registry_path = Path.home() / ".docker" / "mcp" / "registry.yaml"
-            available_servers = set(enabled_servers)  # Start with enabled servers
-            
-            if registry_path.exists():
-                try:
-                    with open(registry_path) as f:
-                        registry_data = yaml.safe_load(f)
-                        if registry_data and "registry" in registry_data:
-                            # Add all servers from registry
-                            for server_name in registry_data["registry"].keys():
-                                available_servers.add(server_name)
-                except Exception as e:
-                    logger.debug(f"Failed to read registry.yaml: {e}")
+            # Start with the servers in registry.yaml (the enabled ones)
+            available_servers = set(await self._get_enabled_docker_servers())
             
             # Also try to get available servers using docker mcp server list
             try:
-                result = subprocess.run(
+                result = run_command(
                     [self.claude.docker_path, "mcp", "server", "list"],
                     capture_output=True,
                     text=True,
@@ -1955,7 +1878,7 @@ class SimpleMCPManager:
             # If we still don't have any servers, try to get them from the catalog
             if not available_servers:
                 try:
-                    result = subprocess.run(
+                    result = run_command(
                         [self.claude.docker_path, "mcp", "catalog", "show"],
                         capture_output=True,
                         text=True,
@@ -1966,7 +1889,6 @@ class SimpleMCPManager:
                         catalog_output = result.stdout.strip()
                         if catalog_output:
                             # Parse catalog output to extract server names
-                            import re
                             # Look for lines that start with a server name followed by a colon
                             server_pattern = r'^([a-zA-Z][a-zA-Z0-9_-]*): '
                             for line in catalog_output.split('\n'):
@@ -1996,7 +1918,7 @@ class SimpleMCPManager:
             catalog_file = config_dir / "server_catalog.json"
             
             if catalog_file.exists():
-                with open(catalog_file) as f:
+                with span("read server catalog", "io", path=str(catalog_file)), open(catalog_file) as f:
                     return json.load(f)
             return {"servers": {}}
             
@@ -2014,7 +1936,7 @@ class SimpleMCPManager:
             config_dir.mkdir(parents=True, exist_ok=True)
             catalog_file = config_dir / "server_catalog.json"
             
-            with open(catalog_file, "w") as f:
+            with span("write server catalog", "io", path=str(catalog_file)), open(catalog_file, "w") as f:
                 json.dump(catalog, f, indent=2)
                 
         except Exception as e:
@@ -2058,63 +1980,6 @@ class SimpleMCPManager:
                 disabled_servers.append(name)
         return disabled_servers
     
-    async def _find_matching_docker_images(self, image_pattern: str) -> List[str]:
-        """
-        Find Docker images that match the given pattern.
-        
-        Args:
-            image_pattern: Image name pattern to match (e.g., "mcp/sqlite")
-            
-        Returns:
-            List of matching image names with full tags/digests
-        """
-        try:
-            # Get all docker images and filter for matches
-            result = subprocess.run(
-                ["docker", "images", "--format", "{{.Repository}}:{{.Tag}}"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            
-            if result.returncode != 0:
-                logger.debug(f"Failed to list Docker images: {result.stderr}")
-                return []
-            
-            matching_images = []
-            base_name = image_pattern.split(":")[0]  # Remove any existing tag/digest
-            
-            for line in result.stdout.strip().split('\n'):
-                if line and base_name in line:
-                    matching_images.append(line.strip())
-            
-            # Also try to get digest-tagged images using a different format
-            digest_result = subprocess.run(
-                ["docker", "images", "--digests", "--format", "table {{.Repository}}\t{{.Tag}}\t{{.Digest}}"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            
-            if digest_result.returncode == 0:
-                lines = digest_result.stdout.strip().split('\n')
-                # Skip the header line
-                for line in lines[1:] if len(lines) > 1 else []:
-                    if line and base_name in line:
-                        parts = line.split('\t')
-                        if len(parts) >= 3:
-                            repo, tag, digest = parts[0].strip(), parts[1].strip(), parts[2].strip()
-                            if digest and digest.startswith("sha256:"):
-                                digest_image = f"{repo}@{digest}"
-                                matching_images.append(digest_image)
-            
-            logger.debug(f"Found matching images for {image_pattern}: {matching_images}")
-            return matching_images
-            
-        except Exception as e:
-            logger.debug(f"Failed to find matching Docker images for {image_pattern}: {e}")
-            return []
-    
     def _extract_docker_image_from_args(self, args: List[str]) -> Optional[str]:
         """Extract Docker image name from command arguments."""
         # Look for image name in Docker run command
@@ -2173,6 +2038,7 @@ class SimpleMCPManager:
         
         This method runs `mcp --help` inside the Docker container to extract
         available commands/tools, which is more reliable than MCP protocol communication.
+        All probes share one container, and an image probed before is not probed again.
         
         Args:
             server: Server configuration for Docker-based MCP server
@@ -2180,9 +2046,6 @@ class SimpleMCPManager:
         Returns:
             List of tool dictionaries with name and description
         """
-        import subprocess
-        import re
-        
         try:
             # Extract Docker image from server args
             docker_image = self._extract_docker_image_from_args(server.args or [])
@@ -2201,99 +2064,53 @@ class SimpleMCPManager:
                 ["node", "/app/dist/index.js", "--help"]
             ]
 
-            for help_cmd in help_commands:
-                try:
-                    result = subprocess.run(
-                        ["docker", "run", "--rm", docker_image] + help_cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        timeout=20
-                    )
+            with open_probe(docker_image) as probe:
+                for help_cmd in help_commands:
+                    result = probe.run(help_cmd, timeout=20)
+                    if result.returncode == -1:
+                        logger.debug(f"Failed help command {' '.join(help_cmd)}: {result.stderr}")
+                        continue
 
                     if result.returncode == 0 and result.stdout.strip():
-                        tools = []
-                        capture = False
+                        tools = self._parse_docker_help_output(result.stdout, server.name)
+                        for tool in tools:
+                            tool["source"] = "docker_help"
                         
-                        for line in result.stdout.splitlines():
-                            if re.match(r"Commands:", line):
-                                capture = True
-                                continue
-                            if capture:
-                                if line.strip() == "":
-                                    break  # stop when empty line after commands block
-                                parts = line.strip().split(None, 1)
-                                if len(parts) >= 1:
-                                    cmd = parts[0]
-                                    desc = parts[1] if len(parts) > 1 else f"Tool from {server.name}"
-                                    tools.append({
-                                        "name": cmd,
-                                        "description": desc,
-                                        "source": "docker_help"
-                                    })
-
                         if tools:
                             logger.debug(f"Successfully discovered {len(tools)} tools from Docker container using: {' '.join(help_cmd)}")
                             return tools
-
-                except subprocess.TimeoutExpired:
-                    logger.debug(f"Timeout running help command: {' '.join(help_cmd)}")
-                    continue
-                except Exception as e:
-                    logger.debug(f"Failed help command {' '.join(help_cmd)}: {e}")
-                    continue
-            
-            # If help commands failed, try exploring the container filesystem
-            logger.debug(f"Help commands failed, trying filesystem exploration for {server.name}")
-            return self._discover_tools_via_filesystem_exploration(docker_image, server.name)
+                
+                # If help commands failed, try exploring the container filesystem
+                logger.debug(f"Help commands failed, trying filesystem exploration for {server.name}")
+                return self._discover_tools_via_filesystem_exploration(probe, server.name)
 
         except Exception as e:
             logger.debug(f"Failed Docker help-based discovery for {server.name}: {e}")
             return []
     
-    def _discover_tools_via_filesystem_exploration(self, docker_image: str, server_name: str) -> List[Dict[str, Any]]:
+    def _discover_tools_via_filesystem_exploration(self, probe: ContainerProbe, server_name: str) -> List[Dict[str, Any]]:
         """
         Discover tools by inspecting Docker container configuration.
         
         This method inspects the container's entrypoint, cmd, and environment
         to understand the actual MCP server structure and available tools.
         """
-        import subprocess
-        import json
-        
         try:
             tools = []
             
             # First, inspect the Docker image configuration
             logger.debug(f"Inspecting Docker image configuration for {server_name}")
             
-            # Get entrypoint, cmd, and environment
-            inspect_commands = {
-                "entrypoint": "--format='{{.Config.Entrypoint}}'",
-                "cmd": "--format='{{.Config.Cmd}}'", 
-                "env": "--format='{{.Config.Env}}'"
-            }
-            
+            # Get entrypoint, cmd, and environment from the image's cached metadata
             container_info = {}
-            
-            for info_type, format_arg in inspect_commands.items():
-                try:
-                    result = subprocess.run(
-                        ["docker", "inspect", docker_image, format_arg],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if result.returncode == 0:
-                        output = result.stdout.strip().strip("'\"")
-                        container_info[info_type] = output
-                        logger.debug(f"{info_type}: {output}")
-                
-                except Exception as e:
-                    logger.debug(f"Error getting {info_type}: {e}")
-                    continue
+            metadata = probe.metadata
+            if metadata is not None:
+                container_info = {
+                    "entrypoint": " ".join(metadata.entrypoint),
+                    "cmd": " ".join(metadata.cmd),
+                    "env": metadata.env_text(),
+                }
+                logger.debug(f"Image configuration: {container_info}")
             
             # Parse the configuration to understand MCP tools
             if container_info:
@@ -2343,20 +2160,14 @@ class SimpleMCPManager:
             
             # Try to get tools from container documentation
             if not tools:
-                doc_tools = self._discover_tools_from_container_docs(docker_image, server_name)
+                doc_tools = self._discover_tools_from_container_docs(probe, server_name)
                 if doc_tools:
                     tools.extend(doc_tools)
             
             # Fallback: try to explore /app directory structure
             if not tools:
                 try:
-                    result = subprocess.run(
-                        ["docker", "run", "--rm", docker_image, "ls", "-la", "/app"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        timeout=10
-                    )
+                    result = probe.exec(["ls", "-la", "/app"], timeout=10)
                     
                     if result.returncode == 0:
                         logger.debug(f"/app directory contents: {result.stdout}")
@@ -2382,50 +2193,70 @@ class SimpleMCPManager:
             logger.debug(f"Failed Docker inspection: {e}")
             return []
     
-    def _discover_tools_from_container_docs(self, docker_image: str, server_name: str) -> List[Dict[str, Any]]:
+    def _docker_hub_repository_url(self, docker_image: str) -> Optional[str]:
+        """Get the Docker Hub API URL of an image's repository, or None for other registries."""
+        repository = image_repository(docker_image)
+        if "/" not in repository:
+            repository = f"library/{repository}"
+        else:
+            registry = repository.split("/", 1)[0]
+            if "." in registry or ":" in registry or registry == "localhost":
+                return None
+        return f"{get_config().discovery.docker_hub_url}/v2/repositories/{repository}/"
+    
+    async def prefetch_docker_hub_docs(self, servers: List[Server]) -> None:
+        """
+        Fetch the Docker Hub documentation of Docker servers concurrently.
+        
+        Later tool discovery for these servers reads the documentation from
+        the registry client's cache instead of requesting it one by one.
+        
+        Args:
+            servers: Servers to prefetch for; non-Docker servers are skipped
+        """
+        urls = []
+        for server in servers:
+            if server.server_type != ServerType.DOCKER:
+                continue
+            docker_image = self._extract_docker_image_from_args(server.args or [])
+            url = self._docker_hub_repository_url(docker_image) if docker_image else None
+            if url:
+                urls.append(url)
+        
+        if urls:
+            with span("docker hub docs prefetch", "http", repositories=len(urls)):
+                await get_registry_client().fetch_all(urls)
+    
+    def _discover_tools_from_container_docs(self, probe: ContainerProbe, server_name: str) -> List[Dict[str, Any]]:
         """
         Discover tools from Docker container documentation and labels.
         
         This method extracts information from Docker Hub API, container labels,
         and any embedded documentation to understand available MCP tools.
         """
-        import subprocess
-        import re
-        import json
+        docker_image = probe.image
         
         try:
             tools = []
             
             # First, check container labels which might contain tool information
             try:
-                result = subprocess.run(
-                    ["docker", "inspect", docker_image, "--format='{{.Config.Labels}}'"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=10
-                )
+                metadata = probe.metadata
+                labels = {**metadata.labels, **metadata.annotations} if metadata is not None else {}
+                logger.debug(f"Container labels: {labels}")
                 
-                if result.returncode == 0:
-                    labels_output = result.stdout.strip().strip("'\"")
-                    logger.debug(f"Container labels: {labels_output}")
-                    
-                    # Parse labels for tool information
-                    if labels_output and labels_output != "map[]" and labels_output != "<no value>":
-                        # Look for MCP-specific labels or descriptions
-                        labels_text = labels_output.lower()
-                        if "mcp" in labels_text and "tools" in labels_text:
-                            # Try to extract tool names from labels
-                            tool_matches = re.findall(r'tools?["\']?:\s*["\']?([^"\'}\]]+)', labels_text)
-                            for match in tool_matches:
-                                tool_names = [t.strip() for t in match.split(',')]
-                                for tool_name in tool_names:
-                                    if tool_name and len(tool_name) > 2:
-                                        tools.append({
-                                            "name": tool_name,
-                                            "description": f"Tool from container labels",
-                                            "source": "docker_labels"
-                                        })
+                # Parse labels for tool information
+                if labels:
+                    # Look for MCP-specific labels or descriptions
+                    labels_text = json.dumps(labels).lower()
+                    if "mcp" in labels_text and "tools" in labels_text:
+                        # Try to extract tool names from labels
+                        for candidate in scan_labels(labels_text):
+                            tools.append({
+                                "name": candidate.name,
+                                "description": f"Tool from container labels",
+                                "source": "docker_labels"
+                            })
             
             except Exception as e:
                 logger.debug(f"Error checking container labels: {e}")
@@ -2433,145 +2264,52 @@ class SimpleMCPManager:
             # Try to get documentation from Docker Hub API
             if not tools:
                 try:
-                    # Parse image name for Docker Hub API call
-                    if "/" in docker_image:
-                        namespace, repo_tag = docker_image.split("/", 1)
-                        if ":" in repo_tag:
-                            repo, tag = repo_tag.split(":", 1)
-                        else:
-                            repo = repo_tag
-                            tag = "latest"
-                    else:
-                        namespace = "library"
-                        if ":" in docker_image:
-                            repo, tag = docker_image.split(":", 1)
-                        else:
-                            repo = docker_image
-                            tag = "latest"
-                    
-                    # Use httpx to get Docker Hub repository information
-                    import httpx
-                    
-                    # Get repository description from Docker Hub API
-                    hub_url = f"https://hub.docker.com/v2/repositories/{namespace}/{repo}/"
-                    
-                    async def fetch_docker_hub_info():
-                        async with httpx.AsyncClient(timeout=5.0) as client:
-                            response = await client.get(hub_url)
-                            if response.status_code == 200:
-                                data = response.json()
-                                description = data.get("description", "")
-                                full_description = data.get("full_description", "")
-                                
-                                # Parse description for MCP tools
-                                combined_text = f"{description} {full_description}".lower()
-                                logger.debug(f"Docker Hub description: {description}")
-                                
-                                # Look for tool patterns in description
-                                tool_patterns = [
-                                    r'tools?:\s*([^.]+)',
-                                    r'provides?\s+([^.]+)\s+tools?',
-                                    r'supports?\s+([^.]+)\s+operations?',
-                                    r'includes?\s+([^.]+)\s+functionality'
-                                ]
-                                
-                                found_tools = []
-                                for pattern in tool_patterns:
-                                    matches = re.findall(pattern, combined_text)
-                                    for match in matches:
-                                        # Extract individual tool names
-                                        tool_names = re.split(r'[,&\sand\s]+', match.strip())
-                                        for tool_name in tool_names:
-                                            tool_name = tool_name.strip()
-                                            if tool_name and len(tool_name) > 2:
-                                                found_tools.append({
-                                                    "name": tool_name,
-                                                    "description": f"Tool from Docker Hub description",
-                                                    "source": "docker_hub_api"
-                                                })
-                                
-                                return found_tools
-                            return []
-                    
-                    # Use sync httpx to get Docker Hub repository information
-                    with httpx.Client(timeout=5.0) as client:
-                        try:
-                            response = client.get(hub_url)
-                            if response.status_code == 200:
-                                data = response.json()
-                                description = data.get("description", "")
-                                full_description = data.get("full_description", "")
-                                
-                                logger.debug(f"Docker Hub description for {namespace}/{repo}: {description}")
-                                
-                                # Parse description for MCP tools
-                                combined_text = f"{description} {full_description}".lower()
-                                
-                                # Look for tool patterns in Docker Hub documentation
-                                # First, try to find the structured tools table
-                                tools_table_match = re.search(r'tools provided by this server.*?\n(.+?)(?:\n---|\n##|\n\n|\Z)', combined_text, re.DOTALL | re.IGNORECASE)
-                                
-                                if tools_table_match:
-                                    # Extract tools from the structured table
-                                    table_content = tools_table_match.group(1)
-                                    # Look for `tool_name`|description patterns
-                                    tool_matches = re.findall(r'`([a-zA-Z_][a-zA-Z0-9_]*)`\s*\|\s*([^|]+)', table_content)
-                                    for tool_name, description in tool_matches:
-                                        tools.append({
-                                            "name": tool_name,
-                                            "description": description.strip(),
-                                            "source": "docker_hub_documentation"
-                                        })
-                                
-                                # Also look for individual tool headings like "#### Tool: **`tool_name`**"
-                                tool_header_matches = re.findall(r'tool:\s*\*\*`([a-zA-Z_][a-zA-Z0-9_]*)`\*\*', combined_text, re.IGNORECASE)
-                                for tool_name in tool_header_matches:
-                                    # Only add if we haven't already found it in the table
-                                    if not any(t["name"] == tool_name for t in tools):
-                                        tools.append({
-                                            "name": tool_name,
-                                            "description": f"MCP tool from {docker_image}",
-                                            "source": "docker_hub_documentation"
-                                        })
-                                
-                                # Fallback: look for any `tool_name` patterns in backticks
-                                if not tools:
-                                    tool_patterns = [
-                                        r'`([a-zA-Z_][a-zA-Z0-9_]*)`',  # `tool_name`
-                                        r'\*\*`([a-zA-Z_][a-zA-Z0-9_]*)`\*\*',  # **`tool_name`**
-                                    ]
-                                    
-                                    for pattern in tool_patterns:
-                                        matches = re.findall(pattern, combined_text)
-                                        for tool_name in matches:
-                                            # Filter out common non-tool words
-                                            if tool_name not in ["string", "array", "boolean", "object", "number", "file", "dir"]:
-                                                tools.append({
-                                                    "name": tool_name,
-                                                    "description": f"Tool from Docker Hub documentation",
-                                                    "source": "docker_hub_api"
-                                                })
-                                
-                                # If it's a filesystem server, add standard filesystem tools
-                                if "filesystem" in combined_text and not tools:
-                                    tools.extend([
-                                        {"name": "read_file", "description": "Read file contents", "source": "docker_hub_analysis"},
-                                        {"name": "write_file", "description": "Write file contents", "source": "docker_hub_analysis"},
-                                        {"name": "list_directory", "description": "List directory contents", "source": "docker_hub_analysis"},
-                                        {"name": "create_directory", "description": "Create directories", "source": "docker_hub_analysis"}
-                                    ])
-                                
-                                # For custom Docker containers not on Docker Hub, try pattern matching
-                                elif not tools:
-                                    custom_tools = self._predict_docker_tools_from_image_name(docker_image)
-                                    if custom_tools:
-                                        tools.extend(custom_tools)
+                    hub_url = self._docker_hub_repository_url(docker_image)
+                    # Served from the registry client's cache while it is fresh
+                    data = get_registry_client().get_json(hub_url) if hub_url else None
+                    if data:
+                        description = data.get("description", "")
+                        full_description = data.get("full_description", "")
                         
-                        except httpx.RequestError as e:
-                            logger.debug(f"Network error accessing Docker Hub: {e}")
-                        except Exception as e:
-                            logger.debug(f"Error parsing Docker Hub response: {e}")
-                    
+                        logger.debug(f"Docker Hub description for {docker_image}: {description}")
+                        
+                        # Parse description for MCP tools
+                        combined_text = f"{description} {full_description}".lower()
+                        
+                        # Look for tool patterns in Docker Hub documentation, in one pass:
+                        # rows of the structured tools table and headings like
+                        # "#### Tool: **`tool_name`**"
+                        for candidate in scan_hub_docs(combined_text):
+                            tools.append({
+                                "name": candidate.name,
+                                "description": candidate.description or f"MCP tool from {docker_image}",
+                                "source": "docker_hub_documentation"
+                            })
+                        
+                        # Fallback: any `tool_name` in backticks, without common non-tool words
+                        if not tools:
+                            for candidate in scan_hub_mentions(combined_text):
+                                tools.append({
+                                    "name": candidate.name,
+                                    "description": f"Tool from Docker Hub documentation",
+                                    "source": "docker_hub_api"
+                                })
+                        
+                        # If it's a filesystem server, add standard filesystem tools
+                        if "filesystem" in combined_text and not tools:
+                            tools.extend([
+                                {"name": "read_file", "description": "Read file contents", "source": "docker_hub_analysis"},
+                                {"name": "write_file", "description": "Write file contents", "source": "docker_hub_analysis"},
+                                {"name": "list_directory", "description": "List directory contents", "source": "docker_hub_analysis"},
+                                {"name": "create_directory", "description": "Create directories", "source": "docker_hub_analysis"}
+                            ])
+                        
+                        # For custom Docker containers not on Docker Hub, try pattern matching
+                        elif not tools:
+                            custom_tools = self._predict_docker_tools_from_image_name(docker_image)
+                            if custom_tools:
+                                tools.extend(custom_tools)
+                
                 except Exception as e:
                     logger.debug(f"Error fetching Docker Hub info: {e}")
             
@@ -2580,36 +2318,21 @@ class SimpleMCPManager:
                 doc_files = ["README.md", "README.txt", "README", "DOCS.md", "docs/README.md"]
                 for doc_file in doc_files:
                     try:
-                        result = subprocess.run(
-                            ["docker", "run", "--rm", docker_image, "cat", f"/{doc_file}"],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            timeout=5
-                        )
+                        content = probe.read_file(f"/{doc_file}")
                         
-                        if result.returncode == 0 and result.stdout:
-                            doc_content = result.stdout.lower()
+                        if content:
+                            doc_content = content.lower()
                             logger.debug(f"Found documentation file: {doc_file}")
                             
                             # Look for MCP tool patterns in documentation
                             if "mcp" in doc_content and any(word in doc_content for word in ["tools", "commands", "functions"]):
                                 # Extract tool information from documentation
-                                tool_patterns = [
-                                    r'- `(\w+)`[:\s]+([^\n]+)',  # - `tool_name`: description
-                                    r'\*\*(\w+)\*\*[:\s]+([^\n]+)',  # **tool_name**: description
-                                    r'### (\w+)\n([^\n]+)',  # ### tool_name\ndescription
-                                ]
-                                
-                                for pattern in tool_patterns:
-                                    matches = re.findall(pattern, doc_content)
-                                    for name, desc in matches:
-                                        if any(keyword in name.lower() for keyword in ["read", "write", "list", "create", "delete", "search"]):
-                                            tools.append({
-                                                "name": name,
-                                                "description": desc.strip(),
-                                                "source": f"container_docs_{doc_file}"
-                                            })
+                                for candidate in scan_readme(doc_content):
+                                    tools.append({
+                                        "name": candidate.name,
+                                        "description": candidate.description,
+                                        "source": f"container_docs_{doc_file}"
+                                    })
                                 
                                 if tools:
                                     break
@@ -2632,16 +2355,13 @@ class SimpleMCPManager:
         """
         Discover tools from NPX-based MCP servers.
         
-        This method attempts various approaches to discover tools from NPX servers:
-        1. Try --help commands
-        2. Check package.json for tool information
-        3. Query npm registry for package documentation
-        4. Use pattern matching based on server name
+        This method attempts various approaches to discover tools from NPX servers,
+        none of which installs or runs the package:
+        1. Read the tools the package declares, or its README, from the
+           local npx cache if the server has run before
+        2. Read the package's documentation from the npm registry
+        3. Use pattern matching based on server name
         """
-        import subprocess
-        import json
-        import re
-        
         try:
             tools = []
             
@@ -2662,49 +2382,33 @@ class SimpleMCPManager:
             
             logger.debug(f"Discovering tools for NPX package: {package_name}")
             
-            # Method 1: Try --help command
+            # Method 1: The installed package in the npx cache, read offline
             try:
-                result = subprocess.run(
-                    ["npx", package_name, "--help"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=15
-                )
-                
-                if result.returncode == 0 and result.stdout:
-                    help_tools = self._parse_npx_help_output(result.stdout, package_name)
-                    if help_tools:
-                        tools.extend(help_tools)
-                        logger.debug(f"Found {len(help_tools)} tools from --help for {package_name}")
+                npx_cache = get_npx_cache()
+                local_manifest = npx_cache.read_package(package_name)
+                if local_manifest:
+                    local_tools = npx_cache.declared_tools(local_manifest)
+                    if not local_tools:
+                        local_tools = self._parse_npm_package_info(local_manifest, package_name)
+                    if local_tools:
+                        tools.extend(local_tools)
+                        logger.debug(f"Found {len(local_tools)} tools in the npx cache for {package_name}")
             
-            except subprocess.TimeoutExpired:
-                logger.debug(f"Timeout running --help for {package_name}")
             except Exception as e:
-                logger.debug(f"Error running --help for {package_name}: {e}")
+                logger.debug(f"Error reading the npx cache for {package_name}: {e}")
             
-            # Method 2: Try npm info to get package documentation
+            # Method 2: Package documentation from the registry, cached per name@version
             if not tools:
                 try:
-                    result = subprocess.run(
-                        ["npm", "info", package_name, "--json"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if result.returncode == 0 and result.stdout:
-                        npm_info = json.loads(result.stdout)
-                        npm_tools = self._parse_npm_package_info(npm_info, package_name)
+                    manifest = get_npm_metadata().get_manifest(package_name)
+                    if manifest:
+                        npm_tools = self._parse_npm_package_info(manifest, package_name)
                         if npm_tools:
                             tools.extend(npm_tools)
-                            logger.debug(f"Found {len(npm_tools)} tools from npm info for {package_name}")
+                            logger.debug(f"Found {len(npm_tools)} tools from npm metadata for {package_name}")
                 
-                except subprocess.TimeoutExpired:
-                    logger.debug(f"Timeout running npm info for {package_name}")
                 except Exception as e:
-                    logger.debug(f"Error running npm info for {package_name}: {e}")
+                    logger.debug(f"Error reading npm metadata for {package_name}: {e}")
             
             # Method 3: Pattern-based tool prediction
             if not tools:
@@ -2719,103 +2423,24 @@ class SimpleMCPManager:
             logger.debug(f"Failed NPX tool discovery for {server.name}: {e}")
             return []
     
-    def _parse_npx_help_output(self, help_output: str, package_name: str) -> List[Dict[str, Any]]:
-        """Parse help output from NPX packages to extract tool information."""
-        tools = []
-        
-        try:
-            lines = help_output.lower().split('\n')
-            
-            # Look for common help patterns
-            in_commands_section = False
-            for line in lines:
-                line = line.strip()
-                
-                # Detect commands/tools section
-                if any(keyword in line for keyword in ['commands:', 'tools:', 'actions:', 'available:']):
-                    in_commands_section = True
-                    continue
-                
-                if in_commands_section:
-                    # Stop if we hit options or examples section
-                    if any(keyword in line for keyword in ['options:', 'examples:', 'usage:', '--']):
-                        break
-                    
-                    # Extract command patterns like "  command_name    description"
-                    command_match = re.match(r'\s*([a-zA-Z_][a-zA-Z0-9_-]*)\s+(.+)', line)
-                    if command_match:
-                        cmd_name, description = command_match.groups()
-                        tools.append({
-                            "name": cmd_name.strip(),
-                            "description": description.strip(),
-                            "source": "npx_help"
-                        })
-            
-            # Also look for any tool-like patterns in the entire output
-            if not tools:
-                # Look for patterns like "Available tools:" or similar
-                tool_patterns = [
-                    r'tools?:\s*([^.\n]+)',
-                    r'provides?\s+([^.\n]+)\s+functionality',
-                    r'supports?\s+([^.\n]+)\s+operations?'
-                ]
-                
-                for pattern in tool_patterns:
-                    matches = re.findall(pattern, help_output.lower())
-                    for match in matches:
-                        # Extract individual tool names
-                        tool_names = re.split(r'[,&\sand\s]+', match.strip())
-                        for tool_name in tool_names:
-                            tool_name = tool_name.strip()
-                            if tool_name and len(tool_name) > 2:
-                                tools.append({
-                                    "name": tool_name.replace(" ", "_"),
-                                    "description": f"Tool from {package_name}",
-                                    "source": "npx_help_pattern"
-                                })
-            
-            return tools
-            
-        except Exception as e:
-            logger.debug(f"Error parsing NPX help output: {e}")
-            return []
-    
     def _parse_npm_package_info(self, npm_info: dict, package_name: str) -> List[Dict[str, Any]]:
         """Parse npm package info to extract tool information."""
         tools = []
         
         try:
-            # Check description for tool hints
-            description = npm_info.get('description', '').lower()
-            readme = npm_info.get('readme', '').lower()
-            keywords = npm_info.get('keywords', [])
-            
-            combined_text = f"{description} {readme}"
+            # Check description for tool hints, lowercased once
+            combined_text = f"{npm_info.get('description') or ''} {npm_info.get('readme') or ''}".lower()
+            keywords = npm_info.get('keywords') or []
             
             # Look for MCP-specific patterns
             if 'mcp' in combined_text or any('mcp' in str(k).lower() for k in keywords):
-                # Extract tool names from documentation
-                tool_patterns = [
-                    r'tools?[:\s]+([^.\n]+)',
-                    r'provides?\s+([^.\n]+)\s+tools?',
-                    r'supports?\s+([^.\n]+)\s+operations?',
-                    r'functions?[:\s]+([^.\n]+)',
-                    r'commands?[:\s]+([^.\n]+)'
-                ]
-                
-                for pattern in tool_patterns:
-                    matches = re.findall(pattern, combined_text)
-                    for match in matches:
-                        # Extract individual tool names
-                        tool_names = re.split(r'[,&\sand\s]+', match.strip())
-                        for tool_name in tool_names:
-                            tool_name = tool_name.strip()
-                            if tool_name and len(tool_name) > 2 and tool_name not in ['the', 'and', 'or']:
-                                tools.append({
-                                    "name": tool_name.replace(" ", "_"),
-                                    "description": f"Tool from {package_name} package",
-                                    "source": "npm_package_info"
-                                })
+                # Extract tool names listed in the documentation, in one pass
+                for candidate in scan_package_docs(combined_text):
+                    tools.append({
+                        "name": candidate.name,
+                        "description": f"Tool from {package_name} package",
+                        "source": "npm_package_info"
+                    })
             
             return tools
             
@@ -2966,9 +2591,8 @@ class SimpleMCPManager:
         Returns:
             List of tool dictionaries
         """
-        import re
-        
         tools = []
+        seen = set()
         
         try:
             lines = help_output.splitlines()
@@ -2978,7 +2602,7 @@ class SimpleMCPManager:
                 line = line.strip()
                 
                 # Look for sections that indicate commands/tools
-                if re.search(r"(commands?|tools?|available|usage):", line.lower()):
+                if HELP_SECTION_RE.search(line):
                     capture_commands = True
                     continue
                     
@@ -2994,28 +2618,18 @@ class SimpleMCPManager:
                     # "  command_name    Description here"
                     # "* command_name - Description"
                     # "command_name: Description"
-                    command_patterns = [
-                        r"^\s*\*?\s*([a-zA-Z_][a-zA-Z0-9_-]*)\s*[-:]\s*(.+)$",  # command - description
-                        r"^\s*([a-zA-Z_][a-zA-Z0-9_-]*)\s{2,}(.+)$",           # command    description (2+ spaces)
-                        r"^\s*([a-zA-Z_][a-zA-Z0-9_-]*)\s*$"                   # just command name
-                    ]
-                    
-                    for pattern in command_patterns:
-                        match = re.match(pattern, line)
-                        if match:
-                            tool_name = match.group(1).strip()
-                            description = match.group(2).strip() if len(match.groups()) > 1 else f"Tool from {server_name}"
-                            
-                            # Skip generic help-related commands
-                            if tool_name.lower() in ['help', 'version', '--help', '--version', '-h', '-v']:
-                                break
-                            
-                            tools.append({
-                                "name": tool_name,
-                                "description": description,
-                                "parameters": []  # Help output usually doesn't include detailed parameter info
-                            })
-                            break
+                    candidate = HELP_COMMANDS.match(line)
+                    if candidate:
+                        # Skip generic help-related commands
+                        if candidate.name.lower() in HELP_BUILTINS or candidate.name in seen:
+                            continue
+                        
+                        seen.add(candidate.name)
+                        tools.append({
+                            "name": candidate.name,
+                            "description": candidate.description or f"Tool from {server_name}",
+                            "parameters": []  # Help output usually doesn't include detailed parameter info
+                        })
             
             # If no structured commands found, try to find any command-like words
             if not tools:
@@ -3060,6 +2674,9 @@ class SimpleMCPManager:
             
             logger.debug(f"Testing {len(servers)} servers for tool discovery")
             
+            # Documentation lookups run concurrently here rather than once per server below
+            await self.prefetch_docker_hub_docs(servers)
+            
             for server in servers:
                 servers_tested.append(server.name)
                 
@@ -0,0 +1,264 @@
+"""
+Tool name extraction from help output, READMEs, descriptions and labels.
+
+Tool discovery guesses tool names from free text when a server cannot be
+asked directly. All patterns are compiled once per process. The patterns
+for each kind of document are joined into a single alternation, so a
+document is searched by one regex however many patterns apply to it,
+finding the same matches as running each pattern on its own. Scanning
+yields ``ToolCandidate`` tuples carrying the offset where each tool was
+first found. Documentation mentions the same few tools over and over, so
+names are deduplicated through a set as they are matched, and a candidate
+is only built for the first mention. Callers lowercase a document at most
+once.
+"""
+
+import re
+from typing import Dict, Iterator, NamedTuple, Optional, Set, Tuple
+
+# Words the npm prose patterns capture that are never tool names
+NPM_STOPWORDS = frozenset({"the", "and", "or"})
+
+# Backticked words in Docker Hub docs that name types or arguments rather than tools
+HUB_NON_TOOL_WORDS = frozenset({"string", "array", "boolean", "object", "number", "file", "dir"})
+
+# Commands every CLI prints in its help
+HELP_BUILTINS = frozenset({"help", "version", "--help", "--version", "-h", "-v"})
+
+# Words a README tool name must contain to be kept
+README_TOOL_NAME_RE = re.compile(r'read|write|list|create|delete|search')
+
+
+class ToolCandidate(NamedTuple):
+    """A tool name found in a document."""
+    
+    name: str
+    description: str
+    kind: str
+    offset: int
+
+
+class ToolPatterns:
+    """
+    Named patterns scanned together as one alternation.
+    
+    Each pattern captures the tool name as ``(?P<name>...)`` and may
+    capture ``(?P<description>...)``. Scanning finds what running each
+    pattern on its own would: matches of one pattern never overlap, but may
+    start inside a match of another, as in "provides search tools: fetch".
+    Where several patterns match at the same offset, the first one listed
+    wins.
+    """
+    
+    def __init__(self, patterns: Dict[str, str], flags: int = 0):
+        branches = []
+        kinds: Dict[int, str] = {}
+        for kind, pattern in patterns.items():
+            # Group names must be unique across the alternation
+            pattern = pattern.replace("(?P<name>", f"(?P<{kind}_name>")
+            pattern = pattern.replace("(?P<description>", f"(?P<{kind}_description>")
+            # Branches are not wrapped in a group of their own, which would
+            # hide their leading literals from the engine's prefix search;
+            # instead every group maps back to the branch it belongs to
+            first = len(kinds) + 1
+            for index in range(first, first + re.compile(pattern).groups):
+                kinds[index] = kind
+            branches.append(pattern)
+        self.regex = re.compile("|".join(branches), flags)
+        # Kind, name group and description group by the group that closes
+        # last, which is never None since every pattern captures a name
+        self._groups: Dict[Optional[int], Tuple[str, int, Optional[int]]] = {
+            index: (kind, self.regex.groupindex[f"{kind}_name"], self.regex.groupindex.get(f"{kind}_description"))
+            for index, kind in kinds.items()
+        }
+    
+    def _candidate(self, match: "re.Match[str]") -> ToolCandidate:
+        kind, name_group, description_group = self._groups[match.lastindex]
+        description = (match.group(description_group) or "").strip() if description_group else ""
+        return ToolCandidate(match.group(name_group), description, kind, match.start(name_group))
+    
+    def scan(
+        self,
+        text: str,
+        pos: int = 0,
+        endpos: Optional[int] = None,
+        seen: Optional[Set[str]] = None,
+        regions: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> Iterator[ToolCandidate]:
+        """
+        Find tool candidates in one pass.
+        
+        Args:
+            text: Document to scan
+            pos: Offset to start at
+            endpos: Offset to stop at, defaulting to the end of the document
+            seen: Names to skip; the names found are added to it
+            regions: Start and end offsets outside of which matches of a
+                kind are ignored
+        
+        Yields:
+            The first mention of each name, in document order
+        """
+        seen = set() if seen is None else seen
+        regions = regions or {}
+        groups = self._groups
+        endpos = len(text) if endpos is None else endpos
+        # End of the last match of each kind, which later matches of that kind may not overlap
+        ends: Dict[str, int] = {}
+        search = self.regex.search
+        match = search(text, pos, endpos)
+        while match:
+            start = match.start()
+            kind, name_group, _ = groups[match.lastindex]
+            in_region = kind not in regions or regions[kind][0] <= start < regions[kind][1]
+            if in_region and start >= ends.get(kind, 0):
+                ends[kind] = match.end()
+                # Only the name is extracted until it is known to be new
+                name = match.group(name_group)
+                if name not in seen:
+                    seen.add(name)
+                    yield self._candidate(match)
+            # Resume inside the match, where other patterns may match
+            match = search(text, start + 1, endpos)
+    
+    def match(self, text: str) -> Optional[ToolCandidate]:
+        """Match the patterns at the start of ``text``, e.g. a single line."""
+        match = self.regex.match(text)
+        return self._candidate(match) if match else None
+
+
+# npm descriptions and READMEs: prose listing tools, e.g. "Tools: read_file, write_file"
+NPM_TOOL_LISTS = ToolPatterns({
+    "tools": r'tools?[:\s]+(?P<name>[^.\n]+)',
+    "provides": r'provides?\s+(?P<name>[^.\n]+)\s+tools?',
+    "supports": r'supports?\s+(?P<name>[^.\n]+)\s+operations?',
+    "functions": r'functions?[:\s]+(?P<name>[^.\n]+)',
+    "commands": r'commands?[:\s]+(?P<name>[^.\n]+)',
+})
+
+# Items of such a list, separated by commas, ampersands, whitespace or "and"
+LIST_ITEM_RE = re.compile(r'[^,&\s]+')
+
+
+def scan_package_docs(text: str) -> Iterator[ToolCandidate]:
+    """
+    Find tool names listed in npm package prose.
+    
+    Args:
+        text: Lowercased description and README
+    
+    Yields:
+        One candidate per listed name, with the offset of its first mention
+    """
+    seen = set(NPM_STOPWORDS)
+    # Identical lists are common in long READMEs and are split only once
+    for listing in NPM_TOOL_LISTS.scan(text, seen=set()):
+        start = listing.offset
+        end = start + len(listing.name)
+        if seen.issuperset(LIST_ITEM_RE.findall(text, start, end)):
+            continue
+        for item in LIST_ITEM_RE.finditer(text, start, end):
+            name = item.group()
+            if len(name) > 2 and name not in seen:
+                seen.add(name)
+                yield ToolCandidate(name, "", listing.kind, item.start())
+
+
+# Docker Hub full descriptions
+HUB_TOOLS_TABLE_RE = re.compile(
+    r'tools provided by this server.*?\n(.+?)(?:\n---|\n##|\n\n|\Z)', re.DOTALL | re.IGNORECASE
+)
+HUB_DOC_TOOLS = ToolPatterns({
+    "table": r'`(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)`\s*\|\s*(?P<description>[^|\n]+)',  # | `tool_name` | description |
+    "header": r'tool:\s*\*\*`(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)`\*\*',  # #### tool: **`tool_name`**
+})
+HUB_MENTIONS = ToolPatterns({
+    "backtick": r'`(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)`',  # `tool_name` anywhere
+})
+
+
+def scan_hub_docs(text: str) -> Iterator[ToolCandidate]:
+    """
+    Find documented tools in a Docker Hub description.
+    
+    Tools are rows of the "Tools provided by this server" table, of kind
+    ``table``, and "Tool: **`name`**" headings, of kind ``header``.
+    Table-like rows elsewhere in the document are not tools.
+    
+    Args:
+        text: Lowercased description and full description
+    
+    Yields:
+        Candidates in document order
+    """
+    table = HUB_TOOLS_TABLE_RE.search(text)
+    return HUB_DOC_TOOLS.scan(text, regions={"table": table.span(1) if table else (0, 0)})
+
+
+def scan_hub_mentions(text: str) -> Iterator[ToolCandidate]:
+    """
+    Find backticked names in a Docker Hub description, as a fallback.
+    
+    Args:
+        text: Lowercased description and full description
+    
+    Yields:
+        Candidates in document order, without common type names
+    """
+    return HUB_MENTIONS.scan(text, seen=set(HUB_NON_TOOL_WORDS))
+
+
+# READMEs shipped inside containers
+README_TOOLS = ToolPatterns({
+    "list": r'- `(?P<name>\w+)`[:\s]+(?P<description>[^\n]+)',  # - `tool_name`: description
+    "bold": r'\*\*(?P<name>\w+)\*\*[:\s]+(?P<description>[^\n]+)',  # **tool_name**: description
+    "heading": r'### (?P<name>\w+)\n(?P<description>[^\n]+)',  # ### tool_name\ndescription
+})
+
+
+def scan_readme(text: str) -> Iterator[ToolCandidate]:
+    """
+    Find documented tools whose names look like operations in a README.
+    
+    Args:
+        text: Lowercased README
+    
+    Yields:
+        Candidates in document order
+    """
+    for candidate in README_TOOLS.scan(text):
+        if README_TOOL_NAME_RE.search(candidate.name):
+            yield candidate
+
+
+# Image labels serialized as JSON, e.g. {"mcp.tools": "fetch,search"}
+LABEL_TOOLS_RE = re.compile(r'tools?["\']?:\s*["\']?([^"\'}\]]+)')
+LABEL_ITEM_RE = re.compile(r'[^,]+')
+
+
+def scan_labels(text: str) -> Iterator[ToolCandidate]:
+    """
+    Find comma-separated tool lists in image labels.
+    
+    Args:
+        text: Lowercased labels as JSON
+    
+    Yields:
+        One candidate per listed tool
+    """
+    seen = set()
+    for match in LABEL_TOOLS_RE.finditer(text):
+        for item in LABEL_ITEM_RE.finditer(text, match.start(1), match.end(1)):
+            name = item.group().strip()
+            if len(name) > 2 and name not in seen:
+                seen.add(name)
+                yield ToolCandidate(name, "", "label", item.start())
+
+
+# CLI help output, matched line by line
+HELP_SECTION_RE = re.compile(r'(commands?|tools?|available|usage):', re.IGNORECASE)
+HELP_COMMANDS = ToolPatterns({
+    "described": r'\s*\*?\s*(?P<name>[a-zA-Z_][a-zA-Z0-9_-]*)\s*[-:]\s*(?P<description>.+)$',  # command - description
+    "columns": r'\s*(?P<name>[a-zA-Z_][a-zA-Z0-9_-]*)\s{2,}(?P<description>.+)$',  # command    description
+    "bare": r'\s*(?P<name>[a-zA-Z_][a-zA-Z0-9_-]*)\s*$',  # just command name
+})
@@ -7,19 +7,63 @@ tools like `docker mcp` or `claude mcp` commands.
 """
 
 import asyncio
+import heapq
+import inspect
 import os
 import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Callable, Any, Tuple
+from datetime import datetime
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.api import BaseObserver
+from watchdog.events import (
+    FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent, FileSystemEventHandler,
+)
 
+from mcp_manager.utils.config import invalidate_config
 from mcp_manager.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Configuration file names watched in every monitored directory
+RELEVANT_FILES = frozenset({
+    'registry.yaml',
+    'mcp-servers.json',
+    '.mcp.json',
+    '.claude.json',
+    'server_catalog.json',
+    'config.toml',
+    '.mcp-manager.toml',
+})
+
+# MCP Manager settings files; changes invalidate the loaded configuration
+SETTINGS_FILES = frozenset({'config.toml', '.mcp-manager.toml'})
+
+# Project-level configuration files
+PROJECT_FILES = ('.mcp.json', '.mcp-manager.toml')
+
+# Files marking the root of a project above the current directory
+PROJECT_ROOT_MARKERS = ('.mcp.json', '.git')
+
+# Event types delivered to handlers; open/close events are never needed
+WATCHED_EVENT_TYPES = [FileCreatedEvent, FileModifiedEvent, FileDeletedEvent, FileMovedEvent]
+
+# watchdog>=4 accepts an event filter that also narrows the inotify mask
+_SUPPORTS_EVENT_FILTER = 'event_filter' in inspect.signature(BaseObserver.schedule).parameters
+
+# Bounds for AsyncConfigWatcher's queue and worker group
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_WORKERS = 4
+
+# Seconds a path must be quiet before its coalesced event is emitted
+DEFAULT_QUIET_PERIOD = 0.5
+
+# Upper bound on paths tracked while waiting for their quiet window
+MAX_PENDING_PATHS = 256
+
 
 class ConfigChangeEvent:
     """Represents a configuration file change event."""
@@ -42,122 +86,259 @@ class ConfigChangeEvent:
         return f"ConfigChangeEvent({self.source}:{self.scope}:{self.event_type}:{Path(self.file_path).name})"
 
 
+class _PendingChange:
+    """Events seen for one path during the current quiet window."""
+    
+    __slots__ = ('file_path', 'existed_before', 'scope', 'source', 'callback', 'deadline', 'merged')
+    
+    def __init__(self, file_path: str, existed_before: bool, scope: str, source: str,
+                 callback: Callable[[ConfigChangeEvent], None], deadline: float):
+        self.file_path = file_path
+        self.existed_before = existed_before
+        self.scope = scope
+        self.source = source
+        self.callback = callback
+        self.deadline = deadline
+        self.merged = 1
+
+
+class EventCoalescer:
+    """Trailing-edge, per-path coalescing of file system events.
+    
+    Every event kind for a path restarts that path's quiet window. Once the
+    path has been quiet for ``quiet_period`` seconds a single settled event is
+    emitted describing the net change: 'created', 'modified' or 'deleted'.
+    Paths that appear and disappear inside one window (temp files) emit
+    nothing. One timer thread serves every handler sharing the coalescer.
+    """
+    
+    def __init__(self, quiet_period: float = DEFAULT_QUIET_PERIOD, max_pending: int = MAX_PENDING_PATHS):
+        self.quiet_period = quiet_period
+        self.max_pending = max_pending
+        self._pending: Dict[str, _PendingChange] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+    
+    def submit(
+        self,
+        file_path: str,
+        event_type: str,
+        scope: str,
+        source: str,
+        callback: Callable[[ConfigChangeEvent], None],
+    ) -> None:
+        """Record a raw event for a path and restart its quiet window."""
+        overflow: List[_PendingChange] = []
+        
+        with self._cond:
+            if self._closed:
+                return
+            
+            deadline = time.monotonic() + self.quiet_period
+            pending = self._pending.get(file_path)
+            
+            if pending:
+                pending.deadline = deadline
+                pending.merged += 1
+            else:
+                # Bound the state: settle the oldest paths early rather than grow
+                while len(self._pending) >= self.max_pending:
+                    oldest = min(self._pending.values(), key=lambda p: p.deadline)
+                    overflow.append(self._pending.pop(oldest.file_path))
+                
+                self._pending[file_path] = _PendingChange(
+                    file_path=file_path,
+                    existed_before=event_type != 'created',
+                    scope=scope,
+                    source=source,
+                    callback=callback,
+                    deadline=deadline,
+                )
+            
+            heapq.heappush(self._heap, (deadline, file_path))
+            self._ensure_thread()
+            self._cond.notify()
+        
+        for pending in overflow:
+            self._emit(pending)
+    
+    def pending_count(self) -> int:
+        """Get the number of paths waiting for their quiet window to end."""
+        with self._cond:
+            return len(self._pending)
+    
+    def flush(self) -> None:
+        """Emit all pending events immediately."""
+        with self._cond:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._heap.clear()
+        
+        for change in pending:
+            self._emit(change)
+    
+    def close(self, flush: bool = False) -> None:
+        """Stop the timer thread, optionally emitting pending events first."""
+        if flush:
+            self.flush()
+        
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._heap.clear()
+            self._cond.notify()
+            thread = self._thread
+        
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+    
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="mcp-config-coalescer", daemon=True
+            )
+            self._thread.start()
+    
+    def _run(self) -> None:
+        """Timer loop: sleep until the earliest deadline and settle due paths."""
+        while True:
+            due: List[_PendingChange] = []
+            
+            with self._cond:
+                while not self._closed and not self._heap:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    deadline, file_path = heapq.heappop(self._heap)
+                    pending = self._pending.get(file_path)
+                    # Stale heap entries belong to windows that were restarted
+                    if pending and pending.deadline <= deadline:
+                        due.append(self._pending.pop(file_path))
+                
+                if not due:
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    self._cond.wait(timeout)
+                    continue
+            
+            for pending in due:
+                self._emit(pending)
+    
+    def _emit(self, pending: _PendingChange) -> None:
+        """Emit the settled event for a path based on its final state."""
+        exists = os.path.exists(pending.file_path)
+        
+        if pending.existed_before:
+            event_type = 'modified' if exists else 'deleted'
+        elif exists:
+            event_type = 'created'
+        else:
+            logger.debug(f"Dropping transient config file events: {pending.file_path}")
+            return
+        
+        logger.debug(
+            f"Config file {event_type}: {pending.file_path} "
+            f"(coalesced {pending.merged} events)"
+        )
+        
+        try:
+            pending.callback(ConfigChangeEvent(
+                file_path=pending.file_path,
+                event_type=event_type,
+                scope=pending.scope,
+                source=pending.source
+            ))
+        except Exception as e:
+            logger.error(f"Error in config change callback: {e}")
+
+
 class ConfigFileHandler(FileSystemEventHandler):
     """Handles file system events for MCP configuration files."""
     
-    def __init__(self, callback: Callable[[ConfigChangeEvent], None], scope: str, source: str):
+    def __init__(
+        self,
+        callback: Callable[[ConfigChangeEvent], None],
+        scope: str,
+        source: str,
+        coalescer: Optional[EventCoalescer] = None,
+        file_routes: Optional[Dict[str, Tuple[str, str]]] = None
+    ):
         super().__init__()
         self.callback = callback
         self.scope = scope
         self.source = source
-        self._debounce_events: Dict[str, datetime] = {}
-        self._debounce_delay = timedelta(seconds=1)  # Debounce rapid changes
+        # Exact file names handled in this directory, mapped to (scope, source)
+        self.file_routes = file_routes
+        # Bursts of raw events (atomic-rename saves, editors) settle into one event
+        self.coalescer = coalescer or EventCoalescer()
     
-    def _should_process_event(self, file_path: str) -> bool:
-        """Check if we should process this event (debouncing)."""
-        now = datetime.now()
-        last_event = self._debounce_events.get(file_path)
-        
-        if last_event and (now - last_event) < self._debounce_delay:
-            return False
-        
-        self._debounce_events[file_path] = now
-        return True
+    def _route(self, file_path: str) -> Optional[Tuple[str, str]]:
+        """Get the (scope, source) for a file, or None if it is not watched."""
+        file_name = os.path.basename(file_path)
+        if self.file_routes is not None:
+            return self.file_routes.get(file_name)
+        if file_name in RELEVANT_FILES:
+            return (self.scope, self.source)
+        return None
     
     def _is_relevant_file(self, file_path: str) -> bool:
         """Check if the file is relevant for MCP configuration monitoring."""
-        file_name = os.path.basename(file_path)
-        relevant_files = [
-            'registry.yaml',
-            'mcp-servers.json',
-            '.mcp.json',
-            '.claude.json',
-            'server_catalog.json',
-            '.mcp-manager.toml'
-        ]
-        return file_name in relevant_files
+        return self._route(file_path) is not None
+    
+    def _submit(self, file_path: str, event_type: str) -> None:
+        route = self._route(file_path)
+        if route:
+            scope, source = route
+            self.coalescer.submit(file_path, event_type, scope, source, self.callback)
     
     def on_modified(self, event):
         """Handle file modification events."""
         if event.is_directory:
             return
-            
-        if not self._is_relevant_file(event.src_path):
-            return
-            
-        if not self._should_process_event(event.src_path):
-            return
-            
-        logger.debug(f"Config file modified: {event.src_path}")
-        change_event = ConfigChangeEvent(
-            file_path=event.src_path,
-            event_type='modified',
-            scope=self.scope,
-            source=self.source
-        )
-        self.callback(change_event)
+        self._submit(event.src_path, 'modified')
     
     def on_created(self, event):
         """Handle file creation events."""
         if event.is_directory:
             return
-            
-        if not self._is_relevant_file(event.src_path):
-            return
-            
-        logger.debug(f"Config file created: {event.src_path}")
-        change_event = ConfigChangeEvent(
-            file_path=event.src_path,
-            event_type='created',
-            scope=self.scope,
-            source=self.source
-        )
-        self.callback(change_event)
+        self._submit(event.src_path, 'created')
     
     def on_deleted(self, event):
         """Handle file deletion events."""
         if event.is_directory:
             return
-            
-        if not self._is_relevant_file(event.src_path):
-            return
-            
-        logger.debug(f"Config file deleted: {event.src_path}")
-        change_event = ConfigChangeEvent(
-            file_path=event.src_path,
-            event_type='deleted',
-            scope=self.scope,
-            source=self.source
-        )
-        self.callback(change_event)
+        self._submit(event.src_path, 'deleted')
     
     def on_moved(self, event):
         """Handle file move/rename events."""
         if event.is_directory:
             return
-            
-        # Check both source and destination paths
-        src_relevant = self._is_relevant_file(event.src_path)
-        dest_relevant = self._is_relevant_file(event.dest_path)
-        
-        if src_relevant or dest_relevant:
-            logger.debug(f"Config file moved: {event.src_path} -> {event.dest_path}")
-            change_event = ConfigChangeEvent(
-                file_path=event.dest_path,
-                event_type='moved',
-                scope=self.scope,
-                source=self.source
-            )
-            self.callback(change_event)
+        
+        # A rename touches both paths: the source is gone, the destination replaced
+        self._submit(event.src_path, 'deleted')
+        self._submit(event.dest_path, 'moved')
 
 
 class ConfigWatcher:
     """Watches MCP configuration files for changes across all scopes."""
     
-    def __init__(self, change_callback: Optional[Callable[[ConfigChangeEvent], None]] = None):
+    def __init__(
+        self,
+        change_callback: Optional[Callable[[ConfigChangeEvent], None]] = None,
+        quiet_period: float = DEFAULT_QUIET_PERIOD,
+        project_dir: Optional[str] = None
+    ):
         self.change_callback = change_callback or self._default_change_callback
         self.observer = Observer()
-        self._watch_handles: List[Any] = []
+        self.quiet_period = quiet_period
+        # Shared by every handler so one timer thread settles all watched paths
+        self._coalescer: Optional[EventCoalescer] = None
+        self._watches: Dict[str, Tuple[Any, "ConfigFileHandler"]] = {}
+        self._project_dir = project_dir
         self._is_running = False
         self._lock = threading.Lock()
         
@@ -168,6 +349,13 @@ class ConfigWatcher:
         """Default callback that just logs the event."""
         logger.info(f"Config change detected: {event}")
     
+    def _dispatch(self, event: ConfigChangeEvent) -> None:
+        """Deliver a settled event, first dropping stale MCP Manager settings."""
+        if os.path.basename(event.file_path) in SETTINGS_FILES:
+            invalidate_config()
+            logger.debug(f"Configuration invalidated by change to {event.file_path}")
+        self.change_callback(event)
+    
     def _get_config_paths(self) -> Dict[str, Dict[str, str]]:
         """Get all configuration paths to monitor by scope and source."""
         home_dir = Path.home()
@@ -191,6 +379,7 @@ class ConfigWatcher:
             'mcp_manager': {
                 'user': str(home_dir / '.config' / 'mcp-manager'),
                 'catalog_file': str(home_dir / '.config' / 'mcp-manager' / 'server_catalog.json'),
+                'settings_file': str(home_dir / '.config' / 'mcp-manager' / 'config.toml'),
             }
         }
     
@@ -202,6 +391,7 @@ class ConfigWatcher:
                 return
             
             try:
+                self._coalescer = EventCoalescer(self.quiet_period)
                 self._setup_watchers()
                 self.observer.start()
                 self._is_running = True
@@ -221,7 +411,10 @@ class ConfigWatcher:
             try:
                 self.observer.stop()
                 self.observer.join(timeout=5.0)
-                self._watch_handles.clear()
+                if self._coalescer:
+                    self._coalescer.close()
+                self.observer = Observer()
+                self._watches.clear()
                 self._is_running = False
                 logger.info("ConfigWatcher stopped successfully")
                 
@@ -232,118 +425,150 @@ class ConfigWatcher:
         """Check if the watcher is currently running."""
         return self._is_running
     
+    def watched_directories(self) -> List[str]:
+        """Get the directories currently scheduled on the observer."""
+        with self._lock:
+            return sorted(self._watches.keys())
+    
+    def replan(self, project_dir: Optional[str] = None) -> bool:
+        """
+        Re-plan watches for a new project directory.
+        
+        Only directories whose routes changed are rescheduled, so this is
+        cheap enough to call whenever the working directory may have moved.
+        
+        Args:
+            project_dir: Project directory, defaults to the current directory
+            
+        Returns:
+            True if the set of watches changed
+        """
+        with self._lock:
+            self._project_dir = project_dir or os.getcwd()
+            if not self._is_running:
+                return False
+            return self._apply_plan(self._plan_watches())
+    
     def _setup_watchers(self):
         """Set up file system watchers for all configuration paths."""
+        self._project_dir = self._project_dir or os.getcwd()
+        self._apply_plan(self._plan_watches())
+    
+    def _plan_watches(self) -> Dict[str, Dict[str, Tuple[str, str]]]:
+        """
+        Plan one watch per directory across all configuration sources.
+        
+        Returns:
+            Mapping of directory to {file name: (scope, source)}
+        """
         config_paths = self._config_paths
+        home_dir = Path.home()
+        plan: Dict[str, Dict[str, Tuple[str, str]]] = {}
         
-        # Watch Docker Desktop registry
-        self._setup_docker_watcher(config_paths['docker'])
+        def add(file_path: str, scope: str, source: str) -> None:
+            directory, file_name = os.path.split(file_path)
+            if not os.path.isdir(directory):
+                logger.debug(f"Config directory not found: {directory}")
+                return
+            plan.setdefault(directory, {}).setdefault(file_name, (scope, source))
         
-        # Watch Claude configurations
-        self._setup_claude_watcher(config_paths['claude'])
+        add(config_paths['docker']['registry_file'], 'user', 'docker')
+        add(config_paths['claude']['user_file'], 'user', 'claude')
+        add(config_paths['claude']['internal_file'], 'internal', 'claude')
+        add(config_paths['mcp_manager']['catalog_file'], 'user', 'mcp_manager')
+        add(config_paths['mcp_manager']['settings_file'], 'user', 'mcp_manager')
         
-        # Watch MCP Manager configurations
-        self._setup_mcp_manager_watcher(config_paths['mcp_manager'])
+        # Project configs live in the current directory and the project root,
+        # so only those two are watched rather than every ancestor
+        project_dir = Path(self._project_dir or os.getcwd())
+        project_dirs = [project_dir]
+        project_root = _find_project_root(project_dir, home_dir)
+        if project_root and project_root != project_dir:
+            project_dirs.append(project_root)
         
-        # Watch for project-level configurations (current directory)
-        self._setup_project_watcher()
-    
-    def _setup_docker_watcher(self, docker_paths: Dict[str, str]):
-        """Set up watcher for Docker Desktop MCP configurations."""
-        docker_dir = docker_paths['user']
+        for directory in project_dirs:
+            for file_name in PROJECT_FILES:
+                add(str(directory / file_name), 'project', 'claude')
         
-        if os.path.exists(docker_dir):
-            handler = ConfigFileHandler(
-                callback=self.change_callback,
-                scope='user',
-                source='docker'
-            )
-            watch_handle = self.observer.schedule(handler, docker_dir, recursive=False)
-            self._watch_handles.append(watch_handle)
-            logger.debug(f"Watching Docker MCP directory: {docker_dir}")
-        else:
-            logger.debug(f"Docker MCP directory not found: {docker_dir}")
+        return plan
     
-    def _setup_claude_watcher(self, claude_paths: Dict[str, str]):
-        """Set up watcher for Claude MCP configurations."""
-        # Watch user-level Claude config
-        claude_user_dir = claude_paths['user']
-        if os.path.exists(claude_user_dir):
-            handler = ConfigFileHandler(
-                callback=self.change_callback,
-                scope='user',
-                source='claude'
-            )
-            watch_handle = self.observer.schedule(handler, claude_user_dir, recursive=False)
-            self._watch_handles.append(watch_handle)
-            logger.debug(f"Watching Claude user config directory: {claude_user_dir}")
+    def _apply_plan(self, plan: Dict[str, Dict[str, Tuple[str, str]]]) -> bool:
+        """Schedule and unschedule watches so the observer matches the plan."""
+        changed = False
         
-        # Watch internal Claude config (home directory for .claude.json)
-        claude_internal_dir = claude_paths['internal']
-        if os.path.exists(claude_internal_dir):
-            handler = ConfigFileHandler(
-                callback=self.change_callback,
-                scope='internal',
-                source='claude'
-            )
-            watch_handle = self.observer.schedule(handler, claude_internal_dir, recursive=False)
-            self._watch_handles.append(watch_handle)
-            logger.debug(f"Watching Claude internal config directory: {claude_internal_dir}")
-    
-    def _setup_mcp_manager_watcher(self, mcp_manager_paths: Dict[str, str]):
-        """Set up watcher for MCP Manager configurations."""
-        mcp_manager_dir = mcp_manager_paths['user']
+        for directory in list(self._watches):
+            watch, handler = self._watches[directory]
+            if plan.get(directory) == handler.file_routes:
+                continue
+            self.observer.unschedule(watch)
+            del self._watches[directory]
+            changed = True
+            logger.debug(f"Stopped watching config directory: {directory}")
         
-        if os.path.exists(mcp_manager_dir):
+        for directory, routes in plan.items():
+            if directory in self._watches:
+                continue
+            scope, source = next(iter(routes.values()))
             handler = ConfigFileHandler(
-                callback=self.change_callback,
-                scope='user',
-                source='mcp_manager'
+                callback=self._dispatch,
+                scope=scope,
+                source=source,
+                coalescer=self._coalescer,
+                file_routes=routes
             )
-            watch_handle = self.observer.schedule(handler, mcp_manager_dir, recursive=False)
-            self._watch_handles.append(watch_handle)
-            logger.debug(f"Watching MCP Manager config directory: {mcp_manager_dir}")
-    
-    def _setup_project_watcher(self):
-        """Set up watcher for project-level MCP configurations."""
-        # Watch current working directory for .mcp.json and .mcp-manager.toml
-        current_dir = os.getcwd()
-        
-        handler = ConfigFileHandler(
-            callback=self.change_callback,
-            scope='project',
-            source='claude'
-        )
-        watch_handle = self.observer.schedule(handler, current_dir, recursive=False)
-        self._watch_handles.append(watch_handle)
-        logger.debug(f"Watching project config directory: {current_dir}")
-        
-        # Also watch parent directories up to home directory for project configs
-        parent_dir = Path(current_dir).parent
-        home_dir = Path.home()
-        
-        while parent_dir != home_dir and parent_dir != parent_dir.parent:
-            if parent_dir.exists():
-                handler = ConfigFileHandler(
-                    callback=self.change_callback,
-                    scope='project',
-                    source='claude'
+            
+            if _SUPPORTS_EVENT_FILTER:
+                # Lets the inotify backend skip open/close events entirely
+                watch = self.observer.schedule(
+                    handler, directory, recursive=False, event_filter=WATCHED_EVENT_TYPES
                 )
-                watch_handle = self.observer.schedule(handler, str(parent_dir), recursive=False)
-                self._watch_handles.append(watch_handle)
-                logger.debug(f"Watching parent project directory: {parent_dir}")
+            else:
+                watch = self.observer.schedule(handler, directory, recursive=False)
             
-            parent_dir = parent_dir.parent
+            self._watches[directory] = (watch, handler)
+            changed = True
+            logger.debug(f"Watching config directory {directory} for {', '.join(sorted(routes))}")
+        
+        return changed
+
+
+def _find_project_root(start: Path, stop: Path) -> Optional[Path]:
+    """Find the nearest ancestor that holds a project config or a VCS root."""
+    for directory in [start, *start.parents]:
+        if directory == stop:
+            return None
+        if any((directory / marker).exists() for marker in PROJECT_ROOT_MARKERS):
+            return directory
+    return None
 
 
 class AsyncConfigWatcher:
-    """Async wrapper for ConfigWatcher that integrates with asyncio event loops."""
+    """Async wrapper for ConfigWatcher that integrates with asyncio event loops.
+    
+    Events are handed from the observer thread to the event loop with
+    ``call_soon_threadsafe`` into a bounded queue. Queued events for the same
+    path are merged; when the queue is full the oldest event is dropped.
+    A fixed group of workers runs the callback, never two at once for the
+    same path, so a slow consumer cannot stall the observer.
+    """
     
-    def __init__(self, change_callback: Optional[Callable[[ConfigChangeEvent], Any]] = None):
+    def __init__(
+        self,
+        change_callback: Optional[Callable[[ConfigChangeEvent], Any]] = None,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+        max_workers: int = DEFAULT_WORKERS
+    ):
         self.change_callback = change_callback
-        self._watcher = None
-        self._event_queue = asyncio.Queue()
-        self._processing_task = None
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_workers = max(1, max_workers)
+        self._watcher: Optional[ConfigWatcher] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Only touched on the event loop thread
+        self._pending: "OrderedDict[str, ConfigChangeEvent]" = OrderedDict()
+        self._in_flight: set = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        self._stats = {'received': 0, 'merged': 0, 'dropped': 0, 'processed': 0, 'failed': 0}
     
     async def start(self):
         """Start the async config watcher."""
@@ -351,58 +576,116 @@ class AsyncConfigWatcher:
             logger.warning("AsyncConfigWatcher is already running")
             return
         
+        self._loop = asyncio.get_running_loop()
+        wakeup = self._wakeup = asyncio.Event()
+        
         # Create watcher with queue-based callback
-        self._watcher = ConfigWatcher(self._queue_event)
+        watcher = self._watcher = ConfigWatcher(self._queue_event)
         
         # Start the background watcher
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._watcher.start)
+        await self._loop.run_in_executor(None, watcher.start)
         
-        # Start event processing task
-        self._processing_task = asyncio.create_task(self._process_events())
+        # Start event workers
+        self._workers = [
+            asyncio.create_task(self._process_events(wakeup)) for _ in range(self.max_workers)
+        ]
         
         logger.info("AsyncConfigWatcher started")
     
     async def stop(self):
         """Stop the async config watcher."""
-        if self._processing_task:
-            self._processing_task.cancel()
-            try:
-                await self._processing_task
-            except asyncio.CancelledError:
-                pass
-        
         if self._watcher:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, self._watcher.stop)
         
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
         logger.info("AsyncConfigWatcher stopped")
     
+    async def replan(self, project_dir: Optional[str] = None) -> bool:
+        """Re-plan watches for a new project directory; see ConfigWatcher.replan."""
+        if not self._watcher:
+            return False
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._watcher.replan, project_dir)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get event queue counters."""
+        return {**self._stats, 'queued': len(self._pending), 'in_flight': len(self._in_flight)}
+    
     def _queue_event(self, event: ConfigChangeEvent):
-        """Queue an event for async processing."""
+        """Hand an event from the observer thread to the event loop."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        
         try:
-            self._event_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            logger.warning(f"Event queue full, dropping event: {event}")
+            loop.call_soon_threadsafe(self._enqueue, event)
+        except RuntimeError:
+            # Loop shut down between the check and the call
+            logger.debug(f"Event loop closed, discarding event: {event}")
     
-    async def _process_events(self):
-        """Process queued events asynchronously."""
+    def _enqueue(self, event: ConfigChangeEvent) -> None:
+        """Add an event to the bounded queue. Runs on the event loop thread."""
+        self._stats['received'] += 1
+        previous = self._pending.get(event.file_path)
+        
+        if previous is not None:
+            # The newer event describes the latest state, except that a path
+            # created and then modified is still new to the consumer
+            if previous.event_type == 'created' and event.event_type == 'modified':
+                event.event_type = 'created'
+            self._pending[event.file_path] = event
+            self._stats['merged'] += 1
+        else:
+            if len(self._pending) >= self.max_queue_size:
+                _, dropped = self._pending.popitem(last=False)
+                self._stats['dropped'] += 1
+                logger.warning(f"Event queue full, dropping oldest event: {dropped}")
+            self._pending[event.file_path] = event
+        
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    def _take_ready_event(self) -> Optional[ConfigChangeEvent]:
+        """Take the oldest queued event whose path is not being processed."""
+        for file_path in self._pending:
+            if file_path not in self._in_flight:
+                return self._pending.pop(file_path)
+        return None
+    
+    async def _process_events(self, wakeup: asyncio.Event) -> None:
+        """Worker: process queued events asynchronously."""
         while True:
+            event = self._take_ready_event()
+            if event is None:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            
+            self._in_flight.add(event.file_path)
             try:
-                event = await self._event_queue.get()
-                
                 if self.change_callback:
                     if asyncio.iscoroutinefunction(self.change_callback):
                         await self.change_callback(event)
                     else:
                         self.change_callback(event)
-                
-                self._event_queue.task_done()
+                self._stats['processed'] += 1
                 
             except asyncio.CancelledError:
-                break
+                raise
             except Exception as e:
+                self._stats['failed'] += 1
                 logger.error(f"Error processing config change event: {e}")
+            finally:
+                self._in_flight.discard(event.file_path)
+                # Another event for this path may now be ready
+                if self._pending:
+                    wakeup.set()
 
 
 # Convenience functions for common use cases
@@ -415,9 +698,11 @@ def start_config_monitoring(callback: Callable[[ConfigChangeEvent], None]) -> Co
 
 
 async def start_async_config_monitoring(
-    callback: Callable[[ConfigChangeEvent], Any]
+    callback: Callable[[ConfigChangeEvent], Any],
+    max_queue_size: int = DEFAULT_QUEUE_SIZE,
+    max_workers: int = DEFAULT_WORKERS
 ) -> AsyncConfigWatcher:
     """Start async monitoring of configuration files."""
-    watcher = AsyncConfigWatcher(callback)
+    watcher = AsyncConfigWatcher(callback, max_queue_size=max_queue_size, max_workers=max_workers)
     await watcher.start()
     return watcher
\ No newline at end of file
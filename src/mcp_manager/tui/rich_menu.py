@@ -9,10 +9,10 @@ import asyncio
 import logging
 import os
 import sys
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
@@ -25,6 +25,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from mcp_manager import __version__
 from mcp_manager.core.simple_manager import SimpleMCPManager
+from mcp_manager.core.docker_janitor import get_image_janitor
 from mcp_manager.core.discovery import ServerDiscovery
 from mcp_manager.core.models import Server, ServerType, ServerScope
 from mcp_manager.core.change_detector import detect_external_changes, ChangeDetector
@@ -34,6 +35,31 @@ from mcp_manager.utils.config import get_config
 logger = get_logger(__name__)
 console = Console()
 
+# Actions of the server management screen: key, label, colour, icon
+SERVER_ACTIONS = [
+    ("a", "Add", "blue", "➕"),
+    ("c", "Configure", "magenta", "⚙️"),
+    ("e", "Enable", "green", "✅"),
+    ("d", "Disable", "red", "❌"),
+    ("x", "Remove", "red", "🗑"),
+    ("m", "Multi-Select", "yellow", "☰"),
+    ("r", "Refresh", "cyan", "🔄"),
+    ("h", "Help", "yellow", "❓"),
+    ("q", "Quit", "red", "🚪"),
+    ("b", "Back", "dim", "←")
+]
+
+SERVER_TYPE_DISPLAY = {
+    'npm': '[green]NPM[/green]',
+    'docker': '[blue]Docker[/blue]',
+    'docker-desktop': '[cyan]Docker Desktop[/cyan]',
+    'custom': '[yellow]Custom[/yellow]'
+}
+
+# Terminal lines taken by everything on the server screen except table rows
+SERVER_SCREEN_CHROME_LINES = 32
+MIN_SERVER_PAGE_SIZE = 10
+
 
 class RichMenuApp:
     """Rich-based interactive menu for MCP Manager."""
@@ -42,6 +68,13 @@ class RichMenuApp:
         self.manager = SimpleMCPManager()
         self.discovery = ServerDiscovery()
         self.running = True
+        # Servers as last listed, with their table rows; None until listed or after a change
+        self._servers: Optional[List[Server]] = None
+        self._server_rows: List[Tuple[str, str, str, str]] = []
+        self._server_page = 0
+        # Screen parts that never change are built once
+        self._header = self._build_header()
+        self._server_actions = self._build_server_actions()
         self._ensure_logging_setup()
     
     def _ensure_logging_setup(self):
@@ -73,10 +106,8 @@ class RichMenuApp:
             )
             logger.warning(f"Failed to setup logging configuration: {e}")
     
-    def show_header(self):
-        """Display the application header."""
-        console.clear()
-        
+    def _build_header(self) -> Table:
+        """Build the application header."""
         # Create header as a table to match server table styling exactly
         header_table = Table(
             title=f"[bold]MCP Manager v{__version__}[/bold]",
@@ -87,8 +118,12 @@ class RichMenuApp:
         )
         header_table.add_column("Header", justify="center", style="blue")
         header_table.add_row("Complete MCP Server Management")
-        
-        console.print(header_table)
+        return header_table
+    
+    def show_header(self) -> None:
+        """Display the application header."""
+        console.clear()
+        console.print(self._header)
         console.print()
     
     def show_main_menu(self) -> str:
@@ -135,148 +170,176 @@ class RichMenuApp:
         
         return choice
     
+    def _build_server_actions(self) -> Group:
+        """Build the action bar of the server management screen."""
+        # Use a simple list format instead of table to avoid alignment issues
+        action_panels = []
+        for key, action, color, icon in SERVER_ACTIONS:
+            panel_content = f"[bold cyan]{key}[/bold cyan] - [{color}]{action}[/{color}]"
+            panel = Panel(
+                panel_content,
+                width=25,
+                box=box.ROUNDED,
+                padding=(0, 1)
+            )
+            action_panels.append(panel)
+        
+        # Display panels in columns for better layout
+        return Group(
+            Text.from_markup("[bold blue]Available Actions:[/bold blue]"),
+            Text(),
+            Columns(action_panels, equal=True, expand=True),
+            Text(),
+        )
+    
+    @staticmethod
+    def _server_row(server: Server) -> Tuple[str, str, str, str]:
+        """Format a server for the servers table."""
+        # Professional status indicators
+        if server.enabled:
+            status = "[green]●[/green] [green]Enabled[/green]"
+        else:
+            status = "[red]○[/red] [dim]Disabled[/dim]"
+        
+        # Clean command display
+        command = server.command
+        if len(command) > 42:
+            # Smart truncation - show beginning and end
+            command = command[:20] + "..." + command[-19:]
+        
+        type_display = SERVER_TYPE_DISPLAY.get(server.server_type.value, server.server_type.value)
+        return server.name, type_display, status, command
+    
+    async def _get_servers(self, refresh: bool = False) -> List[Server]:
+        """
+        Get the servers, listing them only if they changed since last time.
+        
+        Args:
+            refresh: List the servers even if nothing changed through this menu
+        
+        Returns:
+            The servers
+        """
+        if self._servers is None or refresh:
+            servers = await self.manager.list_servers()
+            self._servers = servers
+            self._server_rows = [self._server_row(server) for server in servers]
+        return self._servers
+    
+    def _invalidate_servers(self) -> None:
+        """
+        Have the servers listed again after this menu tried to change them.
+        
+        Called whether or not the change succeeded, since a failed change
+        may have been applied in part.
+        """
+        self._servers = None
+    
+    def _server_page_size(self) -> int:
+        """Get the number of table rows that fit the terminal."""
+        return max(MIN_SERVER_PAGE_SIZE, console.size.height - SERVER_SCREEN_CHROME_LINES)
+    
+    def _build_servers_table(self, start: int, end: int) -> Table:
+        """Build the servers table for the rows of one page."""
+        # Create clean, professional servers table
+        table = Table(
+            title=f"[bold]Server Management - {len(self._server_rows)} Configured[/bold]",
+            box=box.ROUNDED,
+            title_style="bold blue",
+            show_header=True,
+            header_style="bold white on blue"
+        )
+        table.add_column("#", style="dim", width=4, justify="center")
+        table.add_column("Server Name", style="bold cyan", width=22)
+        table.add_column("Type", style="yellow", width=14, justify="center")
+        table.add_column("Status", width=12, justify="center")
+        table.add_column("Command", style="dim", width=45)
+        
+        for i in range(start, end):
+            table.add_row(str(i + 1), *self._server_rows[i])
+        return table
+    
     async def show_servers(self):
         """Display and manage servers."""
+        refresh = False
         while True:
-            console.clear()
-            self.show_header()
-            
-            console.print("[bold]Server Management[/bold]", style="blue")
-            console.print()
-            
-            # Show loading spinner while fetching servers
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True,
-            ) as progress:
-                task = progress.add_task("Loading servers...", total=None)
-                try:
-                    servers = await self.manager.list_servers()
-                except Exception as e:
-                    console.print(f"[red]Error loading servers: {e}[/red]")
-                    Prompt.ask("Press Enter to continue", default="")
-                    return
-            
+            if self._servers is None or refresh:
+                # Show loading spinner while fetching servers
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                    transient=True,
+                ) as progress:
+                    task = progress.add_task("Loading servers...", total=None)
+                    try:
+                        await self._get_servers(refresh=refresh)
+                    except Exception as e:
+                        console.print(f"[red]Error loading servers: {e}[/red]")
+                        Prompt.ask("Press Enter to continue", default="")
+                        return
+                refresh = False
+            servers = await self._get_servers()
+            
+            page_size = self._server_page_size()
+            pages = max(1, -(-len(servers) // page_size))
+            self._server_page = min(self._server_page, pages - 1)
+            start = self._server_page * page_size
+            end = min(start + page_size, len(servers))
+            
+            screen: List[RenderableType] = [
+                self._header, Text(), Text.from_markup("[bold blue]Server Management[/bold blue]"), Text()
+            ]
             if not servers:
-                console.print(Panel(
+                screen.append(Panel(
                     "[yellow]No servers configured[/yellow]\n\n"
                     "[dim]Use 'Add Server' or 'Discover & Install' to get started[/dim]",
                     title="Server Status",
                     style="yellow",
                     box=box.ROUNDED
                 ))
-                console.print()
             else:
-                # Create clean, professional servers table
-                table = Table(
-                    title=f"[bold]Server Management - {len(servers)} Configured[/bold]",
-                    box=box.ROUNDED,
-                    title_style="bold blue",
-                    show_header=True,
-                    header_style="bold white on blue"
-                )
-                table.add_column("#", style="dim", width=4, justify="center")
-                table.add_column("Server Name", style="bold cyan", width=22)
-                table.add_column("Type", style="yellow", width=14, justify="center")
-                table.add_column("Status", width=12, justify="center")
-                table.add_column("Command", style="dim", width=45)
-                
-                for i, server in enumerate(servers, 1):
-                    # Professional status indicators
-                    if server.enabled:
-                        status = "[green]●[/green] [green]Enabled[/green]"
-                    else:
-                        status = "[red]○[/red] [dim]Disabled[/dim]"
-                    
-                    # Clean command display
-                    command = server.command
-                    if len(command) > 42:
-                        # Smart truncation - show beginning and end
-                        command = command[:20] + "..." + command[-19:]
-                    
-                    # Type formatting
-                    type_display = {
-                        'npm': '[green]NPM[/green]',
-                        'docker': '[blue]Docker[/blue]',
-                        'docker-desktop': '[cyan]Docker Desktop[/cyan]',
-                        'custom': '[yellow]Custom[/yellow]'
-                    }.get(server.server_type.value, server.server_type.value)
-                    
-                    table.add_row(
-                        str(i),
-                        server.name,
-                        type_display,
-                        status,
-                        command
-                    )
-                
-                console.print(table)
-                console.print()
-            
-            # Compact horizontal action bar
-            from rich.columns import Columns
-            
-            # All actions in compact format with icons
-            actions = [
-                ("a", "Add", "blue", "➕"),
-                ("c", "Configure", "magenta", "⚙️"),
-                ("e", "Enable", "green", "✅"),
-                ("d", "Disable", "red", "❌"),
-                ("x", "Remove", "red", "🗑"),
-                ("m", "Multi-Select", "yellow", "☰"),
-                ("r", "Refresh", "cyan", "🔄"),
-                ("h", "Help", "yellow", "❓"),
-                ("q", "Quit", "red", "🚪"),
-                ("b", "Back", "dim", "←")
-            ]
-            
-            # Import needed components
-            from rich.columns import Columns
-            from rich.panel import Panel
-            
-            # Use a simple list format instead of table to avoid alignment issues
-            console.print("[bold blue]Available Actions:[/bold blue]")
-            console.print()
-            
-            # Display actions in a clean 3-column format
-            
-            action_panels = []
-            for key, action, color, icon in actions:
-                panel_content = f"[bold cyan]{key}[/bold cyan] - [{color}]{action}[/{color}]"
-                panel = Panel(
-                    panel_content,
-                    width=25,
-                    box=box.ROUNDED,
-                    padding=(0, 1)
-                )
-                action_panels.append(panel)
-            
-            # Display panels in columns for better layout
-            console.print(Columns(action_panels, equal=True, expand=True))
-            console.print()
+                # Only the rows of the current page are rendered
+                screen.append(self._build_servers_table(start, end))
+                if pages > 1:
+                    screen.append(Text.from_markup(
+                        f"[dim]Servers {start + 1}-{end} of {len(servers)} · page {self._server_page + 1}/{pages} · "
+                        f"[bold cyan]n[/bold cyan] next · [bold cyan]p[/bold cyan] previous[/dim]"
+                    ))
+            screen.append(Text())
+            screen.append(self._server_actions)
             
             # Add instruction for server details
             if servers:
-                console.print(f"[dim]💡 Enter server number (1-{len(servers)}) to view details[/dim]")
-                console.print()
+                screen.append(Text.from_markup(f"[dim]💡 Enter server number (1-{len(servers)}) to view details[/dim]"))
+                screen.append(Text())
+            
+            # Draw the screen in one go to avoid flicker
+            console.clear()
+            console.print(Group(*screen))
             
             # Collect all valid choices - include action keys and server numbers
-            all_choices = [a[0] for a in actions]
+            all_choices = [a[0] for a in SERVER_ACTIONS]
+            if pages > 1:
+                all_choices.extend(["n", "p"])
             if servers:
                 all_choices.extend([str(i) for i in range(1, len(servers) + 1)])
             
             choice = Prompt.ask(
                 "[bold cyan]Select Action or Server Number[/bold cyan]",
                 choices=all_choices,
+                show_choices=False,
                 default="b"
             )
             
             if choice == "b":
                 return
             elif choice == "r":
-                continue  # Refresh by reloading the loop
+                refresh = True  # List the servers again
+            elif choice == "n":
+                self._server_page = min(self._server_page + 1, pages - 1)
+            elif choice == "p":
+                self._server_page = max(self._server_page - 1, 0)
             elif choice == "h":
                 self.show_help()
                 Prompt.ask("Press Enter to continue", default="")
@@ -309,7 +372,8 @@ class RichMenuApp:
                 try:
                     server_idx = Prompt.ask(
                         f"Select server (1-{len(servers)})",
-                        choices=server_choices
+                        choices=server_choices,
+                        show_choices=False
                     )
                     selected_server = servers[int(server_idx) - 1]
                     
@@ -339,6 +403,8 @@ class RichMenuApp:
             console.print(f"[green]✓ Enabled {server.name}[/green]")
         except Exception as e:
             console.print(f"[red]Failed to enable {server.name}: {e}[/red]")
+        finally:
+            self._invalidate_servers()
         
         Prompt.ask("Press Enter to continue", default="")
     
@@ -357,6 +423,8 @@ class RichMenuApp:
             console.print(f"[green]✓ Disabled {server.name}[/green]")
         except Exception as e:
             console.print(f"[red]Failed to disable {server.name}: {e}[/red]")
+        finally:
+            self._invalidate_servers()
         
         Prompt.ask("Press Enter to continue", default="")
     
@@ -377,11 +445,13 @@ class RichMenuApp:
             
             # Check if it was a Docker-based server for additional feedback
             if server.server_type in [ServerType.DOCKER, ServerType.DOCKER_DESKTOP]:
-                console.print(f"[green]✓ Removed {server.name} and cleaned up Docker images[/green]")
+                console.print(f"[green]✓ Removed {server.name}, Docker images will be cleaned up[/green]")
             else:
                 console.print(f"[green]✓ Removed {server.name}[/green]")
         except Exception as e:
             console.print(f"[red]Failed to remove {server.name}: {e}[/red]")
+        finally:
+            self._invalidate_servers()
         
         Prompt.ask("Press Enter to continue", default="")
     
@@ -542,6 +612,8 @@ class RichMenuApp:
                     success_count += 1
                 except Exception as e:
                     console.print(f"[red]✗ Failed to enable {server.name}: {e}[/red]")
+                finally:
+                    self._invalidate_servers()
                 progress.remove_task(task)
         
         console.print(f"[blue]Enabled {success_count}/{len(servers)} servers[/blue]")
@@ -565,6 +637,8 @@ class RichMenuApp:
                     success_count += 1
                 except Exception as e:
                     console.print(f"[red]✗ Failed to disable {server.name}: {e}[/red]")
+                finally:
+                    self._invalidate_servers()
                 progress.remove_task(task)
         
         console.print(f"[blue]Disabled {success_count}/{len(servers)} servers[/blue]")
@@ -574,7 +648,8 @@ class RichMenuApp:
         console.print(f"[blue]Removing {len(servers)} servers...[/blue]")
         success_count = 0
         
-        with Progress(
+        # Docker images of all removed servers are cleaned up in one sweep afterwards
+        with get_image_janitor().batch(), Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
@@ -586,12 +661,14 @@ class RichMenuApp:
                     await self.manager.remove_server(server.name)
                     # Check if it was a Docker-based server for additional feedback
                     if server.server_type in [ServerType.DOCKER, ServerType.DOCKER_DESKTOP]:
-                        console.print(f"[green]✓ Removed {server.name} and cleaned up Docker images[/green]")
+                        console.print(f"[green]✓ Removed {server.name}, Docker images will be cleaned up[/green]")
                     else:
                         console.print(f"[green]✓ Removed {server.name}[/green]")
                     success_count += 1
                 except Exception as e:
                     console.print(f"[red]✗ Failed to remove {server.name}: {e}[/red]")
+                finally:
+                    self._invalidate_servers()
                 progress.remove_task(task)
         
         console.print(f"[blue]Removed {success_count}/{len(servers)} servers[/blue]")
@@ -659,6 +736,8 @@ class RichMenuApp:
             console.print(f"[green]✓ Added server: {name}[/green]")
         except Exception as e:
             console.print(f"[red]Failed to add server: {e}[/red]")
+        finally:
+            self._invalidate_servers()
         
         Prompt.ask("Press Enter to continue", default="")
     
@@ -783,6 +862,8 @@ class RichMenuApp:
             console.print(f"[green]✓ Installed {server_name}[/green]")
         except Exception as e:
             console.print(f"[red]Installation failed: {e}[/red]")
+        finally:
+            self._invalidate_servers()
         
         Prompt.ask("Press Enter to continue", default="")
     
@@ -809,29 +890,12 @@ class RichMenuApp:
         ) as progress:
             task = progress.add_task(f"Finding '{install_id}'...", total=None)
             try:
-                results = await self.discovery.discover_servers(limit=100)
+                target_result = await self.discovery.resolve_install_id(install_id)
             except Exception as e:
                 console.print(f"[red]Search failed: {e}[/red]")
                 Prompt.ask("Press Enter to continue", default="")
                 return
         
-        # Find matching result
-        target_result = None
-        for result in results:
-            # Recreate install_id logic
-            if result.server_type == ServerType.NPM:
-                result_id = result.package.replace("@", "").replace("/", "-").replace("server-", "")
-            elif result.server_type == ServerType.DOCKER:
-                result_id = result.package.replace("/", "-")
-            elif result.server_type == ServerType.DOCKER_DESKTOP:
-                result_id = f"dd-{result.name.replace('docker-desktop-', '')}"
-            else:
-                result_id = result.name
-            
-            if result_id == install_id:
-                target_result = result
-                break
-        
         if not target_result:
             console.print(f"[red]Install ID '{install_id}' not found[/red]")
             Prompt.ask("Press Enter to continue", default="")
@@ -1093,6 +1157,8 @@ class RichMenuApp:
             console.print("[green]✓ Configuration cleanup completed[/green]")
         except Exception as e:
             console.print(f"[red]Cleanup failed: {e}[/red]")
+        finally:
+            self._invalidate_servers()
         
         console.print()
         Prompt.ask("Press Enter to continue", default="")
@@ -2001,7 +2067,7 @@ class RichMenuApp:
             
             # Get all servers
             try:
-                servers = await self.manager.list_servers()
+                servers = await self._get_servers()
             except Exception as e:
                 console.print(f"[red]Error loading servers: {e}[/red]")
                 Prompt.ask("Press Enter to continue", default="")
@@ -2488,6 +2554,8 @@ This menu allows you to configure servers that require additional settings:
                 except Exception as e:
                     console.print(f"  [red]❌ Failed to apply change for {change.server_name}: {e}[/red]")
                     error_count += 1
+                finally:
+                    self._invalidate_servers()
             
             console.print()
             if success_count > 0:
@@ -2553,6 +2621,8 @@ This menu allows you to configure servers that require additional settings:
                     except Exception as e:
                         logger.error(f"Failed to apply change for {change.server_name}: {e}")
                         error_count += 1
+                    finally:
+                        self._invalidate_servers()
                 
             except Exception as e:
                 console.print(f"[red]❌ Error during sync: {e}[/red]")
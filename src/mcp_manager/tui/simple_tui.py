@@ -16,6 +16,7 @@ from rich.columns import Columns
 from rich import box
 
 from mcp_manager.core.simple_manager import SimpleMCPManager
+from mcp_manager.core.docker_janitor import get_image_janitor
 from mcp_manager.core.discovery import ServerDiscovery
 from mcp_manager.core.models import Server, ServerType, ServerScope
 from mcp_manager.utils.logging import get_logger
@@ -283,13 +284,15 @@ class SimpleTUI:
     async def bulk_remove(self, servers: List[Server]):
         """Remove multiple servers."""
         success_count = 0
-        for server in servers:
-            try:
-                await self.manager.remove_server(server.name)
-                console.print(f"[green]✓ Removed {server.name}[/green]")
-                success_count += 1
-            except Exception as e:
-                console.print(f"[red]✗ Failed to remove {server.name}: {e}[/red]")
+        # Docker images of all removed servers are cleaned up in one sweep afterwards
+        with get_image_janitor().batch():
+            for server in servers:
+                try:
+                    await self.manager.remove_server(server.name)
+                    console.print(f"[green]✓ Removed {server.name}[/green]")
+                    success_count += 1
+                except Exception as e:
+                    console.print(f"[red]✗ Failed to remove {server.name}: {e}[/red]")
         
         console.print(f"[blue]Removed {success_count}/{len(servers)} servers[/blue]")
     
@@ -380,11 +383,10 @@ class SimpleTUI:
             table.add_column("Type", style="yellow", width=10)
             table.add_column("Description", style="dim", width=40)
             
-            # Import the same install ID generation logic from CLI
-            from mcp_manager.cli.main import _generate_install_id
+            from mcp_manager.core.install_index import generate_install_id
             
             for i, result in enumerate(results, 1):
-                install_id = _generate_install_id(result)
+                install_id = generate_install_id(result)
                 desc = result.description[:37] + "..." if result.description and len(result.description) > 40 else (result.description or "")
                 table.add_row(str(i), install_id, result.server_type.value, desc)
             
@@ -400,7 +402,7 @@ class SimpleTUI:
                 choice_idx = int(install_choice) - 1
                 if 0 <= choice_idx < len(results):
                     result = results[choice_idx]
-                    install_id = _generate_install_id(result)
+                    install_id = generate_install_id(result)
                     await self.install_server_by_id(install_id)
                 else:
                     console.print("[red]Invalid selection[/red]")
@@ -418,15 +420,7 @@ class SimpleTUI:
             discovery = cli_context.get_discovery()
             manager = cli_context.get_manager()
             
-            # Search for the server
-            results = await discovery.discover_servers(limit=200)
-            from mcp_manager.cli.main import _generate_install_id
-            
-            target_result = None
-            for result in results:
-                if _generate_install_id(result) == install_id:
-                    target_result = result
-                    break
+            target_result = await discovery.resolve_install_id(install_id)
             
             if not target_result:
                 console.print(f"[red]✗[/red] Install ID '{install_id}' not found")
@@ -3,13 +3,20 @@ Configuration management for MCP Manager.
 
 Provides hierarchical configuration loading with validation using Pydantic.
 Supports multiple configuration sources and environment variable overrides.
+Validated settings are persisted as a snapshot keyed by a fingerprint of
+their sources, so later processes skip TOML parsing and validation when
+nothing has changed.
 """
 
+import copy
+import hashlib
+import json
 import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar, Union
 
-import toml
 from pydantic import BaseModel, Field, field_validator
 try:
     from pydantic_settings import BaseSettings
@@ -17,9 +24,30 @@ except ImportError:
     from pydantic import BaseSettings
 
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import span
 
 logger = get_logger(__name__)
 
+# Configuration files in increasing order of precedence
+DEFAULT_CONFIG_FILES = (
+    "/etc/mcp-manager/config.toml",
+    "~/.config/mcp-manager/config.toml",
+    "./.mcp-manager.toml",
+)
+
+# Environment variables with this prefix override configuration values
+ENV_PREFIX = "MCP_MANAGER_"
+
+# Bump when the Config schema changes so older snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def get_snapshot_file() -> Path:
+    """Get the path of the persisted configuration snapshot."""
+    return Path.home() / ".config" / "mcp-manager" / "config_snapshot.json"
+
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
@@ -74,8 +102,35 @@ class DiscoveryConfig(BaseModel):
         default="docker.io",
         description="Docker registry URL"
     )
+    docker_hub_url: str = Field(
+        default="https://hub.docker.com",
+        description="Docker Hub API base URL for repository listings"
+    )
+    docker_index_url: str = Field(
+        default="https://index.docker.io",
+        description="Docker Index API base URL for image search"
+    )
     cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
     max_results: int = Field(default=100, description="Maximum search results")
+    max_connections: int = Field(default=10, description="Concurrent registry requests for tool documentation")
+
+
+class DockerConfig(BaseModel):
+    """Docker access configuration."""
+    
+    engine_api: bool = Field(
+        default=True,
+        description="Talk to the Docker Engine API socket instead of the docker CLI where possible"
+    )
+    socket_path: Optional[str] = Field(
+        default=None,
+        description="Docker Engine socket (defaults to DOCKER_HOST or the standard locations)"
+    )
+    timeout: int = Field(default=30, description="Engine API request timeout in seconds")
+    image_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds an image tag is trusted to name the same image before it is inspected again"
+    )
 
 
 class UIConfig(BaseModel):
@@ -138,11 +193,12 @@ class Config(BaseSettings):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     claude: ClaudeConfig = Field(default_factory=ClaudeConfig)
     discovery: DiscoveryConfig = Field(default_factory=DiscoveryConfig)
+    docker: DockerConfig = Field(default_factory=DockerConfig)
     ui: UIConfig = Field(default_factory=UIConfig)
     change_detection: ChangeDetectionConfig = Field(default_factory=ChangeDetectionConfig)
     
     model_config = {
-        "env_prefix": "MCP_MANAGER_",
+        "env_prefix": ENV_PREFIX,
         "env_nested_delimiter": "__",
         "case_sensitive": False,
     }
@@ -165,11 +221,77 @@ class Config(BaseSettings):
         return Path(os.path.expanduser(self.claude.config_path))
 
 
+def _construct(model_class: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """Build a model from already validated data without validating it again."""
+    values = {}
+    for name, field in model_class.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+            value = _construct(annotation, value)
+        values[name] = value
+    return model_class.model_construct(**values)
+
+
+def compute_config_fingerprint(config_files: Sequence[Path], overrides: Dict[str, Any]) -> str:
+    """
+    Fingerprint everything a loaded configuration depends on.
+    
+    Args:
+        config_files: Absolute configuration file paths
+        overrides: Configuration overrides
+        
+    Returns:
+        Hex digest that changes when any file, environment override or
+        explicit override changes
+    """
+    from mcp_manager import __version__
+    
+    files = []
+    for file_path in config_files:
+        try:
+            stat = os.stat(file_path)
+            files.append([str(file_path), stat.st_ino, stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            files.append([str(file_path), None])
+    
+    sources = {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "package_version": __version__,
+        "files": files,
+        "env": sorted(
+            [key.upper(), value] for key, value in os.environ.items()
+            if key.upper().startswith(ENV_PREFIX)
+        ),
+        "overrides": overrides,
+    }
+    encoded = json.dumps(sources, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ConfigSnapshot(BaseModel):
+    """Validated configuration values and the fingerprint of their sources."""
+    
+    model_config = {"frozen": True}
+    
+    fingerprint: str = Field(description="Fingerprint of the configuration sources")
+    data: Dict[str, Any] = Field(description="Validated configuration values")
+    
+    def to_config(self) -> Config:
+        """Build a Config from the snapshot without re-validating it."""
+        return _construct(Config, copy.deepcopy(self.data))
+
+
 class ConfigManager:
     """Configuration manager with hierarchical loading."""
     
-    def __init__(self):
+    def __init__(self, snapshot_file: Optional[Union[str, Path]] = None):
         self._config: Optional[Config] = None
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._snapshot_file = Path(snapshot_file) if snapshot_file else None
+        self._lock = threading.RLock()
         
     def load_config(
         self,
@@ -179,6 +301,9 @@ class ConfigManager:
         """
         Load configuration from multiple sources.
         
+        A persisted snapshot is used instead of parsing and validating the
+        sources when its fingerprint still matches them.
+        
         Args:
             config_files: List of configuration files to load
             **overrides: Configuration overrides
@@ -186,25 +311,48 @@ class ConfigManager:
         Returns:
             Loaded configuration
         """
-        if self._config is not None:
-            return self._config
+        with self._lock:
+            if self._config is not None:
+                return self._config
+            
+            # Default configuration files
+            if config_files is None:
+                config_files = list(DEFAULT_CONFIG_FILES)
+            
+            file_paths = [Path(os.path.abspath(os.path.expanduser(str(f)))) for f in config_files]
+            fingerprint = compute_config_fingerprint(file_paths, overrides)
+            
+            snapshot = self._read_snapshot(fingerprint)
+            if snapshot is not None:
+                try:
+                    self._config = snapshot.to_config()
+                    self._snapshot = snapshot
+                    logger.debug("Loaded configuration from snapshot")
+                    return self._config
+                except Exception as e:
+                    logger.debug(f"Ignoring unusable configuration snapshot: {e}")
             
-        # Default configuration files
-        if config_files is None:
-            config_files = [
-                "/etc/mcp-manager/config.toml",
-                "~/.config/mcp-manager/config.toml",
-                "./.mcp-manager.toml",
-            ]
+            self._config = self._build_config(file_paths, overrides)
+            self._snapshot = ConfigSnapshot(
+                fingerprint=fingerprint,
+                data=self._config.model_dump(mode="json"),
+            )
+            self._write_snapshot(self._snapshot)
             
+            return self._config
+        
+    def _build_config(self, file_paths: List[Path], overrides: Dict[str, Any]) -> Config:
+        """Parse configuration files and validate them with overrides applied."""
+        import toml
+        
         # Load configuration data
         config_data = {}
         
-        for config_file in config_files:
-            file_path = Path(os.path.expanduser(str(config_file)))
+        for file_path in file_paths:
             if file_path.exists():
                 try:
-                    file_data = toml.load(file_path)
+                    with span(f"parse {file_path.name}", "parse", path=str(file_path)):
+                        file_data = toml.load(file_path)
                     config_data.update(file_data)
                     logger.debug(f"Loaded configuration from {file_path}")
                 except Exception as e:
@@ -214,9 +362,39 @@ class ConfigManager:
         config_data.update(overrides)
         
         # Create configuration instance
-        self._config = Config(**config_data)
+        return Config(**config_data)
         
-        return self._config
+    def _get_snapshot_file(self) -> Path:
+        return self._snapshot_file or get_snapshot_file()
+        
+    def _read_snapshot(self, fingerprint: str) -> Optional[ConfigSnapshot]:
+        """Read the persisted snapshot if it matches the fingerprint."""
+        try:
+            with open(self._get_snapshot_file(), "r") as f:
+                snapshot = ConfigSnapshot.model_validate(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Failed to read configuration snapshot: {e}")
+            return None
+        
+        return snapshot if snapshot.fingerprint == fingerprint else None
+        
+    def _write_snapshot(self, snapshot: ConfigSnapshot) -> None:
+        """Persist a snapshot atomically; failures only cost the next process a reload."""
+        snapshot_file = self._get_snapshot_file()
+        try:
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=snapshot_file.parent, prefix=".config_snapshot.")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(snapshot.model_dump_json())
+                os.replace(temp_path, snapshot_file)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except Exception as e:
+            logger.debug(f"Failed to write configuration snapshot: {e}")
         
     def get_config(self) -> Config:
         """Get current configuration."""
@@ -224,10 +402,27 @@ class ConfigManager:
             return self.load_config()
         return self._config
         
+    def get_snapshot(self) -> ConfigSnapshot:
+        """Get the snapshot the current configuration was loaded from."""
+        with self._lock:
+            if self._snapshot is None:
+                self.load_config()
+            if self._snapshot is None:
+                raise RuntimeError("Configuration was loaded without a snapshot")
+            return self._snapshot
+        
     def reload_config(self, **overrides: Any) -> Config:
         """Reload configuration."""
-        self._config = None
-        return self.load_config(**overrides)
+        with self._lock:
+            self._config = None
+            self._snapshot = None
+            return self.load_config(**overrides)
+        
+    def invalidate(self) -> None:
+        """Drop the loaded configuration so the next access checks its sources again."""
+        with self._lock:
+            self._config = None
+            self._snapshot = None
 
 
 # Global configuration manager
@@ -236,4 +431,5 @@ _config_manager = ConfigManager()
 # Convenience functions
 load_config = _config_manager.load_config
 get_config = _config_manager.get_config
-reload_config = _config_manager.reload_config
\ No newline at end of file
+reload_config = _config_manager.reload_config
+invalidate_config = _config_manager.invalidate
\ No newline at end of file
@@ -3,14 +3,22 @@ Enterprise-grade logging infrastructure for MCP Manager.
 
 Provides structured logging with multiple handlers, formatters, and
 configuration options suitable for production use.
+
+Records are handed to a queue and written by a background listener thread,
+so callers never block on file or console output. Hot paths should pass
+``%``-style arguments and hoist ``logger.isEnabledFor(logging.DEBUG)`` out
+of loops, so filtered messages cost almost nothing.
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -68,12 +76,29 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the writer thread.
+    
+    Only the message is merged with its arguments in the caller's thread, so
+    later changes to mutable arguments can't alter it. Exception info is kept
+    for the output handlers to render.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message with its arguments before queueing."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class MCPLogger:
     """Enterprise logging manager for MCP Manager."""
     
     def __init__(self):
         self._loggers: Dict[str, logging.Logger] = {}
         self._setup_done = False
+        self._listener: Optional[logging.handlers.QueueListener] = None
         
     def setup_logging(
         self,
@@ -86,6 +111,7 @@ class MCPLogger:
         max_bytes: int = 10 * 1024 * 1024,  # 10MB
         backup_count: int = 5,
         suppress_http: bool = True,
+        queued: bool = True,
         **kwargs: Any,
     ) -> None:
         """
@@ -101,6 +127,7 @@ class MCPLogger:
             max_bytes: Maximum log file size before rotation
             backup_count: Number of backup files to keep
             suppress_http: Suppress HTTP request logging
+            queued: Write records from a background thread instead of the caller's
             **kwargs: Additional configuration options
         """
         if self._setup_done:
@@ -155,7 +182,7 @@ class MCPLogger:
                 console_handler.setFormatter(formatter)
                 
         console_handler.setLevel(console_level)  # Use console_level for console
-        root_logger.addHandler(console_handler)
+        output_handlers: List[logging.Handler] = [console_handler]
         
         # File handler
         if log_file:
@@ -178,7 +205,20 @@ class MCPLogger:
                 file_handler.setFormatter(file_formatter)
                 
             file_handler.setLevel(level)  # Use file level for file
-            root_logger.addHandler(file_handler)
+            output_handlers.append(file_handler)
+        
+        if queued:
+            # One unbounded queue feeds every output handler from a writer thread
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            root_logger.addHandler(DeferredQueueHandler(log_queue))
+            self._listener = logging.handlers.QueueListener(
+                log_queue, *output_handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.shutdown)
+        else:
+            for handler in output_handlers:
+                root_logger.addHandler(handler)
         
         # Suppress HTTP request logging only if explicitly requested
         if suppress_http:
@@ -193,6 +233,14 @@ class MCPLogger:
                 
         self._setup_done = True
         
+    def shutdown(self) -> None:
+        """Write out queued records and stop the writer thread."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+        
     def get_logger(self, name: str) -> logging.Logger:
         """
         Get or create a logger instance.
@@ -214,6 +262,7 @@ _logger_manager = MCPLogger()
 
 # Convenience functions
 setup_logging = _logger_manager.setup_logging
+shutdown_logging = _logger_manager.shutdown
 get_logger = _logger_manager.get_logger
 
 # Module logger
@@ -0,0 +1,330 @@
+"""
+Lightweight tracing for MCP Manager.
+
+Spans time subprocesses, HTTP requests, file parses and catalog I/O and
+record their parent/child relationships, so a slow command can be broken
+down with ``mcp-manager --trace``. Tracing is off by default; a disabled
+span is a single flag check returning a shared no-op context manager.
+"""
+
+import contextvars
+import itertools
+import json
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+# Finished spans kept per trace; later spans are counted but dropped
+MAX_SPANS = 100_000
+
+# Width of the proportional bar in the summary
+SUMMARY_BAR_WIDTH = 20
+
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "mcp_manager_current_span", default=None
+)
+
+
+class Span:
+    """A timed operation, entered as a context manager."""
+    
+    __slots__ = (
+        "_tracer", "_token", "name", "category", "attributes",
+        "span_id", "parent_id", "thread_id", "start_ns", "end_ns",
+    )
+    
+    def __init__(self, tracer: "Tracer", name: str, category: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self._token: Optional[contextvars.Token[Optional[Span]]] = None
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.span_id = next(tracer._ids)
+        self.parent_id: Optional[int] = None
+        self.thread_id = 0
+        self.start_ns = 0
+        self.end_ns = 0
+    
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.thread_id = threading.get_ident()
+        self._token = _current_span.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.end_ns = time.perf_counter_ns()
+        if self._token is not None:
+            _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._tracer._finish(self)
+    
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+    
+    def set(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self) -> "_NoopSpan":
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        pass
+    
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Collects finished spans while enabled."""
+    
+    def __init__(self, max_spans: int = MAX_SPANS):
+        self.enabled = False
+        self.max_spans = max_spans
+        self.dropped = 0
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._origin_ns = time.perf_counter_ns()
+    
+    def start(self) -> None:
+        """Enable tracing and discard previously collected spans."""
+        with self._lock:
+            self._spans = []
+            self.dropped = 0
+            self._origin_ns = time.perf_counter_ns()
+        self.enabled = True
+    
+    def stop(self) -> None:
+        """Disable tracing, keeping collected spans for reporting."""
+        self.enabled = False
+    
+    def span(self, name: str, category: str = "internal", **attributes: Any) -> Union[Span, _NoopSpan]:
+        """
+        Create a span for use as a context manager.
+        
+        Args:
+            name: Operation name, e.g. "claude mcp list"
+            category: Kind of operation: subprocess, http, parse, io or internal
+            **attributes: Extra details exported with the span
+        
+        Returns:
+            The span, or a shared no-op span when tracing is disabled
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, category, attributes)
+    
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(span)
+            else:
+                self.dropped += 1
+    
+    def spans(self) -> List[Span]:
+        """Get the finished spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+    
+    def _paths(self, spans: List[Span]) -> Dict[int, Tuple[str, ...]]:
+        """Map span ids to the names of the span and its ancestors."""
+        by_id = {span.span_id: span for span in spans}
+        paths: Dict[int, Tuple[str, ...]] = {}
+        
+        def path_of(span: Span) -> Tuple[str, ...]:
+            cached = paths.get(span.span_id)
+            if cached is not None:
+                return cached
+            parent = by_id.get(span.parent_id) if span.parent_id is not None else None
+            path = (path_of(parent) if parent else ()) + (span.name,)
+            paths[span.span_id] = path
+            return path
+        
+        for span in spans:
+            path_of(span)
+        return paths
+    
+    def latency_histograms(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize span durations by name.
+        
+        Returns:
+            Mapping of span name to count, total, p50, p95 and max in milliseconds
+        """
+        durations: Dict[str, List[float]] = {}
+        for span in self.spans():
+            durations.setdefault(span.name, []).append(span.duration_ms)
+        
+        histograms = {}
+        for name, values in durations.items():
+            values.sort()
+            histograms[name] = {
+                "count": len(values),
+                "total_ms": sum(values),
+                "p50_ms": values[(len(values) - 1) // 2],
+                "p95_ms": values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max_ms": values[-1],
+            }
+        return histograms
+    
+    def summary(self) -> str:
+        """Render a flame-style tree of spans followed by latency statistics."""
+        spans = self.spans()
+        if not spans:
+            return "No spans recorded"
+        
+        paths = self._paths(spans)
+        totals: Dict[Tuple[str, ...], List[float]] = {}
+        for span in spans:
+            entry = totals.setdefault(paths[span.span_id], [0.0, 0])
+            entry[0] += span.duration_ms
+            entry[1] += 1
+        
+        children: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+        for path in totals:
+            children.setdefault(path[:-1], []).append(path)
+        
+        roots = children.get((), [])
+        scale = max(totals[path][0] for path in roots) or 1.0
+        
+        lines = [f"{'total ms':>10} {'self ms':>10} {'count':>6}  span"]
+        
+        def render(path: Tuple[str, ...]) -> None:
+            total, count = totals[path]
+            child_paths = sorted(children.get(path, []), key=lambda p: totals[p][0], reverse=True)
+            # Concurrent children can add up to more than their parent
+            self_ms = max(0.0, total - sum(totals[p][0] for p in child_paths))
+            bar = "█" * max(1, round(SUMMARY_BAR_WIDTH * min(total, scale) / scale))
+            indent = "  " * (len(path) - 1)
+            lines.append(f"{total:>10.1f} {self_ms:>10.1f} {count:>6}  {indent}{path[-1]}  {bar}")
+            for child in child_paths:
+                render(child)
+        
+        for root in sorted(roots, key=lambda p: totals[p][0], reverse=True):
+            render(root)
+        
+        lines.append("")
+        lines.append(f"{'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}  span")
+        histograms = sorted(self.latency_histograms().items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for name, stats in histograms:
+            lines.append(
+                f"{stats['count']:>6} {stats['p50_ms']:>10.1f} {stats['p95_ms']:>10.1f} "
+                f"{stats['max_ms']:>10.1f}  {name}"
+            )
+        
+        if self.dropped:
+            lines.append(f"({self.dropped} spans dropped after the first {self.max_spans})")
+        return "\n".join(lines)
+    
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Convert collected spans to the Chrome trace-event format."""
+        pid = os.getpid()
+        events = []
+        for span in self.spans():
+            args = {key: value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+                    for key, value in span.attributes.items()}
+            args["span_id"] = span.span_id
+            if span.parent_id is not None:
+                args["parent_id"] = span.parent_id
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self._origin_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+    
+    def export_chrome_trace(self, path: Union[str, Path]) -> None:
+        """
+        Write collected spans as Chrome trace-event JSON.
+        
+        The file can be opened in chrome://tracing or Perfetto.
+        
+        Args:
+            path: Output file
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def _command_name(cmd: Union[str, Sequence[str]]) -> str:
+    """Name a command after its program and up to two subcommands."""
+    if isinstance(cmd, (str, bytes, os.PathLike)):
+        parts = os.fsdecode(cmd).split()
+    else:
+        parts = [os.fsdecode(part) for part in cmd]
+    if not parts:
+        return "subprocess"
+    
+    name = [os.path.basename(parts[0])]
+    for part in parts[1:3]:
+        if part.startswith("-"):
+            break
+        name.append(part)
+    return " ".join(name)
+
+
+def run_command(cmd: Union[str, Sequence[str]], **kwargs: Any) -> subprocess.CompletedProcess:
+    """
+    Run a command with subprocess.run inside a span.
+    
+    Args:
+        cmd: Command to run
+        **kwargs: Arguments for subprocess.run
+    
+    Returns:
+        The completed process
+    """
+    if not _tracer.enabled:
+        return subprocess.run(cmd, **kwargs)
+    
+    with _tracer.span(_command_name(cmd), "subprocess") as span:
+        result = subprocess.run(cmd, **kwargs)
+        span.set("returncode", result.returncode)
+        return result
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer."""
+    return _tracer
+
+
+# Global tracer
+_tracer = Tracer()
+
+# Convenience functions
+span = _tracer.span
+enable_tracing = _tracer.start
+disable_tracing = _tracer.stop
@@ -13,6 +13,7 @@ from typing import List, Optional, Tuple
 
 from mcp_manager.core.exceptions import DependencyError, ValidationError
 from mcp_manager.utils.logging import get_logger
+from mcp_manager.utils.tracing import run_command
 
 logger = get_logger(__name__)
 
@@ -202,7 +203,7 @@ def validate_claude_cli() -> Tuple[bool, Optional[str]]:
         Tuple of (available, version)
     """
     try:
-        result = subprocess.run(
+        result = run_command(
             ["claude", "--version"],
             capture_output=True,
             text=True,
@@ -411,7 +412,7 @@ def validate_server_availability(server_type: str, server_name: str) -> Tuple[bo
             
         # Check if Docker daemon is running
         try:
-            result = subprocess.run(
+            result = run_command(
                 ["docker", "info"],
                 capture_output=True,
                 timeout=5,
@@ -9,7 +9,6 @@ from pathlib import Path
 from unittest.mock import patch
 
 from mcp_manager.utils.config import Config
-from mcp_manager.core.manager import MCPManager
 
 
 @pytest.fixture
@@ -29,11 +28,15 @@ def test_config(temp_config_dir):
 @pytest.fixture
 def manager(test_config):
     """Create a test MCP manager with isolated configuration."""
+    from mcp_manager.core.manager import MCPManager
     return MCPManager(config=test_config)
 
 
 @pytest.fixture(autouse=True)
 def isolate_tests(temp_config_dir):
     """Ensure tests are isolated from real configuration."""
-    with patch.dict(os.environ, {'MCP_MANAGER_CONFIG_DIR': str(temp_config_dir)}):
+    # Discovery records every result in the install-ID index
+    index_file = temp_config_dir / "install_index.json"
+    with patch.dict(os.environ, {'MCP_MANAGER_CONFIG_DIR': str(temp_config_dir)}), \
+            patch("mcp_manager.core.install_index.get_index_file", return_value=index_file):
         yield
\ No newline at end of file
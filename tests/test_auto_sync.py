@@ -0,0 +1,203 @@
+"""
+Test the auto-sync planner.
+
+Test grouping of detected changes, batched catalog writes, the single
+docker-gateway reconcile for Docker Desktop changes, and that changes
+which could not be checked or are not synced are not reported as applied.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp_manager.core.auto_sync import AutoSyncPlanner
+from mcp_manager.core.change_detector import ChangeSource, ChangeType, DetectedChange
+from mcp_manager.core.claude_interface import ClaudeInterface
+from mcp_manager.core.models import ServerRecord, ServerScope, ServerType
+
+
+class FakeClaude:
+    """Thread-safe stand-in for ClaudeInterface with a slow CLI."""
+
+    def __init__(self, names, delay=0.05):
+        self.names = set(names)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def _run(self, call):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(call)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+
+    def list_server_records(self, strict=False):
+        return [
+            ServerRecord(name=name, command="npx", scope=ServerScope.USER, server_type=ServerType.NPM)
+            for name in sorted(self.names)
+        ]
+
+    def add_server(self, name, command, args=None, env=None):
+        self._run(("add", name))
+        with self.lock:
+            self.names.add(name)
+        return True
+
+    def remove_server(self, name):
+        self._run(("remove", name))
+        with self.lock:
+            self.names.discard(name)
+        return True
+
+    def _determine_server_type(self, command):
+        return ClaudeInterface._determine_server_type(None, command)
+
+
+def make_manager(claude, catalog):
+    """Create a manager mock around a fake Claude interface."""
+    manager = MagicMock()
+    manager.claude = claude
+    manager._get_server_catalog = AsyncMock(return_value=catalog)
+    manager._save_server_catalog = AsyncMock()
+    manager._refresh_docker_gateway = AsyncMock(return_value=True)
+    return manager
+
+
+def added(name, source=ChangeSource.CLAUDE_USER, command="npx"):
+    return DetectedChange(
+        change_type=ChangeType.SERVER_ADDED, source=source, server_name=name,
+        details={"server_info": {"command": command, "args": ["-y", name], "source": source.value}},
+    )
+
+
+def removed(name, server_type=ServerType.NPM.value):
+    return DetectedChange(
+        change_type=ChangeType.SERVER_REMOVED, source=ChangeSource.UNKNOWN, server_name=name,
+        details={"catalog_info": {"type": server_type}},
+    )
+
+
+class TestAutoSyncPlanner:
+    """Test AutoSyncPlanner."""
+
+    def test_plan_groups_by_target(self):
+        """Test changes are grouped by the system they touch."""
+        planner = AutoSyncPlanner(make_manager(FakeClaude([]), {"servers": {}}))
+        changes = [
+            added("fs"),
+            added("github", source=ChangeSource.DOCKER, command="docker"),
+            removed("old-docker", server_type=ServerType.DOCKER_DESKTOP.value),
+            DetectedChange(ChangeType.SERVER_DISABLED, ChangeSource.DOCKER, "fs"),
+            DetectedChange(ChangeType.SERVER_MODIFIED, ChangeSource.CLAUDE_USER, "fs"),
+        ]
+
+        plan = planner.plan(changes)
+
+        assert [c.server_name for c in plan.claude] == ["fs"]
+        assert [c.server_name for c in plan.docker] == ["github", "old-docker"]
+        assert len(plan.catalog) == 1
+        assert len(plan.skipped) == 1
+        assert len(plan) == 5
+
+    def test_claude_changes_run_concurrently(self):
+        """Test Claude CLI calls overlap and the catalog is written once."""
+        claude = FakeClaude(["stale-1", "stale-2"])
+        catalog = {"servers": {"stale-1": {}, "stale-2": {}}}
+        manager = make_manager(claude, catalog)
+        planner = AutoSyncPlanner(manager, max_concurrency=3)
+        changes = [added(f"new-{i}") for i in range(6)] + [removed("stale-1"), removed("stale-2")]
+
+        results = asyncio.run(planner.apply(changes))
+
+        assert [r.server_name for r in results] == [c.server_name for c in changes]
+        assert all(r.success for r in results)
+        assert 1 < claude.peak <= 3
+        assert manager._save_server_catalog.await_count == 1
+        assert set(catalog["servers"]) == {f"new-{i}" for i in range(6)}
+        assert catalog["servers"]["new-0"]["type"] == ServerType.NPM.value
+        manager._refresh_docker_gateway.assert_not_awaited()
+
+    def test_already_applied_changes_skip_cli(self):
+        """Test changes already visible in Claude only update the catalog."""
+        claude = FakeClaude(["existing"])
+        manager = make_manager(claude, {"servers": {"gone": {}}})
+        planner = AutoSyncPlanner(manager)
+
+        results = asyncio.run(planner.apply([added("existing"), removed("gone")]))
+
+        assert [r.action for r in results] == ["catalog", "catalog"]
+        assert claude.calls == []
+
+    def test_docker_changes_reconcile_once(self):
+        """Test Docker Desktop changes share a single gateway reconcile."""
+        catalog = {"servers": {"old": {"type": ServerType.DOCKER_DESKTOP.value}}}
+        manager = make_manager(FakeClaude([]), catalog)
+        planner = AutoSyncPlanner(manager)
+        changes = [
+            added("github", source=ChangeSource.DOCKER, command="docker"),
+            added("fetch", source=ChangeSource.DOCKER, command="docker"),
+            removed("old", server_type=ServerType.DOCKER_DESKTOP.value),
+        ]
+
+        results = asyncio.run(planner.apply(changes))
+
+        assert manager._refresh_docker_gateway.await_count == 1
+        assert all(r.action == "gateway_reconcile" and r.success for r in results)
+        assert set(catalog["servers"]) == {"github", "fetch"}
+        assert catalog["servers"]["github"]["type"] == ServerType.DOCKER_DESKTOP.value
+
+    def test_failures_are_reported_per_change(self):
+        """Test a failing CLI call does not affect other changes."""
+        claude = FakeClaude([])
+        original_add = claude.add_server
+
+        def add_server(name, command, args=None, env=None):
+            if name == "bad":
+                raise RuntimeError("boom")
+            return original_add(name, command, args, env)
+
+        claude.add_server = add_server
+        catalog = {"servers": {}}
+        planner = AutoSyncPlanner(make_manager(claude, catalog))
+
+        results = asyncio.run(planner.apply([added("good"), added("bad")]))
+
+        assert results[0].success
+        assert not results[1].success
+        assert results[1].error == "boom"
+        assert set(catalog["servers"]) == {"good"}
+
+    def test_unknown_claude_state_applies_nothing(self):
+        """Test changes fail, and the catalog keeps its entries, when Claude's servers cannot be listed."""
+        claude = FakeClaude(["gone"])
+
+        def list_server_records(strict=False):
+            raise RuntimeError("claude not responding")
+
+        claude.list_server_records = list_server_records
+        catalog = {"servers": {"gone": {}}}
+        planner = AutoSyncPlanner(make_manager(claude, catalog))
+
+        results = asyncio.run(planner.apply([removed("gone"), added("new")]))
+
+        assert [(r.action, r.success) for r in results] == [("claude_remove", False), ("claude_add", False)]
+        assert "claude not responding" in results[0].error
+        assert claude.calls == []
+        assert set(catalog["servers"]) == {"gone"}
+
+    def test_modified_servers_are_skipped(self):
+        """Test modifications are reported as skipped rather than applied."""
+        planner = AutoSyncPlanner(make_manager(FakeClaude([]), {"servers": {}}))
+
+        results = asyncio.run(planner.apply([
+            DetectedChange(ChangeType.SERVER_MODIFIED, ChangeSource.CLAUDE_USER, "fs"),
+        ]))
+
+        assert results[0].skipped
+        assert not results[0].success
@@ -0,0 +1,224 @@
+"""
+Test container probe sessions.
+
+Test that all probes of an image share one container, that files are
+copied out instead of run through cat, and that results are reused per
+image ID only when the probe actually ran in the image's container.
+"""
+
+import io
+import subprocess
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from mcp_manager.core.container_probe import ContainerProbe, ProbeCache, read_tar_file
+from mcp_manager.core.image_metadata import ImageMetadata
+from mcp_manager.core.models import Server, ServerScope, ServerType
+from mcp_manager.core.simple_manager import SimpleMCPManager
+
+METADATA = ImageMetadata(id="sha256:abc", entrypoint=["node", "index.js"])
+
+
+def tar_bytes(name, content):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        data = content.encode()
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class DockerCli:
+    """subprocess.run replacement emulating docker create/start/exec/cp/rm."""
+
+    def __init__(self, outputs=None, files=None, start_fails=False, create_fails=False):
+        self.calls = []
+        self.outputs = outputs or {}
+        self.files = files or {}
+        self.start_fails = start_fails
+        self.create_fails = create_fails
+
+    def __call__(self, cmd, **kwargs):
+        args = cmd[1:]
+        self.calls.append(args)
+        returncode, stdout, stderr = 0, "", ""
+        if self.create_fails:
+            returncode, stderr = 1, "Cannot connect to the Docker daemon at unix:///var/run/docker.sock"
+        elif args[0] == "create":
+            stdout = "c0ffee\n"
+        elif args[0] == "start" and self.start_fails:
+            returncode = 1
+        elif args[0] in ("exec", "run"):
+            command = tuple(args[2:]) if args[0] == "exec" else tuple(args[3:])
+            returncode, stdout = (0, self.outputs[command]) if command in self.outputs else (127, "")
+        elif args[0] == "cp":
+            path = args[1].split(":", 1)[1]
+            if path in self.files:
+                stdout = tar_bytes(path.rsplit("/", 1)[-1], self.files[path])
+            else:
+                returncode, stdout = 1, b""
+                stderr = f"Error response from daemon: Could not find the file {path} in container c0ffee".encode()
+        return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr=stderr)
+
+    def commands(self):
+        return [call[0] for call in self.calls]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ProbeCache(tmp_path / "probe_cache.json")
+
+
+def probe_session(cache):
+    return ContainerProbe("mcp/fetch", lambda image: METADATA, cache=cache)
+
+
+def patch_run(run):
+    return patch("mcp_manager.utils.tracing.subprocess.run", run)
+
+
+class TestContainerProbe:
+    """Test probes through the docker CLI."""
+
+    def test_probes_share_one_container(self, cache):
+        """Test every probe runs in a single container removed at the end."""
+        run = DockerCli(outputs={("node", "index.js", "--help"): "Commands:\n  fetch  Fetch a URL\n"})
+
+        with patch_run(run), probe_session(cache) as probe:
+            for args in (["mcp", "--help"], ["--help"], ["/app/mcp", "--help"]):
+                probe.run(args)
+            listing = probe.exec(["ls", "-la", "/app"])
+
+        assert run.commands() == ["create", "start", "exec", "exec", "exec", "exec", "rm"]
+        assert run.calls[2] == ["exec", "c0ffee", "node", "index.js", "mcp", "--help"]
+        assert listing.returncode == 127
+
+    def test_run_prepends_entrypoint(self, cache):
+        """Test run() passes arguments to the image's entrypoint like docker run."""
+        run = DockerCli(outputs={("node", "index.js", "--help"): "usage\n"})
+
+        with patch_run(run), probe_session(cache) as probe:
+            result = probe.run(["--help"])
+
+        assert (result.returncode, result.stdout) == (0, "usage\n")
+
+    def test_read_file_copies_archive(self, cache):
+        """Test files are copied out of the container rather than run through cat."""
+        run = DockerCli(files={"/README.md": "# Tools\n- `read_file`: read\n"})
+
+        with patch_run(run), probe_session(cache) as probe:
+            assert probe.read_file("/README.md") == "# Tools\n- `read_file`: read\n"
+            assert probe.read_file("/DOCS.md") is None
+
+        assert run.calls[2] == ["cp", "c0ffee:/README.md", "-"]
+
+    def test_results_cached_per_image(self, cache):
+        """Test a second session on the same image ID starts no container."""
+        run = DockerCli(outputs={("node", "index.js", "--help"): "usage\n"}, files={"/README.md": "docs"})
+        with patch_run(run), probe_session(cache) as probe:
+            probe.run(["--help"])
+            probe.read_file("/README.md")
+
+        rerun = DockerCli()
+        with patch_run(rerun), probe_session(ProbeCache(cache.cache_file)) as probe:
+            assert probe.run(["--help"]).stdout == "usage\n"
+            assert probe.read_file("/README.md") == "docs"
+
+        assert rerun.calls == []
+
+    def test_image_that_cannot_idle(self, cache):
+        """Test run() falls back to one container per probe if the idle command fails."""
+        run = DockerCli(outputs={("--help",): "usage\n"}, start_fails=True)
+
+        with patch_run(run), probe_session(cache) as probe:
+            assert probe.run(["--help"]).stdout == "usage\n"
+
+        assert run.commands() == ["create", "start", "run", "rm"]
+        assert run.calls[2] == ["run", "--rm", "mcp/fetch", "--help"]
+
+    def test_failures_not_cached(self, cache):
+        """Test probes that could not run are retried by the next session."""
+        def missing(cmd, **kwargs):
+            raise FileNotFoundError(cmd[0])
+
+        with patch_run(missing), probe_session(cache) as probe:
+            assert probe.run(["--help"]).returncode == -1
+
+        assert cache.get("sha256:abc") == {}
+
+    def test_docker_unavailable_not_cached(self, cache):
+        """Test nothing is cached when the probe container could not be created."""
+        run = DockerCli(create_fails=True)
+
+        with patch_run(run), probe_session(cache) as probe:
+            assert probe.read_file("/README.md") is None
+            assert probe.run(["--help"]).returncode == 1
+
+        assert run.commands() == ["create", "run"]
+        assert cache.get("sha256:abc") == {}
+
+    def test_missing_files_cached(self, cache):
+        """Test a file the image does not have is remembered."""
+        run = DockerCli()
+        with patch_run(run), probe_session(cache) as probe:
+            assert probe.read_file("/README.md") is None
+
+        assert cache.get("sha256:abc") == {"file:/README.md": None}
+
+
+class TestDockerToolDiscovery:
+    """Test help-based tool discovery runs in one probe session."""
+
+    def test_help_discovery_single_container(self, cache):
+        """Test help probes, inspection and documentation reads share one container."""
+        run = DockerCli(files={"/README.md": "mcp tools:\n- `read_file`: Read a file\n"})
+        server = Server(
+            name="fetch", command="docker", scope=ServerScope.USER, server_type=ServerType.DOCKER,
+            args=["run", "-i", "--rm", "mcp/fetch"],
+        )
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+
+        def open_probe(image):
+            return ContainerProbe(image, lambda image: METADATA, cache=cache)
+
+        with patch_run(run), patch("mcp_manager.core.simple_manager.open_probe", open_probe):
+            tools = manager._discover_docker_tools_via_help(server)
+
+        assert tools and tools[0]["source"] == "docker_inspect"
+        assert run.commands().count("create") == 1
+        assert run.commands()[-1] == "rm"
+
+    def test_help_output_parsed(self, cache):
+        """Test tools are read from the Commands section of the help output."""
+        help_output = "Usage: mcp [command]\n\nCommands:\n  fetch    Fetch a URL\n  help     Show help\n\nOptions:\n"
+        run = DockerCli(outputs={("node", "index.js", "--help"): help_output})
+        server = Server(
+            name="fetch", command="docker", scope=ServerScope.USER, server_type=ServerType.DOCKER,
+            args=["run", "-i", "--rm", "mcp/fetch"],
+        )
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+
+        def open_probe(image):
+            return ContainerProbe(image, lambda image: METADATA, cache=cache)
+
+        with patch_run(run), patch("mcp_manager.core.simple_manager.open_probe", open_probe):
+            tools = manager._discover_docker_tools_via_help(server)
+
+        assert [(tool["name"], tool["description"], tool["source"]) for tool in tools] == [
+            ("fetch", "Fetch a URL", "docker_help"),
+        ]
+
+
+class TestReadTarFile:
+    """Test extracting documentation from archives."""
+
+    def test_first_regular_file(self):
+        """Test the first regular file of the archive is returned."""
+        assert read_tar_file(tar_bytes("README.md", "hello")) == "hello"
+
+    def test_invalid_archive(self):
+        """Test data that is not a tar archive yields None."""
+        assert read_tar_file(b"not a tar archive") is None
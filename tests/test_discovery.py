@@ -251,4 +251,146 @@ class TestDiscoveryResult:
         
         assert result.description is None
         assert result.keywords == []
-        assert result.homepage is None
\ No newline at end of file
+        assert result.homepage is None
+
+class TestDiscoveryEndpoints:
+    """Test registry endpoints come from configuration."""
+    
+    def test_docker_hub_urls_configurable(self):
+        """Test Docker Hub discovery only contacts the configured hosts."""
+        import httpx
+        from mcp_manager.utils.config import Config
+        
+        config = Config()
+        config.discovery.docker_hub_url = "http://hub.test"
+        config.discovery.docker_index_url = "http://index.test"
+        requested = []
+        
+        def handler(request):
+            requested.append((request.url.host, request.url.path))
+            return httpx.Response(200, json={"results": []})
+        
+        real_client = httpx.AsyncClient
+        
+        def client(**kwargs):
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+        
+        with patch("mcp_manager.core.discovery.httpx.AsyncClient", client):
+            results = asyncio.run(ServerDiscovery(config)._discover_docker_hub_servers(limit=5))
+        
+        assert results == []
+        assert ("hub.test", "/v2/repositories/modelcontextprotocol/") in requested
+        assert ("index.test", "/v1/search") in requested
+        assert {host for host, _ in requested} == {"hub.test", "index.test"}
+    
+    def test_npm_search_downloads(self):
+        """Test npm results take weekly downloads, not the 0-1 popularity rating."""
+        import httpx
+        
+        def handler(request):
+            return httpx.Response(200, json={"objects": [{
+                "package": {"name": "@test/mcp-server", "version": "1.0.0", "description": "MCP server"},
+                "score": {"detail": {"popularity": 0.8}},
+                "downloads": {"monthly": 4000, "weekly": 1000},
+            }]})
+        
+        real_client = httpx.AsyncClient
+        
+        def client(**kwargs):
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+        
+        with patch("mcp_manager.core.discovery.httpx.AsyncClient", client):
+            results = asyncio.run(ServerDiscovery()._discover_npm_servers(limit=1))
+        
+        assert [(result.package, result.downloads) for result in results] == [("@test/mcp-server", 1000)]
+
+
+class TestInstallIndex:
+    """Test install-ID resolution."""
+    
+    def make_result(self, package="@modelcontextprotocol/server-filesystem"):
+        return DiscoveryResult(
+            name="filesystem",
+            package=package,
+            version="1.0.0",
+            server_type=ServerType.NPM,
+            install_command="npx",
+            install_args=["-y", package],
+        )
+    
+    def test_index_persists(self, tmp_path):
+        """Test recorded results survive in a new index instance."""
+        from mcp_manager.core.install_index import InstallIndex
+        
+        InstallIndex(tmp_path / "index.json").record([self.make_result()])
+        
+        index = InstallIndex(tmp_path / "index.json")
+        assert index.get("modelcontextprotocol-filesystem") == self.make_result()
+        assert index.find_by_name("filesystem").package == "@modelcontextprotocol/server-filesystem"
+        assert index.get("unknown") is None
+    
+    def test_resolve_from_index_without_requests(self, tmp_path):
+        """Test an indexed ID resolves without any lookup."""
+        from mcp_manager.core.install_index import InstallIndex
+        
+        index = InstallIndex(tmp_path / "index.json")
+        index.record([self.make_result()])
+        discovery = ServerDiscovery(install_index=index)
+        
+        with patch("mcp_manager.core.discovery.httpx.AsyncClient", side_effect=AssertionError("no requests")):
+            result = asyncio.run(discovery.resolve_install_id("modelcontextprotocol-filesystem"))
+        
+        assert result.package == "@modelcontextprotocol/server-filesystem"
+    
+    def test_resolve_miss_fetches_single_packages(self, tmp_path):
+        """Test an unknown ID is looked up by package name, not searched."""
+        import httpx
+        from mcp_manager.core.install_index import InstallIndex
+        from mcp_manager.core.npm_metadata import NpmManifestCache, NpmMetadataService
+        from mcp_manager.core.registry_client import RegistryClient, ResponseCache
+        
+        requested = []
+        
+        def handler(request):
+            requested.append(request.url.path)
+            version = {"name": "@modelcontextprotocol/server-filesystem", "version": "2.0.0", "description": "Files"}
+            if request.url.path == "/@modelcontextprotocol/server-filesystem":
+                return httpx.Response(200, json={"dist-tags": {"latest": "2.0.0"}, "versions": {"2.0.0": version}})
+            if request.url.path == "/@modelcontextprotocol/server-filesystem/2.0.0":
+                return httpx.Response(200, json=version)
+            return httpx.Response(404, json={})
+        
+        real_client = httpx.AsyncClient
+        
+        def client(**kwargs):
+            kwargs.setdefault("transport", httpx.MockTransport(handler))
+            return real_client(**kwargs)
+        
+        index = InstallIndex(tmp_path / "index.json")
+        registry_client = RegistryClient(ResponseCache(tmp_path / "http_cache"), transport=httpx.MockTransport(handler))
+        npm_metadata = NpmMetadataService(client=registry_client, cache=NpmManifestCache(tmp_path / "npm.json"))
+        discovery = ServerDiscovery(install_index=index, npm_metadata=npm_metadata)
+        
+        try:
+            with patch("mcp_manager.core.discovery.httpx.AsyncClient", client):
+                result = asyncio.run(discovery.resolve_install_id("modelcontextprotocol-filesystem"))
+        finally:
+            registry_client.close()
+        
+        assert result.package == "@modelcontextprotocol/server-filesystem"
+        assert result.version == "2.0.0"
+        assert not any("search" in path for path in requested)
+        assert index.get("modelcontextprotocol-filesystem") == result
+    
+    def test_resolve_docker_desktop_id(self, tmp_path):
+        """Test dd- IDs are looked up in the Docker MCP catalog."""
+        from mcp_manager.core.install_index import InstallIndex
+        
+        discovery = ServerDiscovery(install_index=InstallIndex(tmp_path / "index.json"))
+        catalog = {"SQLite": {"description": "SQLite database"}}
+        
+        with patch.object(discovery, "_get_docker_mcp_catalog", AsyncMock(return_value=catalog)):
+            result = asyncio.run(discovery.resolve_install_id("dd-sqlite"))
+        
+        assert result.name == "docker-desktop-SQLite"
+        assert result.install_args == ["mcp", "server", "enable", "SQLite"]
@@ -0,0 +1,305 @@
+"""
+Test the Docker Engine API client.
+
+Test image operations against a fake daemon listening on a Unix socket,
+and that they start no docker processes.
+"""
+
+import io
+import json
+import socketserver
+import struct
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from mcp_manager.core import docker_engine
+from mcp_manager.core.container_probe import ContainerProbe, ProbeCache
+from mcp_manager.core.docker_engine import DockerEngineClient, demultiplex, find_docker_socket
+from mcp_manager.core.docker_janitor import ImageJanitor
+from mcp_manager.core.image_metadata import ImageMetadata, ImageMetadataCache
+from mcp_manager.core.exceptions import DockerEngineError
+
+IMAGES = [
+    {"Id": "sha256:aaa", "RepoTags": ["mcp/fetch:latest"], "RepoDigests": ["mcp/fetch@sha256:111"]},
+    {"Id": "sha256:bbb", "RepoTags": None, "RepoDigests": ["mcp/github@sha256:222"]},
+    {"Id": "sha256:ccc", "RepoTags": ["redis:7"], "RepoDigests": []},
+]
+
+
+def tar_bytes(name, content):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        data = content.encode()
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class FakeDaemonHandler(BaseHTTPRequestHandler):
+    """Answer the image and container endpoints from the server's state."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def send_json(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def find(self, reference):
+        for image in self.server.images:
+            names = (image["RepoTags"] or []) + (image["RepoDigests"] or [])
+            if reference in [image["Id"]] + names or f"{reference}:latest" in names:
+                return image
+        return None
+
+    def send_bytes(self, status, payload):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def route(self, method):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        self.server.requests.append((method, url.path, query))
+        path = url.path
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        if path.startswith(("/containers/", "/exec/")):
+            self.route_container(method, path, query, body)
+        elif method == "GET" and path == "/_ping":
+            payload = b"OK"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        elif method == "GET" and path == "/images/json":
+            self.send_json(200, self.server.images)
+        elif method == "GET" and path.startswith("/images/") and path.endswith("/json"):
+            image = self.find(path[len("/images/"):-len("/json")])
+            if image is None:
+                self.send_json(404, {"message": "No such image"})
+            else:
+                self.send_json(200, {**image, "Config": {"Entrypoint": ["node", "index.js"], "Labels": {}}})
+        elif method == "DELETE" and path.startswith("/images/"):
+            image = self.find(path[len("/images/"):])
+            if image is None:
+                self.send_json(404, {"message": "No such image"})
+            else:
+                self.server.images.remove(image)
+                self.send_json(200, [{"Deleted": image["Id"]}])
+        elif method == "POST" and path == "/images/prune":
+            self.send_json(200, {"ImagesDeleted": None, "SpaceReclaimed": 0})
+        else:
+            self.send_json(404, {"message": "page not found"})
+
+    def route_container(self, method, path, query, body):
+        if method == "POST" and path == "/containers/create":
+            self.server.created.append(body)
+            self.send_json(201, {"Id": "c0ffee"})
+        elif method == "POST" and path == "/containers/c0ffee/start":
+            self.send_bytes(204, b"")
+        elif method == "POST" and path == "/containers/c0ffee/exec":
+            self.server.execs.append(body["Cmd"])
+            self.send_json(201, {"Id": "e1"})
+        elif method == "POST" and path == "/exec/e1/start":
+            output = self.server.exec_outputs.get(tuple(self.server.execs[-1]), b"")
+            frames = struct.pack(">BxxxI", 1, len(output)) + output
+            frames += struct.pack(">BxxxI", 2, len(b"warning\n")) + b"warning\n"
+            self.send_bytes(200, frames)
+        elif method == "GET" and path == "/exec/e1/json":
+            known = tuple(self.server.execs[-1]) in self.server.exec_outputs
+            self.send_json(200, {"ExitCode": 0 if known else 127})
+        elif method == "GET" and path == "/containers/c0ffee/archive":
+            name = query["path"][0]
+            if name in self.server.files:
+                self.send_bytes(200, tar_bytes(name.rsplit("/", 1)[-1], self.server.files[name]))
+            else:
+                self.send_json(404, {"message": "Could not find the file"})
+        elif method == "DELETE" and path == "/containers/c0ffee":
+            self.server.removed_containers += 1
+            self.send_bytes(204, b"")
+        else:
+            self.send_json(404, {"message": "page not found"})
+
+    def do_GET(self):
+        self.route("GET")
+
+    def do_POST(self):
+        self.route("POST")
+
+    def do_DELETE(self):
+        self.route("DELETE")
+
+
+class FakeDaemon(socketserver.ThreadingUnixStreamServer):
+    """Docker daemon stand-in serving on a Unix socket in the background."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path):
+        super().__init__(str(socket_path), FakeDaemonHandler)
+        self.images = [dict(image) for image in IMAGES]
+        self.requests = []
+        self.connections = 0
+        self.created = []
+        self.execs = []
+        self.exec_outputs = {("node", "index.js", "--help"): b"Commands:\n  fetch  Fetch a URL\n"}
+        self.files = {"/README.md": "# fetch"}
+        self.removed_containers = 0
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = FakeDaemon(tmp_path / "docker.sock")
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def engine(daemon):
+    client = DockerEngineClient(daemon.server_address)
+    yield client
+    client.close()
+
+
+def no_processes(*args, **kwargs):
+    raise AssertionError("docker CLI started")
+
+
+class TestDockerEngineClient:
+    """Test the image endpoints over the socket."""
+
+    def test_list_and_inspect(self, engine):
+        """Test images are listed and inspected as the daemon reports them."""
+        assert engine.ping() is True
+        assert [image["Id"] for image in engine.list_images()] == ["sha256:aaa", "sha256:bbb", "sha256:ccc"]
+        assert engine.inspect_image("mcp/fetch")["Config"]["Entrypoint"] == ["node", "index.js"]
+        assert engine.inspect_image("mcp/missing") is None
+
+    def test_remove_and_prune(self, engine, daemon):
+        """Test removal reports missing images and prune sends the dangling filter."""
+        assert engine.remove_image("sha256:aaa") is True
+        assert engine.remove_image("sha256:aaa") is False
+        assert engine.prune_images() == 0
+
+        method, path, query = daemon.requests[-1]
+        assert (method, path) == ("POST", "/images/prune")
+        assert json.loads(query["filters"][0]) == {"dangling": ["true"]}
+
+    def test_connection_reused(self, engine, daemon):
+        """Test requests share one pooled connection."""
+        for _ in range(5):
+            engine.list_images()
+
+        assert daemon.connections == 1
+
+    def test_unreachable_socket(self, tmp_path):
+        """Test a missing socket raises DockerEngineError for the CLI fallback."""
+        client = DockerEngineClient(str(tmp_path / "missing.sock"))
+
+        assert client.ping() is False
+        with pytest.raises(DockerEngineError):
+            client.list_images()
+
+    def test_find_socket_from_docker_host(self, monkeypatch):
+        """Test DOCKER_HOST selects the socket and TCP hosts are left to the CLI."""
+        monkeypatch.setenv("DOCKER_HOST", "unix:///run/user/1000/docker.sock")
+        assert find_docker_socket() == "/run/user/1000/docker.sock"
+
+        monkeypatch.setenv("DOCKER_HOST", "tcp://127.0.0.1:2375")
+        assert find_docker_socket() is None
+
+
+class TestEngineBackedJanitor:
+    """Test image cleanup through the Engine API."""
+
+    def test_sweep_without_processes(self, engine, daemon, monkeypatch, tmp_path):
+        """Test a sweep lists, removes and prunes without starting docker."""
+        monkeypatch.setattr("mcp_manager.core.docker_janitor.get_docker_engine", lambda: engine)
+        monkeypatch.setattr(
+            "mcp_manager.core.docker_janitor.get_image_metadata_cache",
+            lambda: ImageMetadataCache(tmp_path / "image_metadata.json"),
+        )
+
+        with patch("mcp_manager.utils.tracing.subprocess.run", no_processes):
+            removed = ImageJanitor().sweep(["mcp/fetch:latest", "mcp/github"])
+
+        assert removed == ["sha256:aaa", "sha256:bbb"]
+        assert [image["Id"] for image in daemon.images] == ["sha256:ccc"]
+        assert [(method, path) for method, path, _ in daemon.requests] == [
+            ("GET", "/images/json"),
+            ("DELETE", "/images/sha256:aaa"),
+            ("DELETE", "/images/sha256:bbb"),
+            ("POST", "/images/prune"),
+        ]
+
+    def test_global_client_disabled(self, daemon, monkeypatch):
+        """Test the global client honours the engine_api setting."""
+        config = docker_engine.get_config()
+        monkeypatch.setattr(config.docker, "socket_path", daemon.server_address)
+        docker_engine.reset_docker_engine()
+        try:
+            assert docker_engine.get_docker_engine() is not None
+
+            monkeypatch.setattr(config.docker, "engine_api", False)
+            docker_engine.reset_docker_engine()
+            assert docker_engine.get_docker_engine() is None
+        finally:
+            docker_engine.reset_docker_engine()
+
+
+class TestEngineProbe:
+    """Test container probes through the Engine API."""
+
+    def test_demultiplex(self):
+        """Test attached output frames are split into stdout and stderr."""
+        stream = struct.pack(">BxxxI", 1, 3) + b"out" + struct.pack(">BxxxI", 2, 3) + b"err"
+
+        assert demultiplex(stream) == ("out", "err")
+
+    def test_probe_session(self, engine, daemon, tmp_path):
+        """Test one idle container serves exec probes and file reads without processes."""
+        inspect = lambda image: ImageMetadata(id="sha256:aaa", entrypoint=["node", "index.js"])
+        probe = ContainerProbe("mcp/fetch", inspect, engine=engine, cache=ProbeCache(tmp_path / "cache.json"))
+
+        with patch("mcp_manager.utils.tracing.subprocess.run", no_processes), probe:
+            help_result = probe.run(["--help"])
+            missing = probe.run(["mcp", "--help"])
+            readme = probe.read_file("/README.md")
+
+        assert (help_result.returncode, help_result.stdout, help_result.stderr) == (
+            0, "Commands:\n  fetch  Fetch a URL\n", "warning\n"
+        )
+        assert missing.returncode == 127
+        assert readme == "# fetch"
+        assert daemon.created == [{
+            "Image": "mcp/fetch",
+            "Entrypoint": ["sleep"],
+            "Cmd": ["3600"],
+            "Labels": daemon.created[0]["Labels"],
+        }]
+        assert daemon.removed_containers == 1
@@ -0,0 +1,164 @@
+"""
+Test batched Docker image cleanup.
+
+Test that images are resolved from a single inventory and removed with one
+docker rmi and at most one prune, however many servers were removed.
+"""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from mcp_manager.core.docker_janitor import (
+    ImageJanitor,
+    ImageRecord,
+    image_repository,
+    parse_inventory,
+    resolve_image_ids,
+)
+from mcp_manager.core.image_metadata import ImageMetadataCache
+
+
+def inventory_line(image_id, repository, tag="latest", digest="<none>"):
+    return json.dumps({"ID": image_id, "Repository": repository, "Tag": tag, "Digest": digest})
+
+
+class DockerRun:
+    """subprocess.run replacement answering docker images and rmi."""
+
+    def __init__(self, inventory):
+        self.calls = []
+        self.inventory = "\n".join(inventory) + "\n"
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(cmd[1:])
+        if cmd[1] == "images":
+            stdout = self.inventory
+        elif cmd[1] == "rmi":
+            stdout = "".join(f"Deleted: {image_id}\n" for image_id in cmd[3:])
+        else:
+            stdout = ""
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+
+@pytest.fixture(autouse=True)
+def no_engine(monkeypatch):
+    """Use the docker CLI path whether or not a daemon socket exists."""
+    monkeypatch.setattr("mcp_manager.core.docker_janitor.get_docker_engine", lambda: None)
+
+
+@pytest.fixture(autouse=True)
+def metadata_cache(tmp_path, monkeypatch):
+    """Keep image metadata of the tests out of the user's cache."""
+    cache = ImageMetadataCache(tmp_path / "image_metadata.json", ttl=3600)
+    monkeypatch.setattr("mcp_manager.core.docker_janitor.get_image_metadata_cache", lambda: cache)
+    return cache
+
+
+def patch_run(run):
+    return patch("mcp_manager.utils.tracing.subprocess.run", run)
+
+
+class TestImageResolution:
+    """Test matching image references against the inventory."""
+
+    def test_image_repository(self):
+        """Test tags, digests, registry ports and Docker Hub prefixes are stripped."""
+        assert image_repository("mcp/sqlite:latest") == "mcp/sqlite"
+        assert image_repository("mcp/sqlite@sha256:abc") == "mcp/sqlite"
+        assert image_repository("docker.io/mcp/sqlite") == "mcp/sqlite"
+        assert image_repository("docker.io/library/redis:7") == "redis"
+        assert image_repository("localhost:5000/tools/server:1.0") == "localhost:5000/tools/server"
+
+    def test_resolves_all_tags_of_repository(self):
+        """Test every tag and digest of a scheduled repository is matched."""
+        inventory = parse_inventory("\n".join([
+            inventory_line("aaa", "mcp/sqlite"),
+            inventory_line("bbb", "mcp/sqlite", tag="<none>", digest="sha256:123"),
+            inventory_line("ccc", "mcp/sqlite-extra"),
+            inventory_line("ddd", "redis"),
+        ]))
+
+        assert resolve_image_ids(["mcp/sqlite:latest"], inventory) == ["aaa", "bbb"]
+
+    def test_keeps_images_tagged_elsewhere(self):
+        """Test an image also tagged under another repository is not removed."""
+        inventory = [
+            ImageRecord("aaa", "mcp/fetch", "latest", ""),
+            ImageRecord("aaa", "myorg/fetch", "pinned", ""),
+        ]
+
+        assert resolve_image_ids(["mcp/fetch"], inventory) == []
+
+    def test_skips_unparseable_lines(self):
+        """Test output that is not JSON is ignored."""
+        output = "json\n" + inventory_line("aaa", "mcp/fetch") + "\n"
+
+        assert [record.id for record in parse_inventory(output)] == ["aaa"]
+
+
+class TestImageJanitor:
+    """Test sweeps issue a fixed number of docker calls."""
+
+    def test_sweep_single_rmi_and_prune(self):
+        """Test ten images cost one inventory, one rmi and one prune."""
+        run = DockerRun([inventory_line(f"id{index}", f"mcp/server-{index}") for index in range(10)])
+
+        with patch_run(run):
+            removed = ImageJanitor().sweep([f"mcp/server-{index}:latest" for index in range(10)])
+
+        assert removed == [f"id{index}" for index in range(10)]
+        assert run.calls == [
+            ["images", "--digests", "--format", "{{json .}}"],
+            ["rmi", "-f"] + removed,
+            ["image", "prune", "-f"],
+        ]
+
+    def test_sweep_without_matches(self):
+        """Test nothing is removed or pruned when no image matches."""
+        run = DockerRun([inventory_line("aaa", "redis")])
+
+        with patch_run(run):
+            assert ImageJanitor().sweep(["mcp/fetch"]) == []
+
+        assert [call[0] for call in run.calls] == ["images"]
+
+    def test_batch_sweeps_once(self):
+        """Test images scheduled inside a batch are removed in one sweep after it exits."""
+        run = DockerRun([inventory_line("aaa", "mcp/fetch"), inventory_line("bbb", "mcp/github")])
+        janitor = ImageJanitor()
+
+        with patch_run(run):
+            with janitor.batch():
+                janitor.schedule(["mcp/fetch:latest"])
+                janitor.schedule(["mcp/github:latest"])
+                assert janitor.wait(5)
+                assert run.calls == []
+            assert janitor.wait(5)
+
+        assert [call[0] for call in run.calls] == ["images", "rmi", "image"]
+        assert run.calls[1] == ["rmi", "-f", "aaa", "bbb"]
+
+    def test_sweep_forgets_image_metadata(self, metadata_cache):
+        """Test removed images are inspected again on the next lookup."""
+        inspected = []
+        def inspect(reference):
+            inspected.append(reference)
+            return {"Id": "sha256:aaa111", "Config": {}}
+
+        metadata_cache.get("mcp/fetch", inspect)
+        with patch_run(DockerRun([inventory_line("aaa111", "mcp/fetch")])):
+            ImageJanitor().sweep(["mcp/fetch"])
+        metadata_cache.get("mcp/fetch", inspect)
+
+        assert inspected == ["mcp/fetch", "mcp/fetch"]
+
+    def test_docker_missing(self):
+        """Test a missing docker binary does not raise."""
+        def missing(cmd, **kwargs):
+            raise FileNotFoundError(cmd[0])
+
+        with patch_run(missing):
+            assert ImageJanitor().sweep(["mcp/fetch"]) == []
@@ -0,0 +1,139 @@
+"""
+Test the image metadata cache.
+
+Test that inspect output is turned into typed metadata, that a cached
+reference costs no docker call until its tag may have moved, and that the
+cache is shared between processes through its file.
+"""
+
+import time
+
+import pytest
+
+from mcp_manager.core.image_metadata import ImageMetadata, ImageMetadataCache
+
+INSPECT = {
+    "Id": "sha256:aaa",
+    "RepoTags": ["mcp/fetch:latest"],
+    "RepoDigests": ["mcp/fetch@sha256:111"],
+    "Config": {
+        "Entrypoint": ["node", "index.js"],
+        "Cmd": None,
+        "Env": ["PATH=/usr/bin", "MCP_MODE=stdio", "EMPTY"],
+        "WorkingDir": "/app",
+        "Labels": {
+            "org.opencontainers.image.title": "fetch",
+            "io.mcp.tools": "fetch",
+        },
+    },
+    "Descriptor": {"annotations": {"org.opencontainers.image.source": "https://example.com/fetch"}},
+}
+
+
+class Inspector:
+    """Inspect function counting the images it was asked about."""
+
+    def __init__(self, data=INSPECT):
+        self.calls = []
+        self.data = data
+
+    def __call__(self, reference):
+        self.calls.append(reference)
+        return self.data
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ImageMetadataCache(tmp_path / "image_metadata.json", ttl=3600)
+
+
+class TestImageMetadata:
+    """Test building metadata from inspect output."""
+
+    def test_from_inspect(self):
+        """Test the configuration fields are typed and annotations collected."""
+        metadata = ImageMetadata.from_inspect(INSPECT)
+
+        assert metadata.id == "sha256:aaa"
+        assert metadata.entrypoint == ["node", "index.js"]
+        assert metadata.cmd == []
+        assert metadata.env == {"PATH": "/usr/bin", "MCP_MODE": "stdio", "EMPTY": ""}
+        assert metadata.working_dir == "/app"
+        assert metadata.labels["io.mcp.tools"] == "fetch"
+        assert metadata.annotations == {
+            "org.opencontainers.image.title": "fetch",
+            "org.opencontainers.image.source": "https://example.com/fetch",
+        }
+
+    def test_env_text(self):
+        """Test the environment joins back into KEY=value pairs."""
+        metadata = ImageMetadata(id="sha256:aaa", env={"A": "1", "B": "two"})
+
+        assert metadata.env_text() == "A=1 B=two"
+
+
+class TestImageMetadataCache:
+    """Test lookups only inspect images on a miss."""
+
+    def test_repeated_lookups_inspect_once(self, cache):
+        """Test a cached reference makes no further inspect call."""
+        inspect = Inspector()
+
+        for _ in range(3):
+            assert cache.get("mcp/fetch", inspect).entrypoint == ["node", "index.js"]
+
+        assert inspect.calls == ["mcp/fetch"]
+
+    def test_shared_through_file(self, cache):
+        """Test another cache instance reads the metadata from disk."""
+        cache.get("mcp/fetch", Inspector())
+
+        inspect = Inspector()
+        other = ImageMetadataCache(cache.cache_file, ttl=3600)
+
+        assert other.get("mcp/fetch", inspect).id == "sha256:aaa"
+        assert inspect.calls == []
+
+    def test_tag_expires(self, cache, monkeypatch):
+        """Test a tag is inspected again after the TTL but a digest is not."""
+        now = time.time()
+        monkeypatch.setattr("mcp_manager.core.image_metadata.time.time", lambda: now)
+        inspect = Inspector()
+        cache.get("mcp/fetch:latest", inspect)
+        cache.get("mcp/fetch@sha256:111", inspect)
+
+        monkeypatch.setattr("mcp_manager.core.image_metadata.time.time", lambda: now + 7200)
+        cache.get("mcp/fetch:latest", inspect)
+        cache.get("mcp/fetch@sha256:111", inspect)
+
+        assert inspect.calls == ["mcp/fetch:latest", "mcp/fetch@sha256:111", "mcp/fetch:latest"]
+
+    def test_missing_image_not_cached(self, cache):
+        """Test an image that is not available locally is looked up again."""
+        inspect = Inspector(data=None)
+
+        assert cache.get("mcp/fetch", inspect) is None
+        assert cache.get("mcp/fetch", inspect) is None
+        assert inspect.calls == ["mcp/fetch", "mcp/fetch"]
+
+    def test_forget_short_id(self, cache):
+        """Test forgetting an image by the short ID docker images prints."""
+        inspect = Inspector()
+        cache.get("mcp/fetch", inspect)
+
+        cache.forget(["aaa"])
+        cache.get("mcp/fetch", inspect)
+
+        assert inspect.calls == ["mcp/fetch", "mcp/fetch"]
+
+    def test_trims_oldest_images(self, tmp_path):
+        """Test only the most recently inspected images are kept."""
+        cache = ImageMetadataCache(tmp_path / "image_metadata.json", ttl=3600, max_images=2)
+        for index in range(3):
+            cache.get(f"mcp/server-{index}", lambda reference: {"Id": f"sha256:{reference}"})
+
+        inspect = Inspector()
+        cache.get("mcp/server-0", inspect)
+        cache.get("mcp/server-2", inspect)
+
+        assert inspect.calls == ["mcp/server-0"]
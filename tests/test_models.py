@@ -0,0 +1,97 @@
+"""
+Test core data models.
+
+Test the lightweight ServerRecord used on internal listing paths and its
+conversion to and from the Server model.
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from mcp_manager.core.claude_interface import ClaudeInterface
+from mcp_manager.core.models import Server, ServerRecord, ServerScope, ServerType
+
+
+def make_record(**overrides):
+    fields = dict(
+        name="filesystem",
+        command="npx",
+        scope=ServerScope.USER,
+        server_type=ServerType.NPM,
+        args=["-y", "@modelcontextprotocol/server-filesystem"],
+    )
+    fields.update(overrides)
+    return ServerRecord(**fields)
+
+
+class TestServerRecord:
+    """Test ServerRecord."""
+
+    def test_immutable(self):
+        """Test records cannot be modified."""
+        record = make_record()
+
+        with pytest.raises(AttributeError):
+            record.name = "other"
+        with pytest.raises(AttributeError):
+            record.extra = 1
+        assert record.args == ("-y", "@modelcontextprotocol/server-filesystem")
+
+    def test_round_trip(self):
+        """Test conversion to a Server model and back."""
+        record = make_record(env={"ROOT": "/tmp"}, enabled=False, description="Files")
+
+        server = record.to_server()
+
+        assert isinstance(server, Server)
+        assert server.args == ["-y", "@modelcontextprotocol/server-filesystem"]
+        assert server.env == {"ROOT": "/tmp"}
+        assert server.enabled is False
+        assert ServerRecord.from_server(server) == record
+
+    def test_equality_and_hashing(self):
+        """Test records compare by value and can be indexed."""
+        first = make_record(env={"A": "1"})
+        second = make_record(env={"A": "1"})
+
+        assert first == second
+        assert len({first, second}) == 1
+        assert first != make_record(env={"A": "2"})
+        assert make_record().env == {}
+
+    def test_invalid_record_fails_at_conversion(self):
+        """Test validation is deferred to the model boundary."""
+        record = make_record(name=" ")
+
+        with pytest.raises(ValueError):
+            record.to_server()
+
+
+class TestClaudeInterfaceListing:
+    """Test parsing of claude mcp list output."""
+
+    def test_list_server_records(self):
+        """Test list output is parsed into records and converted on demand."""
+        claude = ClaudeInterface.__new__(ClaudeInterface)
+        claude.claude_path = "claude"
+        output = (
+            "filesystem: npx -y @modelcontextprotocol/server-filesystem\n"
+            "docker-gateway: docker mcp gateway run --servers a,b\n"
+            "broken:\n"
+        )
+        completed = subprocess.CompletedProcess([], 0, stdout=output, stderr="")
+
+        with patch("mcp_manager.core.claude_interface.subprocess.run", return_value=completed):
+            records = claude.list_server_records()
+            servers = claude.list_servers()
+
+        assert [(r.name, r.server_type) for r in records] == [
+            ("filesystem", ServerType.NPM),
+            ("docker-gateway", ServerType.DOCKER),
+        ]
+        assert [s.to_claude_config() for s in servers] == [
+            {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-filesystem"]},
+            {"command": "docker", "args": ["mcp", "gateway", "run", "--servers", "a,b"]},
+        ]
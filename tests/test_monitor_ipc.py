@@ -0,0 +1,235 @@
+"""
+Test the monitor daemon IPC control channel.
+
+Test JSON-RPC round trips over the Unix domain socket, the client
+fallback when no daemon is running, and the monitor state served over it.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_manager.core import background_monitor
+from mcp_manager.core.background_monitor import BackgroundMonitor, MonitorDaemon
+from mcp_manager.core.monitor_ipc import (
+    METHOD_NOT_FOUND, MonitorIPCClient, MonitorIPCError, MonitorIPCServer,
+    call_daemon, ipc_supported, is_daemon_running,
+)
+from mcp_manager.utils.config import get_config, invalidate_config
+
+pytestmark = pytest.mark.skipif(not ipc_supported(), reason="Unix sockets not available")
+
+
+class RunningServer:
+    """Run a MonitorIPCServer on a private event loop thread."""
+
+    def __init__(self, socket_path):
+        self.server = MonitorIPCServer(socket_path)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result(5)
+        return self.server
+
+    def __exit__(self, *exc_info):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Short socket path inside a temporary directory."""
+    return tmp_path / "m.sock"
+
+
+class TestMonitorIPC:
+    """Test MonitorIPCServer and MonitorIPCClient."""
+
+    def test_call_registered_method(self, socket_path):
+        """Test calling a registered method returns its result."""
+        server_ctx = RunningServer(socket_path)
+
+        async def echo(params):
+            return {"echo": params.get("value")}
+
+        server_ctx.server.register("echo", echo)
+
+        with server_ctx:
+            client = MonitorIPCClient(socket_path, timeout=5)
+            assert client.call("echo", {"value": 42}) == {"echo": 42}
+            assert call_daemon("echo", {"value": "x"}, socket_path=socket_path) == {"echo": "x"}
+
+    def test_unknown_method(self, socket_path):
+        """Test unknown methods return a JSON-RPC error."""
+        with RunningServer(socket_path):
+            client = MonitorIPCClient(socket_path, timeout=5)
+            with pytest.raises(MonitorIPCError) as exc_info:
+                client.call("missing")
+            assert exc_info.value.code == METHOD_NOT_FOUND
+
+    def test_handler_error_falls_back(self, socket_path):
+        """Test call_daemon returns None when the handler fails."""
+        server_ctx = RunningServer(socket_path)
+
+        async def broken(params):
+            raise ValueError("boom")
+
+        server_ctx.server.register("broken", broken)
+
+        with server_ctx:
+            assert call_daemon("broken", socket_path=socket_path) is None
+
+    def test_no_daemon(self, socket_path):
+        """Test the client reports no daemon when the socket is missing."""
+        assert call_daemon("status", socket_path=socket_path) is None
+        assert is_daemon_running(socket_path) is False
+
+    def test_stale_socket_replaced(self, socket_path):
+        """Test a stale socket file does not block server start."""
+        socket_path.write_text("")
+
+        server_ctx = RunningServer(socket_path)
+
+        async def ping(params):
+            return {"ok": True}
+
+        server_ctx.server.register("ping", ping)
+
+        with server_ctx:
+            assert is_daemon_running(socket_path) is True
+
+        assert not socket_path.exists()
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    """A monitor over a fake manager, with one server source file."""
+    source = tmp_path / "server_catalog.json"
+    source.write_text("{}")
+    manager = MagicMock()
+    manager.list_servers = AsyncMock(return_value=[])
+    with patch.object(background_monitor, "get_state_file", lambda: tmp_path / "monitor_state.json"), \
+            patch.object(background_monitor, "_server_source_files", lambda: [source]):
+        monitor = BackgroundMonitor(manager=manager, auto_sync=True)
+        monitor.source = source
+        yield monitor
+
+
+class TestMonitorState:
+    """Test the monitor state the daemon serves."""
+
+    def test_server_cache_invalidation(self, monitor):
+        """Test the server list is rebuilt only after a source file changes or on request."""
+        asyncio.run(monitor.get_cached_servers())
+        asyncio.run(monitor.get_cached_servers())
+        assert monitor.manager.list_servers.await_count == 1
+
+        monitor.source.write_text('{"servers": {}}')
+        asyncio.run(monitor.get_cached_servers())
+        assert monitor.manager.list_servers.await_count == 2
+
+        asyncio.run(monitor.get_cached_servers(refresh=True))
+        monitor.invalidate_server_cache()
+        asyncio.run(monitor.get_cached_servers())
+        assert monitor.manager.list_servers.await_count == 4
+
+    def test_detect_changes_has_no_side_effects(self, monitor):
+        """Test detecting changes neither records, counts nor syncs them."""
+        change = MagicMock()
+        monitor.detector.detect_changes = AsyncMock(return_value=[change])
+        monitor._auto_sync_changes = AsyncMock()
+
+        assert asyncio.run(monitor.detect_changes()) == [change]
+
+        assert monitor.checks_performed == 0
+        assert monitor.changes_detected == 0
+        assert monitor.change_history == []
+        monitor._auto_sync_changes.assert_not_awaited()
+
+
+class TestMonitorDaemon:
+    """Test the monitor daemon lifecycle."""
+
+    def test_settings_change_reloads_config(self, tmp_path, monkeypatch):
+        """Test editing config.toml while the daemon runs is seen by get_config."""
+        home = tmp_path / "home"
+        settings = home / ".config" / "mcp-manager" / "config.toml"
+        settings.parent.mkdir(parents=True)
+        settings.write_text("debug = false\n")
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(tmp_path)
+        invalidate_config()
+
+        seen = []
+
+        class FakeMonitor:
+            """Monitor that edits the settings and waits for the reload."""
+
+            running = False
+
+            def __init__(self, **kwargs):
+                pass
+
+            async def start(self):
+                seen.append(get_config().debug)
+                settings.write_text("debug = true\n")
+                deadline = time.monotonic() + 5
+                while not get_config().debug and time.monotonic() < deadline:
+                    await asyncio.sleep(0.05)
+                seen.append(get_config().debug)
+
+        daemon = MonitorDaemon(socket_path=tmp_path / "m.sock")
+        try:
+            with patch.object(background_monitor, "BackgroundMonitor", FakeMonitor):
+                asyncio.run(daemon.start_daemon())
+        finally:
+            invalidate_config()
+
+        assert seen == [False, True]
+        assert daemon.config_watcher is None
+
+    def test_watches_follow_working_directory(self, tmp_path, monkeypatch):
+        """Test the daemon re-plans its watches after the working directory moves."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        monkeypatch.chdir(first)
+        config_file = tmp_path / "daemon.json"
+        config_file.write_text(json.dumps({"check_interval": 0.05}))
+
+        daemon = MonitorDaemon(config_file=str(config_file), socket_path=tmp_path / "m.sock")
+        seen = []
+
+        class FakeMonitor:
+            """Monitor that moves the working directory and waits for the re-plan."""
+
+            running = False
+
+            def __init__(self, **kwargs):
+                pass
+
+            async def start(self):
+                seen.append(str(first) in daemon.config_watcher.watched_directories())
+                os.chdir(second)
+                deadline = time.monotonic() + 5
+                while (str(second) not in daemon.config_watcher.watched_directories()
+                       and time.monotonic() < deadline):
+                    await asyncio.sleep(0.05)
+                watched = daemon.config_watcher.watched_directories()
+                seen.append(str(second) in watched and str(first) not in watched)
+
+        with patch.object(background_monitor, "BackgroundMonitor", FakeMonitor):
+            asyncio.run(daemon.start_daemon())
+
+        assert seen == [True, True]
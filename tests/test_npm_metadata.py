@@ -0,0 +1,188 @@
+"""
+Test npm package metadata from the registry.
+
+Test that versions are resolved from the abbreviated packument, that each
+name@version manifest is fetched once, and that NPX tool discovery runs no
+npm or npx process.
+"""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mcp_manager.core.models import Server, ServerScope, ServerType
+from mcp_manager.core.npm_metadata import (
+    ABBREVIATED_ACCEPT,
+    NpmManifestCache,
+    NpmMetadataService,
+    resolve_version,
+    split_package_spec,
+)
+from mcp_manager.core.registry_client import RegistryClient, ResponseCache
+from mcp_manager.core.simple_manager import SimpleMCPManager
+
+README = "# Filesystem MCP server\n\nTools: write_file, list_files\n"
+
+
+class FakeRegistry:
+    """httpx handler serving one package's packument and version documents."""
+
+    def __init__(self, version_readmes=True):
+        self.requests = []
+        self.latest = "1.0.0"
+        # Registries often keep the README in the full packument only
+        self.version_readmes = version_readmes
+
+    def versions(self):
+        return {
+            version: {
+                "name": "@mcp/files", "version": version, "description": "Files over MCP", "keywords": ["mcp"],
+                "readme": f"{README}Version {version}\n",
+            }
+            for version in ("1.0.0", "1.1.0")
+            if version <= self.latest
+        }
+
+    def version_document(self, versions, version):
+        document = dict(versions[version])
+        if not self.version_readmes:
+            del document["readme"]
+        return document
+
+    def __call__(self, request):
+        accept = request.headers.get("Accept")
+        path = request.url.path
+        self.requests.append((path, accept, request.headers.get("If-None-Match")))
+        versions = self.versions()
+        if path.startswith("/@mcp/files/") and path.rsplit("/", 1)[1] in versions:
+            return httpx.Response(200, json=self.version_document(versions, path.rsplit("/", 1)[1]))
+        if path != "/@mcp/files":
+            return httpx.Response(404, json={"error": "Not found"})
+
+        etag = f'"{self.latest}-{accept == ABBREVIATED_ACCEPT}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        body = {"name": "@mcp/files", "dist-tags": {"latest": self.latest}, "versions": versions}
+        if accept != ABBREVIATED_ACCEPT:
+            body["readme"] = versions[self.latest]["readme"]
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+
+@pytest.fixture
+def registry():
+    return FakeRegistry()
+
+
+@pytest.fixture
+def make_service(registry, tmp_path):
+    clients = []
+
+    def make(max_age=3600):
+        client = RegistryClient(
+            ResponseCache(tmp_path / "http_cache"), max_age=max_age, transport=httpx.MockTransport(registry)
+        )
+        clients.append(client)
+        return NpmMetadataService("https://registry.test", client, NpmManifestCache(tmp_path / "npm_metadata.json"))
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+class TestPackageSpecs:
+    """Test parsing and resolving npx package specs."""
+
+    def test_split_package_spec(self):
+        """Test scoped names keep their leading @."""
+        assert split_package_spec("@mcp/files") == ("@mcp/files", "")
+        assert split_package_spec("@mcp/files@1.0.0") == ("@mcp/files", "1.0.0")
+        assert split_package_spec("files@next") == ("files", "next")
+
+    def test_resolve_version(self):
+        """Test exact versions, dist-tags and the latest fallback."""
+        packument = {"dist-tags": {"latest": "2.0.0", "next": "3.0.0-rc.1"}, "versions": {"1.0.0": {}, "2.0.0": {}}}
+
+        assert resolve_version(packument, "1.0.0") == "1.0.0"
+        assert resolve_version(packument, "next") == "3.0.0-rc.1"
+        assert resolve_version(packument, "") == "2.0.0"
+        assert resolve_version(packument, "^1.0.0") == "2.0.0"
+
+
+class TestNpmMetadataService:
+    """Test manifests are fetched once per version."""
+
+    def test_manifest_fetched_once(self, make_service, registry):
+        """Test the abbreviated packument resolves and the version document is read once."""
+        service = make_service()
+
+        manifest = service.get_manifest("@mcp/files")
+        assert (manifest["version"], manifest["readme"]) == ("1.0.0", f"{README}Version 1.0.0\n")
+        assert [(path, accept) for path, accept, _ in registry.requests] == [
+            ("/@mcp/files", ABBREVIATED_ACCEPT),
+            ("/@mcp/files/1.0.0", "application/json"),
+        ]
+
+        assert make_service().get_manifest("@mcp/files") == manifest
+        assert len(registry.requests) == 2
+
+    def test_stale_packument_revalidated(self, make_service, registry):
+        """Test an unchanged package costs one conditional request once stale."""
+        make_service().get_manifest("@mcp/files")
+        registry.requests.clear()
+
+        assert make_service(max_age=0).get_manifest("@mcp/files")["version"] == "1.0.0"
+        assert registry.requests == [("/@mcp/files", ABBREVIATED_ACCEPT, '"1.0.0-True"')]
+
+    def test_new_release_fetched(self, make_service, registry):
+        """Test a new latest version is fetched after revalidation."""
+        make_service().get_manifest("@mcp/files")
+        registry.latest = "1.1.0"
+
+        assert make_service(max_age=0).get_manifest("@mcp/files")["version"] == "1.1.0"
+        old = make_service().get_manifest("@mcp/files@1.0.0")
+        assert (old["version"], old["readme"]) == ("1.0.0", f"{README}Version 1.0.0\n")
+        # Version documents carry their README, so the full packument is never read
+        assert ("/@mcp/files", "application/json") not in [(path, accept) for path, accept, _ in registry.requests]
+
+    def test_readme_from_full_packument(self, make_service, registry):
+        """Test only the latest version falls back to the full packument's README."""
+        registry.version_readmes = False
+        registry.latest = "1.1.0"
+        service = make_service()
+
+        latest = service.get_manifest("@mcp/files")
+        assert (latest["version"], latest["readme"]) == ("1.1.0", f"{README}Version 1.1.0\n")
+        assert ("/@mcp/files", "application/json") in [(path, accept) for path, accept, _ in registry.requests]
+
+        registry.requests.clear()
+        old = service.get_manifest("@mcp/files@1.0.0")
+        assert (old["version"], old["readme"]) == ("1.0.0", "")
+        assert ("/@mcp/files", "application/json") not in [(path, accept) for path, accept, _ in registry.requests]
+
+    def test_missing_package(self, make_service):
+        """Test an unknown package yields None."""
+        assert make_service().get_manifest("@mcp/unknown") is None
+
+
+class TestNpxToolDiscovery:
+    """Test NPX tool discovery reads the registry instead of running npx."""
+
+    def test_no_subprocesses(self, make_service):
+        """Test tools come from the package README without npm or npx."""
+        service = make_service()
+        server = Server(
+            name="files", command="npx", scope=ServerScope.USER, server_type=ServerType.NPM,
+            args=["-y", "@mcp/files"],
+        )
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+
+        def no_processes(cmd, **kwargs):
+            raise AssertionError(f"started {cmd[0]}")
+
+        with patch("mcp_manager.core.simple_manager.get_npm_metadata", lambda: service), \
+                patch("mcp_manager.utils.tracing.subprocess.run", no_processes):
+            tools = manager._discover_npx_tools(server)
+
+        assert {"write_file", "list_files"} <= {tool["name"] for tool in tools}
+        assert {tool["source"] for tool in tools} == {"npm_package_info"}
@@ -0,0 +1,138 @@
+"""
+Test offline package lookup in the npx cache.
+
+Test that installed packages are found under ``_npx/<hash>/node_modules``,
+that declared tools are read from package.json or shipped manifests, and
+that NPX tool discovery for an installed package needs neither a process
+nor the registry.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from mcp_manager.core.models import Server, ServerScope, ServerType
+from mcp_manager.core.npx_cache import NpxCache, find_npx_cache_dir
+from mcp_manager.core.simple_manager import SimpleMCPManager
+
+
+def install(cache_dir, install_hash, manifest, files=None, mtime=None):
+    """Write a package into the npx cache the way npx lays it out."""
+    package_dir = cache_dir / install_hash / "node_modules" / manifest["name"]
+    package_dir.mkdir(parents=True)
+    (package_dir / "package.json").write_text(json.dumps(manifest))
+    for name, content in (files or {}).items():
+        (package_dir / name).write_text(content if isinstance(content, str) else json.dumps(content))
+    if mtime is not None:
+        os.utime(package_dir / "package.json", (mtime, mtime))
+    return package_dir
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "_npx"
+
+
+class TestNpxCache:
+    """Test finding and reading installed packages."""
+
+    def test_cache_dir_follows_npm_config(self, tmp_path):
+        """Test npm's cache setting moves the npx cache."""
+        with patch.dict(os.environ, {"npm_config_cache": str(tmp_path)}):
+            assert find_npx_cache_dir() == tmp_path / "_npx"
+
+    def test_missing_package(self, cache_dir):
+        """Test packages npx never installed, and a missing cache, yield None."""
+        assert NpxCache(cache_dir).read_package("@mcp/files") is None
+
+        install(cache_dir, "a1", {"name": "other", "version": "1.0.0"})
+        assert NpxCache(cache_dir).read_package("@mcp/files") is None
+
+    def test_version_selection(self, cache_dir):
+        """Test an exact version is preferred, otherwise the newest install."""
+        install(cache_dir, "a1", {"name": "@mcp/files", "version": "1.0.0"}, mtime=2000)
+        install(cache_dir, "b2", {"name": "@mcp/files", "version": "1.1.0"}, mtime=1000)
+        cache = NpxCache(cache_dir)
+
+        assert cache.read_package("@mcp/files@1.1.0")["version"] == "1.1.0"
+        assert cache.read_package("@mcp/files")["version"] == "1.0.0"
+        assert cache.read_package("@mcp/files@latest")["version"] == "1.0.0"
+
+    def test_readme_attached(self, cache_dir):
+        """Test the installed README is read into the manifest."""
+        package_dir = install(cache_dir, "a1", {"name": "files", "version": "1.0.0"}, {"README.md": "# Files"})
+
+        manifest = NpxCache(cache_dir).read_package("files")
+
+        assert manifest["readme"] == "# Files"
+        assert manifest["path"] == str(package_dir)
+
+    def test_tools_declared_in_package_json(self, cache_dir):
+        """Test the mcp field of package.json takes precedence over shipped manifests."""
+        install(
+            cache_dir, "a1",
+            {"name": "files", "version": "1.0.0", "mcp": {"tools": [{"name": "read_file", "description": "Read"}]}},
+            {"manifest.json": {"tools": ["ignored"]}},
+        )
+        cache = NpxCache(cache_dir)
+
+        tools = cache.declared_tools(cache.read_package("files"))
+
+        assert tools == [{"name": "read_file", "description": "Read", "source": "package_json_mcp"}]
+
+    def test_tools_from_shipped_manifest(self, cache_dir):
+        """Test the first shipped manifest listing tools is used, skipping invalid ones."""
+        install(
+            cache_dir, "a1", {"name": "files", "version": "1.0.0"},
+            {"manifest.json": "{not json", "tools.json": [{"name": "list_files"}, "stat_file", {"bad": 1}]},
+        )
+        cache = NpxCache(cache_dir)
+
+        tools = cache.declared_tools(cache.read_package("files"))
+
+        assert [(tool["name"], tool["source"]) for tool in tools] == [
+            ("list_files", "npx_cache_tools.json"),
+            ("stat_file", "npx_cache_tools.json"),
+        ]
+
+
+class TestOfflineNpxToolDiscovery:
+    """Test NPX tool discovery reads installed packages first."""
+
+    def discover(self, cache_dir, spec):
+        server = Server(
+            name="files", command="npx", scope=ServerScope.USER, server_type=ServerType.NPM, args=["-y", spec],
+        )
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+
+        def no_processes(cmd, **kwargs):
+            raise AssertionError(f"started {cmd[0]}")
+
+        def no_registry():
+            raise AssertionError("queried the npm registry")
+
+        with patch("mcp_manager.core.simple_manager.get_npx_cache", lambda: NpxCache(cache_dir)), \
+                patch("mcp_manager.core.simple_manager.get_npm_metadata", no_registry), \
+                patch("mcp_manager.utils.tracing.subprocess.run", no_processes):
+            return manager._discover_npx_tools(server)
+
+    def test_declared_tools(self, cache_dir):
+        """Test declared tools are used without running anything or querying the registry."""
+        install(cache_dir, "a1", {"name": "@mcp/files", "version": "1.0.0"}, {"mcp.json": {"tools": ["read_file"]}})
+
+        tools = self.discover(cache_dir, "@mcp/files")
+
+        assert ("read_file", "npx_cache_mcp.json") in {(tool["name"], tool["source"]) for tool in tools}
+
+    def test_installed_readme(self, cache_dir):
+        """Test the installed README is parsed when the package declares no tools."""
+        install(
+            cache_dir, "a1", {"name": "@mcp/files", "version": "1.0.0", "description": "Files over MCP"},
+            {"README.md": "# Filesystem MCP server\n\nTools: write_file, list_files\n"},
+        )
+
+        tools = self.discover(cache_dir, "@mcp/files@1.0.0")
+
+        assert {"write_file", "list_files"} <= {tool["name"] for tool in tools}
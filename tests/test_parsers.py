@@ -0,0 +1,305 @@
+"""
+Test external configuration parsers.
+
+Test that parsed state is memoized by file stamp and only re-read
+when the file's inode, size or mtime changes, the shared registry.yaml
+reader, the server scope index and the incremental extraction of server
+sections from ~/.claude.json.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from mcp_manager.core.models import ServerScope
+from mcp_manager.core.parsers import (
+    ClaudeConfigParser, DockerRegistryParser, load_claude_mcp_sections, read_server_scopes,
+)
+from mcp_manager.core.parsers.claude_json import extract_mcp_servers_from_bytes
+from mcp_manager.core.parsers.docker_parser import YAML_LOADER, read_registry
+from mcp_manager.core.parsers.file_stamp import get_file_stamp
+from mcp_manager.core.parsers.json_store import JsonFileStore, put_recent
+
+
+@pytest.fixture
+def fake_home(tmp_path, monkeypatch):
+    """Temporary home directory."""
+    home = tmp_path / "home"
+    (home / ".config" / "claude-code").mkdir(parents=True)
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+    monkeypatch.chdir(tmp_path)
+    return home
+
+
+def write_servers(path, names):
+    path.write_text(json.dumps({"mcpServers": {name: {"command": "npx"} for name in names}}))
+
+
+class TestFileStamp:
+    """Test get_file_stamp."""
+
+    def test_missing_file(self, tmp_path):
+        """Test missing files have no stamp."""
+        assert get_file_stamp(tmp_path / "missing.json") is None
+
+    def test_same_size_rewrite_changes_stamp(self, tmp_path):
+        """Test a same-size rewrite within one second is detected."""
+        path = tmp_path / "config.json"
+        path.write_text("aaaa")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        first = get_file_stamp(path)
+
+        path.write_text("bbbb")
+        os.utime(path, ns=(1_000_000_001, 1_000_000_001))
+
+        assert get_file_stamp(path) != first
+
+
+
+class TestJsonFileStore:
+    """Test the versioned JSON file store shared by the caches."""
+
+    def test_shared_between_stores(self, tmp_path):
+        """Test a store sees another store's save and ignores other versions."""
+        path = tmp_path / "cache.json"
+        writer = JsonFileStore(lambda: path, 1, ("entries",), "test cache")
+        reader = JsonFileStore(lambda: path, 1, ("entries",), "test cache")
+        writer.load()["entries"]["a"] = 1
+        writer.save()
+
+        assert reader.load() == {"entries": {"a": 1}}
+        assert JsonFileStore(lambda: path, 2, ("entries",), "test cache").load() == {"entries": {}}
+
+    def test_unreadable_file_is_empty(self, tmp_path):
+        """Test a corrupt file loads as empty sections."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        assert JsonFileStore(lambda: path, 1, ("a", "b"), "test cache").load() == {"a": {}, "b": {}}
+
+    def test_put_recent_drops_oldest(self):
+        """Test re-inserted entries count as recent when trimming."""
+        entries = {"a": 1, "b": 2}
+
+        assert put_recent(entries, "a", 3, max_entries=2) == []
+        assert put_recent(entries, "c", 4, max_entries=2) == ["b"]
+        assert entries == {"a": 3, "c": 4}
+
+
+class TestClaudeConfigParser:
+    """Test ClaudeConfigParser memoization."""
+
+    def test_unchanged_file_returns_cached_state(self, fake_home):
+        """Test repeated parses of an unchanged file reuse the state object."""
+        write_servers(fake_home / ".claude.json", ["a", "b"])
+        parser = ClaudeConfigParser()
+
+        first = parser.parse_config("internal")
+        assert parser.has_changed("internal") is False
+
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert parser.parse_config("internal") is first
+
+        assert first.get_server_names() == {"a", "b"}
+
+    def test_atomic_replace_is_detected(self, fake_home):
+        """Test a file replaced by rename is re-parsed."""
+        config = fake_home / ".config" / "claude-code" / "mcp-servers.json"
+        write_servers(config, ["a"])
+        parser = ClaudeConfigParser()
+        first = parser.parse_config("user")
+
+        temp = config.with_suffix(".tmp")
+        write_servers(temp, ["b"])
+        os.replace(temp, config)
+
+        assert parser.has_changed("user") is True
+        changes = parser.get_changes_since_last_parse("user")
+        assert changes["added_servers"] == ["b"]
+        assert changes["removed_servers"] == ["a"]
+        assert parser.parse_config("user") is not first
+
+    def test_missing_file_is_cached(self, fake_home):
+        """Test a missing file parses to an empty cached state."""
+        parser = ClaudeConfigParser()
+
+        first = parser.parse_config("project")
+        assert first.servers == {}
+        assert parser.parse_config("project") is first
+
+        write_servers(Path(".mcp.json"), ["local"])
+        assert parser.has_changed("project") is True
+        assert parser.parse_config("project").get_server_names() == {"local"}
+
+
+class TestDockerRegistryParser:
+    """Test DockerRegistryParser memoization."""
+
+    def test_registry_memoized(self, tmp_path):
+        """Test the registry is only re-parsed when its stamp changes."""
+        registry = tmp_path / "registry.yaml"
+        registry.write_text("registry:\n  github:\n    ref: ''\n")
+        parser = DockerRegistryParser(str(registry))
+
+        first = parser.parse_registry()
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert parser.parse_registry() is first
+        assert parser.has_changed() is False
+
+        registry.write_text("registry:\n  github:\n    ref: ''\n  fetch:\n    ref: ''\n")
+
+        assert parser.has_changed() is True
+        changes = parser.get_changes_since_last_parse()
+        assert changes["added_servers"] == ["fetch"]
+        assert parser.get_last_state().get_enabled_servers() == {"github", "fetch"}
+
+
+class TestReadRegistry:
+    """Test the shared registry reader."""
+
+    def test_single_parse_shared(self, tmp_path):
+        """Test the parser and direct callers share one YAML parse."""
+        registry = tmp_path / "registry.yaml"
+        registry.write_text("registry:\n  github:\n    ref: ''\n  fetch:\n")
+
+        with patch("mcp_manager.core.parsers.docker_parser.yaml.load", wraps=yaml.load) as load:
+            assert set(read_registry(registry)) == {"github", "fetch"}
+            assert read_registry(registry)["fetch"] == {}
+            state = DockerRegistryParser(str(registry)).parse_registry()
+
+        assert load.call_count == 1
+        assert load.call_args.kwargs["Loader"] is YAML_LOADER
+        assert state.get_enabled_servers() == {"github", "fetch"}
+
+    def test_returned_mapping_is_a_copy(self, tmp_path):
+        """Test callers cannot corrupt the cached registry."""
+        registry = tmp_path / "registry.yaml"
+        registry.write_text("registry:\n  github: {}\n")
+
+        read_registry(registry).pop("github")
+
+        assert "github" in read_registry(registry)
+
+    @pytest.mark.parametrize("content", ["", "other: 1\n", "registry:\n", "- a\n"])
+    def test_empty_registries(self, tmp_path, content):
+        """Test files without a registry section read as empty."""
+        registry = tmp_path / "registry.yaml"
+        registry.write_text(content)
+        assert read_registry(registry) == {}
+
+    def test_missing_registry(self, tmp_path):
+        """Test a missing registry reads as empty."""
+        assert read_registry(tmp_path / "registry.yaml") == {}
+
+
+class TestClaudeJsonExtraction:
+    """Test extraction of mcpServers sections without loading the whole file."""
+
+    def make_document(self):
+        history = [
+            {"display": 'quoted \\"} and {brackets] \u00e9', "pastedContents": {}, "nested": [[1], {"x": [2]}]}
+            for _ in range(5)
+        ]
+        return {
+            "numStartups": 12,
+            "tipsHistory": {"a": 1},
+            "mcpServers": {"top": {"command": "npx", "args": ["-y", "top"]}},
+            "projectConfigs": {
+                "/work/a": {"history": history, "mcpServers": {"fs": {"command": "npx", "env": {"K": "v"}}}},
+                "/work/b": {"history": history, "allowedTools": []},
+                "/work/ü": {"mcpServers": {}, "history": []},
+            },
+            "projects": {"/work/c": {"mcpServers": {"ignored": {"command": "x"}}}},
+            "flags": [True, False, None, -1.5e3],
+        }
+
+    def test_matches_full_parse(self, tmp_path):
+        """Test extracted sections equal those of a full json.load."""
+        document = self.make_document()
+        path = tmp_path / ".claude.json"
+        path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+
+        sections = load_claude_mcp_sections(path)
+
+        assert sections == {
+            "mcpServers": document["mcpServers"],
+            "projectConfigs": {
+                "/work/a": {"mcpServers": document["projectConfigs"]["/work/a"]["mcpServers"]},
+                "/work/ü": {"mcpServers": {}},
+            },
+        }
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file yields no sections."""
+        path = tmp_path / ".claude.json"
+        path.write_text("")
+        assert load_claude_mcp_sections(path) == {}
+
+    @pytest.mark.parametrize("content", [
+        b'{"a": [1, 2',
+        b'{"a" 1}',
+        b'[1]',
+        b'{"mcpServers": {"x": }}',
+        b'{"a": "unterminated}',
+        b'{} trailing',
+    ])
+    def test_malformed_documents(self, content):
+        """Test malformed documents raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            extract_mcp_servers_from_bytes(content)
+
+    def test_internal_scope_uses_project_servers(self, fake_home):
+        """Test the internal scope reads per-project servers."""
+        document = self.make_document()
+        (fake_home / ".claude.json").write_text(json.dumps(document))
+
+        state = ClaudeConfigParser().parse_config("internal")
+
+        assert state.get_server_names() == {"fs", "top"}
+
+
+class TestServerScopes:
+    """Test the server scope index."""
+
+    def test_scopes_from_config_files(self, fake_home, tmp_path):
+        """Test each scope is read from its file and local wins over project and user."""
+        project = str(tmp_path)
+        (fake_home / ".claude.json").write_text(json.dumps({
+            "mcpServers": {"user-only": {}, "shadowed": {}},
+            "projects": {
+                project: {"mcpServers": {"local-only": {}, "shadowed": {}}},
+                "/elsewhere": {"mcpServers": {"other-project": {}}},
+            },
+        }))
+        write_servers(tmp_path / ".mcp.json", ["team", "user-only"])
+
+        scopes = read_server_scopes(project)
+
+        assert scopes == {
+            "user-only": ServerScope.PROJECT,
+            "shadowed": ServerScope.LOCAL,
+            "local-only": ServerScope.LOCAL,
+            "team": ServerScope.PROJECT,
+        }
+
+    def test_cached_until_files_change(self, fake_home, tmp_path):
+        """Test the index is only rebuilt when a config file changes."""
+        write_servers(fake_home / ".claude.json", ["a"])
+
+        assert read_server_scopes(tmp_path) == {"a": ServerScope.USER}
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert read_server_scopes(tmp_path) == {"a": ServerScope.USER}
+
+        write_servers(tmp_path / ".mcp.json", ["a"])
+        assert read_server_scopes(tmp_path) == {"a": ServerScope.PROJECT}
+
+    def test_unreadable_files_are_empty(self, fake_home, tmp_path):
+        """Test malformed config files don't break the index."""
+        (fake_home / ".claude.json").write_text("{not json")
+        (tmp_path / ".mcp.json").write_text("[1, 2]")
+
+        assert read_server_scopes(tmp_path) == {}
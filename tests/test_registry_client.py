@@ -0,0 +1,211 @@
+"""
+Test the shared registry client.
+
+Test that documents are served from the response cache while fresh,
+revalidated with conditional requests once stale, and fetched in batches
+over a bounded pool of reused connections.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from mcp_manager.core.image_metadata import ImageMetadata
+from mcp_manager.core.models import Server, ServerScope, ServerType
+from mcp_manager.core.registry_client import RegistryClient, ResponseCache
+from mcp_manager.core.simple_manager import SimpleMCPManager
+
+HUB_DOCUMENT = {
+    "description": "Fetch MCP server",
+    "full_description": (
+        "## Tools provided by this server\n| Tool | Description |\n|---|---|\n"
+        "| `fetch` | Fetch a URL |\n| `search` | Search the web |\n"
+    ),
+}
+
+
+class DocumentHandler(BaseHTTPRequestHandler):
+    """Serve JSON documents with ETags, counting requests and connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("If-None-Match")))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.latency)
+            document = server.documents.get(self.path)
+            etag = f'"{len(json.dumps(document))}"'
+            if document is None:
+                status, payload = 404, b'{"message": "not found"}'
+            elif self.headers.get("If-None-Match") == etag:
+                status, payload = 304, b""
+            else:
+                status, payload = 200, json.dumps(document).encode()
+            self.send_response(status)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class DocumentServer(ThreadingHTTPServer):
+    """Registry stand-in serving in the background."""
+
+    daemon_threads = True
+
+    def __init__(self, documents, latency=0.0):
+        super().__init__(("127.0.0.1", 0), DocumentHandler)
+        self.documents = documents
+        self.latency = latency
+        self.requests = []
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server():
+    documents = {f"/v2/repositories/mcp/server-{index}/": {"name": f"server-{index}"} for index in range(12)}
+    documents["/v2/repositories/mcp/fetch/"] = HUB_DOCUMENT
+    instance = DocumentServer(documents)
+    yield instance
+    instance.shutdown()
+    instance.server_close()
+
+
+@pytest.fixture
+def client(tmp_path):
+    instance = RegistryClient(ResponseCache(tmp_path / "http_cache"), max_connections=3, max_age=3600)
+    yield instance
+    instance.close()
+
+
+class TestRegistryClient:
+    """Test cached and conditional requests."""
+
+    def test_fresh_document_from_cache(self, client, server):
+        """Test a fresh document is served without a request, also by a new client."""
+        url = f"{server.url}/v2/repositories/mcp/fetch/"
+        assert client.get_json(url) == HUB_DOCUMENT
+        assert client.get_json(url) == HUB_DOCUMENT
+
+        other = RegistryClient(client.cache, max_connections=1, max_age=3600)
+        try:
+            assert other.get_json(url) == HUB_DOCUMENT
+        finally:
+            other.close()
+
+        assert len(server.requests) == 1
+
+    def test_stale_document_revalidated(self, client, server):
+        """Test a stale document is revalidated with its ETag and kept on 304."""
+        url = f"{server.url}/v2/repositories/mcp/fetch/"
+        client.get_json(url)
+
+        assert client.get_json(url, max_age=0) == HUB_DOCUMENT
+        assert server.requests[0][1] is None
+        assert server.requests[1][1] == f'"{len(json.dumps(HUB_DOCUMENT))}"'
+
+    def test_missing_document_cached(self, client, server):
+        """Test a 404 is remembered rather than requested again."""
+        url = f"{server.url}/v2/repositories/mcp/missing/"
+
+        assert client.get_json(url) is None
+        assert client.get_json(url) is None
+        assert len(server.requests) == 1
+
+    def test_unreachable_registry_serves_stale(self, client, server):
+        """Test a stale document is returned when the registry cannot be reached."""
+        url = f"{server.url}/v2/repositories/mcp/fetch/"
+        client.get_json(url)
+        server.shutdown()
+        server.server_close()
+
+        assert client.get_json(url, max_age=0) == HUB_DOCUMENT
+
+    def test_batch_bounded_by_pool(self, client, server):
+        """Test a batch runs concurrently but never beyond max_connections."""
+        server.latency = 0.05
+        urls = [f"{server.url}/v2/repositories/mcp/server-{index}/" for index in range(12)]
+
+        documents = asyncio.run(client.fetch_all(urls))
+
+        assert [documents[url]["name"] for url in urls] == [f"server-{index}" for index in range(12)]
+        assert 1 < server.max_in_flight <= 3
+        assert server.connections <= 3
+
+    def test_pool_shared_across_event_loops(self, client, server):
+        """Test separate asyncio.run calls and sync callers reuse the same connection."""
+        for index in range(3):
+            asyncio.run(client.fetch_json(f"{server.url}/v2/repositories/mcp/server-{index}/"))
+        client.get_json(f"{server.url}/v2/repositories/mcp/server-3/")
+
+        assert server.connections == 1
+
+
+class TestDockerHubDocs:
+    """Test tool discovery from Docker Hub documentation."""
+
+    def test_repository_url(self):
+        """Test official images, tags and other registries."""
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+        with patch("mcp_manager.core.simple_manager.get_config") as config:
+            config.return_value.discovery.docker_hub_url = "https://hub"
+            assert manager._docker_hub_repository_url("mcp/fetch:latest") == "https://hub/v2/repositories/mcp/fetch/"
+            assert manager._docker_hub_repository_url("redis") == "https://hub/v2/repositories/library/redis/"
+            assert manager._docker_hub_repository_url("ghcr.io/org/server") is None
+
+    def test_tools_from_cached_documentation(self, client, server):
+        """Test documentation prefetched for many servers is parsed without further requests."""
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+        servers = [
+            Server(
+                name="fetch", command="docker", scope=ServerScope.USER, server_type=ServerType.DOCKER,
+                args=["run", "-i", "--rm", "mcp/fetch"],
+            ),
+            Server(
+                name="files", command="npx", scope=ServerScope.USER, server_type=ServerType.NPM,
+                args=["-y", "mcp-files"],
+            ),
+        ]
+        probe = SimpleNamespace(image="mcp/fetch", metadata=ImageMetadata(id="sha256:aaa"), read_file=lambda path: None)
+
+        with patch("mcp_manager.core.simple_manager.get_registry_client", lambda: client), \
+                patch("mcp_manager.core.simple_manager.get_config") as config:
+            config.return_value.discovery.docker_hub_url = server.url
+            asyncio.run(manager.prefetch_docker_hub_docs(servers))
+            tools = manager._discover_tools_from_container_docs(probe, "fetch")
+
+        assert [(tool["name"], tool["description"]) for tool in tools] == [
+            ("fetch", "fetch a url"),
+            ("search", "search the web"),
+        ]
+        assert [path for path, _ in server.requests] == ["/v2/repositories/mcp/fetch/"]
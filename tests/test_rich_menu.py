@@ -0,0 +1,94 @@
+"""
+Test the server management screen of the Rich menu.
+
+Test that servers are listed once and kept until the menu changes them or
+the user refreshes, and that only the rows of the current page are drawn.
+"""
+
+import asyncio
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from rich.console import Console
+
+from mcp_manager.core.models import Server, ServerScope, ServerType
+from mcp_manager.tui import rich_menu
+from mcp_manager.tui.rich_menu import RichMenuApp
+
+
+def make_servers(count):
+    return [
+        Server(name=f"server-{index:03d}", command="npx", scope=ServerScope.USER, server_type=ServerType.NPM)
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def screen():
+    """A recording console 120 columns by 50 lines."""
+    console = Console(file=io.StringIO(), record=True, width=120, height=50)
+    with patch.object(rich_menu, "console", console):
+        yield console
+
+
+@pytest.fixture
+def app():
+    with patch.object(rich_menu, "SimpleMCPManager", MagicMock), \
+            patch.object(rich_menu, "ServerDiscovery", MagicMock), \
+            patch.object(RichMenuApp, "_ensure_logging_setup"):
+        app = RichMenuApp()
+    app.manager.list_servers = AsyncMock(return_value=make_servers(3))
+    app.manager.enable_server = AsyncMock()
+    return app
+
+
+def run_screen(app, answers):
+    """Show the server screen, answering prompts in turn."""
+    with patch.object(rich_menu.Prompt, "ask", side_effect=answers):
+        asyncio.run(app.show_servers())
+
+
+class TestServerScreen:
+    """Test the server list model and table rendering."""
+
+    def test_listed_once(self, app, screen):
+        """Test viewing details, help and paging reuse the listed servers."""
+        app.show_single_server_details = AsyncMock()
+
+        run_screen(app, ["1", "h", "", "2", "b"])
+        run_screen(app, ["b"])
+
+        assert app.manager.list_servers.await_count == 1
+
+    def test_refresh_and_changes_list_again(self, app, screen):
+        """Test the servers are listed again on refresh and after enabling one."""
+        run_screen(app, ["r", "e", "1", "", "b"])
+
+        assert app.manager.list_servers.await_count == 3
+        app.manager.enable_server.assert_awaited_once_with("server-000")
+
+    def test_failed_change_lists_again(self, app, screen):
+        """Test the servers are listed again after a change fails, as it may be partly applied."""
+        app.manager.enable_server.side_effect = RuntimeError("claude mcp add failed")
+
+        run_screen(app, ["e", "1", "", "b"])
+
+        assert app.manager.list_servers.await_count == 2
+
+    def test_only_current_page_drawn(self, app, screen):
+        """Test a long server list is drawn a page at a time, numbered throughout."""
+        app.manager.list_servers.return_value = make_servers(200)
+        page_size = app._server_page_size()
+
+        run_screen(app, ["b"])
+        first_page = screen.export_text()
+        run_screen(app, ["n", "b"])
+        second_page = screen.export_text()
+
+        assert "server-000" in first_page
+        assert f"server-{page_size:03d}" not in first_page
+        assert "server-199" not in first_page
+        assert f"server-{page_size:03d}" in second_page
+        assert f"Servers {page_size + 1}-{2 * page_size} of 200" in second_page
+        assert app.manager.list_servers.await_count == 1
@@ -0,0 +1,123 @@
+"""
+Test SimpleMCPManager mutations against Claude's CLI.
+
+Test that servers are listed with their real scope and that mutations
+target that scope with a single claude mcp call.
+"""
+
+import asyncio
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_manager.core.claude_interface import ClaudeInterface
+from mcp_manager.core.models import ServerScope
+from mcp_manager.core.simple_manager import SimpleMCPManager
+
+
+class RecordingRun:
+    """subprocess.run replacement recording claude mcp invocations."""
+
+    def __init__(self, list_output=""):
+        self.calls = []
+        self.list_output = list_output
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(cmd[1:])
+        stdout = self.list_output if cmd[1:3] == ["mcp", "list"] else ""
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project directory with a home holding Claude and Docker configuration."""
+    home = tmp_path / "home"
+    (home / ".docker" / "mcp").mkdir(parents=True)
+    (home / ".docker" / "mcp" / "registry.yaml").write_text("registry:\n  github: {}\n  fetch: {}\n")
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+    monkeypatch.chdir(project_dir)
+    (home / ".claude.json").write_text(json.dumps({
+        "mcpServers": {"filesystem": {"command": "npx"}},
+        "projects": {str(project_dir): {"mcpServers": {"docker-gateway": {"command": "docker"}}}},
+    }))
+    return project_dir
+
+
+@pytest.fixture
+def manager():
+    """Manager with a Claude interface that skips CLI discovery."""
+    claude = ClaudeInterface.__new__(ClaudeInterface)
+    claude.claude_path = "claude"
+    claude.docker_path = "docker"
+    manager = SimpleMCPManager.__new__(SimpleMCPManager)
+    manager.claude = claude
+    return manager
+
+
+def patch_run(run):
+    return patch("mcp_manager.core.claude_interface.subprocess.run", run)
+
+
+class TestServerScopes:
+    """Test scope-aware listing and mutations."""
+
+    def test_records_carry_scope(self, project, manager):
+        """Test listed servers report the scope Claude loads them from."""
+        run = RecordingRun(
+            "filesystem: npx -y server-filesystem\n"
+            "docker-gateway: docker mcp gateway run --servers github\n"
+        )
+
+        with patch_run(run):
+            records = manager.claude.list_server_records()
+
+        assert {r.name: r.scope for r in records} == {
+            "filesystem": ServerScope.USER,
+            "docker-gateway": ServerScope.LOCAL,
+        }
+
+    def test_remove_targets_scope(self, project, manager):
+        """Test a remove without a scope targets the server's scope."""
+        run = RecordingRun()
+
+        with patch_run(run):
+            assert manager.claude.remove_server("docker-gateway") is True
+
+        assert run.calls == [["mcp", "remove", "--scope", "local", "docker-gateway"]]
+
+    def test_gateway_refresh_single_remove(self, project, manager):
+        """Test the gateway is refreshed in its own scope without trial removes."""
+        run = RecordingRun()
+
+        with patch_run(run), patch("mcp_manager.core.simple_manager.subprocess.run", run):
+            assert asyncio.run(manager._refresh_docker_gateway()) is True
+
+        assert run.calls == [
+            ["mcp", "remove", "--scope", "local", "docker-gateway"],
+            ["mcp", "add", "--scope", "local", "docker-gateway", "docker",
+             "--", "mcp", "gateway", "run", "--servers", "github,fetch"],
+        ]
+
+
+class TestServerListing:
+    """Test listing servers from Claude and the catalog."""
+
+    def test_catalog_read_once(self, project, manager):
+        """Test one catalog read serves both new entries and disabled servers."""
+        manager._get_server_catalog = AsyncMock(return_value={"servers": {
+            "filesystem": {"type": "npm", "enabled": True},
+            "fetch": {"type": "docker-desktop", "enabled": False},
+        }})
+        manager._add_server_to_catalog = AsyncMock()
+
+        with patch_run(RecordingRun("filesystem: npx -y server-filesystem\nmemory: npx -y server-memory\n")):
+            records = asyncio.run(manager.list_server_records())
+
+        assert [(r.name, r.enabled) for r in records] == [("filesystem", True), ("memory", True), ("fetch", False)]
+        assert manager._get_server_catalog.await_count == 1
+        assert manager._add_server_to_catalog.await_args.kwargs["name"] == "memory"
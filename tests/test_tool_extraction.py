@@ -0,0 +1,152 @@
+"""
+Test tool name extraction from documents.
+
+Test that each kind of document is scanned in one pass yielding the first
+mention of each tool in document order, that list items are split on
+separators rather than on letters, and that the manager's parsers report
+each tool once.
+"""
+
+from mcp_manager.core.simple_manager import SimpleMCPManager
+from mcp_manager.core.tool_extraction import (
+    HELP_COMMANDS,
+    ToolCandidate,
+    ToolPatterns,
+    scan_hub_docs,
+    scan_hub_mentions,
+    scan_labels,
+    scan_package_docs,
+    scan_readme,
+)
+
+
+class TestToolPatterns:
+    """Test combined pattern scanning."""
+
+    def test_scan_reports_kind_and_offset(self):
+        """Test each candidate names the pattern that found it and where."""
+        patterns = ToolPatterns({
+            "colon": r'(?P<name>\w+): (?P<description>[^\n]+)',
+            "bullet": r'\* (?P<name>\w+)',
+        })
+        text = "* fetch\nsearch: Search the web\n"
+
+        assert list(patterns.scan(text)) == [
+            ToolCandidate("fetch", "", "bullet", 2),
+            ToolCandidate("search", "Search the web", "colon", 8),
+        ]
+
+    def test_scan_deduplicates(self):
+        """Test only the first mention of each name is yielded, and seen names are skipped."""
+        patterns = ToolPatterns({"bullet": r'\* (?P<name>\w+)'})
+        seen = {"skip"}
+
+        candidates = list(patterns.scan("* a\n* skip\n* b\n* a\n", seen=seen))
+
+        assert [(candidate.name, candidate.offset) for candidate in candidates] == [("a", 2), ("b", 13)]
+        assert seen == {"skip", "a", "b"}
+
+    def test_scan_regions(self):
+        """Test matches of a kind outside its region are ignored."""
+        patterns = ToolPatterns({"bullet": r'\* (?P<name>\w+)', "colon": r'(?P<name>\w+):'})
+        text = "* a\nb:\n* c\n"
+
+        candidates = patterns.scan(text, regions={"bullet": (7, len(text))})
+
+        assert [candidate.name for candidate in candidates] == ["b", "c"]
+
+    def test_help_commands(self):
+        """Test help lines in each layout."""
+        assert HELP_COMMANDS.match("* fetch - Fetch a URL")[:3] == ("fetch", "Fetch a URL", "described")
+        assert HELP_COMMANDS.match("search    Search the web")[:3] == ("search", "Search the web", "columns")
+        assert HELP_COMMANDS.match("status")[:3] == ("status", "", "bare")
+        assert HELP_COMMANDS.match("--verbose  Print more") is None
+
+
+class TestDocumentScanners:
+    """Test the scanners for each kind of document."""
+
+    def test_package_docs_split_on_separators(self):
+        """Test lists split on commas, ampersands, whitespace and "and", but not inside names."""
+        text = "tools: read_data, random_and_other & delete_node and android"
+
+        names = [candidate.name for candidate in scan_package_docs(text)]
+
+        assert names == ["read_data", "random_and_other", "delete_node", "android"]
+
+    def test_package_docs_overlapping_lists(self):
+        """Test a list inside another pattern's match is found, as by separate patterns."""
+        names = [candidate.name for candidate in scan_package_docs("it provides search tools: fetch_url, read_page\n")]
+
+        assert names == ["search", "fetch_url", "read_page"]
+
+    def test_package_docs_offsets(self):
+        """Test candidate offsets point at the item in the document."""
+        text = "mcp server.\ncommands: fetch, search\n"
+
+        for candidate in scan_package_docs(text):
+            assert text[candidate.offset:candidate.offset + len(candidate.name)] == candidate.name
+
+    def test_hub_table_rows_only_inside_table(self):
+        """Test table-like rows outside the tools table are not tools."""
+        text = (
+            "| `config` | not a tool |\n\n"
+            "## tools provided by this server\n| tool | description |\n"
+            "| `fetch` | fetch a url |\n\n"
+            "#### tool: **`search`**\n"
+        )
+
+        assert [(candidate.name, candidate.kind, candidate.description) for candidate in scan_hub_docs(text)] == [
+            ("fetch", "table", "fetch a url"),
+            ("search", "header", ""),
+        ]
+
+    def test_hub_mentions(self):
+        """Test the fallback finds backticked names other than type names."""
+        text = "call `fetch` with a `string`, or `fetch` again"
+
+        assert [candidate.name for candidate in scan_hub_mentions(text)] == ["fetch"]
+
+    def test_readme_keeps_operation_names(self):
+        """Test README entries are kept only if they look like operations."""
+        text = "- `read_file`: read a file\n**write_file**: write a file\n### overview\nabout\n"
+
+        assert [(candidate.name, candidate.kind) for candidate in scan_readme(text)] == [
+            ("read_file", "list"),
+            ("write_file", "bold"),
+        ]
+
+    def test_labels(self):
+        """Test comma-separated label lists."""
+        text = '{"mcp.tools": "fetch, search,ab"}'
+
+        assert [candidate.name for candidate in scan_labels(text)] == ["fetch", "search"]
+
+
+class TestManagerParsers:
+    """Test the manager's parsers on top of the scanners."""
+
+    def test_npm_package_info_deduplicated(self):
+        """Test a tool listed twice is reported once."""
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+        npm_info = {
+            "description": "MCP server. Tools: fetch, search.",
+            "readme": "# Server\n\nCommands: Fetch\n",
+            "keywords": None,
+        }
+
+        tools = manager._parse_npm_package_info(npm_info, "server")
+
+        assert [tool["name"] for tool in tools] == ["fetch", "search"]
+
+    def test_docker_help_output(self):
+        """Test commands are read from the help section, skipping built-ins and repeats."""
+        manager = SimpleMCPManager.__new__(SimpleMCPManager)
+        help_output = "Usage: server [command]\n\nCommands:\n  fetch    Fetch a URL\n  help     Show help\n  fetch\n  status\n"
+
+        tools = manager._parse_docker_help_output(help_output, "server")
+
+        assert [(tool["name"], tool["description"]) for tool in tools] == [
+            ("fetch", "Fetch a URL"),
+            ("status", "Tool from server"),
+        ]
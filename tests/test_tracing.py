@@ -0,0 +1,104 @@
+"""
+Test tracing spans and reports.
+
+Test span nesting across threads and event loops, the disabled fast path
+and the summary and Chrome trace output.
+"""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from mcp_manager.utils.tracing import Tracer, _NOOP_SPAN, _command_name, get_tracer, run_command
+
+
+@pytest.fixture
+def tracer():
+    """The global tracer, enabled for one test."""
+    tracer = get_tracer()
+    tracer.start()
+    yield tracer
+    tracer.stop()
+
+
+class TestSpans:
+    """Test span collection."""
+
+    def test_disabled_returns_noop(self):
+        """Test spans are a shared no-op while tracing is disabled."""
+        tracer = Tracer()
+
+        with tracer.span("claude mcp list", "subprocess") as span:
+            span.set("returncode", 0)
+
+        assert span is _NOOP_SPAN
+        assert tracer.spans() == []
+
+    def test_nesting_across_threads(self, tracer):
+        """Test spans opened in worker threads keep their parent."""
+        async def command():
+            with tracer.span("sync"):
+                await asyncio.gather(
+                    asyncio.to_thread(run_command, [sys.executable, "-c", "pass"]),
+                    asyncio.to_thread(run_command, [sys.executable, "-c", "raise SystemExit(3)"]),
+                )
+
+        asyncio.run(command())
+
+        spans = {span.name: span for span in tracer.spans()}
+        children = [span for span in tracer.spans() if span.category == "subprocess"]
+        assert len(children) == 2
+        assert all(span.parent_id == spans["sync"].span_id for span in children)
+        assert sorted(span.attributes["returncode"] for span in children) == [0, 3]
+
+    def test_error_recorded(self, tracer):
+        """Test a span records the exception that ended it."""
+        with pytest.raises(ValueError):
+            with tracer.span("parse registry.yaml", "parse"):
+                raise ValueError("bad yaml")
+
+        assert tracer.spans()[0].attributes["error"] == "ValueError"
+
+    def test_command_name(self):
+        """Test subprocess spans are named after the command, not its arguments."""
+        assert _command_name(["/usr/local/bin/claude", "mcp", "list"]) == "claude mcp list"
+        assert _command_name(["docker", "mcp", "server", "enable", "fetch"]) == "docker mcp server"
+        assert _command_name(["npm", "--version"]) == "npm"
+        assert _command_name("docker ps") == "docker ps"
+
+
+class TestReports:
+    """Test summary and export output."""
+
+    def test_summary_and_histograms(self, tracer):
+        """Test repeated spans are aggregated per call path."""
+        with tracer.span("mcp-manager list", "cli"):
+            for _ in range(3):
+                with tracer.span("claude mcp list", "subprocess"):
+                    pass
+
+        histograms = tracer.latency_histograms()
+        summary = tracer.summary()
+
+        assert histograms["claude mcp list"]["count"] == 3
+        assert histograms["claude mcp list"]["p95_ms"] <= histograms["claude mcp list"]["max_ms"]
+        tree = summary.splitlines()[1:3]
+        assert "mcp-manager list" in tree[0]
+        assert "  claude mcp list" in tree[1] and tree[1].split()[2] == "3"
+
+    def test_chrome_trace_export(self, tracer, tmp_path):
+        """Test spans are written as complete trace events."""
+        with tracer.span("mcp-manager list", "cli"):
+            with tracer.span("GET npm search", "http", url="https://registry.npmjs.org"):
+                pass
+        path = tmp_path / "trace.json"
+
+        tracer.export_chrome_trace(path)
+
+        events = json.loads(path.read_text())["traceEvents"]
+        assert [event["name"] for event in events] == ["GET npm search", "mcp-manager list"]
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+        assert events[0]["args"]["parent_id"] == events[1]["args"]["span_id"]
+        assert events[0]["args"]["url"] == "https://registry.npmjs.org"
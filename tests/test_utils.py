@@ -7,11 +7,14 @@ Test configuration, logging, and validation utilities.
 import pytest
 import tempfile
 import os
+import logging
+import queue
+import threading
 from pathlib import Path
 from unittest.mock import patch, mock_open, MagicMock
 
-from mcp_manager.utils.config import Config
-from mcp_manager.utils.logging import get_logger, setup_logging
+from mcp_manager.utils.config import Config, ConfigManager
+from mcp_manager.utils.logging import DeferredQueueHandler, MCPLogger, get_logger, setup_logging
 from mcp_manager.utils.validators import (
     validate_server_name, validate_command, validate_npm_package,
     validate_docker_image, validate_claude_cli
@@ -72,6 +75,77 @@ class TestConfig:
         assert config.ui.theme == "dark"
 
 
+class TestConfigSnapshot:
+    """Test persisted configuration snapshots."""
+    
+    @pytest.fixture
+    def sources(self, tmp_path):
+        """A configuration file and a snapshot location."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[logging]\nlevel = "debug"\n')
+        return [config_file], tmp_path / "config_snapshot.json"
+        
+    def test_snapshot_skips_parsing(self, sources):
+        """Test a second process loads from the snapshot without parsing TOML."""
+        config_files, snapshot_file = sources
+        first = ConfigManager(snapshot_file).load_config(config_files)
+        
+        with patch("toml.load", side_effect=AssertionError("config re-parsed")):
+            second = ConfigManager(snapshot_file).load_config(config_files)
+            
+        assert snapshot_file.exists()
+        assert second.logging.level == "DEBUG"
+        assert isinstance(second.logging, type(first.logging))
+        assert second.model_dump() == first.model_dump()
+        
+    def test_snapshot_invalidated_by_sources(self, sources):
+        """Test file, environment and override changes invalidate the snapshot."""
+        config_files, snapshot_file = sources
+        ConfigManager(snapshot_file).load_config(config_files)
+        
+        config_files[0].write_text('[logging]\nlevel = "error"\n')
+        assert ConfigManager(snapshot_file).load_config(config_files).logging.level == "ERROR"
+        
+        with patch.dict(os.environ, {"MCP_MANAGER_UNRELATED": "1"}):
+            with patch("toml.load", return_value={}) as load:
+                ConfigManager(snapshot_file).load_config(config_files)
+        assert load.called
+        
+        assert ConfigManager(snapshot_file).load_config(config_files, verbose=True).verbose is True
+        
+    def test_snapshot_is_immutable(self, sources):
+        """Test changes to a loaded config don't leak into the snapshot."""
+        config_files, snapshot_file = sources
+        manager = ConfigManager(snapshot_file)
+        config = manager.load_config(config_files)
+        
+        config.logging.level = "INFO"
+        snapshot = manager.get_snapshot()
+        
+        assert snapshot.data["logging"]["level"] == "DEBUG"
+        with pytest.raises(Exception):
+            snapshot.fingerprint = "other"
+            
+    def test_invalidate(self, sources):
+        """Test invalidation makes the next access check the sources again."""
+        config_files, snapshot_file = sources
+        manager = ConfigManager(snapshot_file)
+        first = manager.load_config(config_files)
+        
+        assert manager.load_config(config_files) is first
+        manager.invalidate()
+        config_files[0].write_text("")
+        
+        assert manager.load_config(config_files).logging.level == "INFO"
+        
+    def test_corrupt_snapshot_ignored(self, sources):
+        """Test an unreadable snapshot falls back to a full load."""
+        config_files, snapshot_file = sources
+        snapshot_file.write_text("{not json")
+        
+        assert ConfigManager(snapshot_file).load_config(config_files).logging.level == "DEBUG"
+
+
 class TestLogging:
     """Test logging utilities."""
     
@@ -104,6 +178,61 @@ class TestLogging:
         assert result is True
 
 
+class TestQueuedLogging:
+    """Test the queued logging pipeline."""
+    
+    @pytest.fixture
+    def root_logger(self):
+        """Root logger restored after the test."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield root
+        root.handlers[:] = handlers
+        root.setLevel(level)
+        
+    def test_records_written_by_listener_thread(self, root_logger, tmp_path):
+        """Test output handlers run off the caller's thread."""
+        log_file = tmp_path / "mcp-manager.log"
+        manager = MCPLogger()
+        manager.setup_logging(level="DEBUG", console_level="CRITICAL", log_file=log_file, enable_rich=False)
+        
+        writer_threads = set()
+        file_handler = manager._listener.handlers[1]
+        original_emit = file_handler.emit
+        
+        def emit(record):
+            writer_threads.add(threading.current_thread())
+            original_emit(record)
+        
+        file_handler.emit = emit
+        assert [type(h) for h in root_logger.handlers] == [DeferredQueueHandler]
+        
+        logging.getLogger("mcp_manager.test").debug("server %s has %d tools", "github", 3)
+        manager.shutdown()
+        
+        assert "server github has 3 tools" in log_file.read_text()
+        assert threading.current_thread() not in writer_threads
+        
+    def test_message_merged_before_queueing(self):
+        """Test later changes to mutable arguments don't alter queued messages."""
+        log_queue = queue.SimpleQueue()
+        logger = logging.getLogger("mcp_manager.test.deferred")
+        handler = DeferredQueueHandler(log_queue)
+        logger.addHandler(handler)
+        logger.propagate = False
+        try:
+            servers = ["github"]
+            logger.warning("servers: %s", servers)
+            servers.append("fetch")
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+        
+        record = log_queue.get_nowait()
+        assert record.getMessage() == "servers: ['github']"
+        assert record.args is None
+
+
 class TestValidators:
     """Test validation utilities."""
     
@@ -0,0 +1,312 @@
+"""
+Test configuration file watchers.
+
+Test trailing-edge coalescing of raw file system events into settled
+configuration change events, the directory watch planner and the
+async event queue.
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+from unittest.mock import patch
+
+import pytest
+
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+
+from mcp_manager.core.watchers import (
+    AsyncConfigWatcher, ConfigChangeEvent, ConfigFileHandler, ConfigWatcher, EventCoalescer,
+)
+
+QUIET = 0.1
+
+
+class Collector:
+    """Thread-safe callback recording emitted events."""
+
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def __call__(self, event):
+        with self.lock:
+            self.events.append(event)
+
+    def wait(self, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if len(self.events) >= count:
+                    return list(self.events)
+            time.sleep(0.01)
+        return list(self.events)
+
+
+class TestEventCoalescer:
+    """Test EventCoalescer."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.collector = Collector()
+        self.coalescer = EventCoalescer(quiet_period=QUIET)
+
+    def teardown_method(self):
+        """Stop the timer thread."""
+        self.coalescer.close()
+
+    def test_burst_emits_single_event(self, tmp_path):
+        """Test a burst of mixed events settles into one modified event."""
+        config = tmp_path / ".claude.json"
+        config.write_text("{}")
+
+        for event_type in ("modified", "deleted", "created", "modified", "modified"):
+            self.coalescer.submit(str(config), event_type, "internal", "claude", self.collector)
+
+        time.sleep(QUIET * 4)
+        events = self.collector.wait(1)
+
+        assert len(events) == 1
+        assert events[0].event_type == "modified"
+        assert events[0].scope == "internal"
+        assert self.coalescer.pending_count() == 0
+
+    def test_trailing_edge(self, tmp_path):
+        """Test events keep restarting the quiet window."""
+        config = tmp_path / ".mcp.json"
+        config.write_text("{}")
+
+        for _ in range(5):
+            self.coalescer.submit(str(config), "modified", "project", "claude", self.collector)
+            time.sleep(QUIET / 2)
+
+        assert self.collector.events == []
+        assert len(self.collector.wait(1)) == 1
+
+    def test_final_state_decides_event_type(self, tmp_path):
+        """Test created, deleted and transient paths are reported by final state."""
+        created = tmp_path / "registry.yaml"
+        created.write_text("registry: {}")
+        deleted = tmp_path / "server_catalog.json"
+        transient = tmp_path / ".mcp.json"
+
+        self.coalescer.submit(str(created), "created", "user", "docker", self.collector)
+        self.coalescer.submit(str(deleted), "modified", "user", "mcp_manager", self.collector)
+        self.coalescer.submit(str(transient), "created", "project", "claude", self.collector)
+
+        events = self.collector.wait(2)
+        time.sleep(QUIET * 2)
+
+        assert {(e.file_path, e.event_type) for e in self.collector.events} == {
+            (str(created), "created"),
+            (str(deleted), "deleted"),
+        }
+        assert len(events) == 2
+
+    def test_pending_state_is_bounded(self, tmp_path):
+        """Test the oldest paths are settled early once the bound is reached."""
+        coalescer = EventCoalescer(quiet_period=10, max_pending=2)
+        paths = []
+        for index in range(3):
+            path = tmp_path / f"{index}" / ".mcp.json"
+            path.parent.mkdir()
+            path.write_text("{}")
+            paths.append(str(path))
+            coalescer.submit(str(path), "modified", "project", "claude", self.collector)
+
+        assert coalescer.pending_count() == 2
+        assert [e.file_path for e in self.collector.events] == paths[:1]
+        coalescer.close()
+
+
+class TestConfigFileHandler:
+    """Test ConfigFileHandler with a shared coalescer."""
+
+    def test_atomic_rename_save(self, tmp_path):
+        """Test an atomic-rename save produces one callback."""
+        collector = Collector()
+        coalescer = EventCoalescer(quiet_period=QUIET)
+        handler = ConfigFileHandler(collector, scope="internal", source="claude", coalescer=coalescer)
+
+        config = tmp_path / ".claude.json"
+        temp = tmp_path / ".claude.json.tmp"
+        config.write_text("{}")
+
+        handler.on_created(FileCreatedEvent(str(temp)))
+        handler.on_modified(FileModifiedEvent(str(temp)))
+        handler.on_moved(FileMovedEvent(str(temp), str(config)))
+        handler.on_modified(FileModifiedEvent(str(config)))
+        handler.on_modified(FileModifiedEvent(str(tmp_path / "unrelated.txt")))
+
+        time.sleep(QUIET * 4)
+        events = collector.wait(1)
+        coalescer.close()
+
+        assert len(events) == 1
+        assert events[0].file_path == str(config)
+        assert events[0].event_type == "modified"
+
+
+@pytest.fixture
+def fake_home(tmp_path, monkeypatch):
+    """Home directory with Claude, Docker and MCP Manager config directories."""
+    home = tmp_path / "home"
+    for directory in (".docker/mcp", ".config/claude-code", ".config/mcp-manager"):
+        (home / directory).mkdir(parents=True)
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+    return home
+
+
+class TestConfigWatcherPlan:
+    """Test ConfigWatcher watch planning."""
+
+    def test_one_watch_per_directory(self, fake_home):
+        """Test sources sharing a directory are merged into one watch."""
+        watcher = ConfigWatcher(Collector(), project_dir=str(fake_home))
+
+        plan = watcher._plan_watches()
+
+        assert len(plan) == 4
+        assert plan[str(fake_home)] == {
+            ".claude.json": ("internal", "claude"),
+            ".mcp.json": ("project", "claude"),
+            ".mcp-manager.toml": ("project", "claude"),
+        }
+        assert plan[str(fake_home / ".docker" / "mcp")] == {"registry.yaml": ("user", "docker")}
+
+    def test_no_ancestor_chain(self, fake_home):
+        """Test only the project directory and its root are watched."""
+        root = fake_home / "work" / "monorepo"
+        project = root / "packages" / "a" / "src"
+        project.mkdir(parents=True)
+        (root / ".git").mkdir()
+
+        watcher = ConfigWatcher(Collector(), project_dir=str(project))
+        plan = watcher._plan_watches()
+
+        project_dirs = {d for d, routes in plan.items() if ".mcp.json" in routes}
+        assert project_dirs == {str(project), str(root)}
+        assert str(root / "packages") not in plan
+        assert str(fake_home / "work") not in plan
+
+    def test_replan_on_cwd_change(self, fake_home):
+        """Test re-planning only reschedules the changed directories."""
+        first = fake_home / "first"
+        second = fake_home / "second"
+        first.mkdir()
+        second.mkdir()
+
+        collector = Collector()
+        watcher = ConfigWatcher(collector, quiet_period=QUIET, project_dir=str(first))
+        watcher.start()
+        try:
+            assert str(first) in watcher.watched_directories()
+            shared = watcher._watches[str(fake_home)][0]
+
+            assert watcher.replan(str(second)) is True
+            watched = watcher.watched_directories()
+            assert str(second) in watched
+            assert str(first) not in watched
+            assert watcher._watches[str(fake_home)][0] is shared
+            assert watcher.replan(str(second)) is False
+
+            (second / ".mcp.json").write_text("{}")
+            (second / "notes.txt").write_text("ignored")
+            events = collector.wait(1)
+        finally:
+            watcher.stop()
+
+        assert [(e.file_path, e.scope) for e in events] == [(str(second / ".mcp.json"), "project")]
+
+    def test_settings_change_invalidates_config(self, fake_home):
+        """Test MCP Manager settings changes drop the loaded configuration."""
+        collector = Collector()
+        watcher = ConfigWatcher(collector, project_dir=str(fake_home))
+        settings = fake_home / ".config" / "mcp-manager" / "config.toml"
+
+        assert "config.toml" in watcher._plan_watches()[str(settings.parent)]
+
+        with patch("mcp_manager.core.watchers.invalidate_config") as invalidate:
+            watcher._dispatch(ConfigChangeEvent(str(settings), "modified", "user", "mcp_manager"))
+            watcher._dispatch(ConfigChangeEvent(str(fake_home / ".mcp.json"), "modified", "project", "claude"))
+
+        assert invalidate.call_count == 1
+        assert len(collector.events) == 2
+
+
+def change_event(path, event_type="modified"):
+    return ConfigChangeEvent(file_path=path, event_type=event_type, scope="user", source="claude")
+
+
+class TestAsyncConfigWatcher:
+    """Test the AsyncConfigWatcher queue."""
+
+    def test_threaded_handoff_merges_and_drops(self, fake_home):
+        """Test events from another thread are merged by path and bounded."""
+
+        async def scenario():
+            release = asyncio.Event()
+            seen = []
+
+            async def callback(event):
+                await release.wait()
+                seen.append((event.file_path, event.event_type))
+
+            watcher = AsyncConfigWatcher(callback, max_queue_size=2, max_workers=1)
+            await watcher.start()
+            try:
+                # The single worker is blocked on "busy" while the rest queue up
+                watcher._queue_event(change_event("busy"))
+                while not watcher.get_stats()["in_flight"]:
+                    await asyncio.sleep(0.01)
+
+                def produce():
+                    watcher._queue_event(change_event("a", "created"))
+                    watcher._queue_event(change_event("a", "modified"))
+                    watcher._queue_event(change_event("b"))
+                    watcher._queue_event(change_event("c"))
+
+                await asyncio.get_running_loop().run_in_executor(None, produce)
+                await asyncio.sleep(0.05)
+                stats = watcher.get_stats()
+                release.set()
+                while watcher.get_stats()["processed"] < 3:
+                    await asyncio.sleep(0.01)
+            finally:
+                await watcher.stop()
+            return stats, seen
+
+        stats, seen = asyncio.run(scenario())
+
+        assert stats["received"] == 5
+        assert stats["in_flight"] == 1
+        assert stats["merged"] == 1
+        assert stats["dropped"] == 1
+        assert stats["queued"] == 2
+        assert seen == [("busy", "modified"), ("b", "modified"), ("c", "modified")]
+
+    def test_slow_callback_does_not_block_other_paths(self, fake_home):
+        """Test workers process other paths while one callback is slow."""
+
+        async def scenario():
+            order = []
+
+            async def callback(event):
+                if event.file_path == "slow":
+                    await asyncio.sleep(0.2)
+                order.append(event.file_path)
+
+            watcher = AsyncConfigWatcher(callback, max_workers=2)
+            await watcher.start()
+            try:
+                watcher._queue_event(change_event("slow"))
+                watcher._queue_event(change_event("fast"))
+                while watcher.get_stats()["processed"] < 2:
+                    await asyncio.sleep(0.01)
+            finally:
+                await watcher.stop()
+            return order
+
+        assert asyncio.run(scenario()) == ["fast", "slow"]